@@ -44,11 +44,12 @@ from llama_agents.core.config import DEFAULT_DEPLOYMENT_FILE_PATH
 from llama_agents.server import WorkflowServer
 from prometheus_fastapi_instrumentator import Instrumentator
 
-from .deployment import Deployment
+from .deployment import Deployment, migrate_shared_store
 from .interrupts import shutdown_event
 from .process_utils import run_process
 from .routers import health_router
 from .stats import apiserver_state
+from .workers import WorkerRoutingMiddleware, run_workers
 
 logger = logging.getLogger("uvicorn.info")
 
@@ -173,6 +174,16 @@ if not os.environ.get("DISABLE_CORS", False):
 app.include_router(health_router)
 add_log_middleware(app)
 
+if settings.workers > 1 and settings.worker_index is not None:
+    # Added last so it runs first: a forwarded request is logged and measured
+    # by the worker that serves it.
+    app.add_middleware(
+        cast(Any, WorkerRoutingMiddleware),
+        worker_index=settings.worker_index,
+        workers=settings.workers,
+        socket_dir=settings.worker_socket_dir,
+    )
+
 
 def open_browser_async(host: str, port: int) -> None:
     def _open_with_delay() -> None:
@@ -211,6 +222,7 @@ def start_server(
     deployment_file: Path | None = None,
     open_browser: bool = False,
     configure_logging: bool = True,
+    workers: int | None = None,
 ) -> None:
     # Configure via environment so uvicorn reload workers inherit the values
     configure_settings(
@@ -218,6 +230,7 @@ def start_server(
         app_root=cwd,
         deployment_file_path=deployment_file or Path(DEFAULT_DEPLOYMENT_FILE_PATH),
         reload=reload,
+        workers=workers,
     )
     cfg = get_deployment_config()
     load_environment_variables(cfg, settings.resolved_config_parent)
@@ -237,6 +250,20 @@ def start_server(
         if configure_logging:
             setup_logging(os.getenv("LOG_LEVEL", "INFO"))
 
+        if settings.workers > 1 and not reload:
+            migrate_shared_store(settings)
+            run_workers(
+                settings.workers,
+                host=settings.host,
+                port=settings.port,
+                timeout_graceful_shutdown=1,
+                access_log=False,
+                log_config=None,
+            )
+            return
+        if settings.workers > 1:
+            logger.warning("Reload runs a single worker; ignoring workers setting")
+
         uvicorn.run(
             "llama_agents.appserver.app:app",
             host=settings.host,
@@ -485,6 +512,7 @@ if __name__ == "__main__":
     parser.add_argument("--reload", action="store_true")
     parser.add_argument("--deployment-file", type=Path)
     parser.add_argument("--open-browser", action="store_true")
+    parser.add_argument("--workers", type=int)
     parser.add_argument("--preflight", action="store_true")
     parser.add_argument("--skip-env-validation", action="store_true")
     parser.add_argument("--export-json-graph", action="store_true")
@@ -509,4 +537,5 @@ if __name__ == "__main__":
             reload=args.reload,
             deployment_file=args.deployment_file,
             open_browser=args.open_browser,
+            workers=args.workers,
         )
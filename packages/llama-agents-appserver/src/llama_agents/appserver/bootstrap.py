@@ -10,12 +10,17 @@ Supports two modes of operation:
   and uploads it to the Build API for S3 storage.
 """
 
+import contextlib
+import io
 import logging
 import os
+import shutil
 import tarfile
 import time
+from collections.abc import Iterator
 from importlib.metadata import version as pkg_version
 from pathlib import Path
+from typing import Any
 
 import httpx
 from llama_agents.appserver.configure_logging import setup_logging
@@ -74,6 +79,168 @@ def _extract_filter(member: tarfile.TarInfo, dest_path: str) -> tarfile.TarInfo:
     return member.replace(uid=0, gid=0, uname="", gname="", deep=False)
 
 
+_DOWNLOAD_CHUNK_SIZE = 65536
+_DOWNLOAD_MAX_RESUMES = 5
+_DOWNLOAD_RESUME_BACKOFF_SECONDS = 1.0
+
+
+class _ResumableArtifactStream(io.RawIOBase):
+    """Read-only file object over an artifact download.
+
+    Bytes are pulled from the HTTP response on demand, so ``tarfile`` can
+    extract while the download is still in flight. If the connection drops
+    mid-body, the download is resumed with a ``Range`` request from the last
+    received byte. Servers that ignore ``Range`` and answer ``200`` are handled
+    by discarding the already-received prefix of the new body.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth_token: str,
+        max_resumes: int = _DOWNLOAD_MAX_RESUMES,
+    ) -> None:
+        super().__init__()
+        self._url = url
+        self._auth_token = auth_token
+        self._max_resumes = max_resumes
+        self._response_cm: contextlib.AbstractContextManager[httpx.Response] | None = (
+            None
+        )
+        self._chunks: Iterator[bytes] = iter(())
+        self._pending = b""
+        self.bytes_received = 0
+        self.total_size: int | None = None
+        self.resumes = 0
+        self._open()
+
+    def _open(self) -> None:
+        headers = {"Authorization": f"Bearer {self._auth_token}"}
+        offset = self.bytes_received
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        response_cm = httpx.stream(
+            "GET",
+            self._url,
+            headers=headers,
+            timeout=600.0,
+        )
+        response = response_cm.__enter__()
+        try:
+            if response.status_code == 503:
+                raise RuntimeError(
+                    "Build artifact storage not configured on the control plane. "
+                    "Cannot download build artifact. Ensure S3_BUCKET is set."
+                )
+            response.raise_for_status()
+            chunks = response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+            if offset and response.status_code == 206:
+                content_range = response.headers.get("Content-Range", "")
+                if not content_range.startswith(f"bytes {offset}-"):
+                    raise RuntimeError(
+                        f"Artifact server resumed at {content_range!r}, "
+                        f"expected byte {offset}"
+                    )
+            elif offset:
+                logger.info(
+                    "Artifact server ignored Range request; skipping %d bytes",
+                    offset,
+                )
+                chunks = _skip_prefix(chunks, offset)
+            if self.total_size is None and "Content-Length" in response.headers:
+                self.total_size = int(response.headers["Content-Length"])
+        except BaseException:
+            response_cm.__exit__(None, None, None)
+            raise
+        self._response_cm = response_cm
+        self._chunks = chunks
+
+    def _close_response(self) -> None:
+        if self._response_cm is not None:
+            response_cm, self._response_cm = self._response_cm, None
+            response_cm.__exit__(None, None, None)
+
+    def _resume(self, reason: str) -> None:
+        """Reopen the download at the last received byte.
+
+        A resume attempt that fails to connect or gets a 5xx uses up one of
+        the remaining attempts rather than failing the download.
+        """
+        self._close_response()
+        while True:
+            if self.resumes >= self._max_resumes:
+                raise RuntimeError(
+                    f"Artifact download failed after {self.resumes} resume attempts "
+                    f"({self.bytes_received} bytes received): {reason}"
+                )
+            self.resumes += 1
+            logger.warning(
+                "Artifact download interrupted at %d bytes (%s); resuming (attempt %d/%d)",
+                self.bytes_received,
+                reason,
+                self.resumes,
+                self._max_resumes,
+            )
+            time.sleep(_DOWNLOAD_RESUME_BACKOFF_SECONDS * self.resumes)
+            try:
+                self._open()
+                return
+            except httpx.TransportError as e:
+                reason = repr(e)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code < 500:
+                    raise
+                reason = f"HTTP {e.response.status_code}"
+
+    def _fill(self) -> bool:
+        """Load the next chunk into the pending buffer. Returns False at EOF."""
+        while not self._pending:
+            try:
+                chunk = next(self._chunks, None)
+            except httpx.TransportError as e:
+                self._resume(repr(e))
+                continue
+            if chunk is None:
+                if (
+                    self.total_size is not None
+                    and self.bytes_received < self.total_size
+                ):
+                    self._resume(
+                        f"body ended at {self.bytes_received} of {self.total_size} bytes"
+                    )
+                    continue
+                return False
+            self._pending = chunk
+            self.bytes_received += len(chunk)
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._fill():
+            return 0
+        view = memoryview(buffer).cast("B")
+        n = min(len(view), len(self._pending))
+        view[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        self._close_response()
+        super().close()
+
+
+def _skip_prefix(chunks: Iterator[bytes], count: int) -> Iterator[bytes]:
+    """Drop the first ``count`` bytes of a chunk iterator."""
+    for chunk in chunks:
+        if count >= len(chunk):
+            count -= len(chunk)
+            continue
+        yield chunk[count:]
+        count = 0
+
+
 def _download_and_extract_artifact(
     build_api_host: str,
     deployment_name: str,
@@ -81,38 +248,69 @@ def _download_and_extract_artifact(
     auth_token: str,
     target_dir: str,
 ) -> None:
-    """Download a pre-built artifact from the Build API and extract into target_dir."""
+    """Download a pre-built artifact from the Build API and extract into target_dir.
+
+    The response body is fed straight into a streaming tar reader, so extraction
+    overlaps with the download and nothing is staged on local disk.
+    """
     url = f"http://{build_api_host}/deployments/{deployment_name}/builds/{build_id}"
     logger.info("Downloading build artifact from %s", url)
 
-    tarball_path = "/tmp/build-artifact-download.tar.gz"
-    with httpx.stream(
-        "GET",
-        url,
-        headers={"Authorization": f"Bearer {auth_token}"},
-        timeout=600.0,
-    ) as response:
-        if response.status_code == 503:
-            raise RuntimeError(
-                "Build artifact storage not configured on the control plane. "
-                "Cannot download build artifact. Ensure S3_BUCKET is set."
-            )
-        response.raise_for_status()
-        with open(tarball_path, "wb") as f:
-            for chunk in response.iter_bytes(chunk_size=65536):
-                f.write(chunk)
+    start = time.monotonic()
+    existing = set(os.listdir(target_dir)) if os.path.isdir(target_dir) else None
+    try:
+        _stream_artifact_into(url, auth_token, target_dir, start)
+    except BaseException:
+        _remove_extracted(target_dir, existing)
+        raise
 
-    tarball_size = os.path.getsize(tarball_path)
-    logger.info("Downloaded artifact: %.1f MB", tarball_size / (1024 * 1024))
 
-    os.makedirs(target_dir, exist_ok=True)
-    logger.info("Extracting artifact...")
-    extract_start = time.monotonic()
-    with tarfile.open(tarball_path, "r:*") as tf:
-        tf.extractall(path=target_dir, filter=_extract_filter)
-    extract_elapsed = time.monotonic() - extract_start
-    logger.info("Extracted artifact into %s (%.1fs)", target_dir, extract_elapsed)
-    os.remove(tarball_path)
+def _remove_extracted(target_dir: str, existing: set[str] | None) -> None:
+    """Remove what a failed extraction left in ``target_dir``.
+
+    Entries that were there before the download are kept, and so is
+    ``target_dir`` itself if it already existed (it may be a volume mount).
+    """
+    if existing is None:
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return
+    with contextlib.suppress(FileNotFoundError):
+        for name in set(os.listdir(target_dir)) - existing:
+            path = os.path.join(target_dir, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
+
+
+def _stream_artifact_into(
+    url: str, auth_token: str, target_dir: str, start: float
+) -> None:
+    with contextlib.closing(_ResumableArtifactStream(url, auth_token)) as raw:
+        connect_elapsed = time.monotonic() - start
+        logger.info(
+            "Connected to artifact download (%.1fs, %s)",
+            connect_elapsed,
+            f"{raw.total_size / (1024 * 1024):.1f} MB"
+            if raw.total_size is not None
+            else "unknown size",
+        )
+        os.makedirs(target_dir, exist_ok=True)
+        stream = io.BufferedReader(raw, buffer_size=_DOWNLOAD_CHUNK_SIZE)
+        with tarfile.open(fileobj=stream, mode="r|*") as tf:
+            tf.extractall(path=target_dir, filter=_extract_filter)
+        elapsed = time.monotonic() - start
+        logger.info(
+            "Downloaded and extracted artifact into %s: %.1f MB in %.1fs "
+            "(connect %.1fs, stream+extract %.1fs, %d resumes)",
+            target_dir,
+            raw.bytes_received / (1024 * 1024),
+            elapsed,
+            connect_elapsed,
+            elapsed - connect_elapsed,
+            raw.resumes,
+        )
 
 
 _TARBALL_EXCLUDE_DIRS = {".git", "node_modules", "__pycache__", ".pnpm-store"}
@@ -2,20 +2,24 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Tuple
+from typing import Any, Callable, Tuple
 from urllib.parse import quote_plus
 
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from llama_agents.appserver.deployment_config_parser import get_deployment_config
 from llama_agents.appserver.settings import ApiserverSettings, settings
+from llama_agents.appserver.stats import run_scheduler_collector
 from llama_agents.appserver.types import generate_id
+from llama_agents.appserver.workers import worker_for
 from llama_agents.appserver.workflow_loader import DEFAULT_SERVICE_ID
 from llama_agents.core.deployment_config import DeploymentConfig
 from llama_agents.server import (
     AbstractWorkflowStore,
     AgentDataStore,
     MemoryWorkflowStore,
+    PersistentHandler,
+    RunScheduler,
     SqliteWorkflowStore,
     WorkflowServer,
 )
@@ -31,6 +35,39 @@ logger = logging.getLogger()
 class DeploymentError(Exception): ...
 
 
+def _local_persistence_path(settings: ApiserverSettings) -> str:
+    return settings.local_persistence_path or "workflows.db"
+
+
+def migrate_shared_store(settings: ApiserverSettings) -> None:
+    """Apply the local sqlite store's migrations before workers open it.
+
+    Workers share one store and start together; migrating it once up front
+    keeps them from applying the same migration concurrently.
+    """
+    if settings.persistence == "local":
+        SqliteWorkflowStore.run_migrations(_local_persistence_path(settings))
+
+
+def _resume_filter(
+    settings: ApiserverSettings,
+) -> Callable[[PersistentHandler], bool] | None:
+    """Resume only this worker's handlers from the shared store on startup.
+
+    Ownership follows the current worker count, so after the count changes
+    each handler is resumed, and routed to, by its new owner.
+    """
+    worker_index = settings.worker_index
+    workers = settings.workers
+    if workers <= 1 or worker_index is None:
+        return None
+
+    def owned(handler: PersistentHandler) -> bool:
+        return worker_for(handler.handler_id, workers) == worker_index
+
+    return owned
+
+
 class Deployment:
     def __init__(
         self,
@@ -99,9 +136,7 @@ class Deployment:
         persistence: AbstractWorkflowStore = MemoryWorkflowStore()
         if settings.persistence == "local":
             logger.info("Using local sqlite persistence for workflows")
-            persistence = SqliteWorkflowStore(
-                settings.local_persistence_path or "workflows.db"
-            )
+            persistence = SqliteWorkflowStore(_local_persistence_path(settings))
         elif settings.persistence == "cloud" or (
             # default to cloud if api key is present to use
             settings.persistence is None and os.getenv("LLAMA_CLOUD_API_KEY")
@@ -128,7 +163,18 @@ class Deployment:
             )
         else:
             logger.info("Not persisting workflows")
-        server = WorkflowServer(workflow_store=persistence)
+        run_scheduler = None
+        if settings.max_concurrent_runs is not None:
+            run_scheduler = RunScheduler(
+                max_concurrent_runs=settings.max_concurrent_runs,
+                max_queued_runs=settings.max_queued_runs,
+            )
+        run_scheduler_collector.scheduler = run_scheduler
+        server = WorkflowServer(
+            workflow_store=persistence,
+            run_scheduler=run_scheduler,
+            resume_filter=_resume_filter(settings),
+        )
         for service_id, workflow in self._workflow_services.items():
             server.add_workflow(service_id, workflow)
         return server
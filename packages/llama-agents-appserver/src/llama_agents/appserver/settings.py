@@ -93,6 +93,31 @@ class ApiserverSettings(BaseSettings):
         description="Agent Data deployment name to use for workflow persistence. May optionally include a `:` delimited collection name, e.g. 'my_agent:my_collection'. Leave none to use the current deployment name. Recommended to override with _public if running locally, and specify a collection name",
     )
 
+    max_concurrent_runs: int | None = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of workflow runs executing at once. Further run requests wait in a queue, and get a 429 response when it is full. Unlimited when unset",
+    )
+    max_queued_runs: int = Field(
+        default=100,
+        ge=0,
+        description="The maximum number of run requests waiting for a slot when max_concurrent_runs is set",
+    )
+
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description="The number of worker processes. Each workflow run is pinned to one worker, and requests for it are routed to that worker",
+    )
+    worker_index: int | None = Field(
+        default=None,
+        description="Set internally in each worker process of a multi-worker server",
+    )
+    worker_socket_dir: str | None = Field(
+        default=None,
+        description="Set internally to the directory holding the workers' Unix sockets",
+    )
+
     @property
     def resolved_config_parent(self) -> Path:
         return resolve_config_parent(self.app_root, self.deployment_file_path)
@@ -110,6 +135,7 @@ def configure_settings(
     local_persistence_path: str | None = None,
     cloud_persistence_name: str | None = None,
     host: str | None = None,
+    workers: int | None = None,
 ) -> None:
     if proxy_ui is not None:
         settings.proxy_ui = proxy_ui
@@ -141,3 +167,6 @@ def configure_settings(
     if host is not None:
         settings.host = host
         os.environ["LLAMA_DEPLOY_APISERVER_HOST"] = host
+    if workers is not None:
+        settings.workers = workers
+        os.environ["LLAMA_DEPLOY_APISERVER_WORKERS"] = str(workers)
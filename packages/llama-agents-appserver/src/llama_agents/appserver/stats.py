@@ -1,4 +1,9 @@
-from prometheus_client import Enum
+from collections.abc import Iterator
+
+from llama_agents.server import RunScheduler
+from prometheus_client import REGISTRY, Enum
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
 
 apiserver_state = Enum(
     "apiserver_state",
@@ -34,3 +39,55 @@ service_state = Enum(
         "ready",
     ],
 )
+
+
+class RunSchedulerCollector(Collector):
+    """Exports the workflow server's run scheduler stats at scrape time."""
+
+    def __init__(self) -> None:
+        self.scheduler: RunScheduler | None = None
+
+    def collect(self) -> Iterator[GaugeMetricFamily | CounterMetricFamily]:
+        if self.scheduler is None:
+            return
+        stats = self.scheduler.stats()
+        running = GaugeMetricFamily(
+            "workflow_runs_running",
+            "Workflow runs holding a run scheduler slot",
+            labels=["workflow_name"],
+        )
+        for workflow_name, count in stats.running_by_workflow.items():
+            running.add_metric([workflow_name], count)
+        yield running
+        queued = GaugeMetricFamily(
+            "workflow_runs_queued",
+            "Workflow run requests waiting for a run scheduler slot",
+            labels=["fairness_key"],
+        )
+        for key, count in stats.queued_by_key.items():
+            queued.add_metric([key], count)
+        yield queued
+        yield CounterMetricFamily(
+            "workflow_runs_admitted",
+            "Workflow runs admitted by the run scheduler",
+            value=stats.admitted_total,
+        )
+        yield CounterMetricFamily(
+            "workflow_runs_rejected",
+            "Workflow run requests rejected by the run scheduler",
+            value=stats.rejected_total,
+        )
+        yield CounterMetricFamily(
+            "workflow_run_queue_wait_seconds",
+            "Total time admitted runs spent waiting for a slot",
+            value=stats.queue_wait_seconds_total,
+        )
+        yield GaugeMetricFamily(
+            "workflow_run_queue_wait_seconds_max",
+            "Longest time an admitted run waited for a slot",
+            value=stats.queue_wait_seconds_max,
+        )
+
+
+run_scheduler_collector = RunSchedulerCollector()
+REGISTRY.register(run_scheduler_collector)
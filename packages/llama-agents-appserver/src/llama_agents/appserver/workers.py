@@ -0,0 +1,426 @@
+"""Multi-process serving with handler-affine routing.
+
+With ``LLAMA_DEPLOY_APISERVER_WORKERS`` above 1, ``start_server`` runs that
+many appserver processes on one listening socket, so CPU-bound steps in one
+run no longer hold up the event loop of every other run. Each handler belongs
+to one worker, picked by a hash of its handler ID. That worker runs it, and
+resumes it on startup from the store all workers share. A request for a
+handler that reaches another worker is forwarded to the owner over the
+owner's Unix socket. New
+runs without a handler ID are handed to the workers in turn, whichever worker
+accepted them: a client that sends everything over one keep-alive connection
+would otherwise put every run on the same worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+import zlib
+from collections.abc import AsyncGenerator, Iterable
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+import httpx
+import uvicorn
+from llama_agents.appserver.settings import settings
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from workflows.utils import _nanoid as nanoid
+
+logger = logging.getLogger(__name__)
+
+APP_PATH = "llama_agents.appserver.app:app"
+
+# Set on forwarded requests so the owner serves them instead of routing again.
+_HOP_HEADER = b"x-llama-deploy-worker-hop"
+# The workflow server's own limit; larger batches are left to it to reject.
+_MAX_BATCH_SIZE = 1000
+# Legacy task and session state lives in memory, so one worker serves it all.
+_LEGACY_WORKER = 0
+
+_HOP_BY_HOP = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",  # codespell:ignore
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "content-length",
+}
+
+_DEPLOYMENT_PATH = re.compile(r"^/deployments/[^/]+(/.*)$")
+_HANDLER_PATH = re.compile(r"^/(?:events|results|handlers)/([^/]+)(?:/cancel)?/?$")
+_RUN_PATH = re.compile(r"^/workflows/[^/]+/(?:run|run-nowait)/?$")
+_RUN_BATCH_PATH = re.compile(r"^/workflows/[^/]+/run-nowait/batch/?$")
+_LEGACY_PATH = re.compile(r"^/(?:tasks|sessions)(?:/|$)")
+
+
+def worker_for(handler_id: str, workers: int) -> int:
+    """Return the index of the worker that owns ``handler_id``."""
+    return zlib.crc32(handler_id.encode()) % workers
+
+
+def mint_handler_id(worker_index: int, workers: int) -> str:
+    """Return a fresh handler ID owned by ``worker_index``."""
+    while True:
+        handler_id = nanoid()
+        if worker_for(handler_id, workers) == worker_index:
+            return handler_id
+
+
+def worker_socket_path(socket_dir: str | Path, worker_index: int) -> str:
+    return str(Path(socket_dir) / f"worker-{worker_index}.sock")
+
+
+class WorkerRoutingMiddleware:
+    """Send each workflow-server request to the worker that owns its handler.
+
+    Handler-scoped requests (``/events/{id}``, ``/results/{id}``,
+    ``/handlers/{id}`` and cancel) go to the owner. Runs and batches are split
+    by the handler IDs in their bodies. ``GET /handlers`` is answered by all
+    workers and merged. Everything else is served where it lands.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        worker_index: int,
+        workers: int,
+        socket_dir: str | Path,
+    ) -> None:
+        self.app = app
+        self.worker_index = worker_index
+        self.workers = workers
+        self.socket_dir = socket_dir
+        self._clients: dict[int, httpx.AsyncClient] = {}
+        self._next_owner = worker_index
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or _HOP_HEADER in dict(scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        match = _DEPLOYMENT_PATH.match(scope["path"])
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+
+        path = match.group(1)
+        method = scope["method"]
+        if handler_match := _HANDLER_PATH.match(path):
+            owner = worker_for(handler_match.group(1), self.workers)
+        elif _LEGACY_PATH.match(path):
+            owner = _LEGACY_WORKER
+        elif method == "POST" and _RUN_PATH.match(path):
+            await self._route_run(scope, receive, send)
+            return
+        elif method == "POST" and _RUN_BATCH_PATH.match(path):
+            await self._route_batch(scope, receive, send, "runs", mint=True)
+            return
+        elif method == "POST" and path.rstrip("/") == "/events":
+            await self._route_batch(scope, receive, send, "events", mint=False)
+            return
+        elif method == "GET" and path.rstrip("/") == "/handlers":
+            await self._list_handlers(scope, receive, send)
+            return
+        else:
+            owner = self.worker_index
+
+        if owner == self.worker_index:
+            await self.app(scope, receive, send)
+        else:
+            body = await _read_body(receive)
+            await self._forward(owner, scope, body, receive, send)
+
+    async def _route_run(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = await _read_body(receive)
+        payload = _json_or_none(body)
+        if not isinstance(payload, dict):
+            await self._serve_locally(scope, body, receive, send)
+            return
+        handler_id = payload.get("handler_id")
+        if not handler_id:
+            payload["handler_id"] = self._assign()
+            body = json.dumps(payload).encode()
+        owner = (
+            worker_for(payload["handler_id"], self.workers)
+            if isinstance(payload["handler_id"], str)
+            else self.worker_index
+        )
+        if owner == self.worker_index:
+            await self._serve_locally(scope, body, receive, send)
+        else:
+            await self._forward(owner, scope, body, receive, send)
+
+    async def _route_batch(
+        self, scope: Scope, receive: Receive, send: Send, key: str, *, mint: bool
+    ) -> None:
+        body = await _read_body(receive)
+        payload = _json_or_none(body)
+        items = payload.get(key) if isinstance(payload, dict) else None
+        if not isinstance(items, list) or len(items) > _MAX_BATCH_SIZE:
+            await self._serve_locally(scope, body, receive, send)
+            return
+        assert isinstance(payload, dict)
+
+        # worker -> indices of its items in the batch
+        groups: dict[int, list[int]] = {}
+        for index, item in enumerate(items):
+            owner = self.worker_index
+            if isinstance(item, dict):
+                handler_id = item.get("handler_id")
+                if isinstance(handler_id, str) and handler_id:
+                    owner = worker_for(handler_id, self.workers)
+                elif mint and not handler_id:
+                    item["handler_id"] = self._assign()
+                    owner = worker_for(item["handler_id"], self.workers)
+            groups.setdefault(owner, []).append(index)
+
+        if set(groups) <= {self.worker_index}:
+            await self._serve_locally(
+                scope, json.dumps(payload).encode(), receive, send
+            )
+            return
+
+        async def post(worker: int, indices: list[int]) -> httpx.Response:
+            part = {**payload, key: [items[index] for index in indices]}
+            return await self._request(worker, scope, json.dumps(part).encode())
+
+        responses = await asyncio.gather(
+            *(post(worker, indices) for worker, indices in groups.items())
+        )
+        results: list[Any] = [None] * len(items)
+        for indices, response in zip(groups.values(), responses):
+            if response.status_code != 200:
+                await _send_buffered(response, scope, receive, send)
+                return
+            for index, result in zip(indices, response.json()["results"]):
+                results[index] = result
+        await JSONResponse({"results": results})(scope, receive, send)
+
+    async def _list_handlers(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Merge each worker's own handlers.
+
+        Every worker lists the shared store, but only the owner knows the
+        live state of its runs; without persistence, only the owner has them
+        at all.
+        """
+        responses = await asyncio.gather(
+            *(self._request(worker, scope, b"") for worker in range(self.workers))
+        )
+        handlers: list[Any] = []
+        for worker, response in enumerate(responses):
+            if response.status_code != 200:
+                await _send_buffered(response, scope, receive, send)
+                return
+            handlers.extend(
+                handler
+                for handler in response.json()["handlers"]
+                if worker_for(handler["handler_id"], self.workers) == worker
+            )
+        await JSONResponse({"handlers": handlers})(scope, receive, send)
+
+    def _assign(self) -> str:
+        """Return a handler ID for a new run, owned by the next worker in turn."""
+        owner = self._next_owner
+        self._next_owner = (owner + 1) % self.workers
+        return mint_handler_id(owner, self.workers)
+
+    async def _serve_locally(
+        self, scope: Scope, body: bytes, receive: Receive, send: Send
+    ) -> None:
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name.lower() != b"content-length"
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        sent = False
+
+        async def replay() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app({**scope, "headers": headers}, replay, send)
+
+    def _client(self, worker: int) -> httpx.AsyncClient:
+        client = self._clients.get(worker)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    uds=worker_socket_path(self.socket_dir, worker)
+                ),
+                base_url="http://worker",
+                timeout=None,
+            )
+            self._clients[worker] = client
+        return client
+
+    def _build_request(self, worker: int, scope: Scope, body: bytes) -> httpx.Request:
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name.decode("latin-1").lower() not in _HOP_BY_HOP
+        ]
+        headers.append((_HOP_HEADER, b"1"))
+        raw_path = scope.get("raw_path")
+        url = raw_path.decode("latin-1") if raw_path else scope["path"]
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        return self._client(worker).build_request(
+            scope["method"], url, headers=headers, content=body
+        )
+
+    async def _request(self, worker: int, scope: Scope, body: bytes) -> httpx.Response:
+        request = self._build_request(worker, scope, body)
+        return await self._client(worker).send(request)
+
+    async def _forward(
+        self, worker: int, scope: Scope, body: bytes, receive: Receive, send: Send
+    ) -> None:
+        """Relay the request to ``worker`` and stream its response back."""
+        client = self._client(worker)
+        upstream = await client.send(
+            self._build_request(worker, scope, body), stream=True
+        )
+
+        async def upstream_body() -> AsyncGenerator[bytes, None]:
+            try:
+                async for chunk in upstream.aiter_raw():
+                    yield chunk
+            finally:
+                await upstream.aclose()
+
+        response = StreamingResponse(
+            upstream_body(),
+            status_code=upstream.status_code,
+            headers=_response_headers(upstream.headers.multi_items()),
+        )
+        await response(scope, receive, send)
+
+
+def _response_headers(headers: Iterable[tuple[str, str]]) -> dict[str, str]:
+    return {name: value for name, value in headers if name.lower() not in _HOP_BY_HOP}
+
+
+async def _send_buffered(
+    response: httpx.Response, scope: Scope, receive: Receive, send: Send
+) -> None:
+    await Response(
+        response.content,
+        status_code=response.status_code,
+        headers=_response_headers(response.headers.multi_items()),
+    )(scope, receive, send)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _json_or_none(body: bytes) -> Any:
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def _run_worker(
+    worker_index: int, sockets: list[socket.socket], config: dict[str, Any]
+) -> None:
+    # Set before uvicorn imports the app, which reads it to add the routing.
+    os.environ["LLAMA_DEPLOY_APISERVER_WORKER_INDEX"] = str(worker_index)
+    settings.worker_index = worker_index
+    uvicorn.Server(uvicorn.Config(APP_PATH, **config)).run(sockets=sockets)
+
+
+def run_workers(workers: int, *, host: str, port: int, **config: Any) -> None:
+    """Serve the app from ``workers`` processes until interrupted.
+
+    The public socket and one Unix socket per worker are bound here, before
+    any worker starts, so a worker that crashes is restarted on the same
+    sockets and no request to it is refused in the meantime.
+    """
+    socket_dir = tempfile.mkdtemp(prefix="llama-deploy-workers-")
+    os.environ["LLAMA_DEPLOY_APISERVER_WORKERS"] = str(workers)
+    os.environ["LLAMA_DEPLOY_APISERVER_WORKER_SOCKET_DIR"] = socket_dir
+    settings.workers = workers
+    settings.worker_socket_dir = socket_dir
+
+    public = uvicorn.Config(APP_PATH, host=host, port=port).bind_socket()
+    internal: list[socket.socket] = []
+    for worker_index in range(workers):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(worker_socket_path(socket_dir, worker_index))
+        sock.listen(2048)
+        internal.append(sock)
+
+    spawn = multiprocessing.get_context("spawn")
+
+    def start(worker_index: int) -> BaseProcess:
+        process = spawn.Process(
+            target=_run_worker,
+            args=(worker_index, [public, internal[worker_index]], config),
+            name=f"appserver-worker-{worker_index}",
+        )
+        process.start()
+        return process
+
+    stopping = threading.Event()
+
+    def stop(signum: int, frame: FrameType | None) -> None:
+        stopping.set()
+
+    previous = {
+        signum: signal.signal(signum, stop)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    logger.info(f"Starting {workers} appserver workers on {host}:{port}")
+    processes = [start(worker_index) for worker_index in range(workers)]
+    try:
+        while not stopping.wait(0.5):
+            for worker_index, process in enumerate(processes):
+                if not process.is_alive() and not stopping.is_set():
+                    logger.warning(
+                        f"Appserver worker {worker_index} exited with code "
+                        f"{process.exitcode}, restarting"
+                    )
+                    processes[worker_index] = start(worker_index)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        for sock in (public, *internal):
+            sock.close()
+        shutil.rmtree(socket_dir, ignore_errors=True)
@@ -99,6 +99,44 @@ def test_start_server_proxies_ui_and_terminates(
     assert proc.terminated is True
 
 
+def test_start_server_runs_workers_when_configured(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_deployment_file: Callable[..., Path],
+) -> None:
+    deployment_path = make_deployment_file()
+    settings.app_root = tmp_path
+    settings.deployment_file_path = Path(deployment_path.name)
+    # Restored after the test; start_server writes both.
+    monkeypatch.setattr(settings, "workers", 1)
+    monkeypatch.setenv("LLAMA_DEPLOY_APISERVER_WORKERS", "1")
+
+    calls: list[tuple[int, dict[str, Any]]] = []
+    monkeypatch.setattr(
+        "llama_agents.appserver.app.run_workers",
+        lambda workers, **kwargs: calls.append((workers, kwargs)),
+    )
+
+    def _fail_run(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("uvicorn.run should not be called with workers > 1")
+
+    monkeypatch.setattr("llama_agents.appserver.app.uvicorn.run", _fail_run)
+
+    start_server(
+        cwd=tmp_path,
+        deployment_file=deployment_path,
+        configure_logging=False,
+        workers=3,
+    )
+
+    assert settings.workers == 3
+    assert len(calls) == 1
+    workers, kwargs = calls[0]
+    assert workers == 3
+    assert kwargs["host"] == settings.host
+    assert kwargs["port"] == settings.port
+
+
 def test_prepare_server_calls_install_and_build_when_flags_set(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1,6 +1,11 @@
+import io
+import os
+import tarfile
+from collections.abc import Iterator
 from pathlib import Path
 from unittest import mock
 
+import httpx
 import pytest
 from llama_agents.appserver.bootstrap import (
     _artifact_exists,
@@ -440,3 +445,144 @@ def test_download_artifact_raises_on_503() -> None:
             _download_and_extract_artifact(
                 "host:8000", "dep1", "build1", "tok", "/tmp/test-target"
             )
+
+
+def _make_artifact(tmp_path: Path) -> bytes:
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "pkg" / "main.py").write_text("print('hi')\n")
+    (src / "big.bin").write_bytes(bytes(range(256)) * 2048)
+    (src / "link").symlink_to("/usr/local/bin/python3")
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        tf.add(src, arcname=".")
+    return buf.getvalue()
+
+
+class _FakeStream:
+    """Stand-in for ``httpx.stream`` serving ``data`` with scripted failures."""
+
+    def __init__(
+        self,
+        data: bytes,
+        fail_at: list[int],
+        honor_range: bool = True,
+        open_errors: list[Exception | None] | None = None,
+    ) -> None:
+        self.data = data
+        self.fail_at = fail_at
+        self.honor_range = honor_range
+        self.open_errors = open_errors or []
+        self.range_headers: list[str | None] = []
+
+    def __call__(
+        self, method: str, url: str, headers: dict[str, str], timeout: float
+    ) -> mock.Mock:
+        range_header = headers.get("Range")
+        self.range_headers.append(range_header)
+        open_error = self.open_errors.pop(0) if self.open_errors else None
+        if open_error is not None:
+            raise open_error
+        start = 0
+        status = 200
+        if range_header is not None and self.honor_range:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            status = 206
+        fail_at = self.fail_at.pop(0) if self.fail_at else None
+
+        def iter_bytes(chunk_size: int) -> Iterator[bytes]:
+            pos = start
+            while pos < len(self.data):
+                if fail_at is not None and pos >= fail_at:
+                    raise httpx.ReadError("connection reset")
+                yield self.data[pos : pos + 1000]
+                pos += 1000
+
+        response = mock.Mock(status_code=status)
+        response.headers = {"Content-Length": str(len(self.data) - start)}
+        if status == 206:
+            response.headers["Content-Range"] = (
+                f"bytes {start}-{len(self.data) - 1}/{len(self.data)}"
+            )
+        response.iter_bytes = iter_bytes
+        response.__enter__ = mock.Mock(return_value=response)
+        response.__exit__ = mock.Mock(return_value=False)
+        return response
+
+
+@pytest.mark.parametrize("honor_range", [True, False])
+def test_download_artifact_extracts_while_streaming_and_resumes(
+    tmp_path: Path, honor_range: bool
+) -> None:
+    data = _make_artifact(tmp_path)
+    fake = _FakeStream(
+        data, fail_at=[len(data) // 3, 2 * len(data) // 3], honor_range=honor_range
+    )
+    target = tmp_path / "target"
+    with (
+        mock.patch("llama_agents.appserver.bootstrap.httpx.stream", new=fake),
+        mock.patch("llama_agents.appserver.bootstrap.time.sleep"),
+    ):
+        _download_and_extract_artifact(
+            "host:8000", "dep1", "build1", "tok", str(target)
+        )
+
+    assert (target / "pkg" / "main.py").read_text() == "print('hi')\n"
+    assert (target / "big.bin").read_bytes() == bytes(range(256)) * 2048
+    assert os.readlink(target / "link") == "/usr/local/bin/python3"
+    assert fake.range_headers[0] is None
+    assert len(fake.range_headers) == 3
+    assert all(h is not None and h.startswith("bytes=") for h in fake.range_headers[1:])
+    assert not os.path.exists("/tmp/build-artifact-download.tar.gz")
+
+
+def test_download_artifact_gives_up_after_max_resumes(tmp_path: Path) -> None:
+    data = _make_artifact(tmp_path)
+    fake = _FakeStream(data, fail_at=[1000] * 10)
+    with (
+        mock.patch("llama_agents.appserver.bootstrap.httpx.stream", new=fake),
+        mock.patch("llama_agents.appserver.bootstrap.time.sleep"),
+    ):
+        with pytest.raises(RuntimeError, match="resume attempts"):
+            _download_and_extract_artifact(
+                "host:8000", "dep1", "build1", "tok", str(tmp_path / "target")
+            )
+
+
+def test_download_artifact_retries_failed_resume_attempts(tmp_path: Path) -> None:
+    data = _make_artifact(tmp_path)
+    fake = _FakeStream(
+        data,
+        fail_at=[len(data) // 2],
+        open_errors=[None, httpx.ConnectError("refused"), httpx.ConnectError("again")],
+    )
+    target = tmp_path / "target"
+    with (
+        mock.patch("llama_agents.appserver.bootstrap.httpx.stream", new=fake),
+        mock.patch("llama_agents.appserver.bootstrap.time.sleep"),
+    ):
+        _download_and_extract_artifact(
+            "host:8000", "dep1", "build1", "tok", str(target)
+        )
+
+    assert (target / "big.bin").read_bytes() == bytes(range(256)) * 2048
+    assert len(fake.range_headers) == 4
+    assert len(set(fake.range_headers[1:])) == 1
+
+
+def test_download_artifact_failure_removes_extracted_files(tmp_path: Path) -> None:
+    data = _make_artifact(tmp_path)
+    fake = _FakeStream(data, fail_at=[len(data) - 1000] * 10)
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep.txt").write_text("mounted before the download")
+    with (
+        mock.patch("llama_agents.appserver.bootstrap.httpx.stream", new=fake),
+        mock.patch("llama_agents.appserver.bootstrap.time.sleep"),
+    ):
+        with pytest.raises(RuntimeError, match="resume attempts"):
+            _download_and_extract_artifact(
+                "host:8000", "dep1", "build1", "tok", str(target)
+            )
+
+    assert os.listdir(target) == ["keep.txt"]
@@ -4,6 +4,10 @@ from unittest import mock
 
 import pytest
 from llama_agents.appserver.deployment import Deployment
+from llama_agents.appserver.settings import ApiserverSettings
+from llama_agents.appserver.workers import mint_handler_id
+from llama_agents.server import PersistentHandler
+from prometheus_client import generate_latest
 from workflows import Context, Workflow
 from workflows.handler import WorkflowHandler
 
@@ -77,3 +81,56 @@ def test_run_workflow_no_wait_with_session(tmp_path: Path) -> None:
     assert sid == "sid"
     assert d._handlers[hid] is handler
     wf.run.assert_called_once()
+
+
+def test_workers_share_the_store_and_resume_only_their_handlers(
+    tmp_path: Path,
+) -> None:
+    config = mock.MagicMock()
+    config.name = "app"
+    path = str(tmp_path / "workflows.db")
+    servers = [
+        Deployment(workflows={}).create_workflow_server(
+            config,
+            ApiserverSettings(
+                persistence="local",
+                local_persistence_path=path,
+                workers=3,
+                worker_index=worker,
+            ),
+        )
+        for worker in range(3)
+    ]
+    assert {server._workflow_store.db_path for server in servers} == {path}  # type: ignore[attr-defined]
+
+    handler = PersistentHandler(
+        handler_id=mint_handler_id(1, 3), workflow_name="wf", status="running"
+    )
+    resumes = []
+    for server in servers:
+        persistence = server._runtime_core._persistence
+        assert persistence is not None
+        resume_filter = persistence._resume_filter
+        assert resume_filter is not None
+        resumes.append(resume_filter(handler))
+    assert resumes == [False, True, False]
+
+    single = Deployment(workflows={}).create_workflow_server(
+        config, ApiserverSettings(persistence="local", local_persistence_path=path)
+    )
+    assert single._runtime_core._persistence is not None
+    assert single._runtime_core._persistence._resume_filter is None
+
+
+def test_run_scheduler_stats_are_exported_as_metrics() -> None:
+    config = mock.MagicMock()
+    config.name = "app"
+    server = Deployment(workflows={}).create_workflow_server(
+        config, ApiserverSettings(persistence="memory", max_concurrent_runs=2)
+    )
+    assert server.run_scheduler is not None
+    server.run_scheduler.claim("wf")
+
+    metrics = generate_latest().decode()
+    assert 'workflow_runs_running{workflow_name="wf"} 1.0' in metrics
+    assert "workflow_runs_admitted_total 1.0" in metrics
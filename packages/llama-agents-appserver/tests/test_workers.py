@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import AsyncIterator, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+import uvicorn
+from llama_agents.appserver.workers import (
+    WorkerRoutingMiddleware,
+    mint_handler_id,
+    worker_for,
+    worker_socket_path,
+)
+from llama_agents.server import (
+    AbstractWorkflowStore,
+    SqliteWorkflowStore,
+    WorkflowServer,
+)
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from workflows import Context, Workflow, step
+from workflows.context.serializers import JsonSerializer
+from workflows.events import (
+    HumanResponseEvent,
+    InputRequiredEvent,
+    StartEvent,
+    StopEvent,
+)
+
+WORKERS = 3
+
+
+class Question(InputRequiredEvent):
+    message: str
+
+
+class Answer(HumanResponseEvent):
+    response: str
+
+
+class AskWorkflow(Workflow):
+    @step
+    async def ask(self, ctx: Context, ev: StartEvent) -> Question:
+        return Question(message="ping")
+
+    @step
+    async def answer(self, ctx: Context, ev: Answer) -> StopEvent:
+        return StopEvent(result=f"received: {ev.response}")
+
+
+def _answer(response: str) -> dict:
+    return {"event": JsonSerializer().serialize_value(Answer(response=response))}
+
+
+class Workers:
+    def __init__(self, socket_dir: Path) -> None:
+        self.socket_dir = socket_dir
+
+    def client(self, worker: int) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                uds=worker_socket_path(self.socket_dir, worker)
+            ),
+            base_url="http://test/deployments/app",
+        )
+
+
+@asynccontextmanager
+async def _serve_workers(
+    tmp_path: Path, store: Callable[[], AbstractWorkflowStore | None]
+) -> AsyncIterator[Workers]:
+    cluster = Workers(tmp_path)
+    async with AsyncExitStack() as stack:
+        uvicorn_servers: list[uvicorn.Server] = []
+        tasks: list[asyncio.Task[None]] = []
+        for worker in range(WORKERS):
+            server = WorkflowServer(workflow_store=store())
+            server.add_workflow("ask", AskWorkflow())
+            await stack.enter_async_context(server.contextmanager())
+
+            app = WorkerRoutingMiddleware(
+                Starlette(routes=[Mount("/deployments/{name}", app=server.app)]),
+                worker_index=worker,
+                workers=WORKERS,
+                socket_dir=tmp_path,
+            )
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(worker_socket_path(tmp_path, worker))
+            uvicorn_server = uvicorn.Server(
+                uvicorn.Config(app, lifespan="off", log_config=None)
+            )
+            uvicorn_servers.append(uvicorn_server)
+            tasks.append(asyncio.create_task(uvicorn_server.serve(sockets=[sock])))
+
+        while not all(s.started for s in uvicorn_servers):
+            await asyncio.sleep(0.01)
+        try:
+            yield cluster
+        finally:
+            for uvicorn_server in uvicorn_servers:
+                uvicorn_server.should_exit = True
+            await asyncio.gather(*tasks)
+
+
+@pytest_asyncio.fixture
+async def workers(tmp_path: Path) -> AsyncIterator[Workers]:
+    # Without persistence each worker keeps its handlers in memory.
+    async with _serve_workers(tmp_path, lambda: None) as cluster:
+        yield cluster
+
+
+@pytest_asyncio.fixture
+async def shared_store_workers(tmp_path: Path) -> AsyncIterator[Workers]:
+    # One store file opened by every worker, as with local persistence.
+    path = str(tmp_path / "workflows.db")
+    SqliteWorkflowStore.run_migrations(path)
+    async with _serve_workers(
+        tmp_path, lambda: SqliteWorkflowStore(path, poll_interval=0.05)
+    ) as cluster:
+        yield cluster
+
+
+def test_minted_handler_ids_belong_to_their_worker() -> None:
+    for worker in range(WORKERS):
+        handler_id = mint_handler_id(worker, WORKERS)
+        assert worker_for(handler_id, WORKERS) == worker
+    # Ownership is stable across processes, unlike hash().
+    assert worker_for("handler-1", WORKERS) == worker_for("handler-1", WORKERS)
+
+
+@pytest.mark.asyncio
+async def test_handler_requests_reach_the_owning_worker(workers: Workers) -> None:
+    handler_id = mint_handler_id(2, WORKERS)
+    async with workers.client(0) as entry, workers.client(1) as other:
+        response = await entry.post(
+            "/workflows/ask/run-nowait", json={"handler_id": handler_id}
+        )
+        assert response.status_code == 200
+        assert response.json()["handler_id"] == handler_id
+
+        # Only the owner has the handler.
+        direct = await entry.get(
+            f"/handlers/{handler_id}", headers={"x-llama-deploy-worker-hop": "1"}
+        )
+        assert direct.status_code == 404
+
+        async with other.stream(
+            "GET", f"/events/{handler_id}?sse=false&after_sequence=-1"
+        ) as stream:
+            lines = stream.aiter_lines()
+            async for line in lines:
+                if "Question" in line:
+                    break
+            response = await other.post(f"/events/{handler_id}", json=_answer("hi"))
+            assert response.status_code == 200
+            rest = [line async for line in lines]
+        assert "StopEvent" in rest[-1]
+
+        response = await entry.get(f"/handlers/{handler_id}?wait=5")
+        assert response.status_code == 200
+        assert response.json()["result"]["value"]["result"] == "received: hi"
+
+
+@pytest.mark.asyncio
+async def test_new_runs_are_spread_across_workers(workers: Workers) -> None:
+    # One connection reaches one worker, which hands new runs out in turn.
+    async with workers.client(1) as client:
+        owners = []
+        for _ in range(WORKERS):
+            response = await client.post("/workflows/ask/run-nowait", json={})
+            assert response.status_code == 200
+            handler_id = response.json()["handler_id"]
+            owners.append(worker_for(handler_id, WORKERS))
+            response = await client.get(f"/handlers/{handler_id}")
+            assert response.status_code == 202
+    assert owners == [1, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_batches_and_listing_span_workers(workers: Workers) -> None:
+    owned = [mint_handler_id(worker, WORKERS) for worker in (2, 0, 1)]
+    async with workers.client(0) as client:
+        response = await client.post(
+            "/workflows/ask/run-nowait/batch",
+            json={"runs": [{"handler_id": handler_id} for handler_id in owned] + [{}]},
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["status_code"] for result in results] == [200] * 4
+        assert [result["handler"]["handler_id"] for result in results[:3]] == owned
+        minted = results[3]["handler"]["handler_id"]
+
+        response = await client.get("/handlers")
+        assert response.status_code == 200
+        listed = {handler["handler_id"] for handler in response.json()["handlers"]}
+        assert listed == {*owned, minted}
+
+        response = await client.post(
+            "/events",
+            json={
+                "events": [
+                    {"handler_id": handler_id, **_answer(handler_id)}
+                    for handler_id in owned
+                ]
+                + [{"handler_id": "missing", **_answer("x")}]
+            },
+        )
+        assert response.status_code == 200
+        assert [
+            (result["handler_id"], result["status_code"])
+            for result in response.json()["results"]
+        ] == [*((handler_id, 200) for handler_id in owned), ("missing", 404)]
+
+        response = await client.post(f"/handlers/{minted}/cancel")
+        assert response.status_code == 200
+        for handler_id in owned:
+            response = await client.get(f"/handlers/{handler_id}?wait=5")
+            assert response.json()["result"]["value"]["result"] == (
+                f"received: {handler_id}"
+            )
+
+
+@pytest.mark.asyncio
+async def test_shared_store_lists_each_handler_once(
+    shared_store_workers: Workers,
+) -> None:
+    owned = [mint_handler_id(worker, WORKERS) for worker in range(WORKERS)]
+    async with shared_store_workers.client(1) as client:
+        for handler_id in owned:
+            response = await client.post(
+                "/workflows/ask/run-nowait", json={"handler_id": handler_id}
+            )
+            assert response.status_code == 200
+
+        response = await client.get("/handlers")
+        assert response.status_code == 200
+        listed = [handler["handler_id"] for handler in response.json()["handlers"]]
+        assert sorted(listed) == sorted(owned)
+
+        for handler_id in owned:
+            response = await client.post(
+                f"/events/{handler_id}", json=_answer(handler_id)
+            )
+            assert response.status_code == 200
+            response = await client.get(f"/handlers/{handler_id}?wait=5")
+            assert response.json()["result"]["value"]["result"] == (
+                f"received: {handler_id}"
+            )
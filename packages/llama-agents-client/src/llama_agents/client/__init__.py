@@ -1,9 +1,13 @@
-from .client import EventStream, WorkflowClient
+from .client import EventStream, RawEventEnvelope, WorkflowClient
 from .protocol import (
     CancelHandlerResponse,
     HandlerData,
     HandlersListResponse,
+    RunWorkflowResult,
+    RunWorkflowsResponse,
     SendEventResponse,
+    SendEventResult,
+    SendEventsResponse,
     WorkflowEventsListResponse,
     WorkflowGraphResponse,
     WorkflowSchemaResponse,
@@ -16,7 +20,12 @@ __all__ = [
     "EventStream",
     "HandlerData",
     "HandlersListResponse",
+    "RawEventEnvelope",
+    "RunWorkflowResult",
+    "RunWorkflowsResponse",
     "SendEventResponse",
+    "SendEventResult",
+    "SendEventsResponse",
     "WorkflowEventsListResponse",
     "WorkflowGraphResponse",
     "WorkflowSchemaResponse",
@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
+import random
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import (
     Any,
     AsyncGenerator,
     AsyncIterator,
+    Generic,
+    Iterable,
     Literal,
+    TypeVar,
     overload,
 )
 
@@ -23,7 +29,11 @@ from .protocol import (
     HandlerData,
     HandlersListResponse,
     HealthResponse,
+    RunWorkflowResult,
+    RunWorkflowsResponse,
     SendEventResponse,
+    SendEventResult,
+    SendEventsResponse,
     Status,
     WorkflowEventsListResponse,
     WorkflowGraphResponse,
@@ -35,6 +45,12 @@ from .protocol.serializable_events import (
     EventEnvelopeWithMetadata,
 )
 
+# Pause before re-polling a handler the server reported early as running.
+_WAIT_RETRY_DELAY = 1.0
+
+# Most items the server accepts in one batch request.
+_MAX_BATCH_SIZE = 1000
+
 
 def _raise_for_status_with_body(response: httpx.Response) -> None:
     """
@@ -58,9 +74,31 @@ def _raise_for_status_with_body(response: httpx.Response) -> None:
 
 
 @dataclass(frozen=True)
-class _QueuedEvent:
+class RawEventEnvelope:
+    """An event from ``get_workflow_events(..., decode=False)``, not yet parsed.
+
+    ``data`` is the envelope's JSON as sent by the server. Decode only what
+    is needed: ``json()`` parses it to a dict, ``decode()`` validates it
+    into an ``EventEnvelopeWithMetadata``.
+    """
+
     sequence: int | Literal["now"]
-    event: EventEnvelopeWithMetadata
+    data: str
+
+    def json(self) -> dict[str, Any]:
+        return json.loads(self.data)
+
+    def decode(self) -> EventEnvelopeWithMetadata:
+        return EventEnvelopeWithMetadata.model_validate_json(self.data)
+
+
+_EventT = TypeVar("_EventT", EventEnvelopeWithMetadata, RawEventEnvelope)
+
+
+@dataclass(frozen=True)
+class _QueuedEvent(Generic[_EventT]):
+    sequence: int | Literal["now"]
+    event: _EventT
 
 
 @dataclass(frozen=True)
@@ -73,10 +111,17 @@ class _QueuedDone:
     pass
 
 
-_QueueItem = _QueuedEvent | _QueuedError | _QueuedDone
+_QueueItem = _QueuedEvent[Any] | _QueuedError | _QueuedDone
+
 
+def _reconnect_delay(attempt: int, base: float, cap: float) -> float:
+    """Jittered exponential backoff: ``base * 2**(attempt - 1)``, capped, then
+    scaled by a random factor in [0.5, 1] so clients do not reconnect in step."""
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay * random.uniform(0.5, 1.0)
 
-class EventStream:
+
+class EventStream(Generic[_EventT]):
     """Async iterator over workflow events that exposes the current stream position.
 
     Returned by ``WorkflowClient.get_workflow_events()``. Use
@@ -90,6 +135,9 @@ class EventStream:
         stream = client.get_workflow_events(
             handler_id, after_sequence=stream.last_sequence
         )
+
+    Yields ``EventEnvelopeWithMetadata`` by default, or ``RawEventEnvelope``
+    when the stream was opened with ``decode=False``.
     """
 
     def __init__(
@@ -109,13 +157,13 @@ class EventStream:
         initial ``after_sequence`` value if no events have been yielded yet."""
         return self._last_sequence
 
-    def __aiter__(self) -> AsyncIterator[EventEnvelopeWithMetadata]:
+    def __aiter__(self) -> AsyncIterator[_EventT]:
         if self._iter_started:
             raise RuntimeError("EventStream can only be iterated once")
         self._iter_started = True
         return self._iterate()
 
-    async def _iterate(self) -> AsyncGenerator[EventEnvelopeWithMetadata, None]:
+    async def _iterate(self) -> AsyncGenerator[_EventT, None]:
         try:
             while True:
                 item = await self._queue.get()
@@ -346,13 +394,104 @@ class WorkflowClient:
 
             return HandlerData.model_validate(response.json())
 
+    async def run_workflows_nowait(
+        self,
+        workflow_name: str,
+        start_events: Iterable[StartEvent | dict[str, Any] | None],
+        handler_ids: Iterable[str | None] | None = None,
+        *,
+        batch_size: int = _MAX_BATCH_SIZE,
+    ) -> list[RunWorkflowResult]:
+        """Start many runs of a workflow without waiting for completion.
+
+        Runs are sent ``batch_size`` per request. A run that fails to start
+        does not fail the call: each run gets a ``RunWorkflowResult``, in
+        input order, carrying either its ``HandlerData`` or the status code
+        and detail ``run_workflow_nowait`` would have raised.
+
+        Args:
+            workflow_name: Name of the registered workflow to run.
+            start_events: One input event per run, as a ``StartEvent``, a
+                plain dict, or ``None`` for a default ``StartEvent``.
+            handler_ids: Optional handler identifier per run, matching
+                ``start_events`` one to one. ``None`` entries get a new one.
+            batch_size: Runs per request, at most 1000.
+        """
+        if not 1 <= batch_size <= _MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {_MAX_BATCH_SIZE}")
+        runs: list[dict[str, Any]] = []
+        for start_event in start_events:
+            try:
+                serialized = _serialize_event(
+                    start_event if start_event is not None else StartEvent()
+                )
+            except Exception as e:
+                raise ValueError(
+                    f"Impossible to serialize the start event because of: {e}"
+                )
+            runs.append({"start_event": serialized})
+        if handler_ids is not None:
+            ids = list(handler_ids)
+            if len(ids) != len(runs):
+                raise ValueError(
+                    f"Got {len(ids)} handler_ids for {len(runs)} start_events"
+                )
+            for run, handler_id in zip(runs, ids):
+                if handler_id:
+                    run["handler_id"] = handler_id
+
+        results: list[RunWorkflowResult] = []
+        async with self._get_client() as client:
+            for start in range(0, len(runs), batch_size):
+                response = await client.post(
+                    f"/workflows/{workflow_name}/run-nowait/batch",
+                    json={"runs": runs[start : start + batch_size]},
+                )
+                _raise_for_status_with_body(response)
+                results.extend(
+                    RunWorkflowsResponse.model_validate(response.json()).results
+                )
+        return results
+
+    @overload
+    def get_workflow_events(
+        self,
+        handler_id: str,
+        include_internal_events: bool = ...,
+        after_sequence: int | Literal["now"] = ...,
+        max_reconnect_attempts: int = ...,
+        *,
+        reconnect_delay: float = ...,
+        max_reconnect_delay: float = ...,
+        max_buffered_events: int = ...,
+        decode: Literal[True] = ...,
+    ) -> EventStream[EventEnvelopeWithMetadata]: ...
+    @overload
+    def get_workflow_events(
+        self,
+        handler_id: str,
+        include_internal_events: bool = ...,
+        after_sequence: int | Literal["now"] = ...,
+        max_reconnect_attempts: int = ...,
+        *,
+        reconnect_delay: float = ...,
+        max_reconnect_delay: float = ...,
+        max_buffered_events: int = ...,
+        decode: Literal[False],
+    ) -> EventStream[RawEventEnvelope]: ...
+
     def get_workflow_events(
         self,
         handler_id: str,
         include_internal_events: bool = False,
         after_sequence: int | Literal["now"] = -1,
         max_reconnect_attempts: int = 3,
-    ) -> EventStream:
+        *,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        max_buffered_events: int = 1000,
+        decode: bool = True,
+    ) -> EventStream[EventEnvelopeWithMetadata] | EventStream[RawEventEnvelope]:
         """Stream events as they are produced by the workflow.
 
         Returns an ``EventStream`` whose ``last_sequence`` property tracks
@@ -376,15 +515,25 @@ class WorkflowClient:
                 after sequence ``N``.
             max_reconnect_attempts: Maximum reconnect attempts on connection
                 drop. Defaults to ``3``.
+            reconnect_delay: Delay before the first reconnect, in seconds,
+                doubling on each further attempt. A ``retry:`` field sent by
+                the server replaces it. Each delay is jittered.
+            max_reconnect_delay: Upper bound for the reconnect delay.
+            max_buffered_events: Events read ahead of the consumer. When the
+                buffer is full, reading from the connection pauses, which
+                pushes back on the server instead of growing memory.
+            decode: Yield ``EventEnvelopeWithMetadata``. With ``False``,
+                yield ``RawEventEnvelope`` and leave parsing to the consumer.
         """
-        queue: asyncio.Queue[_QueueItem] = asyncio.Queue()
-        stream = EventStream(queue, None, after_sequence)
+        queue: asyncio.Queue[_QueueItem] = asyncio.Queue(maxsize=max_buffered_events)
+        stream: EventStream[Any] = EventStream(queue, None, after_sequence)
 
         async def reader() -> None:
             incl_inter = "true" if include_internal_events else "false"
             url = f"/events/{handler_id}"
             last_sequence: int | Literal["now"] = after_sequence
             attempts = 0
+            retry_base = reconnect_delay
             try:
                 while True:
                     async with self._get_client() as client:
@@ -411,32 +560,50 @@ class WorkflowClient:
                                 # Reset attempts on successful connection
                                 attempts = 0
 
-                                # Parse SSE stream: "id: N\ndata: {...}\n\n"
+                                # Parse SSE stream: "id: N\ndata: {...}\n\n".
+                                # An event is dispatched at the blank line
+                                # ending it; comment lines (":") are skipped.
                                 current_id: str | None = None
+                                data_lines: list[str] = []
                                 async for line in response.aiter_lines():
                                     stripped = line.strip()
-                                    if not stripped:
-                                        # Empty line = end of SSE event
-                                        continue
-                                    if stripped.startswith("id:"):
-                                        current_id = stripped[3:].strip()
-                                    elif stripped.startswith("data:"):
-                                        data = stripped[5:].strip()
-                                        event = EventEnvelopeWithMetadata.model_validate_json(
-                                            data
-                                        )
-                                        if current_id is not None:
+                                    if stripped:
+                                        if stripped.startswith("id:"):
+                                            current_id = stripped[3:].strip()
+                                        elif stripped.startswith("data:"):
+                                            data_lines.append(stripped[5:].strip())
+                                        elif stripped.startswith("retry:"):
                                             try:
-                                                last_sequence = int(current_id)
+                                                retry_base = (
+                                                    int(stripped[6:].strip()) / 1000
+                                                )
                                             except ValueError:
                                                 pass
-                                        await queue.put(
-                                            _QueuedEvent(
-                                                sequence=last_sequence,
-                                                event=event,
-                                            )
+                                        continue
+                                    if not data_lines:
+                                        continue
+                                    if current_id is not None:
+                                        try:
+                                            last_sequence = int(current_id)
+                                        except ValueError:
+                                            pass
+                                    data = "\n".join(data_lines)
+                                    event: Any = (
+                                        EventEnvelopeWithMetadata.model_validate_json(
+                                            data
+                                        )
+                                        if decode
+                                        else RawEventEnvelope(last_sequence, data)
+                                    )
+                                    # Blocks while the buffer is full, so the
+                                    # connection is not read any further.
+                                    await queue.put(
+                                        _QueuedEvent(
+                                            sequence=last_sequence, event=event
                                         )
-                                        current_id = None
+                                    )
+                                    current_id = None
+                                    data_lines = []
 
                             # Stream ended normally (server closed connection)
                             await queue.put(_QueuedDone())
@@ -452,9 +619,15 @@ class WorkflowClient:
                                 raise ConnectionError(
                                     f"Failed to connect to event stream after {max_reconnect_attempts} attempts"
                                 )
-                            # Retry from last received sequence
+                    # Retry from last received sequence, after a backoff so
+                    # that clients of a restarting server do not stampede it.
+                    await asyncio.sleep(
+                        _reconnect_delay(attempts, retry_base, max_reconnect_delay)
+                    )
             except asyncio.CancelledError:
-                await queue.put(_QueuedDone())
+                # aclose() cancelled us; nobody may be draining a full queue.
+                with contextlib.suppress(asyncio.QueueFull):
+                    queue.put_nowait(_QueuedDone())
             except BaseException as exc:
                 await queue.put(_QueuedError(exc))
 
@@ -490,6 +663,53 @@ class WorkflowClient:
 
             return SendEventResponse.model_validate(response.json())
 
+    async def send_events(
+        self,
+        events: Iterable[tuple[str, Event | dict[str, Any]]],
+        step: str | None = None,
+        *,
+        batch_size: int = _MAX_BATCH_SIZE,
+    ) -> list[SendEventResult]:
+        """Send many events, possibly to different running workflows.
+
+        Events are sent ``batch_size`` per request; those for the same
+        handler are delivered in input order. An event that cannot be
+        delivered does not fail the call: each event gets a
+        ``SendEventResult``, in input order, with the status code
+        ``send_event`` would have raised.
+
+        Args:
+            events: ``(handler_id, event)`` pairs, with each event as an
+                ``Event`` instance or a dict.
+            step: Target a specific workflow step for every event. When
+                ``None``, events are broadcast to all waiting steps.
+            batch_size: Events per request, at most 1000.
+        """
+        if not 1 <= batch_size <= _MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {_MAX_BATCH_SIZE}")
+        items: list[dict[str, Any]] = []
+        for handler_id, event in events:
+            try:
+                serialized_event: dict[str, Any] = _serialize_event(event)
+            except Exception as e:
+                raise ValueError(f"Error while serializing the provided event: {e}")
+            item: dict[str, Any] = {"handler_id": handler_id, "event": serialized_event}
+            if step:
+                item["step"] = step
+            items.append(item)
+
+        results: list[SendEventResult] = []
+        async with self._get_client() as client:
+            for start in range(0, len(items), batch_size):
+                response = await client.post(
+                    "/events", json={"events": items[start : start + batch_size]}
+                )
+                _raise_for_status_with_body(response)
+                results.extend(
+                    SendEventsResponse.model_validate(response.json()).results
+                )
+        return results
+
     async def get_result(self, handler_id: str) -> HandlerData:
         """
         Deprecated. Use get_handler instead.
@@ -535,6 +755,62 @@ class WorkflowClient:
 
             return HandlerData.model_validate(response.json())
 
+    async def wait_for_handler(
+        self,
+        handler_id: str,
+        timeout: float | None = None,
+        poll_wait: float = 30.0,
+    ) -> HandlerData:
+        """Wait for a workflow handler to finish.
+
+        Long-polls ``GET /handlers/{handler_id}?wait=...``: the server holds
+        each request open until the handler finishes or ``poll_wait``
+        elapses, so no client-side polling interval is involved.
+
+        Args:
+            handler_id: ID of the handler.
+            timeout: Give up after this many seconds and return the handler
+                as it stands (possibly still ``"running"``). ``None`` waits
+                until it finishes.
+            poll_wait: Seconds the server holds each request open. The server
+                caps this at 60.
+
+        Raises:
+            httpx.HTTPStatusError: As for ``get_handler``, including when the
+                handler finished with a failure.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        async with self._get_client() as client:
+            while True:
+                wait = poll_wait
+                if deadline is not None:
+                    wait = max(0.0, min(wait, deadline - loop.time()))
+                # The read timeout must outlast the server-side wait.
+                base = client.timeout
+                sent_at = loop.time()
+                response = await client.get(
+                    f"/handlers/{handler_id}",
+                    params={"wait": str(wait)},
+                    timeout=httpx.Timeout(
+                        connect=base.connect,
+                        read=None if base.read is None else base.read + wait,
+                        write=base.write,
+                        pool=base.pool,
+                    ),
+                )
+                _raise_for_status_with_body(response)
+                handler = HandlerData.model_validate(response.json())
+                if handler.status != "running":
+                    return handler
+                now = loop.time()
+                if deadline is not None and now >= deadline:
+                    return handler
+                if now - sent_at < wait:
+                    # Answered early yet still running (e.g. an older server
+                    # ignoring ``wait``): do not spin.
+                    await asyncio.sleep(min(_WAIT_RETRY_DELAY, wait))
+
     async def cancel_handler(
         self, handler_id: str, purge: bool = False
     ) -> CancelHandlerResponse:
@@ -45,6 +45,40 @@ class SendEventResponse(BaseModel):
     status: Literal["sent"]
 
 
+class SendEventResult(BaseModel):
+    """Outcome of one event in a batch, as ``POST /events/{handler_id}`` would
+    have answered it."""
+
+    handler_id: str
+    status_code: int
+    detail: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+
+class SendEventsResponse(BaseModel):
+    results: list[SendEventResult]
+
+
+class RunWorkflowResult(BaseModel):
+    """Outcome of one run in a batch, as ``POST /workflows/{name}/run-nowait``
+    would have answered it."""
+
+    status_code: int
+    handler: HandlerData | None = None
+    detail: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+
+class RunWorkflowsResponse(BaseModel):
+    results: list[RunWorkflowResult]
+
+
 class CancelHandlerResponse(BaseModel):
     status: Literal["deleted", "cancelled"]
 
@@ -70,6 +104,10 @@ __all__ = [
     "HealthResponse",
     "WorkflowsListResponse",
     "SendEventResponse",
+    "SendEventResult",
+    "SendEventsResponse",
+    "RunWorkflowResult",
+    "RunWorkflowsResponse",
     "CancelHandlerResponse",
     "WorkflowSchemaResponse",
     "WorkflowEventsListResponse",
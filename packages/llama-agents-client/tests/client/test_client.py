@@ -1,9 +1,10 @@
 # ty: ignore[invalid-argument-type, not-iterable]
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator, Callable
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -15,7 +16,8 @@ from client_test_workflows import (
     OutputEvent,
 )
 from httpx import ASGITransport, AsyncClient
-from llama_agents.client import WorkflowClient
+from llama_agents.client import RawEventEnvelope, WorkflowClient
+from llama_agents.client import client as client_module
 from llama_agents.client.protocol.serializable_events import (
     EventEnvelopeWithMetadata,
 )
@@ -154,6 +156,55 @@ async def test_get_handler(client: WorkflowClient) -> None:
     assert handler_data.completed_at is not None
 
 
+@pytest.mark.asyncio
+async def test_wait_for_handler(client: WorkflowClient) -> None:
+    handler = await client.run_workflow_nowait(
+        "greeting", start_event=InputEvent(greeting="hello", name="John")
+    )
+
+    handler_data = await client.wait_for_handler(handler.handler_id, timeout=10)
+    assert handler_data.status == "completed"
+    assert handler_data.result is not None
+    assert handler_data.result.value["greeting"].startswith("hello John")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_handler_sends_bounded_waits() -> None:
+    waits: list[float] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        waits.append(float(request.url.params["wait"]))
+        status = "running" if len(waits) < 3 else "completed"
+        return httpx.Response(
+            202 if status == "running" else 200,
+            json={
+                "handler_id": "h1",
+                "workflow_name": "greeting",
+                "run_id": "r1",
+                "status": status,
+                "started_at": "2026-01-01T00:00:00+00:00",
+                "updated_at": None,
+                "completed_at": None,
+                "error": None,
+                "result": None,
+            },
+        )
+
+    httpx_client = AsyncClient(
+        transport=httpx.MockTransport(handle), base_url="http://test"
+    )
+    client = WorkflowClient(httpx_client=httpx_client)
+
+    handler_data = await client.wait_for_handler("h1", poll_wait=0.0)
+    assert handler_data.status == "completed"
+    assert waits == [0.0, 0.0, 0.0]
+
+    waits.clear()
+    handler_data = await client.wait_for_handler("h1", timeout=0.0)
+    assert handler_data.status == "running"
+    assert waits == [0.0]
+
+
 @pytest.mark.asyncio
 async def test_get_handlers(client: WorkflowClient) -> None:
     handler = await client.run_workflow_nowait(
@@ -298,6 +349,45 @@ async def test_send_event(client: WorkflowClient) -> None:
     assert result.result is not None
 
 
+@pytest.mark.asyncio
+async def test_run_workflows_nowait_and_send_events(client: WorkflowClient) -> None:
+    results = await client.run_workflows_nowait(
+        "greeting",
+        [InputEvent(greeting="hello", name=name) for name in ("Ann", "Bo", "Cy")],
+        handler_ids=["batch-ann", None, "batch-ann"],
+        batch_size=2,
+    )
+    assert [r.status_code for r in results] == [200, 200, 409]
+    handler_ids = [r.handler.handler_id for r in results if r.handler is not None]
+    assert handler_ids[0] == "batch-ann"
+
+    sent = await client.send_events(
+        [
+            *(
+                (handler_id, GreetEvent(greeting="Bonjour", exclamation_marks=1))
+                for handler_id in handler_ids
+            ),
+            ("nonexistent_handler", GreetEvent(greeting="?", exclamation_marks=1)),
+        ],
+        batch_size=2,
+    )
+    assert [r.ok for r in sent] == [True, True, False]
+    assert sent[2].status_code == 404
+
+    for handler_id in handler_ids:
+        async for _ in client.get_workflow_events(handler_id=handler_id):
+            pass
+        assert (await client.get_handler(handler_id)).result is not None
+
+
+@pytest.mark.asyncio
+async def test_run_workflows_nowait_checks_arguments(client: WorkflowClient) -> None:
+    with pytest.raises(ValueError, match="handler_ids"):
+        await client.run_workflows_nowait("greeting", [None], handler_ids=[])
+    with pytest.raises(ValueError, match="batch_size"):
+        await client.send_events([], batch_size=0)
+
+
 @pytest.mark.asyncio
 async def test_error_message_format(client: WorkflowClient) -> None:
     """Test that error messages include method, URL, status code, and response body preview."""
@@ -514,6 +604,130 @@ async def test_get_workflow_events_with_now() -> None:
     assert fake.captured_params[0]["after_sequence"] == "now"
 
 
+class FakeLineStreamClient:
+    """Mock httpx client whose connections replay raw SSE lines.
+
+    A connection is an exception (it fails to connect) or a list of lines,
+    where an exception drops the connection at that point.
+    """
+
+    def __init__(
+        self, connections: list[list[str | Exception] | list[str] | Exception]
+    ) -> None:
+        self._connections = list(connections)
+        self.lines_read = 0
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: str, **kwargs: object
+    ) -> AsyncIterator[Any]:
+        entry = self._connections.pop(0)
+        if isinstance(entry, Exception):
+            raise entry
+        resp = MagicMock()
+        resp.status_code = 200
+
+        async def aiter_lines() -> AsyncIterator[str]:
+            for line in entry:
+                if isinstance(line, Exception):
+                    raise line
+                self.lines_read += 1
+                yield line
+
+        resp.aiter_lines = aiter_lines
+        yield resp
+
+
+def _sse_lines(count: int) -> list[str]:
+    lines: list[str] = []
+    for seq in range(count):
+        lines += [f"id: {seq}", f"data: {_envelope(str(seq)).model_dump_json()}", ""]
+    return lines
+
+
+def test_reconnect_delay_is_jittered_exponential_and_capped() -> None:
+    for attempt, full in [(1, 0.5), (2, 1.0), (3, 2.0), (10, 30.0)]:
+        delay = client_module._reconnect_delay(attempt, 0.5, 30.0)
+        assert full / 2 <= delay <= full
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backs_off_using_server_retry_field(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    delays: list[tuple[int, float]] = []
+
+    def record(attempt: int, base: float, cap: float) -> float:
+        delays.append((attempt, base))
+        return 0.0
+
+    monkeypatch.setattr(client_module, "_reconnect_delay", record)
+    fake = FakeLineStreamClient(
+        [
+            httpx.ConnectError("refused"),
+            ["retry: 2500", *_sse_lines(1), httpx.ReadError("reset")],
+            _sse_lines(2)[3:],
+        ]
+    )
+    wf_client = WorkflowClient(httpx_client=fake)  # type: ignore[arg-type]
+
+    events = [e async for e in wf_client.get_workflow_events(handler_id="h")]
+
+    assert [e.value["msg"] for e in events] == ["0", "1"]
+    # Default base until the server sends retry:, then the server's value.
+    assert delays == [(1, 0.5), (1, 2.5)]
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_events_bounds_read_ahead() -> None:
+    fake = FakeLineStreamClient([_sse_lines(500)])
+    wf_client = WorkflowClient(httpx_client=fake)  # type: ignore[arg-type]
+
+    stream = wf_client.get_workflow_events(handler_id="h", max_buffered_events=10)
+    iterator = stream.__aiter__()
+    first = await iterator.__anext__()
+    await asyncio.sleep(0.05)
+
+    assert first.value["msg"] == "0"
+    # One event in hand, ten buffered, one blocked on the full buffer.
+    assert fake.lines_read <= 12 * 3
+    rest = [event async for event in iterator]
+    assert len(rest) == 499
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_events_without_decoding() -> None:
+    fake = FakeLineStreamClient([_sse_lines(2)])
+    wf_client = WorkflowClient(httpx_client=fake)  # type: ignore[arg-type]
+
+    events = [event async for event in wf_client.get_workflow_events("h", decode=False)]
+
+    assert all(isinstance(event, RawEventEnvelope) for event in events)
+    assert [event.sequence for event in events] == [0, 1]
+    assert events[0].json()["value"] == {"msg": "0"}
+    assert events[1].decode() == _envelope("1")
+
+
+@pytest.mark.asyncio
+async def test_many_concurrent_event_streams_against_local_server(
+    client: WorkflowClient,
+) -> None:
+    async def run_and_stream(n: int) -> list[str]:
+        handler = await client.run_workflow_nowait(
+            "greeting", start_event=InputEvent(greeting="hi", name=str(n))
+        )
+        stream = client.get_workflow_events(
+            handler.handler_id, max_buffered_events=1, decode=False
+        )
+        return [event.json()["type"] async for event in stream]
+
+    results = await asyncio.gather(*(run_and_stream(n) for n in range(200)))
+
+    assert all(
+        types == ["InputEvent", "GreetEvent", "OutputEvent"] for types in results
+    )
+
+
 def test_init_without_either_raises_value_error() -> None:
     with pytest.raises(
         ValueError, match="Either httpx_client or base_url must be provided"
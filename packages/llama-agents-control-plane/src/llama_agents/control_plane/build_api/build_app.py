@@ -130,32 +130,50 @@ async def artifact_exists(
     return Response(status_code=200)
 
 
+_OPEN_RANGE = re.compile(r"^bytes=(\d+)-$")
+
+
 @build_app.get("/deployments/{deployment_id}/builds/{build_id}")
 async def download_artifact(
+    request: Request,
     deployment: Annotated[LlamaDeploymentCRD, Depends(authenticate_deployment)],
     build_id: str,
 ) -> StreamingResponse:
-    """Download a build artifact (streamed from S3)."""
+    """Download a build artifact (streamed from S3).
+
+    An open-ended ``Range: bytes=<start>-`` request, as sent to resume an
+    interrupted download, is answered with ``206`` and the rest of the
+    artifact. Other range forms are ignored and the whole artifact is sent.
+    """
     if build_artifact_storage is None:
         raise HTTPException(
             status_code=503, detail="Build artifact storage not configured"
         )
+    range_match = _OPEN_RANGE.match(request.headers.get("Range", "").strip())
+    start = int(range_match.group(1)) if range_match else 0
     try:
         (
-            content_length,
+            total_size,
             stream,
         ) = await build_artifact_storage.download_artifact_streaming(
-            deployment.metadata.name, build_id
+            deployment.metadata.name, build_id, start=start
         )
     except build_artifact_storage.NotFoundError:
         raise HTTPException(status_code=404, detail="Artifact not found")
+    except build_artifact_storage.RangeNotSatisfiableError:
+        raise HTTPException(status_code=416, detail="Range not satisfiable")
+    headers = {
+        "Content-Disposition": f"attachment; filename={build_id}.tar.gz",
+        "Content-Length": str(total_size - start),
+        "Accept-Ranges": "bytes",
+    }
+    if range_match:
+        headers["Content-Range"] = f"bytes {start}-{total_size - 1}/{total_size}"
     return StreamingResponse(
         stream,
+        status_code=206 if range_match else 200,
         media_type="application/gzip",
-        headers={
-            "Content-Disposition": f"attachment; filename={build_id}.tar.gz",
-            "Content-Length": str(content_length),
-        },
+        headers=headers,
     )
 
 
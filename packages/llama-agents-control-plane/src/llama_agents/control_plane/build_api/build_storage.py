@@ -30,6 +30,9 @@ class BuildArtifactStorage(S3ObjectStorage):
     class NotFoundError(Exception):
         """Raised when an artifact is not found in S3."""
 
+    class RangeNotSatisfiableError(Exception):
+        """Raised when a download starts at or past the end of the artifact."""
+
     def __init__(
         self,
         bucket: str,
@@ -76,12 +79,18 @@ class BuildArtifactStorage(S3ObjectStorage):
             )
 
     async def download_artifact_streaming(
-        self, deployment_name: str, build_id: str, chunk_size: int = 65536
+        self,
+        deployment_name: str,
+        build_id: str,
+        chunk_size: int = 65536,
+        start: int = 0,
     ) -> tuple[int, AsyncIterator[bytes]]:
-        """Stream a build artifact from S3.
+        """Stream a build artifact from S3, from byte ``start`` on.
 
-        Returns (content_length, async_iterator_of_chunks).
-        Raises NotFoundError if the artifact does not exist.
+        Returns (total_size, async_iterator_of_chunks); the iterator yields
+        ``total_size - start`` bytes.
+        Raises NotFoundError if the artifact does not exist, and
+        RangeNotSatisfiableError if ``start`` is not inside it.
 
         The caller must consume the iterator within the same context — the S3
         client session stays open until the iterator is exhausted.
@@ -89,19 +98,32 @@ class BuildArtifactStorage(S3ObjectStorage):
         client_cm = self._client()
         client = await client_cm.__aenter__()
         try:
+            kwargs: dict[str, Any] = {}
+            if start:
+                kwargs["Range"] = f"bytes={start}-"
             response = await client.get_object(
                 Bucket=self._bucket,
                 Key=self._key(deployment_name, build_id),
+                **kwargs,
             )
         except ClientError as e:
             await client_cm.__aexit__(type(e), e, e.__traceback__)
-            if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+            code = e.response.get("Error", {}).get("Code")
+            if code == "NoSuchKey":
                 raise self.NotFoundError(
                     f"Artifact not found: {deployment_name}/{build_id}"
                 ) from e
+            if code == "InvalidRange":
+                raise self.RangeNotSatisfiableError(
+                    f"Range start {start} outside artifact {deployment_name}/{build_id}"
+                ) from e
             raise
 
-        content_length: int = response["ContentLength"]
+        if start:
+            # "bytes <first>-<last>/<total>"
+            total_size = int(response["ContentRange"].rsplit("/", 1)[1])
+        else:
+            total_size = response["ContentLength"]
         body = response["Body"]
 
         async def _stream() -> AsyncIterator[bytes]:
@@ -111,7 +133,7 @@ class BuildArtifactStorage(S3ObjectStorage):
             finally:
                 await client_cm.__aexit__(None, None, None)
 
-        return content_length, _stream()
+        return total_size, _stream()
 
     async def artifact_exists(self, deployment_name: str, build_id: str) -> bool:
         """Check if a build artifact exists in S3."""
@@ -1,9 +1,6 @@
-import asyncio
 import logging
-from collections.abc import AsyncIterator
-from datetime import datetime, timezone
 from importlib.metadata import version as pkg_version
-from typing import AsyncGenerator, Literal, cast
+from typing import AsyncGenerator
 
 from fastapi import HTTPException, Request
 from fastapi.responses import Response
@@ -16,13 +13,12 @@ from llama_agents.control_plane.code_repo.git_server import (
 )
 from llama_agents.control_plane.code_repo.service import code_repo_storage
 from llama_agents.control_plane.git import git_service
-from llama_agents.control_plane.lifecycle import shutdown_event
+from llama_agents.control_plane.manage_api.log_hub import (
+    deployment_log_hubs,
+    read_deployment_logs,
+)
 from llama_agents.control_plane.settings import settings
 from llama_agents.core import schema
-from llama_agents.core.iter_utils import (
-    debounced_sorted_prefix,
-    merge_generators,
-)
 from llama_agents.core.schema import LogEvent
 from llama_agents.core.schema.deployments import (
     INTERNAL_CODE_REPO_SCHEME,
@@ -433,49 +429,6 @@ class DeploymentService(AbstractDeploymentsService):
             on_push_complete=_on_push_complete,
         )
 
-    async def _when_replicaset_changes(
-        self,
-        deployment_id: str,
-        interval_seconds: float,
-    ) -> AsyncIterator[Literal["__RS_CHANGED__"]]:
-        initial_uid = await self._current_rs_uid(deployment_id)
-        while True:
-            current_uid = await self._current_rs_uid(deployment_id)
-            if current_uid != initial_uid:
-                yield "__RS_CHANGED__"
-                break
-            await asyncio.sleep(interval_seconds)
-
-    async def _current_rs_uid(
-        self,
-        deployment_id: str,
-    ) -> str | None:
-        rs = await k8s_client.get_latest_replicaset_for_deployment(deployment_id)
-        return rs.metadata.uid if rs is not None and rs.metadata is not None else None
-
-    async def _build_log_events(
-        self,
-        deployment_id: str,
-        since_seconds: int | None,
-        tail_lines: int | None,
-        follow: bool = True,
-    ) -> AsyncGenerator[LogEvent, None]:
-        """Yield log events from the build Job, if one exists."""
-        async for line in k8s_client.stream_build_job_logs(
-            deployment_id=deployment_id,
-            since_seconds=since_seconds,
-            tail_lines=tail_lines,
-            stop_event=shutdown_event,
-            follow=follow,
-        ):
-            timestamp = line.timestamp or datetime.now(timezone.utc)
-            yield LogEvent(
-                pod=line.pod,
-                container=line.container,
-                text=line.text,
-                timestamp=timestamp,
-            )
-
     @override
     async def stream_deployment_logs(
         self,
@@ -489,109 +442,37 @@ class DeploymentService(AbstractDeploymentsService):
         """Stream logs for a deployment.
 
         Build job logs (if any) are automatically merged into the stream.
-        App logs stream from the latest ReplicaSet. When ``follow`` is True
-        and the RS changes (e.g. build finishes and operator creates a
-        Deployment), the inner generators restart so logs continue seamlessly
-        without requiring the client to reconnect. When ``follow`` is False,
-        the generator returns whatever logs are currently available and ends.
+        App logs stream from the latest ReplicaSet. When ``follow`` is True,
+        all viewers of a deployment share one log follow through its
+        ``DeploymentLogHub``, which restarts the upstream when the RS changes
+        (e.g. build finishes and operator creates a Deployment), so logs
+        continue without requiring the client to reconnect. ``tail_lines``
+        and ``since_seconds`` then select from the hub's buffer of recent
+        lines. When ``follow`` is False, the generator returns whatever logs
+        are currently available and ends.
         """
 
         await self._get_deployment_or_raise(project_id, deployment_id)
 
-        include_build_logs = True
-        while True:
-            initial_rs_uid = await self._current_rs_uid(deployment_id)
-
-            app_logs = k8s_client.stream_replicaset_logs(
-                deployment_id=deployment_id,
+        if follow:
+            events = deployment_log_hubs.stream(
+                deployment_id,
                 include_init_containers=include_init_containers,
                 since_seconds=since_seconds,
                 tail_lines=tail_lines,
-                stop_event=shutdown_event,
-                follow=follow,
-            )
-
-            if include_build_logs:
-                build_logs: AsyncGenerator[LogEvent, None] = self._build_log_events(
-                    deployment_id=deployment_id,
-                    since_seconds=since_seconds,
-                    tail_lines=tail_lines,
-                    follow=follow,
-                )
-                include_build_logs = False
-            else:
-                build_logs = _empty_log_gen()
-
-            # Merge build + app logs; build logs are finite, app logs are ongoing.
-            # stop_on_first_completion=False so app logs continue after build finishes.
-            merged_logs = merge_generators(
-                build_logs,
-                app_logs,
-                stop_on_first_completion=False,
             )
-
-            debounced_logs = debounced_sorted_prefix(
-                merged_logs,
-                key=lambda x: (x.timestamp, x.pod, x.container, x.text),
-                debounce_seconds=0.2,
-                max_window_seconds=0.5,
+        else:
+            events = read_deployment_logs(
+                deployment_id,
+                include_init_containers=include_init_containers,
+                since_seconds=since_seconds,
+                tail_lines=tail_lines,
             )
-
-            if follow:
-                when_changes = self._when_replicaset_changes(deployment_id, 0.05)
-
-                rs_changed = False
-                async for ev in merge_generators(
-                    debounced_logs,
-                    cast(AsyncGenerator[LogEvent | str, None], when_changes),
-                    stop_on_first_completion=True,
-                ):
-                    if isinstance(ev, str):
-                        # RS-change sentinel — restart inner generators
-                        rs_changed = True
-                        break
-                    timestamp = ev.timestamp or datetime.now(timezone.utc)
-                    yield LogEvent(
-                        pod=ev.pod,
-                        container=ev.container,
-                        text=ev.text,
-                        timestamp=timestamp,
-                    )
-
-                if rs_changed:
-                    # RS changed (e.g. build→deploy transition). Loop to pick up
-                    # the new RS's pods without dropping the SSE connection.
-                    continue
-
-                # All log generators completed without an RS change. Check if an
-                # RS appeared while we were streaming build logs (race window
-                # where debounced_logs finishes before _when_replicaset_changes
-                # polls).
-                if initial_rs_uid is None:
-                    current_uid = await self._current_rs_uid(deployment_id)
-                    if current_uid is not None:
-                        continue
-
-                # No new RS appeared — nothing more to stream.
-                break
-
-            # follow=False: drain whatever's available and exit. No RS-change
-            # watcher, no reconnect — the underlying read uses follow=False
-            # against k8s and terminates on its own.
-            async for ev in debounced_logs:
-                timestamp = ev.timestamp or datetime.now(timezone.utc)
-                yield LogEvent(
-                    pod=ev.pod,
-                    container=ev.container,
-                    text=ev.text,
-                    timestamp=timestamp,
-                )
-            break
-
-
-async def _empty_log_gen() -> AsyncGenerator[LogEvent, None]:
-    return
-    yield  # make it a generator
+        try:
+            async for event in events:
+                yield event
+        finally:
+            await events.aclose()
 
 
 deployments_service = DeploymentService()
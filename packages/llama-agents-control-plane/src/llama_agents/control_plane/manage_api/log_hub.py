@@ -0,0 +1,460 @@
+"""Shared log streams for deployment log viewers.
+
+Every viewer following a deployment's logs used to open its own log follow
+per pod/container and poll the latest ReplicaSet on its own. A
+``DeploymentLogHub`` does both once per deployment and fans the lines out to
+all viewers. Each pod/container keeps a bounded buffer of recent lines, which
+serves a viewer's ``tail_lines``/``since_seconds`` without another read. That
+includes the viewers that start the hub: they wait for the initial read to
+settle and get their backlog from the buffer like everyone else.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, Literal, TypeVar, cast
+
+from llama_agents.control_plane import k8s_client
+from llama_agents.control_plane.lifecycle import shutdown_event
+from llama_agents.control_plane.settings import settings
+from llama_agents.core.iter_utils import (
+    Debouncer,
+    debounced_sorted_prefix,
+    merge_generators,
+)
+from llama_agents.core.schema import LogEvent
+
+logger = logging.getLogger(__name__)
+
+_RS_POLL_INTERVAL_SECONDS = 0.05
+# A viewer this far behind the upstream loses its oldest undelivered lines,
+# so one slow viewer never holds up the others.
+_VIEWER_QUEUE_SIZE = 10_000
+
+_LineKey = tuple[str, str]
+_Line = k8s_client.LogLine | LogEvent
+
+T = TypeVar("T")
+
+
+async def current_rs_uid(deployment_id: str) -> str | None:
+    rs = await k8s_client.get_latest_replicaset_for_deployment(deployment_id)
+    return rs.metadata.uid if rs is not None and rs.metadata is not None else None
+
+
+async def _when_replicaset_changes(
+    deployment_id: str,
+    initial_uid: str | None,
+    interval_seconds: float,
+) -> AsyncIterator[Literal["__RS_CHANGED__"]]:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if await current_rs_uid(deployment_id) != initial_uid:
+            yield "__RS_CHANGED__"
+            break
+
+
+async def _build_log_events(
+    deployment_id: str,
+    since_seconds: int | None,
+    tail_lines: int | None,
+    follow: bool = True,
+) -> AsyncGenerator[LogEvent, None]:
+    """Yield log events from the build Job, if one exists."""
+    async for line in k8s_client.stream_build_job_logs(
+        deployment_id=deployment_id,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+        stop_event=shutdown_event,
+        follow=follow,
+    ):
+        yield _to_log_event(line)
+
+
+async def _empty_log_gen() -> AsyncGenerator[LogEvent, None]:
+    return
+    yield  # make it a generator
+
+
+async def _noting_containers(
+    lines: AsyncGenerator[k8s_client.LogLine, None],
+    containers: set[_LineKey],
+) -> AsyncGenerator[k8s_client.LogLine, None]:
+    async for line in lines:
+        containers.add((line.pod, line.container))
+        yield line
+
+
+def _to_log_event(line: k8s_client.LogLine | LogEvent) -> LogEvent:
+    return LogEvent(
+        pod=line.pod,
+        container=line.container,
+        text=line.text,
+        timestamp=line.timestamp or datetime.now(timezone.utc),
+    )
+
+
+def _line_key(line: _Line) -> tuple[Any, ...]:
+    return (line.timestamp, line.pod, line.container, line.text)
+
+
+async def _settled_batches(
+    inner: AsyncGenerator[T, None],
+    *,
+    key: Callable[[T], Any],
+) -> AsyncGenerator[list[T], None]:
+    """Like ``debounced_sorted_prefix``, but yield the sorted initial burst as
+    one batch (possibly empty) and each later item as a batch of its own, so
+    the consumer knows when the burst is over."""
+    debouncer = Debouncer(debounce_seconds=0.2, max_window_seconds=0.5)
+    burst: list[T] = []
+    async for item in merge_generators(inner, debouncer.aiter()):
+        if item == "__COMPLETE__":
+            burst.sort(key=key)
+            yield burst
+        elif debouncer.is_complete:
+            yield [cast(T, item)]
+        else:
+            debouncer.extend_window()
+            burst.append(cast(T, item))
+
+
+def _merged_log_lines(
+    deployment_id: str,
+    *,
+    include_init_containers: bool,
+    since_seconds: int | None,
+    tail_lines: int | None,
+    follow: bool,
+    include_build_logs: bool,
+    app_containers: set[_LineKey] | None = None,
+) -> AsyncGenerator[_Line, None]:
+    """Build and latest-ReplicaSet logs, merged in arrival order."""
+    app_logs = k8s_client.stream_replicaset_logs(
+        deployment_id=deployment_id,
+        include_init_containers=include_init_containers,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+        stop_event=shutdown_event,
+        follow=follow,
+    )
+    if app_containers is not None:
+        app_logs = _noting_containers(app_logs, app_containers)
+
+    if include_build_logs:
+        build_logs: AsyncGenerator[LogEvent, None] = _build_log_events(
+            deployment_id=deployment_id,
+            since_seconds=since_seconds,
+            tail_lines=tail_lines,
+            follow=follow,
+        )
+    else:
+        build_logs = _empty_log_gen()
+
+    # Merge build + app logs; build logs are finite, app logs are ongoing.
+    # stop_on_first_completion=False so app logs continue after build finishes.
+    return merge_generators(
+        cast(AsyncGenerator[_Line, None], build_logs),
+        cast(AsyncGenerator[_Line, None], app_logs),
+        stop_on_first_completion=False,
+    )
+
+
+def _log_lines(
+    deployment_id: str,
+    *,
+    include_init_containers: bool,
+    since_seconds: int | None,
+    tail_lines: int | None,
+    follow: bool,
+    include_build_logs: bool,
+) -> AsyncGenerator[_Line, None]:
+    """Build and latest-ReplicaSet logs, merged with the initial burst sorted."""
+    return debounced_sorted_prefix(
+        _merged_log_lines(
+            deployment_id,
+            include_init_containers=include_init_containers,
+            since_seconds=since_seconds,
+            tail_lines=tail_lines,
+            follow=follow,
+            include_build_logs=include_build_logs,
+        ),
+        key=_line_key,
+        debounce_seconds=0.2,
+        max_window_seconds=0.5,
+    )
+
+
+async def read_deployment_logs(
+    deployment_id: str,
+    *,
+    include_init_containers: bool,
+    since_seconds: int | None,
+    tail_lines: int | None,
+) -> AsyncGenerator[LogEvent, None]:
+    """Yield the deployment's currently available logs and end, without following."""
+    async for line in _log_lines(
+        deployment_id,
+        include_init_containers=include_init_containers,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+        follow=False,
+        include_build_logs=True,
+    ):
+        yield _to_log_event(line)
+
+
+@dataclass
+class _Closed:
+    error: Exception | None = None
+
+
+class DeploymentLogHub:
+    """One deployment's log follow, shared by all of its viewers.
+
+    The upstream starts with the first viewer and stops when the last one
+    leaves, or ends for everyone when the deployment's logs end.
+    """
+
+    def __init__(
+        self,
+        deployment_id: str,
+        include_init_containers: bool,
+        *,
+        buffer_lines: int,
+        on_close: Callable[[DeploymentLogHub], None],
+    ) -> None:
+        self.deployment_id = deployment_id
+        self.include_init_containers = include_init_containers
+        self._buffer_lines = buffer_lines
+        self._on_close = on_close
+        # Recent lines per pod/container, tagged with their arrival order.
+        self._buffers: dict[_LineKey, deque[tuple[int, LogEvent]]] = {}
+        self._app_containers: set[_LineKey] = set()
+        self._seq = 0
+        self._viewers: set[asyncio.Queue[LogEvent | _Closed]] = set()
+        # Viewers that joined before the initial read settled, with their
+        # since_seconds/tail_lines; they get their backlog once it has.
+        self._pending: dict[
+            asyncio.Queue[LogEvent | _Closed], tuple[int | None, int | None]
+        ] = {}
+        self._settled = False
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def stream(
+        self,
+        since_seconds: int | None = None,
+        tail_lines: int | None = None,
+    ) -> AsyncGenerator[LogEvent, None]:
+        """Yield buffered lines matching ``since_seconds``/``tail_lines``, then
+        follow the deployment's logs."""
+        queue: asyncio.Queue[LogEvent | _Closed] = asyncio.Queue(
+            maxsize=_VIEWER_QUEUE_SIZE
+        )
+        if self._settled or self._closed:
+            # Taken and registered without awaiting, so no line is missed or
+            # repeated.
+            backlog = self._backlog(since_seconds, tail_lines)
+            self._viewers.add(queue)
+        else:
+            backlog = []
+            self._pending[queue] = (since_seconds, tail_lines)
+        if self._closed:
+            _offer(queue, _Closed())
+        elif self._task is None:
+            self._task = asyncio.create_task(self._run())
+        try:
+            for event in backlog:
+                yield event
+            while True:
+                item = await queue.get()
+                if isinstance(item, _Closed):
+                    if item.error is not None:
+                        raise item.error
+                    return
+                yield item
+        finally:
+            self._viewers.discard(queue)
+            self._pending.pop(queue, None)
+            if not self._viewers and not self._pending:
+                self._stop()
+
+    def _backlog(
+        self, since_seconds: int | None, tail_lines: int | None
+    ) -> list[LogEvent]:
+        cutoff = (
+            None
+            if since_seconds is None
+            else datetime.now(timezone.utc) - timedelta(seconds=since_seconds)
+        )
+        selected: list[tuple[int, LogEvent]] = []
+        for buffer in self._buffers.values():
+            lines = [
+                entry
+                for entry in buffer
+                if cutoff is None or entry[1].timestamp >= cutoff
+            ]
+            if tail_lines is not None:
+                # Like the Kubernetes log API, tail_lines applies per container.
+                lines = lines[len(lines) - tail_lines :] if tail_lines > 0 else []
+            selected.extend(lines)
+        selected.sort(key=lambda entry: entry[0])
+        return [event for _, event in selected]
+
+    def _publish(self, event: LogEvent) -> None:
+        key = (event.pod, event.container)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = deque(maxlen=self._buffer_lines)
+        buffer.append((self._seq, event))
+        self._seq += 1
+        for queue in self._viewers:
+            _offer(queue, event)
+
+    def _settle(self) -> None:
+        """Serve the pending viewers their backlog and make them live."""
+        self._settled = True
+        pending, self._pending = self._pending, {}
+        for queue, (since_seconds, tail_lines) in pending.items():
+            for event in self._backlog(since_seconds, tail_lines):
+                _offer(queue, event)
+            self._viewers.add(queue)
+
+    async def _run(self) -> None:
+        error: Exception | None = None
+        try:
+            await self._follow()
+        except Exception as exc:
+            logger.warning(
+                "Log stream for deployment %s failed", self.deployment_id, exc_info=True
+            )
+            error = exc
+        finally:
+            self._close(_Closed(error))
+
+    async def _follow(self) -> None:
+        include_build_logs = True
+        while True:
+            initial_rs_uid = await current_rs_uid(self.deployment_id)
+
+            batches = _settled_batches(
+                _merged_log_lines(
+                    self.deployment_id,
+                    include_init_containers=self.include_init_containers,
+                    since_seconds=None,
+                    tail_lines=self._buffer_lines,
+                    follow=True,
+                    include_build_logs=include_build_logs,
+                    app_containers=self._app_containers,
+                ),
+                key=_line_key,
+            )
+            include_build_logs = False
+            when_changes = _when_replicaset_changes(
+                self.deployment_id, initial_rs_uid, _RS_POLL_INTERVAL_SECONDS
+            )
+
+            rs_changed = False
+            merged = merge_generators(
+                cast(AsyncGenerator[list[_Line] | str, None], batches),
+                cast(AsyncGenerator[list[_Line] | str, None], when_changes),
+                stop_on_first_completion=True,
+            )
+            try:
+                async for batch in merged:
+                    if isinstance(batch, str):
+                        # RS-change sentinel — restart the upstream
+                        rs_changed = True
+                        break
+                    for line in batch:
+                        self._publish(_to_log_event(line))
+                    if not self._settled:
+                        # The first batch is the initial burst.
+                        self._settle()
+            finally:
+                await merged.aclose()
+
+            if rs_changed:
+                # RS changed (e.g. build→deploy transition). New viewers see
+                # the new RS's pods, as a fresh read would.
+                for key in self._app_containers:
+                    self._buffers.pop(key, None)
+                self._app_containers.clear()
+                continue
+
+            # All log generators completed without an RS change. Check if an
+            # RS appeared while we were streaming build logs (race window
+            # where the logs finish before the RS watcher polls).
+            if initial_rs_uid is None:
+                if await current_rs_uid(self.deployment_id) is not None:
+                    continue
+
+            # No new RS appeared — nothing more to stream.
+            return
+
+    def _stop(self) -> None:
+        task = self._task
+        self._close(_Closed())
+        if task is not None and not task.done():
+            task.cancel()
+
+    def _close(self, closed: _Closed) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._on_close(self)
+        for queue in (*self._viewers, *self._pending):
+            _offer(queue, closed)
+
+
+def _offer(queue: asyncio.Queue[LogEvent | _Closed], item: LogEvent | _Closed) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+class DeploymentLogHubs:
+    """Log hubs by deployment, each live while it has viewers."""
+
+    def __init__(self, buffer_lines: int | None = None) -> None:
+        self._buffer_lines = (
+            settings.deployment_log_buffer_lines
+            if buffer_lines is None
+            else buffer_lines
+        )
+        self._hubs: dict[tuple[str, bool], DeploymentLogHub] = {}
+
+    def stream(
+        self,
+        deployment_id: str,
+        *,
+        include_init_containers: bool = False,
+        since_seconds: int | None = None,
+        tail_lines: int | None = None,
+    ) -> AsyncGenerator[LogEvent, None]:
+        """Follow a deployment's logs through its shared hub."""
+        key = (deployment_id, include_init_containers)
+        hub = self._hubs.get(key)
+        if hub is None:
+            hub = DeploymentLogHub(
+                deployment_id,
+                include_init_containers,
+                buffer_lines=self._buffer_lines,
+                on_close=self._discard,
+            )
+            self._hubs[key] = hub
+        return hub.stream(since_seconds=since_seconds, tail_lines=tail_lines)
+
+    def _discard(self, hub: DeploymentLogHub) -> None:
+        key = (hub.deployment_id, hub.include_init_containers)
+        if self._hubs.get(key) is hub:
+            del self._hubs[key]
+
+
+deployment_log_hubs = DeploymentLogHubs()
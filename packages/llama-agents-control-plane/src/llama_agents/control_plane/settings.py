@@ -66,6 +66,16 @@ class ControlPlaneSettings(BaseSettings):
         alias="K8S_HEALTH_CHECK_TIMEOUT_SECONDS",
     )
 
+    # Deployment log viewers share one upstream log follow per deployment. Each
+    # pod/container keeps this many recent lines to serve new viewers'
+    # tail_lines/since_seconds; older lines are only available to viewers that
+    # were already connected.
+    deployment_log_buffer_lines: int = Field(
+        default=1000,
+        description="Recent log lines kept per pod/container for new deployment log viewers",
+        alias="DEPLOYMENT_LOG_BUFFER_LINES",
+    )
+
     # Default appserver image tag (set by Helm chart via DEFAULT_APPSERVER_IMAGE_TAG)
     default_appserver_image_tag: str = Field(
         default="",
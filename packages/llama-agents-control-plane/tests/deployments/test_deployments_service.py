@@ -10,6 +10,7 @@ from fastapi.responses import Response
 from llama_agents.control_plane.manage_api.deployments_service import (
     deployments_service,
 )
+from llama_agents.control_plane.settings import settings
 from llama_agents.core import schema
 from llama_agents.core.schema.deployments import (
     INTERNAL_CODE_REPO_SCHEME,
@@ -164,11 +165,13 @@ async def test_stream_logs_happy_path(
     assert items[0].pod == "pod-1" and items[0].text == "a"
     assert items[1].pod == "pod-1" and items[1].text == "b"
 
+    # Followed logs come from the deployment's shared hub, which reads as many
+    # lines as it buffers.
     mock_stream_logs.assert_called_once_with(
         deployment_id="dep-1",
         include_init_containers=True,
         since_seconds=None,
-        tail_lines=None,
+        tail_lines=settings.deployment_log_buffer_lines,
         stop_event=mock.ANY,
         follow=True,
     )
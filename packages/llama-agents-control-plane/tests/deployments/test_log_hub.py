@@ -0,0 +1,205 @@
+import asyncio
+import types
+from collections.abc import AsyncGenerator, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from llama_agents.control_plane import k8s_client
+from llama_agents.control_plane.k8s_client import LogLine
+from llama_agents.control_plane.manage_api.log_hub import DeploymentLogHubs
+from llama_agents.core.schema import LogEvent
+
+
+class FakeKubernetes:
+    """Log and ReplicaSet reads of one deployment, driven by the test."""
+
+    def __init__(self) -> None:
+        self.rs_uid: str | None = "rs-1"
+        self.rs_reads = 0
+        self.follows: list[dict[str, Any]] = []
+        self.open_follows = 0
+        self._lines: dict[str | None, asyncio.Queue[LogLine | None]] = {}
+
+    def _queue(self, rs_uid: str | None) -> asyncio.Queue[LogLine | None]:
+        return self._lines.setdefault(rs_uid, asyncio.Queue())
+
+    def emit(self, pod: str, text: str, age_seconds: float = 0) -> None:
+        timestamp = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+        self._queue(self.rs_uid).put_nowait(LogLine(pod, "app", text, timestamp))
+
+    def end(self) -> None:
+        self._queue(self.rs_uid).put_nowait(None)
+
+    async def get_latest_replicaset_for_deployment(
+        self, deployment_id: str
+    ) -> types.SimpleNamespace | None:
+        self.rs_reads += 1
+        if self.rs_uid is None:
+            return None
+        return types.SimpleNamespace(metadata=types.SimpleNamespace(uid=self.rs_uid))
+
+    async def stream_replicaset_logs(
+        self, **kwargs: Any
+    ) -> AsyncGenerator[LogLine, None]:
+        self.follows.append(kwargs)
+        queue = self._queue(self.rs_uid)
+        self.open_follows += 1
+        try:
+            while (line := await queue.get()) is not None:
+                yield line
+        finally:
+            self.open_follows -= 1
+
+    async def stream_build_job_logs(
+        self, **kwargs: Any
+    ) -> AsyncGenerator[LogLine, None]:
+        return
+        yield  # make it a generator
+
+
+@pytest.fixture
+def fake_k8s(monkeypatch: pytest.MonkeyPatch) -> FakeKubernetes:
+    fake = FakeKubernetes()
+    for name in (
+        "get_latest_replicaset_for_deployment",
+        "stream_replicaset_logs",
+        "stream_build_job_logs",
+    ):
+        monkeypatch.setattr(k8s_client, name, getattr(fake, name))
+    return fake
+
+
+async def _take(events: AsyncGenerator[LogEvent, None], count: int) -> list[str]:
+    return [(await asyncio.wait_for(anext(events), 5)).text for _ in range(count)]
+
+
+async def _eventually(condition: Callable[[], bool]) -> None:
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    assert condition()
+
+
+@pytest.mark.asyncio
+async def test_viewers_share_one_upstream_follow(fake_k8s: FakeKubernetes) -> None:
+    hubs = DeploymentLogHubs(buffer_lines=100)
+    viewers = [hubs.stream("dep-1") for _ in range(10)]
+    takes = [asyncio.create_task(_take(viewer, 3)) for viewer in viewers]
+
+    for i in range(3):
+        fake_k8s.emit("pod-1", f"line-{i}")
+
+    for lines in await asyncio.gather(*takes):
+        assert lines == ["line-0", "line-1", "line-2"]
+    assert len(fake_k8s.follows) == 1
+    assert fake_k8s.follows[0]["tail_lines"] == 100
+    assert fake_k8s.follows[0]["since_seconds"] is None
+    # One ReplicaSet watch for all viewers, not one each.
+    assert fake_k8s.rs_reads < 20
+
+    for viewer in viewers:
+        await viewer.aclose()
+    await _eventually(lambda: fake_k8s.open_follows == 0)
+    assert hubs._hubs == {}
+
+
+@pytest.mark.asyncio
+async def test_new_viewers_replay_buffered_lines(fake_k8s: FakeKubernetes) -> None:
+    hubs = DeploymentLogHubs(buffer_lines=5)
+    first = hubs.stream("dep-1", since_seconds=60)
+    fake_k8s.emit("pod-1", "old", age_seconds=3600)
+    for i in range(4):
+        fake_k8s.emit("pod-1", f"a-{i}")
+    fake_k8s.emit("pod-2", "b-0")
+    # The viewer that starts the hub gets the filtered burst, not all of it.
+    assert await _take(first, 5) == ["a-0", "a-1", "a-2", "a-3", "b-0"]
+
+    tail = hubs.stream("dep-1", tail_lines=2)
+    assert await _take(tail, 3) == ["a-2", "a-3", "b-0"]
+    since = hubs.stream("dep-1", since_seconds=60)
+    assert await _take(since, 5) == ["a-0", "a-1", "a-2", "a-3", "b-0"]
+
+    fake_k8s.emit("pod-1", "a-4")
+    for viewer in (first, tail, since):
+        assert await _take(viewer, 1) == ["a-4"]
+    # Each pod/container keeps its last buffer_lines lines.
+    everything = hubs.stream("dep-1")
+    assert await _take(everything, 6) == ["a-0", "a-1", "a-2", "a-3", "b-0", "a-4"]
+    assert len(fake_k8s.follows) == 1
+
+    for viewer in (first, tail, since, everything):
+        await viewer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_starting_viewers_get_their_own_backlog(
+    fake_k8s: FakeKubernetes,
+) -> None:
+    hubs = DeploymentLogHubs(buffer_lines=10)
+    fake_k8s.emit("pod-1", "old", age_seconds=3600)
+    for i in range(3):
+        fake_k8s.emit("pod-1", f"a-{i}")
+    fake_k8s.emit("pod-2", "b-0")
+
+    # Both join before the initial read settles.
+    tail = hubs.stream("dep-1", tail_lines=1)
+    since = hubs.stream("dep-1", since_seconds=60)
+    tail_take = asyncio.create_task(_take(tail, 2))
+    since_take = asyncio.create_task(_take(since, 4))
+    assert await tail_take == ["a-2", "b-0"]
+    assert await since_take == ["a-0", "a-1", "a-2", "b-0"]
+    assert fake_k8s.follows[0]["tail_lines"] == 10
+
+    fake_k8s.emit("pod-1", "a-3")
+    for viewer in (tail, since):
+        assert await _take(viewer, 1) == ["a-3"]
+    assert len(fake_k8s.follows) == 1
+
+    for viewer in (tail, since):
+        await viewer.aclose()
+    await _eventually(lambda: fake_k8s.open_follows == 0)
+
+
+@pytest.mark.asyncio
+async def test_replicaset_change_restarts_follow_once(
+    fake_k8s: FakeKubernetes,
+) -> None:
+    hubs = DeploymentLogHubs(buffer_lines=10)
+    viewers = [hubs.stream("dep-1") for _ in range(3)]
+    fake_k8s.emit("pod-1", "before")
+    for viewer in viewers:
+        assert await _take(viewer, 1) == ["before"]
+
+    fake_k8s.rs_uid = "rs-2"
+    fake_k8s.emit("pod-2", "after")
+    for viewer in viewers:
+        assert await _take(viewer, 1) == ["after"]
+    assert len(fake_k8s.follows) == 2
+
+    # The old ReplicaSet's lines are not replayed to new viewers.
+    late = hubs.stream("dep-1")
+    assert await _take(late, 1) == ["after"]
+
+    for viewer in (*viewers, late):
+        await viewer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_viewers_end_when_logs_end(fake_k8s: FakeKubernetes) -> None:
+    hubs = DeploymentLogHubs(buffer_lines=10)
+    viewers = [hubs.stream("dep-1") for _ in range(2)]
+    fake_k8s.emit("pod-1", "last")
+    fake_k8s.end()
+
+    for viewer in viewers:
+        assert [event.text async for event in viewer] == ["last"]
+    assert hubs._hubs == {}
+
+    # The next viewer starts a new follow.
+    fake_k8s.emit("pod-1", "again")
+    viewer = hubs.stream("dep-1")
+    assert await _take(viewer, 1) == ["again"]
+    assert len(fake_k8s.follows) == 2
+    await viewer.aclose()
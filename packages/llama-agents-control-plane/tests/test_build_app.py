@@ -1,8 +1,13 @@
+from collections.abc import AsyncIterator, Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
-from llama_agents.control_plane.build_api.build_app import build_app
+from llama_agents.control_plane.build_api.build_app import (
+    authenticate_deployment,
+    build_app,
+)
+from llama_agents.control_plane.build_api.build_storage import BuildArtifactStorage
 
 
 @pytest.mark.anyio
@@ -65,3 +70,75 @@ async def test_readyz_returns_503_when_k8s_check_fails() -> None:
             response = await client.get("/readyz")
     assert response.status_code == 503
     assert response.json()["status"] == "unhealthy"
+
+
+class _FakeArtifactStorage:
+    NotFoundError = BuildArtifactStorage.NotFoundError
+    RangeNotSatisfiableError = BuildArtifactStorage.RangeNotSatisfiableError
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.starts: list[int] = []
+
+    async def download_artifact_streaming(
+        self, deployment_name: str, build_id: str, start: int = 0
+    ) -> tuple[int, AsyncIterator[bytes]]:
+        self.starts.append(start)
+        if start >= len(self.data):
+            raise self.RangeNotSatisfiableError(str(start))
+
+        async def stream() -> AsyncIterator[bytes]:
+            yield self.data[start:]
+
+        return len(self.data), stream()
+
+
+@pytest.fixture
+def artifact_client() -> Iterator[tuple[httpx.AsyncClient, _FakeArtifactStorage]]:
+    storage = _FakeArtifactStorage(b"0123456789")
+    deployment = MagicMock()
+    deployment.metadata.name = "dep-1"
+    build_app.dependency_overrides[authenticate_deployment] = lambda: deployment
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=build_app), base_url="http://test"
+    )
+    try:
+        with patch(
+            "llama_agents.control_plane.build_api.build_app.build_artifact_storage",
+            storage,
+        ):
+            yield client, storage
+    finally:
+        build_app.dependency_overrides.pop(authenticate_deployment, None)
+
+
+@pytest.mark.anyio
+async def test_download_artifact_resumes_from_range(
+    artifact_client: tuple[httpx.AsyncClient, _FakeArtifactStorage],
+) -> None:
+    client, storage = artifact_client
+    response = await client.get("/deployments/dep-1/builds/b1")
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+    assert response.headers["accept-ranges"] == "bytes"
+
+    response = await client.get(
+        "/deployments/dep-1/builds/b1", headers={"Range": "bytes=4-"}
+    )
+    assert response.status_code == 206
+    assert response.content == b"456789"
+    assert response.headers["content-range"] == "bytes 4-9/10"
+    assert response.headers["content-length"] == "6"
+
+    # Only open-ended ranges are served partially.
+    response = await client.get(
+        "/deployments/dep-1/builds/b1", headers={"Range": "bytes=2-3"}
+    )
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+
+    response = await client.get(
+        "/deployments/dep-1/builds/b1", headers={"Range": "bytes=10-"}
+    )
+    assert response.status_code == 416
+    assert storage.starts == [0, 4, 0, 10]
@@ -0,0 +1,5 @@
+-- migration: 2
+
+-- Rebuilt BrokerState of a released run and the last tick sequence it covers
+ALTER TABLE run_lifecycle ADD COLUMN IF NOT EXISTS checkpoint_sequence BIGINT;
+ALTER TABLE run_lifecycle ADD COLUMN IF NOT EXISTS checkpoint TEXT;
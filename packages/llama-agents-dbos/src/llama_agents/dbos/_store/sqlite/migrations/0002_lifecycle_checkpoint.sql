@@ -0,0 +1,5 @@
+-- migration: 2
+
+-- Rebuilt BrokerState of a released run and the last tick sequence it covers
+ALTER TABLE run_lifecycle ADD COLUMN checkpoint_sequence INTEGER;
+ALTER TABLE run_lifecycle ADD COLUMN checkpoint TEXT;
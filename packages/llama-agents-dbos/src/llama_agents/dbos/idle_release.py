@@ -11,12 +11,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable, Coroutine
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from contextlib import aclosing
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, cast
 
 from llama_agents.dbos.journal.crud import JournalCrud
 from llama_agents.dbos.journal.lifecycle import (
+    ResumeCheckpoint,
     ResumeClaim,
     RunLifecycleLock,
     RunLifecycleState,
@@ -24,9 +29,10 @@ from llama_agents.dbos.journal.lifecycle import (
 from llama_agents.server._store.abstract_workflow_store import (
     AbstractWorkflowStore,
     HandlerQuery,
-    stream_workflow_ticks,
+    StoredTick,
 )
 from typing_extensions import override
+from workflows.context.context_types import SerializedContext
 from workflows.context.serializers import JsonSerializer
 from workflows.context.state_store import infer_state_type
 from workflows.context.state_store_integration import state_store_handoff
@@ -35,6 +41,7 @@ from workflows.runtime.control_loop import (
     rebuild_state_from_ticks,
     rebuild_state_from_ticks_stream,
 )
+from workflows.runtime.control_loop.reduce import rewind_in_progress
 from workflows.runtime.runtime_decorators import (
     BaseExternalRunAdapterDecorator,
     BaseInternalRunAdapterDecorator,
@@ -50,6 +57,7 @@ from workflows.runtime.types.plugin import (
 from workflows.runtime.types.ticks import (
     TickIdleRelease,
     WorkflowTick,
+    WorkflowTickAdapter,
 )
 from workflows.workflow import Workflow
 
@@ -64,6 +72,15 @@ CRASH_TIMEOUT_SECONDS = 120.0
 STALE_RELEASING_GRACE_SECONDS = 5.0
 
 
+@dataclass
+class _StandbyRun:
+    """Broker state of a released run, as of tick ``sequence``."""
+
+    workflow_name: str
+    state: BrokerState
+    sequence: int | None
+
+
 class _DBOSIdleReleaseInternalRunAdapter(BaseInternalRunAdapterDecorator):
     """Internal adapter that detects idle events and schedules release."""
 
@@ -168,8 +185,11 @@ class DBOSIdleReleaseDecorator(BaseRuntimeDecorator):
         lifecycle_lock: Callable[[], Awaitable[RunLifecycleLock]]
         | Callable[[], RunLifecycleLock]
         | None = None,
+        warm_standby: int = 0,
     ) -> None:
         super().__init__(decorated)
+        if warm_standby < 0:
+            raise ValueError("warm_standby must be >= 0")
         self._store = store
         self._deferred_release_tasks: dict[str, asyncio.Task[None]] = {}
         self._background_tasks: set[asyncio.Task[None]] = set()
@@ -181,6 +201,9 @@ class DBOSIdleReleaseDecorator(BaseRuntimeDecorator):
             raise ValueError("lifecycle_lock is required")
         self._lifecycle_lock_factory = lifecycle_lock
         self._lifecycle_lock_instance: RunLifecycleLock | None = None
+        # Most recently released runs last.
+        self._warm_standby = warm_standby
+        self._standby: OrderedDict[str, _StandbyRun] = OrderedDict()
 
     @property
     def _journal_crud(self) -> JournalCrud | None:
@@ -284,15 +307,144 @@ class DBOSIdleReleaseDecorator(BaseRuntimeDecorator):
             logger.warning(
                 f"Failed to mark released for run_id={run_id}", exc_info=True
             )
+            return
+        await self._checkpoint_released(run_id)
+
+    async def _checkpoint_released(self, run_id: str) -> None:
+        """Save the released run's broker state so resume can skip replay.
+
+        Restoring a checkpoint moves in-progress work back to the queue, as
+        starting a run does anyway, so it is compared with the replayed state
+        after that rewind. It is saved only when the two match; otherwise
+        resume keeps replaying the tick log.
+        """
+        try:
+            handlers = await self._store.query(HandlerQuery(run_id_in=[run_id]))
+            if len(handlers) != 1:
+                return
+            workflow = self._workflows.get(handlers[0].workflow_name)
+            if workflow is None:
+                return
+            state, sequence = await self._replay_ticks(workflow, run_id)
+            if sequence is None:
+                return
+            if self._warm_standby:
+                self._standby[run_id] = _StandbyRun(
+                    workflow.workflow_name, state, sequence
+                )
+                self._standby.move_to_end(run_id)
+                while len(self._standby) > self._warm_standby:
+                    self._standby.popitem(last=False)
+
+            serializer = JsonSerializer()
+            checkpoint = state.to_serialized(serializer).model_dump_json()
+            restored = BrokerState.from_serialized(
+                SerializedContext.model_validate_json(checkpoint), workflow, serializer
+            )
+            now = time.time()
+            if (
+                rewind_in_progress(restored, now)[0]
+                != rewind_in_progress(state, now)[0]
+            ):
+                return
+            lifecycle = await self._get_lifecycle()
+            await lifecycle.save_checkpoint(
+                run_id, ResumeCheckpoint(sequence=sequence, state=checkpoint)
+            )
+        except Exception:
+            logger.warning(
+                f"Failed to checkpoint released run_id={run_id}", exc_info=True
+            )
+
+    async def _replay_ticks(
+        self, workflow: Workflow, run_id: str
+    ) -> tuple[BrokerState, int | None]:
+        """Rebuild BrokerState from persisted ticks, with the last sequence."""
+        last_sequence: int | None = None
+
+        async def ticks() -> AsyncGenerator[WorkflowTick, None]:
+            nonlocal last_sequence
+            async for stored in self._store.stream_ticks(run_id):
+                last_sequence = stored.sequence
+                yield WorkflowTickAdapter.validate_python(stored.tick_data)
+
+        init_state = BrokerState.from_workflow(workflow)
+        state = await rebuild_state_from_ticks_stream(
+            init_state, ticks(), run_id=run_id
+        )
+        return state, last_sequence
 
     async def _broker_state_from_ticks(
         self, workflow: Workflow, run_id: str
     ) -> BrokerState:
         """Rebuild BrokerState from persisted ticks."""
-        init_state = BrokerState.from_workflow(workflow)
-        return await rebuild_state_from_ticks_stream(
-            init_state, stream_workflow_ticks(self._store, run_id), run_id=run_id
+        return (await self._replay_ticks(workflow, run_id))[0]
+
+    async def _has_ticks_after(self, run_id: str, sequence: int) -> bool:
+        ticks = cast(
+            AsyncGenerator[StoredTick, None],
+            self._store.stream_ticks(run_id, after_sequence=sequence),
         )
+        async with aclosing(ticks):
+            async for _ in ticks:
+                return True
+        return False
+
+    async def _resume_broker_state(
+        self,
+        workflow: Workflow,
+        run_id: str,
+        resume_claim: ResumeClaim,
+        standby: _StandbyRun | None,
+    ) -> BrokerState:
+        """BrokerState to resume from: a standby or checkpointed state when
+        no tick was persisted after it, otherwise a replay of the tick log."""
+        checkpoint = resume_claim.checkpoint
+        if standby is not None and standby.sequence is not None:
+            if checkpoint is None or checkpoint.sequence <= standby.sequence:
+                if not await self._has_ticks_after(run_id, standby.sequence):
+                    return standby.state
+        if checkpoint is not None:
+            if not await self._has_ticks_after(run_id, checkpoint.sequence):
+                serializer = JsonSerializer()
+                return BrokerState.from_serialized(
+                    SerializedContext.model_validate_json(checkpoint.state),
+                    workflow,
+                    serializer,
+                )
+        return await self._broker_state_from_ticks(workflow, run_id)
+
+    async def _carry_over_state(
+        self, workflow: Workflow, run_id: str, serializer: JsonSerializer
+    ) -> dict[str, Any] | None:
+        """Hand off the old run's state store, if the workflow has one."""
+        state_type = infer_state_type(workflow)
+        if state_type is None:
+            return None
+        try:
+            old_state_store = self._store.create_state_store(
+                run_id, state_type=state_type
+            )
+            return await state_store_handoff(old_state_store, serializer)
+        except Exception:
+            logger.warning(
+                f"Failed to carry over state from run {run_id}", exc_info=True
+            )
+            return None
+
+    async def _purge_run(self, run_id: str) -> None:
+        try:
+            await DBOS.delete_workflow_async(run_id)
+        except Exception:
+            logger.debug(
+                f"DBOS state already purged for run_id={run_id}", exc_info=True
+            )
+
+    async def _purge_journal(self, journal_crud: JournalCrud, run_id: str) -> None:
+        try:
+            await journal_crud.delete(run_id)
+        except Exception:
+            logger.debug(f"Journal already purged for run_id={run_id}", exc_info=True)
 
     async def _await_old_workflow_for_resume(
         self, run_id: str, resume_claim: ResumeClaim
@@ -334,8 +486,11 @@ class DBOSIdleReleaseDecorator(BaseRuntimeDecorator):
         """Resume a workflow that was previously idle-released.
 
         Waits for the old DBOS workflow to finish (works cross-replica),
-        purges DBOS/journal state, rebuilds from ticks, and starts a fresh
-        DBOS workflow with the same run_id.
+        purges DBOS/journal state, restores the broker state, and starts a
+        fresh DBOS workflow with the same run_id. The broker state comes from
+        this process's warm standby or the checkpoint saved at release when
+        no tick was persisted after it, and from a replay of the tick log
+        otherwise. Independent reads and purges run concurrently.
 
         Args:
             run_id: The workflow run ID to resume.
@@ -346,16 +501,18 @@ class DBOSIdleReleaseDecorator(BaseRuntimeDecorator):
         Returns (run_id, external_adapter).
         """
         self._cancel_deferred_release(run_id)
+        standby = self._standby.pop(run_id, None)
 
-        await self._await_old_workflow_for_resume(run_id, resume_claim)
+        _, handlers = await asyncio.gather(
+            self._await_old_workflow_for_resume(run_id, resume_claim),
+            self._store.query(HandlerQuery(run_id_in=[run_id])),
+        )
 
         lifecycle = await self._get_lifecycle()
         owner_claim = await lifecycle.refresh_resume_owner(run_id, resume_claim.version)
         if owner_claim is None:
             return None
 
-        # Look up handler to get workflow_name
-        handlers = await self._store.query(HandlerQuery(run_id_in=[run_id]))
         if len(handlers) != 1:
             raise ValueError(
                 f"Expected 1 handler for run {run_id}, got {len(handlers)}"
@@ -365,9 +522,15 @@ class DBOSIdleReleaseDecorator(BaseRuntimeDecorator):
         workflow = self._workflows.get(handler.workflow_name)
         if workflow is None:
             raise ValueError(f"Workflow {handler.workflow_name} not found")
+        if standby is not None and standby.workflow_name != handler.workflow_name:
+            standby = None
 
-        # Rebuild BrokerState from persisted ticks
-        init_state = await self._broker_state_from_ticks(workflow, run_id)
+        # Restore BrokerState and carry over the old run's state store.
+        serializer = JsonSerializer()
+        init_state, serialized_state = await asyncio.gather(
+            self._resume_broker_state(workflow, run_id, resume_claim, standby),
+            self._carry_over_state(workflow, run_id, serializer),
+        )
 
         # Include the pending tick in the rebuilt state so the control loop
         # has it queued before it starts processing.
@@ -376,41 +539,15 @@ class DBOSIdleReleaseDecorator(BaseRuntimeDecorator):
                 init_state, [pending_tick], run_id=run_id
             )
 
-        # Carry over state from old run's state store
-        serializer = JsonSerializer()
-        serialized_state: dict[str, Any] | None = None
-        state_type = infer_state_type(workflow)
-        if state_type is not None:
-            try:
-                old_state_store = self._store.create_state_store(
-                    run_id, state_type=state_type
-                )
-                serialized_state = await state_store_handoff(
-                    old_state_store, serializer
-                )
-            except Exception:
-                logger.warning(
-                    f"Failed to carry over state from run {run_id}", exc_info=True
-                )
-
         owner_claim = await lifecycle.refresh_resume_owner(run_id, owner_claim.version)
         if owner_claim is None:
             return None
 
         # Purge DBOS state and journal so the same run_id can be reused.
-        try:
-            await DBOS.delete_workflow_async(run_id)
-        except Exception:
-            logger.debug(
-                f"DBOS state already purged for run_id={run_id}", exc_info=True
-            )
+        purges = [self._purge_run(run_id)]
         if self._journal_crud is not None:
-            try:
-                await self._journal_crud.delete(run_id)
-            except Exception:
-                logger.debug(
-                    f"Journal already purged for run_id={run_id}", exc_info=True
-                )
+            purges.append(self._purge_journal(self._journal_crud, run_id))
+        await asyncio.gather(*purges)
 
         # Start new workflow run with the same run_id.
         new_adapter = self._decorated.run_workflow(
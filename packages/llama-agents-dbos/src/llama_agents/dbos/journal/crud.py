@@ -39,6 +39,17 @@ class JournalCrud(ABC):
     @abstractmethod
     async def insert(self, run_id: str, seq_num: int, task_key: str) -> None: ...
 
+    async def insert_many(
+        self, run_id: str, start_seq_num: int, task_keys: list[str]
+    ) -> None:
+        """Insert consecutive entries starting at ``start_seq_num``.
+
+        Subclasses should override this with a single round trip; the default
+        falls back to one ``insert`` per key.
+        """
+        for offset, task_key in enumerate(task_keys):
+            await self.insert(run_id, start_seq_num + offset, task_key)
+
     @abstractmethod
     async def load(self, run_id: str) -> list[str]: ...
 
@@ -75,6 +86,20 @@ class PostgresJournalCrud(JournalCrud):
             task_key,
         )
 
+    async def insert_many(
+        self, run_id: str, start_seq_num: int, task_keys: list[str]
+    ) -> None:
+        if not task_keys:
+            return
+        await self._pool.execute(
+            f"INSERT INTO {self._table_ref} (run_id, seq_num, task_key) "
+            f"SELECT $1, $2 + ord - 1, task_key "
+            f"FROM unnest($3::text[]) WITH ORDINALITY AS t(task_key, ord)",
+            run_id,
+            start_seq_num,
+            task_keys,
+        )
+
     async def load(self, run_id: str) -> list[str]:
         rows = await self._pool.fetch(
             f"SELECT task_key FROM {self._table_ref} WHERE run_id = $1 ORDER BY seq_num ASC",
@@ -132,6 +157,21 @@ class SqliteJournalCrud(JournalCrud):
             )
             conn.commit()
 
+    async def insert_many(
+        self, run_id: str, start_seq_num: int, task_keys: list[str]
+    ) -> None:
+        if not task_keys:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT INTO {self._table_ref} (run_id, seq_num, task_key) VALUES (?, ?, ?)",
+                [
+                    (run_id, start_seq_num + offset, task_key)
+                    for offset, task_key in enumerate(task_keys)
+                ],
+            )
+            conn.commit()
+
     async def load(self, run_id: str) -> list[str]:
         with self._connect() as conn:
             cursor = conn.execute(
@@ -10,7 +10,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Iterator
+from typing import Any, Iterator
 
 import asyncpg
 from llama_agents.dbos.journal.crud import _qualified_table_ref, _quote_identifier
@@ -26,10 +26,30 @@ class RunLifecycleState(str, Enum):
     resuming = "resuming"
 
 
+@dataclass(frozen=True)
+class ResumeCheckpoint:
+    """Serialized ``BrokerState`` of a released run.
+
+    ``sequence`` is the last persisted tick the state was rebuilt from.
+    """
+
+    sequence: int
+    state: str
+
+
 @dataclass(frozen=True)
 class ResumeClaim:
     version: datetime
     previous_state: RunLifecycleState
+    checkpoint: ResumeCheckpoint | None = None
+
+
+def _checkpoint_from_row(row: Any) -> ResumeCheckpoint | None:
+    if row["checkpoint_sequence"] is None or row["checkpoint"] is None:
+        return None
+    return ResumeCheckpoint(
+        sequence=row["checkpoint_sequence"], state=row["checkpoint"]
+    )
 
 
 class RunLifecycleLock(ABC):
@@ -53,6 +73,15 @@ class RunLifecycleLock(ABC):
         """CAS: releasing -> released. Returns True on success."""
         ...
 
+    @abstractmethod
+    async def save_checkpoint(self, run_id: str, checkpoint: ResumeCheckpoint) -> bool:
+        """Store a resume checkpoint while the run is 'released'.
+
+        A checkpoint never replaces one covering more ticks. Returns True if
+        stored.
+        """
+        ...
+
     @abstractmethod
     async def try_begin_resume(
         self, run_id: str, crash_timeout_seconds: float | None = None
@@ -61,7 +90,8 @@ class RunLifecycleLock(ABC):
 
         Returns:
             None: no row or 'active' - send normally
-            ResumeClaim: transitioned to 'resuming', caller owns resume
+            ResumeClaim: transitioned to 'resuming', caller owns resume. Carries
+                the stored checkpoint, if any.
             releasing/resuming: in progress, caller should wait and retry
 
         If crash_timeout_seconds is set and the current state is 'releasing'
@@ -127,14 +157,27 @@ class PostgresRunLifecycleLock(RunLifecycleLock):
         )
         return row is not None
 
+    async def save_checkpoint(self, run_id: str, checkpoint: ResumeCheckpoint) -> bool:
+        row = await self._pool.fetchrow(
+            f"UPDATE {self._table_ref} SET checkpoint_sequence = $1, checkpoint = $2 "
+            f"WHERE run_id = $3 AND state = $4 "
+            f"AND (checkpoint_sequence IS NULL OR checkpoint_sequence < $1) "
+            f"RETURNING run_id",
+            checkpoint.sequence,
+            checkpoint.state,
+            run_id,
+            RunLifecycleState.released.value,
+        )
+        return row is not None
+
     async def try_begin_resume(
         self, run_id: str, crash_timeout_seconds: float | None = None
     ) -> ResumeClaim | RunLifecycleState | None:
         async with self._pool.acquire() as conn:
             async with conn.transaction():
                 row = await conn.fetchrow(
-                    f"SELECT state, updated_at FROM {self._table_ref} "
-                    f"WHERE run_id = $1 FOR UPDATE",
+                    f"SELECT state, updated_at, checkpoint_sequence, checkpoint "
+                    f"FROM {self._table_ref} WHERE run_id = $1 FOR UPDATE",
                     run_id,
                 )
                 if row is None:
@@ -158,6 +201,7 @@ class PostgresRunLifecycleLock(RunLifecycleLock):
                     return ResumeClaim(
                         version=claim_row["updated_at"],
                         previous_state=state,
+                        checkpoint=_checkpoint_from_row(row),
                     )
                 return state
 
@@ -263,6 +307,24 @@ class SqliteRunLifecycleLock(RunLifecycleLock):
                 conn.commit()
                 return cursor.rowcount > 0
 
+    async def save_checkpoint(self, run_id: str, checkpoint: ResumeCheckpoint) -> bool:
+        async with self._lock(run_id):
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    f"UPDATE {self._table_ref} SET checkpoint_sequence = ?, checkpoint = ? "
+                    f"WHERE run_id = ? AND state = ? "
+                    f"AND (checkpoint_sequence IS NULL OR checkpoint_sequence < ?)",
+                    (
+                        checkpoint.sequence,
+                        checkpoint.state,
+                        run_id,
+                        RunLifecycleState.released.value,
+                        checkpoint.sequence,
+                    ),
+                )
+                conn.commit()
+                return cursor.rowcount > 0
+
     async def try_begin_resume(
         self, run_id: str, crash_timeout_seconds: float | None = None
     ) -> ResumeClaim | RunLifecycleState | None:
@@ -271,7 +333,8 @@ class SqliteRunLifecycleLock(RunLifecycleLock):
                 conn.execute("BEGIN IMMEDIATE")
                 try:
                     row = conn.execute(
-                        f"SELECT state, updated_at FROM {self._table_ref} WHERE run_id = ?",
+                        f"SELECT state, updated_at, checkpoint_sequence, checkpoint "
+                        f"FROM {self._table_ref} WHERE run_id = ?",
                         (run_id,),
                     ).fetchone()
                     if row is None:
@@ -303,7 +366,11 @@ class SqliteRunLifecycleLock(RunLifecycleLock):
                                     run_id,
                                 ),
                             )
-                            result = ResumeClaim(version=version, previous_state=state)
+                            result = ResumeClaim(
+                                version=version,
+                                previous_state=state,
+                                checkpoint=_checkpoint_from_row(row),
+                            )
                     conn.commit()
                     return result
                 except Exception:
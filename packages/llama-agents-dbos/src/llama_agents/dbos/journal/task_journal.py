@@ -60,15 +60,29 @@ class TaskJournal:
 
     async def record(self, key: str) -> None:
         """Record a task completion and persist to database."""
+        await self.record_many([key])
+
+    async def record_many(self, keys: list[str]) -> None:
+        """Record several task completions, in order, with one database write.
+
+        The entries are durable before this returns, so callers may process
+        the completions one at a time afterwards without further writes.
+        """
+        if not keys:
+            return
         if self._entries is None:
             self._entries = []
 
         seq_num = len(self._entries)
-        self._entries.append(key)
-        self._replay_index += 1
+        self._entries.extend(keys)
+        self._replay_index += len(keys)
 
-        if self._crud is not None:
-            await self._crud.insert(self._run_id, seq_num, key)
+        if self._crud is None:
+            return
+        if len(keys) == 1:
+            await self._crud.insert(self._run_id, seq_num, keys[0])
+        else:
+            await self._crud.insert_many(self._run_id, seq_num, keys)
 
     def advance(self) -> None:
         """Advance replay index after processing a replayed task."""
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Completion signals for ``ExternalDBOSAdapter.get_result``.
+
+DBOS answers ``get_result`` on a retrieved or enqueued handle by polling
+``workflow_status``. Instead, a run's control loop signals its waiters in the
+same process as soon as it returns, handing over the result directly. On
+Postgres it also announces the run on a NOTIFY channel, so waiters on other
+replicas fetch the result right away. Polling remains as a safety net for
+signals that are never sent, e.g. when the executing replica crashes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any
+
+import asyncpg
+from workflows.events import StopEvent
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY channel for runs that finished on some replica.
+COMPLETION_CHANNEL = "llama_agents_run_completed"
+
+# Bounds for the LISTEN-connection reconnect backoff.
+_LISTEN_RECONNECT_INITIAL_DELAY = 0.5
+_LISTEN_RECONNECT_MAX_DELAY = 30.0
+
+
+class RunCompletions:
+    """Waiters for runs, woken when a run finishes here or elsewhere.
+
+    A waiter is a future on the waiting loop. It resolves to the run's
+    ``StopEvent`` (or raises its error) when the run finished in this
+    process, and to ``None`` when another replica announced it, in which
+    case the result is read from DBOS. Runs finish on whichever loop DBOS
+    executes them on, so waiters are resolved thread-safely.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict[
+            str, set[tuple[asyncio.AbstractEventLoop, asyncio.Future[Any]]]
+        ] = {}
+        self._listener: asyncpg.Connection | None = None
+        self._dsn: str | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def listening(self) -> bool:
+        """Whether announcements from other replicas are being received."""
+        return self._listener is not None and not self._listener.is_closed()
+
+    def wait(self, run_id: str) -> asyncio.Future[StopEvent | None]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[StopEvent | None] = loop.create_future()
+        with self._lock:
+            self._waiters.setdefault(run_id, set()).add((loop, future))
+        return future
+
+    def discard(self, run_id: str, future: asyncio.Future[Any]) -> None:
+        with self._lock:
+            waiters = self._waiters.get(run_id)
+            if waiters is None:
+                return
+            waiters.discard((future.get_loop(), future))
+            if not waiters:
+                del self._waiters[run_id]
+
+    def finished(
+        self,
+        run_id: str,
+        result: StopEvent | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Wake every waiter of ``run_id``.
+
+        ``result`` and ``error`` are the outcome of a run that finished in
+        this process; with neither, waiters read the outcome from DBOS.
+        """
+        with self._lock:
+            waiters = self._waiters.pop(run_id, set())
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_settle, future, result, error)
+            except RuntimeError:
+                # The waiting loop is closed; nobody is left to wake.
+                pass
+
+    async def listen(self, dsn: str) -> None:
+        """Receive announcements from other replicas on a dedicated connection."""
+        self._dsn = dsn
+        self._closed = False
+        await self._connect(dsn)
+
+    def close(self) -> None:
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        listener, self._listener = self._listener, None
+        if listener is not None and not listener.is_closed():
+            # terminate() does not need the loop the connection was opened
+            # on, which destroy_sync() does not run on.
+            listener.terminate()
+
+    async def _connect(self, dsn: str) -> None:
+        conn = await asyncpg.connect(dsn)
+        await conn.add_listener(COMPLETION_CHANNEL, self._on_notify)
+        conn.add_termination_listener(self._on_listen_termination)
+        self._listener = conn
+
+    @staticmethod
+    async def announce(pool: asyncpg.Pool, run_id: str) -> None:
+        """Tell every listening replica that ``run_id`` finished."""
+        await pool.execute("SELECT pg_notify($1, $2)", COMPLETION_CHANNEL, run_id)
+
+    def _on_notify(
+        self,
+        connection: asyncpg.Connection,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        self.finished(payload)
+
+    def _on_listen_termination(self, connection: asyncpg.Connection) -> None:
+        if self._closed or self._reconnect_task is not None:
+            return
+        self._listener = None
+        try:
+            self._reconnect_task = asyncio.get_running_loop().create_task(
+                self._reconnect()
+            )
+        except RuntimeError:
+            logger.debug("No running loop to schedule completion listener reconnect")
+
+    async def _reconnect(self) -> None:
+        """Re-establish LISTEN with bounded exponential backoff.
+
+        Runs that finished meanwhile are caught by the safety-net poll.
+        """
+        logger.warning("Completion listener connection dropped; reconnecting")
+        delay = _LISTEN_RECONNECT_INITIAL_DELAY
+        try:
+            while not self._closed and self._dsn is not None:
+                try:
+                    await self._connect(self._dsn)
+                    logger.info("Completion listener re-established")
+                    return
+                except Exception:
+                    logger.warning(
+                        "Completion listener reconnect failed; retrying in %.1fs",
+                        delay,
+                        exc_info=True,
+                    )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, _LISTEN_RECONNECT_MAX_DELAY)
+        finally:
+            self._reconnect_task = None
+
+
+def _settle(
+    future: asyncio.Future[StopEvent | None],
+    result: StopEvent | None,
+    error: BaseException | None,
+) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -14,7 +14,8 @@ import logging
 import sqlite3
 import threading
 import time
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Sequence
 from dataclasses import dataclass
 from typing import Any, AsyncGenerator, TypedDict, cast
 
@@ -67,9 +68,7 @@ from workflows.runtime.types.internal_state import BrokerState
 from workflows.runtime.types.named_task import (
     NamedTask,
     PendingStart,
-    all_tasks,
-    find_by_key,
-    get_key,
+    RunningTasks,
 )
 from workflows.runtime.types.plugin import (
     ExternalRunAdapter,
@@ -93,8 +92,9 @@ from workflows.workflow import Workflow
 
 from dbos import DBOS, Queue, SetWorkflowID, WorkflowHandleAsync
 from dbos._context import get_local_dbos_context
+from dbos._core import WorkflowHandleAsyncTask
 from dbos._dbos import _get_dbos_instance
-from dbos._error import DBOSNonExistentWorkflowError
+from dbos._error import DBOSException, DBOSNonExistentWorkflowError
 
 from .executor_lease import ExecutorLeaseManager
 from .idle_release import DBOSIdleReleaseDecorator
@@ -110,6 +110,15 @@ from .journal.lifecycle import (
     SqliteRunLifecycleLock,
 )
 from .journal.task_journal import TaskJournal
+from .run_completion import RunCompletions
+from .stream_batching import (
+    DEFAULT_MAX_DELAY_SEC,
+    DEFAULT_MAX_EVENTS,
+    EventStreamBatchConfig,
+    PublishedEventBatcher,
+    unpack_stream_value,
+)
+from .tick_delivery import TickWakeups, recv_tick
 
 STATE_TABLE_NAME = "workflow_state"
 
@@ -212,14 +221,19 @@ class DBOSWorkflowStore(AbstractWorkflowStore):
     ) -> list[StoredEvent]:
         return await self._resolve().query_events(run_id, after_sequence, limit)
 
+    async def get_last_event(self, run_id: str) -> StoredEvent | None:
+        return await self._resolve().get_last_event(run_id)
+
     async def append_tick(self, run_id: str, tick_data: dict[str, Any]) -> None:
         await self._resolve().append_tick(run_id, tick_data)
 
     async def get_ticks(self, run_id: str) -> list[StoredTick]:
         return await self._resolve().get_ticks(run_id)
 
-    def stream_ticks(self, run_id: str) -> AsyncIterator[StoredTick]:
-        return self._resolve().stream_ticks(run_id)
+    def stream_ticks(
+        self, run_id: str, after_sequence: int | None = None
+    ) -> AsyncIterator[StoredTick]:
+        return self._resolve().stream_ticks(run_id, after_sequence)
 
 
 class ExecutorLeaseConfig(TypedDict, total=False):
@@ -257,6 +271,8 @@ class DBOSRuntimeConfig(TypedDict, total=False):
     pool_size: int
     pool_min_size: int
     max_recovery_attempts: int
+    event_stream_batch: EventStreamBatchConfig | None
+    workflow_event_stream_batch: dict[str, EventStreamBatchConfig | None]
     _experimental_executor_lease: ExecutorLeaseConfig | None
 
 
@@ -346,6 +362,15 @@ class DBOSRuntime(Runtime):
                     Caps how many times a workflow is replayed after a crash
                     before being marked ``MAX_RECOVERY_ATTEMPTS_EXCEEDED``.
                     Defaults to DBOS's own default when unset.
+                event_stream_batch: How events published from inside a step
+                    are coalesced into stream writes: at most ``max_events``
+                    (default 100) per write, each waiting at most
+                    ``max_delay_sec`` (default 0.05). A step's events are
+                    always written before it finishes or sends an event.
+                    Unset or None (the default) writes every event on its
+                    own; pass ``{}`` to batch with the defaults.
+                workflow_event_stream_batch: Per-workflow overrides of
+                    ``event_stream_batch``, keyed by ``workflow_name``.
                 _experimental_executor_lease: Lease-based executor identity.
                     When set, the runtime acquires a named slot from a
                     Postgres-backed pool on launch and uses it as the DBOS
@@ -395,6 +420,8 @@ class DBOSRuntime(Runtime):
         self._workflow_store: AbstractWorkflowStore | None = None
         self._lease_manager: ExecutorLeaseManager | None = None
         self._lease_watch_task: asyncio.Task[None] | None = None
+        self._run_completions = RunCompletions()
+        self._tick_wakeups = TickWakeups()
 
     def _track_task(self, task: asyncio.Task[Any]) -> None:
         self._tasks.append(task)
@@ -470,7 +497,16 @@ class DBOSRuntime(Runtime):
             if self._dsn is not None:
                 await self._ensure_pool()
             workflow_run_fn = create_workflow_run_function(workflow)
-            return await workflow_run_fn(init_state, start_event, tags)
+            run_id = DBOS.workflow_id
+            try:
+                result = await workflow_run_fn(init_state, start_event, tags)
+            except DBOSException:
+                raise
+            except Exception as e:
+                await self._run_finished(run_id, error=e)
+                raise
+            await self._run_finished(run_id, result=result)
+            return result
 
         # Wrap steps with stable names
         wrapped_steps: dict[str, StepWorkerFunction] = {
@@ -487,6 +523,26 @@ class DBOSRuntime(Runtime):
         self._registered[id(workflow)] = registered
         return registered
 
+    async def _run_finished(
+        self,
+        run_id: str | None,
+        result: StopEvent | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Wake this process's get_result waiters and announce the run.
+
+        Called as the control loop returns, before DBOS records the outcome.
+        """
+        if run_id is None:
+            return
+        self._run_completions.finished(run_id, result, error)
+        if self._dsn is None:
+            return
+        try:
+            await RunCompletions.announce(await self._ensure_pool(), run_id)
+        except Exception:
+            logger.debug(f"Failed to announce finished run {run_id}", exc_info=True)
+
     def _get_sql_engine(self) -> Engine:
         """Get the SQLAlchemy engine from DBOS for state storage.
 
@@ -654,18 +710,9 @@ class DBOSRuntime(Runtime):
             with SetWorkflowID(run_id):
                 # Write initial state to DB before starting workflow (non-blocking to caller)
                 if serialized_state:
-                    workflow_store = self.create_workflow_store()
-                    await workflow_store.start()
-                    store = workflow_store.create_state_store(
-                        run_id,
-                        infer_state_type(workflow),
-                        serialized_state,
-                        active_serializer,
+                    await self._seed_state(
+                        run_id, workflow, serialized_state, active_serializer
                     )
-                    # Materialize the seed before the workflow starts so the
-                    # first step observes the restored state.
-                    if isinstance(store, StateStoreFacade):
-                        await store.ensure_seeded()
 
                 try:
                     if workflow._num_concurrent_runs is not None:
@@ -696,8 +743,32 @@ class DBOSRuntime(Runtime):
             run_id,
             self.config.get("polling_interval_sec", 1.0),
             startup_task,
+            completions=self._run_completions,
+            tick_wakeups=self._tick_wakeups,
         )
 
+    async def _seed_state(
+        self,
+        run_id: str,
+        workflow: Workflow,
+        serialized_state: dict[str, Any],
+        serializer: BaseSerializer,
+    ) -> None:
+        """Write a run's initial state through the runtime's workflow store.
+
+        Must complete before the run is submitted. Once DBOS has recorded the
+        run, it recovers it after a crash, and it must never start without
+        its state. ``start()`` is a no-op once the store is running.
+        """
+        workflow_store = self.create_workflow_store()
+        await workflow_store.start()
+        store = workflow_store.create_state_store(
+            run_id, infer_state_type(workflow), serialized_state, serializer
+        )
+        # Materialize the seed so the first step observes the restored state.
+        if isinstance(store, StateStoreFacade):
+            await store.ensure_seeded()
+
     def get_internal_adapter(self, workflow: Workflow) -> InternalRunAdapter:
         # Wait for launch config to be ready. Recovery workflows on DBOS's
         # background loop may arrive before launch() finishes setting up.
@@ -732,14 +803,27 @@ class DBOSRuntime(Runtime):
             else None,
             resolved_pool=self._pool,
             db_path=self._db_path,
+            event_stream_batch=self._event_stream_batch(workflow),
+            tick_wakeups=self._tick_wakeups,
         )
 
+    def _event_stream_batch(self, workflow: Workflow) -> EventStreamBatchConfig | None:
+        overrides = self.config.get("workflow_event_stream_batch", {})
+        if workflow.workflow_name in overrides:
+            return overrides[workflow.workflow_name]
+        return self.config.get("event_stream_batch")
+
     def get_external_adapter(self, run_id: str) -> ExternalRunAdapter:
         if not self._dbos_launched:
             raise RuntimeError(
                 "DBOS runtime not launched. Call runtime.launch() before running workflows."
             )
-        return ExternalDBOSAdapter(run_id, self.config.get("polling_interval_sec", 1.0))
+        return ExternalDBOSAdapter(
+            run_id,
+            self.config.get("polling_interval_sec", 1.0),
+            completions=self._run_completions,
+            tick_wakeups=self._tick_wakeups,
+        )
 
     def create_workflow_store(self) -> AbstractWorkflowStore:
         """Return the cached workflow store, creating it on first call.
@@ -927,7 +1011,9 @@ class DBOSRuntime(Runtime):
         if self.config.get("run_migrations_on_launch", True):
             await self.run_migrations()
 
-    def build_server_runtime(self, *, idle_timeout: float = 600.0) -> Runtime:
+    def build_server_runtime(
+        self, *, idle_timeout: float = 600.0, warm_standby: int = 0
+    ) -> Runtime:
         """Build the decorator chain for use with WorkflowServer.
 
         Wraps the DBOS runtime with:
@@ -941,6 +1027,9 @@ class DBOSRuntime(Runtime):
         Args:
             idle_timeout: Seconds to wait after a workflow becomes idle before
                 releasing it. Defaults to 10 minutes.
+            warm_standby: How many recently released runs keep their broker
+                state in this process, so resuming them here skips loading
+                it. Defaults to 0.
 
         The returned runtime should be passed as the ``runtime`` argument
         to ``WorkflowServer``.
@@ -953,6 +1042,7 @@ class DBOSRuntime(Runtime):
             idle_timeout=idle_timeout,
             journal_crud=self._create_journal_crud_factory(),
             lifecycle_lock=self._create_lifecycle_lock_factory(),
+            warm_standby=warm_standby,
         )
 
     async def launch(self) -> None:
@@ -973,6 +1063,16 @@ class DBOSRuntime(Runtime):
         DBOS.launch()
         self._finalize_launch()
         await self._post_launch()
+        # Only here: launch_sync has no loop that outlives the launch.
+        if self._dsn is not None:
+            try:
+                await self._run_completions.listen(self._dsn)
+            except Exception:
+                logger.warning(
+                    "Could not listen for finished runs; get_result falls back "
+                    "to polling for runs on other replicas",
+                    exc_info=True,
+                )
 
     def launch_sync(self) -> None:
         """Launch DBOS from synchronous code without capturing asyncio.run()'s loop."""
@@ -1043,6 +1143,7 @@ class DBOSRuntime(Runtime):
             await self._lease_manager.release()
             self._lease_manager = None
 
+        self._run_completions.close()
         self._tracked_workflows.clear()
         self._tracked_workflow_ids.clear()
         self._registered.clear()
@@ -1086,14 +1187,29 @@ class DBOSRuntime(Runtime):
 _IO_STREAM_PUBLISHED_EVENTS_NAME = "published_events"
 _IO_STREAM_TICK_TOPIC = "ticks"
 
+# get_result polling once a completion signal is expected instead.
+_SAFETY_NET_POLLING_INTERVAL_SEC = 5.0
+# get_result polling for a run another replica just announced as finished.
+_ANNOUNCED_POLLING_INTERVAL_SEC = 0.02
+
+
+def _current_step_function_id() -> int | None:
+    """Function ID of the DBOS step running in this context, if any."""
+    ctx = get_local_dbos_context()
+    if ctx is None or not ctx.is_step():
+        return None
+    return ctx.curr_step_function_id
+
 
 class InternalDBOSAdapter(InternalRunAdapter):
     """
     Internal DBOS adapter for the workflow control loop.
 
-    - send_event sends ticks via DBOS.send_async
-    - wait_receive receives ticks via DBOS.recv_async
-    - write_to_event_stream publishes events via DBOS streams
+    - send_event sends ticks via DBOS.send_async and wakes a receiver
+      waiting in this process
+    - wait_receive receives ticks via a recorded DBOS recv
+    - write_to_event_stream publishes events via DBOS streams, batching
+      the events of each step invocation
     - get_now returns a durable timestamp
     - close sends shutdown signal to wake blocked recv
     - wait_for_next_task coordinates task completion ordering for deterministic replay
@@ -1110,6 +1226,8 @@ class InternalDBOSAdapter(InternalRunAdapter):
         pool: PoolProvider | None = None,
         resolved_pool: asyncpg.Pool | None = None,
         db_path: str | None = None,
+        event_stream_batch: EventStreamBatchConfig | None = None,
+        tick_wakeups: TickWakeups | None = None,
     ) -> None:
         self._run_id = run_id
         self._engine = engine
@@ -1126,32 +1244,78 @@ class InternalDBOSAdapter(InternalRunAdapter):
         # Journal for deterministic task ordering - lazily initialized
         self._journal: TaskJournal | None = None
         self._orphan_purge_done = False
+        # Completions already journaled but not yet handed to the control loop
+        self._journaled_ready: deque[asyncio.Task[Any]] = deque()
+        self._tick_wakeups = tick_wakeups or TickWakeups()
+        self._event_batcher: PublishedEventBatcher | None = None
+        if event_stream_batch is not None:
+            self._event_batcher = PublishedEventBatcher(
+                self._write_step_events,
+                max_events=event_stream_batch.get("max_events", DEFAULT_MAX_EVENTS),
+                max_delay_sec=event_stream_batch.get(
+                    "max_delay_sec", DEFAULT_MAX_DELAY_SEC
+                ),
+            )
 
     @property
     def run_id(self) -> str:
         return self._run_id
 
+    def supports_in_place_resume(self) -> bool:
+        # Recovery replays the journal, which cannot reattach a live step body.
+        return False
+
     async def write_to_event_stream(self, event: Event) -> None:
-        await DBOS.write_stream_async(_IO_STREAM_PUBLISHED_EVENTS_NAME, event)
+        step_fid = _current_step_function_id()
+        if self._event_batcher is None or step_fid is None:
+            # Control loop writes are recorded operations; they must stay
+            # one per call to replay deterministically.
+            await DBOS.write_stream_async(_IO_STREAM_PUBLISHED_EVENTS_NAME, event)
+            return
+        await self._event_batcher.add(step_fid, event)
+
+    async def _write_step_events(self, step_fid: Hashable, events: list[Event]) -> None:
+        if _current_step_function_id() != step_fid:
+            # A delayed flush outliving its step (only when the step was
+            # cancelled) would write as the workflow and break replay.
+            logger.warning(
+                f"Dropping {len(events)} published events of a cancelled step "
+                f"in run {self._run_id}"
+            )
+            return
+        value = events[0] if len(events) == 1 else events
+        await DBOS.write_stream_async(_IO_STREAM_PUBLISHED_EVENTS_NAME, value)
+
+    async def _flush_step_events(self, last: bool = False) -> None:
+        step_fid = _current_step_function_id()
+        if self._event_batcher is not None and step_fid is not None:
+            await self._event_batcher.flush(step_fid, last=last)
+
+    async def finalize_step(self) -> None:
+        await self._flush_step_events(last=True)
 
     async def get_now(self) -> float:
         return _durable_time()
 
     async def send_event(self, tick: WorkflowTick) -> None:
+        # Events the step published before sending come first in the stream.
+        await self._flush_step_events()
         await DBOS.send_async(self._run_id, tick, topic=_IO_STREAM_TICK_TOPIC)
+        self._tick_wakeups.wake(self._run_id)
 
     async def wait_receive(
         self,
         timeout_seconds: float | None = None,
     ) -> WaitResult:
-        """Wait for tick via DBOS.recv_async. Raises CancelledError on shutdown."""
+        """Wait for tick via a recorded DBOS recv. Raises CancelledError on shutdown."""
         if self._closed:
             raise asyncio.CancelledError("Adapter closed")
 
         recv_task = asyncio.ensure_future(
-            DBOS.recv_async(
+            recv_tick(
+                self._tick_wakeups,
                 _IO_STREAM_TICK_TOPIC,
-                timeout_seconds=timeout_seconds or _UNBOUNDED_WAIT_TIMEOUT_SECONDS,
+                timeout_seconds or _UNBOUNDED_WAIT_TIMEOUT_SECONDS,
             )
         )
         shutdown_task = asyncio.ensure_future(self._shutdown_event.wait())
@@ -1286,7 +1450,7 @@ class InternalDBOSAdapter(InternalRunAdapter):
 
     async def wait_for_next_task(
         self,
-        running: list[NamedTask],
+        running: RunningTasks | Sequence[NamedTask],
         pending: list[PendingStart],
         timeout: float | None = None,
     ) -> WaitForNextTaskResult:
@@ -1298,9 +1462,14 @@ class InternalDBOSAdapter(InternalRunAdapter):
 
         During replay, waits for the specific task that completed in the original run.
         During fresh execution, waits for any task and records the completion order.
+        When several tasks are already done (typical for fan-out), all of them are
+        journaled in one batched write before the first is returned; the rest are
+        handed out by later calls without touching the database.
 
         Args:
-            running: Already-started tasks from previous iterations.
+            running: Started tasks still in flight. Newly started tasks are
+                added to it. A plain sequence of started tasks is tracked in a
+                ``RunningTasks`` for this call only.
             pending: Coroutines to start this iteration.
             timeout: Timeout in seconds, None for no timeout.
 
@@ -1313,6 +1482,9 @@ class InternalDBOSAdapter(InternalRunAdapter):
 
         # Load journal before starting pending coroutines so the orphan purge
         # runs before new fids are consumed.
+        if not isinstance(running, RunningTasks):
+            running = RunningTasks(running)
+
         journal = self._get_or_create_journal()
         await journal.load()
         expected_key = journal.next_expected_key()
@@ -1324,17 +1496,22 @@ class InternalDBOSAdapter(InternalRunAdapter):
         # deterministic function_id ordering for DBOS replay.
         started: list[NamedTask] = []
         for p in pending:
-            started.append(p.start(asyncio.create_task(p.coro)))
+            named = p.start(asyncio.create_task(p.coro))
+            started.append(named)
+            running.add(named)
             await asyncio.sleep(0)
 
-        all_named = running + started
-        tasks = all_tasks(all_named)
-        if not tasks:
+        if not running:
             return WaitForNextTaskResult(None, started)
 
+        while self._journaled_ready:
+            ready = self._journaled_ready.popleft()
+            if ready in running:
+                return WaitForNextTaskResult(ready, started)
+
         if expected_key is not None:
             # Replay mode: wait for specific task
-            target_task = find_by_key(all_named, expected_key)
+            target_task = running.find_by_key(expected_key)
 
             if target_task is None:
                 logger.warning(
@@ -1351,17 +1528,17 @@ class InternalDBOSAdapter(InternalRunAdapter):
                 return WaitForNextTaskResult(target_task, started)
 
         # Fresh execution: wait for first, record it
-        done, _ = await asyncio.wait(
-            tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
-        )
-        if not done:
+        first = await running.wait_done(timeout)
+        if first is None:
             return WaitForNextTaskResult(None, started)
 
-        completed = done.pop()
-        key = get_key(all_named, completed)
-        await journal.record(key)
+        # Journal every finished task in hand-out order (workers before pull),
+        # so the entries are durable before any of them is processed.
+        completed_in_order = [first, *running.pop_all_done()]
+        await journal.record_many([running.key_of(task) for task in completed_in_order])
+        self._journaled_ready.extend(completed_in_order[1:])
 
-        return WaitForNextTaskResult(completed, started)
+        return WaitForNextTaskResult(first, started)
 
 
 class ExternalDBOSAdapter(ExternalRunAdapter):
@@ -1378,11 +1555,15 @@ class ExternalDBOSAdapter(ExternalRunAdapter):
         run_id: str,
         polling_interval_sec: float = 1.0,
         startup_task: asyncio.Task[WorkflowHandleAsync[Any]] | None = None,
+        completions: RunCompletions | None = None,
+        tick_wakeups: TickWakeups | None = None,
     ) -> None:
         self._run_id = run_id
         self._polling_interval_sec = polling_interval_sec
         self._startup_task = startup_task  # None means workflow already started
         self._handle: WorkflowHandleAsync[Any] | None = None
+        self._completions = completions
+        self._tick_wakeups = tick_wakeups
 
     @property
     def run_id(self) -> str:
@@ -1392,16 +1573,63 @@ class ExternalDBOSAdapter(ExternalRunAdapter):
     async def send_event(self, tick: WorkflowTick) -> None:
         await self._ensure_workflow_started()
         await DBOS.send_async(self._run_id, tick, topic=_IO_STREAM_TICK_TOPIC)
+        if self._tick_wakeups is not None:
+            self._tick_wakeups.wake(self._run_id)
 
     async def stream_published_events(self) -> AsyncGenerator[Event, None]:
         await self._ensure_workflow_started()
 
-        async for event in DBOS.read_stream_async(self.run_id, "published_events"):
-            yield event
+        async for value in DBOS.read_stream_async(
+            self.run_id, _IO_STREAM_PUBLISHED_EVENTS_NAME
+        ):
+            for event in unpack_stream_value(value):
+                yield event
 
     async def get_result(self) -> StopEvent:
         handle = await self._ensure_workflow_started()
-        return await handle.get_result(polling_interval_sec=self._polling_interval_sec)
+        ctx = get_local_dbos_context()
+        if (
+            self._completions is None
+            # Already awaits the run's task in this process.
+            or isinstance(handle, WorkflowHandleAsyncTask)
+            # DBOS records get_result inside workflows; keep its path.
+            or (ctx is not None and ctx.is_workflow())
+        ):
+            return await handle.get_result(
+                polling_interval_sec=self._polling_interval_sec
+            )
+
+        completions = self._completions
+        waiter = completions.wait(self._run_id)
+        # Polling is only a safety net for a missed signal; it can be slow
+        # while announcements from other replicas arrive.
+        poll = asyncio.ensure_future(
+            handle.get_result(
+                polling_interval_sec=max(
+                    self._polling_interval_sec, _SAFETY_NET_POLLING_INTERVAL_SEC
+                )
+                if completions.listening
+                else self._polling_interval_sec
+            )
+        )
+        try:
+            await asyncio.wait((waiter, poll), return_when=asyncio.FIRST_COMPLETED)
+            if poll.done():
+                return poll.result()
+            result = waiter.result()
+            if result is not None:
+                return result
+        finally:
+            poll.cancel()
+            completions.discard(self._run_id, waiter)
+            if not waiter.done():
+                waiter.cancel()
+            elif not waiter.cancelled():
+                waiter.exception()  # retrieved, even when the poll won
+        # Announced by another replica, which is recording the outcome now.
+        return await handle.get_result(
+            polling_interval_sec=_ANNOUNCED_POLLING_INTERVAL_SEC
+        )
 
     async def _ensure_workflow_started(self) -> WorkflowHandleAsync[Any]:
         """Wait for the workflow startup task to complete and return the handle."""
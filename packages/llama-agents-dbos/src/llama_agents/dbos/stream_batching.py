@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Coalescing of published events into batched DBOS stream writes.
+
+Every ``DBOS.write_stream_async`` is its own database transaction, so a step
+streaming LLM tokens would otherwise write one row per token. Events a step
+publishes are buffered per step invocation and written as one stream value
+once ``max_events`` are pending or ``max_delay_sec`` passed since the first
+one, and whenever the step finishes or sends an event. A batch is a single
+stream row, so readers see all of its events or none, in publish order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypedDict
+
+from workflows.events import Event
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_EVENTS = 100
+DEFAULT_MAX_DELAY_SEC = 0.05
+
+
+class EventStreamBatchConfig(TypedDict, total=False):
+    """Flush policy for events published from inside a step."""
+
+    max_events: int
+    """Events buffered before a write. 1 writes every event. Default 100."""
+    max_delay_sec: float
+    """Longest an event waits for its batch to fill. Default 0.05."""
+
+
+def unpack_stream_value(value: Any) -> list[Any]:
+    """Events stored in one ``published_events`` stream value, in order."""
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+class PublishedEventBatcher:
+    """Buffers published events per key and writes them in order.
+
+    ``write`` receives the key and the events of one batch. Writes for a key
+    are serialized, so batches reach the stream in the order their events
+    were added.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Hashable, list[Event]], Awaitable[None]],
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_delay_sec: float = DEFAULT_MAX_DELAY_SEC,
+    ) -> None:
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        if max_delay_sec < 0:
+            raise ValueError("max_delay_sec must not be negative")
+        self._write = write
+        self._max_events = max_events
+        self._max_delay_sec = max_delay_sec
+        self._pending: dict[Hashable, list[Event]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._timers: dict[Hashable, asyncio.Task[None]] = {}
+
+    async def add(self, key: Hashable, event: Event) -> None:
+        pending = self._pending.setdefault(key, [])
+        pending.append(event)
+        if len(pending) >= self._max_events:
+            await self.flush(key)
+        elif key not in self._timers:
+            # Created in the caller's context, so the delayed write runs
+            # under the same DBOS step as an immediate one would.
+            self._timers[key] = asyncio.create_task(self._flush_later(key))
+
+    async def flush(self, key: Hashable, *, last: bool = False) -> None:
+        """Write everything pending for ``key``.
+
+        ``last`` means nothing more is added for ``key``, so its bookkeeping
+        is dropped once written.
+        """
+        timer = self._timers.pop(key, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Events added while a write is in flight go out in later
+            # batches, none larger than max_events.
+            while pending := self._pending.get(key):
+                batch = pending[: self._max_events]
+                del pending[: self._max_events]
+                if not pending:
+                    del self._pending[key]
+                await self._write(key, batch)
+        if last:
+            self._locks.pop(key, None)
+
+    async def _flush_later(self, key: Hashable) -> None:
+        await asyncio.sleep(self._max_delay_sec)
+        try:
+            await self.flush(key)
+        except Exception:
+            logger.exception("Failed to write batched published events")
@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""In-process wakeups for ticks sent to a run's control loop.
+
+A tick is always sent durably with ``DBOS.send_async`` and received with a
+recorded ``DBOS.recv``, so recovery replays exactly the operations it would
+without this module. What changes is how a waiting control loop learns that
+a tick arrived. ``DBOS.recv_async`` looks every 100 ms, and on SQLite only
+after DBOS's notification poller (one second by default) noticed the row.
+When the sender is in the same process, typically a step calling
+``ctx.send_event`` on its own run, it wakes the receiver directly instead.
+
+The early wakeup drives DBOS's receive phases through private attributes.
+Each one is checked before use; a DBOS release without them gets plain
+``DBOS.recv_async``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from dbos import DBOS
+from dbos._error import DBOSException
+
+try:
+    from dbos._context import EnterDBOSStepCtx, snapshot_step_context
+    from dbos._dbos import _get_dbos_instance
+except ImportError:  # pragma: no cover - DBOS moved its internals
+    _get_dbos_instance = None  # type: ignore[assignment]
+
+# How often a receiver looks for ticks sent by other processes, as DBOS does.
+_REMOTE_CHECK_INTERVAL_SEC = 0.1
+
+# Private system database attributes recv_tick uses.
+_SYS_DB_ATTRS = (
+    "recv_setup",
+    "recv_check",
+    "recv_consume",
+    "notifications_map",
+    "_notification_fallback_polling_interval",
+)
+
+
+class TickWakeups:
+    """Receivers waiting for ticks, by run ID.
+
+    Receivers may wait on any loop, so wakeups are delivered thread-safely.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict[
+            str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = {}
+
+    @contextmanager
+    def waiting(self, run_id: str) -> Iterator[asyncio.Event]:
+        """Register a receiver for ``run_id`` for the duration of the block."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(run_id, set()).add(waiter)
+        try:
+            yield waiter[1]
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(run_id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[run_id]
+
+    def wake(self, run_id: str) -> None:
+        """Wake receivers of ``run_id``. Call after the tick is committed."""
+        with self._lock:
+            waiters = list(self._waiters.get(run_id, ()))
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The receiving loop is closed.
+                pass
+
+
+def _split_recv_sys_db() -> Any | None:
+    """DBOS's system database if it has everything recv_tick uses, else None."""
+    if _get_dbos_instance is None or not hasattr(
+        DBOS, "_configure_asyncio_thread_pool"
+    ):
+        return None
+    sys_db = getattr(_get_dbos_instance(), "_sys_db", None)
+    if sys_db is None or not all(hasattr(sys_db, name) for name in _SYS_DB_ATTRS):
+        return None
+    return sys_db
+
+
+async def recv_tick(wakeups: TickWakeups, topic: str, timeout_seconds: float) -> Any:
+    """``DBOS.recv_async`` that a same-process sender can wake immediately.
+
+    Records the same operations as ``DBOS.recv_async``, so runs recorded by
+    either replay with the other.
+    """
+    sys_db = _split_recv_sys_db()
+    if sys_db is None:
+        # DBOS releases without split recv phases: no early wakeups.
+        return await DBOS.recv_async(topic, timeout_seconds=timeout_seconds)
+
+    # Function IDs are taken here, before the first await, as DBOS does.
+    cur_ctx = snapshot_step_context(reserve_sleep_id=True)
+    if cur_ctx is None or not cur_ctx.is_workflow():
+        raise DBOSException("recv() must be called from within a workflow")
+    await DBOS._configure_asyncio_thread_pool()
+    with EnterDBOSStepCtx({"name": "recv"}, cur_ctx) as ctx:
+        workflow_id = ctx.workflow_id
+        function_id = ctx.curr_step_function_id
+        # Registered before DBOS checks for a tick, so none is missed.
+        with wakeups.waiting(workflow_id) as woken:
+            setup = await asyncio.to_thread(
+                sys_db.recv_setup,
+                workflow_id,
+                function_id,
+                function_id + 1,
+                topic,
+                timeout_seconds,
+            )
+            if setup[0]:
+                return setup[1]
+            _, arrived, actual_timeout, payload, start_time = setup
+            try:
+                deadline = time.time() + actual_timeout
+                last_check = time.time()
+                while not arrived.is_set():
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(
+                            woken.wait(),
+                            timeout=min(remaining, _REMOTE_CHECK_INTERVAL_SEC),
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    if arrived.is_set():
+                        break
+                    now = time.time()
+                    if (
+                        woken.is_set()
+                        or now - last_check
+                        >= sys_db._notification_fallback_polling_interval
+                    ):
+                        # A wakeup may be for a tick an earlier receive
+                        # already took; only a tick in the table counts.
+                        woken.clear()
+                        last_check = now
+                        await asyncio.to_thread(
+                            sys_db.recv_check, workflow_id, topic, arrived
+                        )
+                return await asyncio.to_thread(
+                    sys_db.recv_consume, workflow_id, function_id, topic, start_time
+                )
+            finally:
+                sys_db.notifications_map.pop(payload)
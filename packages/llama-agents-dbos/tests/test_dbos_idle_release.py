@@ -19,6 +19,7 @@ from llama_agents.dbos.idle_release import (
 )
 from llama_agents.dbos.journal.crud import JournalCrud
 from llama_agents.dbos.journal.lifecycle import (
+    ResumeCheckpoint,
     ResumeClaim,
     RunLifecycleLock,
     RunLifecycleState,
@@ -187,6 +188,7 @@ class FakeLifecycleLock(RunLifecycleLock):
 
     def __init__(self) -> None:
         self._states: dict[str, tuple[RunLifecycleState, datetime]] = {}
+        self.checkpoints: dict[str, ResumeCheckpoint] = {}
 
     async def create(self, run_id: str) -> None:
         self._states[run_id] = (
@@ -214,6 +216,16 @@ class FakeLifecycleLock(RunLifecycleLock):
             return True
         return False
 
+    async def save_checkpoint(self, run_id: str, checkpoint: ResumeCheckpoint) -> bool:
+        entry = self._states.get(run_id)
+        if entry is None or entry[0] != RunLifecycleState.released:
+            return False
+        current = self.checkpoints.get(run_id)
+        if current is not None and current.sequence >= checkpoint.sequence:
+            return False
+        self.checkpoints[run_id] = checkpoint
+        return True
+
     async def try_begin_resume(
         self, run_id: str, crash_timeout_seconds: float | None = None
     ) -> ResumeClaim | RunLifecycleState | None:
@@ -234,7 +246,11 @@ class FakeLifecycleLock(RunLifecycleLock):
                 RunLifecycleState.resuming,
                 version,
             )
-            return ResumeClaim(version=version, previous_state=state)
+            return ResumeClaim(
+                version=version,
+                previous_state=state,
+                checkpoint=self.checkpoints.get(run_id),
+            )
         return state
 
     async def refresh_resume_owner(
@@ -1219,6 +1235,113 @@ async def test_do_resume_replays_persisted_ticks(
     assert init_state.is_running is True
 
 
+async def _release_with_ticks(
+    decorator: DBOSIdleReleaseDecorator,
+    store: MemoryWorkflowStore,
+    lifecycle: FakeLifecycleLock,
+) -> None:
+    workflow = SimpleWorkflow()
+    decorator.track_workflow(workflow)
+    _seed_handler(store, workflow_name=workflow.workflow_name, run_id="run-1")
+    tick = TickAddEvent(event=StartEvent())
+    await store.append_tick("run-1", WorkflowTickAdapter.dump_python(tick))
+    await lifecycle.create("run-1")
+    await lifecycle.begin_release("run-1")
+    await decorator._await_and_mark_released(
+        "run-1", StubExternalAdapter(run_id="run-1")
+    )
+
+
+@pytest.mark.asyncio()
+async def test_do_resume_restores_release_checkpoint_without_replay(
+    decorator: DBOSIdleReleaseDecorator,
+    store: MemoryWorkflowStore,
+    stub_runtime: StubRuntime,
+    mock_journal_crud: AsyncMock,
+    mock_dbos: AsyncMock,
+    lifecycle: FakeLifecycleLock,
+) -> None:
+    await _release_with_ticks(decorator, store, lifecycle)
+    assert "run-1" in lifecycle.checkpoints
+
+    claim = await _claim_resume(lifecycle)
+    with patch.object(
+        decorator, "_broker_state_from_ticks", AsyncMock(side_effect=AssertionError)
+    ):
+        await decorator._do_resume("run-1", resume_claim=claim)
+
+    init_state = stub_runtime.run_workflow_calls[0]["init_state"]
+    assert init_state.is_running is True
+
+
+@pytest.mark.asyncio()
+async def test_do_resume_replays_ticks_persisted_after_checkpoint(
+    decorator: DBOSIdleReleaseDecorator,
+    store: MemoryWorkflowStore,
+    stub_runtime: StubRuntime,
+    mock_journal_crud: AsyncMock,
+    mock_dbos: AsyncMock,
+    lifecycle: FakeLifecycleLock,
+) -> None:
+    await _release_with_ticks(decorator, store, lifecycle)
+    tick = TickAddEvent(event=StartEvent())
+    await store.append_tick("run-1", WorkflowTickAdapter.dump_python(tick))
+
+    claim = await _claim_resume(lifecycle)
+    with patch.object(
+        decorator,
+        "_broker_state_from_ticks",
+        wraps=decorator._broker_state_from_ticks,
+    ) as replay:
+        await decorator._do_resume("run-1", resume_claim=claim)
+
+    replay.assert_awaited_once()
+    assert len(stub_runtime.run_workflow_calls) == 1
+
+
+@pytest.mark.asyncio()
+async def test_do_resume_restores_warm_standby_without_replay(
+    stub_runtime: StubRuntime,
+    store: MemoryWorkflowStore,
+    mock_journal_crud: AsyncMock,
+    mock_dbos: AsyncMock,
+    lifecycle: FakeLifecycleLock,
+) -> None:
+    decorator = DBOSIdleReleaseDecorator(
+        BaseRuntimeDecorator(stub_runtime),
+        store,
+        journal_crud=lambda: mock_journal_crud,
+        lifecycle_lock=lambda: lifecycle,
+        warm_standby=1,
+    )
+    await _release_with_ticks(decorator, store, lifecycle)
+    assert "run-1" in decorator._standby
+    lifecycle.checkpoints.clear()
+
+    claim = await _claim_resume(lifecycle)
+    with patch.object(
+        decorator, "_broker_state_from_ticks", AsyncMock(side_effect=AssertionError)
+    ):
+        await decorator._do_resume("run-1", resume_claim=claim)
+
+    assert stub_runtime.run_workflow_calls[0]["init_state"].is_running is True
+    assert "run-1" not in decorator._standby
+
+
+def test_warm_standby_must_not_be_negative(
+    stub_runtime: StubRuntime,
+    store: MemoryWorkflowStore,
+    lifecycle: FakeLifecycleLock,
+) -> None:
+    with pytest.raises(ValueError, match="warm_standby"):
+        DBOSIdleReleaseDecorator(
+            BaseRuntimeDecorator(stub_runtime),
+            store,
+            lifecycle_lock=lambda: lifecycle,
+            warm_standby=-1,
+        )
+
+
 @pytest.mark.asyncio()
 async def test_await_and_mark_released_handles_get_result_failure(
     decorator: DBOSIdleReleaseDecorator,
@@ -32,7 +32,7 @@ from workflows.context.state_store import DictState, InMemoryStateStore, StateSt
 from workflows.decorators import step
 from workflows.events import Event, StartEvent, StopEvent
 from workflows.runtime.types.internal_state import BrokerState
-from workflows.runtime.types.named_task import WorkerTask
+from workflows.runtime.types.named_task import RunningTasks, WorkerTask
 from workflows.runtime.types.plugin import RegisteredWorkflow
 from workflows.runtime.types.step_id import StepId
 from workflows.testing import WorkflowTestRunner
@@ -396,6 +396,41 @@ async def test_run_workflow_seeds_state_store_from_durable_handle() -> None:
     assert start_observations == {"run_id": "run-1", "state_seeded": True}
 
 
+class SeededCounterWorkflow(Workflow):
+    @step
+    async def bump(self, ctx: Context, ev: StartEvent) -> StopEvent:
+        count = await ctx.store.get("count", default=0)
+        await ctx.store.set("count", count + 1)
+        return StopEvent(result=count + 1)
+
+
+@pytest.mark.asyncio
+async def test_seeded_runs_share_the_runtime_workflow_store(
+    dbos_runtime: DBOSRuntime,
+) -> None:
+    wf = SeededCounterWorkflow(runtime=dbos_runtime)
+    await dbos_runtime.launch()
+    serializer = JsonSerializer()
+    seed = InMemoryStateStore(DictState(count=41)).to_dict(serializer)
+    store = dbos_runtime.create_workflow_store()
+
+    async def run_seeded(run_id: str) -> Any:
+        adapter = dbos_runtime.run_workflow(
+            run_id,
+            wf,
+            BrokerState.from_workflow(wf),
+            start_event=StartEvent(),
+            serialized_state=seed,
+            serializer=serializer,
+        )
+        return await adapter.get_result()
+
+    results = await asyncio.gather(*(run_seeded(f"seeded-{i}") for i in range(5)))
+
+    assert [r.result for r in results] == [42] * 5
+    assert dbos_runtime.create_workflow_store() is store
+
+
 @pytest.mark.asyncio
 async def test_replay_wait_for_next_task_timeout_returns_none(
     journal_db_path: str,
@@ -416,7 +451,7 @@ async def test_replay_wait_for_next_task_timeout_returns_none(
 
     try:
         result = await adapter.wait_for_next_task(
-            [WorkerTask(StepId.root("step_a"), 0, task)],
+            RunningTasks([WorkerTask(StepId.root("step_a"), 0, task)]),
             [],
             timeout=0.01,
         )
@@ -427,6 +462,89 @@ async def test_replay_wait_for_next_task_timeout_returns_none(
             await task
 
 
+@pytest.mark.asyncio
+async def test_fresh_wait_for_next_task_batches_simultaneous_completions(
+    journal_db_path: str,
+    sqlite_engine: Engine,
+) -> None:
+    """Tasks that finished together are journaled once and handed out in order."""
+    run_id = "batched-journal-run"
+    adapter = InternalDBOSAdapter(
+        run_id=run_id, engine=sqlite_engine, db_path=journal_db_path
+    )
+    adapter._orphan_purge_done = True
+
+    async def done(value: int) -> int:
+        return value
+
+    tasks = [asyncio.create_task(done(i)) for i in range(3)]
+    await asyncio.gather(*tasks)
+    running = RunningTasks(
+        WorkerTask(StepId.root("step_a"), i, t) for i, t in enumerate(tasks)
+    )
+
+    with (
+        patch.object(SqliteJournalCrud, "insert", autospec=True) as insert,
+        patch.object(
+            SqliteJournalCrud,
+            "insert_many",
+            autospec=True,
+            side_effect=SqliteJournalCrud.insert_many,
+        ) as insert_many,
+    ):
+        completed = []
+        for _ in range(3):
+            result = await adapter.wait_for_next_task(running, [], timeout=1.0)
+            assert result.completed is not None
+            completed.append(result.completed)
+            running.discard(result.completed)
+
+    assert completed == tasks
+    insert.assert_not_called()
+    assert insert_many.call_count == 1
+
+    journal = TaskJournal(run_id, SqliteJournalCrud(db_path=journal_db_path))
+    await journal.load()
+    assert journal._entries == ["step_a:0", "step_a:1", "step_a:2"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_next_task_accepts_a_task_sequence(
+    journal_db_path: str,
+    sqlite_engine: Engine,
+) -> None:
+    """The override accepts the base signature's plain sequence form."""
+    run_id = "sequence-run"
+    adapter = InternalDBOSAdapter(
+        run_id=run_id, engine=sqlite_engine, db_path=journal_db_path
+    )
+    adapter._orphan_purge_done = True
+
+    async def done() -> None:
+        return None
+
+    task = asyncio.create_task(done())
+    pending = asyncio.create_task(asyncio.sleep(5.0))
+    try:
+        result = await adapter.wait_for_next_task(
+            [
+                WorkerTask(StepId.root("step_a"), 0, pending),
+                WorkerTask(StepId.root("step_b"), 0, task),
+            ],
+            [],
+            timeout=1.0,
+        )
+        assert result.completed is task
+    finally:
+        pending.cancel()
+        with suppress(asyncio.CancelledError):
+            await pending
+
+    journal = TaskJournal(run_id, SqliteJournalCrud(db_path=journal_db_path))
+    await journal.load()
+    assert journal._entries == ["step_b:0"]
+
+
 @pytest.mark.asyncio
 async def test_async_launch_runs_dbos_launch_on_caller_loop(
     monkeypatch: pytest.MonkeyPatch,
@@ -16,6 +16,7 @@ from llama_agents.dbos._store import POSTGRES_MIGRATION_SOURCE
 from llama_agents.dbos.journal.lifecycle import (
     LIFECYCLE_TABLE_NAME,
     PostgresRunLifecycleLock,
+    ResumeCheckpoint,
     ResumeClaim,
     RunLifecycleLock,
     RunLifecycleState,
@@ -178,6 +179,25 @@ async def test_try_begin_resume_released_transitions_to_resuming(
     assert await lock.try_begin_resume("run-1") == RunLifecycleState.resuming
 
 
+@both
+@pytest.mark.asyncio
+async def test_resume_claim_carries_latest_checkpoint(
+    lock_fixture: LockFixture,
+) -> None:
+    lock, _ = lock_fixture
+    await lock.create("run-1")
+    assert await lock.save_checkpoint("run-1", ResumeCheckpoint(1, "{}")) is False
+    await lock.begin_release("run-1")
+    await lock.complete_release("run-1")
+
+    assert await lock.save_checkpoint("run-1", ResumeCheckpoint(7, "new")) is True
+    assert await lock.save_checkpoint("run-1", ResumeCheckpoint(3, "old")) is False
+
+    claim = await lock.try_begin_resume("run-1")
+    assert isinstance(claim, ResumeClaim)
+    assert claim.checkpoint == ResumeCheckpoint(7, "new")
+
+
 @both
 @pytest.mark.asyncio
 async def test_try_begin_resume_releasing_returns_releasing(
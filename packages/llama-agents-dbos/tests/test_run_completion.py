@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Tests for push-based completion of ``ExternalDBOSAdapter.get_result``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import uuid
+from typing import Generator
+
+import pytest
+from dbos import DBOS, DBOSConfig
+from llama_agents.dbos import DBOSRuntime
+from llama_agents.dbos.run_completion import RunCompletions
+from workflows.decorators import step
+from workflows.events import StartEvent, StopEvent
+from workflows.workflow import Workflow
+
+# Far longer than any test may take: results must not come from polling.
+_SLOW_POLLING_INTERVAL_SEC = 60.0
+
+
+@pytest.fixture(scope="module")
+def dbos_config(tmp_path_factory: pytest.TempPathFactory) -> DBOSConfig:
+    db_file = tmp_path_factory.mktemp("dbos") / "dbos_run_completion.sqlite3"
+    return {
+        "name": "workflows-dbos-run-completion",
+        "system_database_url": f"sqlite+pysqlite:///{db_file}?check_same_thread=false",
+        "run_admin_server": False,
+    }  # type: ignore[return-value]
+
+
+@pytest.fixture(scope="module")
+def slow_polling_runtime(
+    dbos_config: DBOSConfig,
+) -> Generator[DBOSRuntime, None, None]:
+    DBOS(config=dbos_config)
+    runtime = DBOSRuntime(polling_interval_sec=_SLOW_POLLING_INTERVAL_SEC)
+    try:
+        yield runtime
+    finally:
+        runtime.destroy_sync()
+
+
+class SlowWorkflow(Workflow):
+    @step
+    async def work(self, ev: StartEvent) -> StopEvent:
+        # Long enough that get_result starts waiting before the run ends.
+        await asyncio.sleep(0.2)
+        return StopEvent(result="done")
+
+
+class FailingWorkflow(Workflow):
+    @step
+    async def work(self, ev: StartEvent) -> StopEvent:
+        await asyncio.sleep(0.2)
+        raise ValueError("boom")
+
+
+# ── RunCompletions ──────────────────────────────────────────────────
+
+
+async def test_finished_resolves_waiters_with_result() -> None:
+    completions = RunCompletions()
+    first = completions.wait("run-1")
+    second = completions.wait("run-1")
+    other = completions.wait("run-2")
+    result = StopEvent(result="done")
+
+    completions.finished("run-1", result)
+
+    assert await first is result
+    assert await second is result
+    assert not other.done()
+
+
+async def test_finished_raises_error_in_waiters() -> None:
+    completions = RunCompletions()
+    waiter = completions.wait("run-1")
+
+    completions.finished("run-1", error=ValueError("boom"))
+
+    with pytest.raises(ValueError, match="boom"):
+        await waiter
+
+
+async def test_announced_run_resolves_waiters_with_none() -> None:
+    completions = RunCompletions()
+    waiter = completions.wait("run-1")
+
+    completions.finished("run-1")
+
+    assert await waiter is None
+
+
+async def test_discarded_waiter_is_not_woken() -> None:
+    completions = RunCompletions()
+    waiter = completions.wait("run-1")
+    completions.discard("run-1", waiter)
+
+    completions.finished("run-1", StopEvent())
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+
+
+async def test_finished_wakes_waiters_from_another_thread() -> None:
+    completions = RunCompletions()
+    waiter = completions.wait("run-1")
+    result = StopEvent(result="done")
+
+    thread = threading.Thread(target=completions.finished, args=("run-1", result))
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(waiter, timeout=5) is result
+
+
+def test_not_listening_without_a_connection() -> None:
+    completions = RunCompletions()
+    assert not completions.listening
+    completions.close()
+
+
+# ── ExternalDBOSAdapter.get_result ──────────────────────────────────
+
+
+async def test_get_result_does_not_wait_for_polling(
+    slow_polling_runtime: DBOSRuntime,
+) -> None:
+    wf = SlowWorkflow(runtime=slow_polling_runtime)
+    await slow_polling_runtime.launch()
+    run_id = f"completion-{uuid.uuid4()}"
+
+    handler = wf.run(run_id=run_id)
+    # A retrieved handle would poll every polling_interval_sec.
+    adapter = slow_polling_runtime.get_external_adapter(run_id)
+    result = await asyncio.wait_for(adapter.get_result(), timeout=10)
+
+    assert result.result == "done"
+    await handler
+
+
+async def test_get_result_raises_run_error_without_polling(
+    slow_polling_runtime: DBOSRuntime,
+) -> None:
+    wf = FailingWorkflow(runtime=slow_polling_runtime)
+    await slow_polling_runtime.launch()
+    run_id = f"completion-{uuid.uuid4()}"
+
+    handler = wf.run(run_id=run_id)
+    adapter = slow_polling_runtime.get_external_adapter(run_id)
+    with pytest.raises(Exception, match="boom"):
+        await asyncio.wait_for(adapter.get_result(), timeout=10)
+
+    with pytest.raises(Exception, match="boom"):
+        await handler
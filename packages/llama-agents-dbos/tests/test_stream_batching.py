@@ -0,0 +1,189 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Tests for batched writes of events published from steps."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import uuid
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from dbos import DBOS, DBOSConfig
+from llama_agents.dbos import DBOSRuntime
+from llama_agents.dbos.stream_batching import (
+    PublishedEventBatcher,
+    unpack_stream_value,
+)
+from workflows.context import Context
+from workflows.decorators import step
+from workflows.events import Event, StartEvent, StopEvent
+from workflows.workflow import Workflow
+
+
+class Token(Event):
+    index: int
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.writes: list[tuple[Hashable, list[int]]] = []
+
+    async def write(self, key: Hashable, events: list[Event]) -> None:
+        await asyncio.sleep(0)
+        self.writes.append((key, [e.index for e in events]))  # type: ignore[attr-defined]
+
+
+# ── PublishedEventBatcher ───────────────────────────────────────────
+
+
+async def test_batcher_writes_when_batch_is_full() -> None:
+    recorder = _Recorder()
+    batcher = PublishedEventBatcher(recorder.write, max_events=3, max_delay_sec=60)
+
+    for i in range(7):
+        await batcher.add("step", Token(index=i))
+    assert recorder.writes == [("step", [0, 1, 2]), ("step", [3, 4, 5])]
+
+    await batcher.flush("step", last=True)
+    assert recorder.writes[-1] == ("step", [6])
+
+
+async def test_batcher_writes_after_max_delay() -> None:
+    recorder = _Recorder()
+    batcher = PublishedEventBatcher(recorder.write, max_events=100, max_delay_sec=0.01)
+
+    await batcher.add("step", Token(index=0))
+    await batcher.add("step", Token(index=1))
+    assert recorder.writes == []
+
+    await asyncio.sleep(0.1)
+    assert recorder.writes == [("step", [0, 1])]
+
+
+async def test_batcher_keeps_order_under_concurrent_adds() -> None:
+    recorder = _Recorder()
+    batcher = PublishedEventBatcher(recorder.write, max_events=4, max_delay_sec=0.001)
+
+    # Fire-and-forget adds, the way ctx.write_event_to_stream issues them.
+    await asyncio.gather(
+        *(batcher.add(key, Token(index=i)) for i in range(50) for key in ("a", "b"))
+    )
+    await batcher.flush("a", last=True)
+    await batcher.flush("b", last=True)
+    await asyncio.sleep(0.01)
+
+    for key in ("a", "b"):
+        batches = [batch for k, batch in recorder.writes if k == key]
+        assert [i for batch in batches for i in batch] == list(range(50))
+        assert all(len(batch) <= 4 for batch in batches)
+
+
+def test_batcher_rejects_invalid_policy() -> None:
+    with pytest.raises(ValueError, match="max_events"):
+        PublishedEventBatcher(_Recorder().write, max_events=0)
+    with pytest.raises(ValueError, match="max_delay_sec"):
+        PublishedEventBatcher(_Recorder().write, max_delay_sec=-1)
+
+
+def test_unpack_stream_value() -> None:
+    event = Token(index=0)
+    assert unpack_stream_value(event) == [event]
+    assert unpack_stream_value([event, event]) == [event, event]
+
+
+# ── DBOS runtime ────────────────────────────────────────────────────
+
+
+def test_batching_is_opt_in() -> None:
+    wf = TokenStreamWorkflow(workflow_name="tokens")
+    assert DBOSRuntime()._event_stream_batch(wf) is None
+    runtime = DBOSRuntime(
+        event_stream_batch={}, workflow_event_stream_batch={"tokens": None}
+    )
+    assert runtime._event_stream_batch(wf) is None
+    assert runtime._event_stream_batch(TokenStreamWorkflow()) == {}
+
+
+_TOKENS = 250
+
+
+class TokenStreamWorkflow(Workflow):
+    @step
+    async def stream(self, ctx: Context, ev: StartEvent) -> StopEvent:
+        for i in range(_TOKENS):
+            ctx.write_event_to_stream(Token(index=i))
+        return StopEvent(result="done")
+
+
+@pytest.fixture(scope="module")
+def db_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("dbos") / "dbos_stream_batching.sqlite3"
+
+
+@pytest.fixture(scope="module")
+def batching_runtime(db_file: Path) -> Generator[DBOSRuntime, None, None]:
+    config: DBOSConfig = {
+        "name": "workflows-dbos-stream-batching",
+        "system_database_url": f"sqlite+pysqlite:///{db_file}?check_same_thread=false",
+        "run_admin_server": False,
+    }
+    DBOS(config=config)
+    runtime = DBOSRuntime(
+        polling_interval_sec=0.01,
+        event_stream_batch={"max_events": 64},
+        workflow_event_stream_batch={"per-event": {"max_events": 1}},
+    )
+    try:
+        yield runtime
+    finally:
+        runtime.destroy_sync()
+
+
+def _stream_rows(db_file: Path, run_id: str) -> int:
+    with sqlite3.connect(db_file) as conn:
+        (count,) = conn.execute(
+            "SELECT COUNT(*) FROM streams WHERE workflow_uuid = ? AND key = ?",
+            (run_id, "published_events"),
+        ).fetchone()
+    return count
+
+
+async def _run_and_read(runtime: DBOSRuntime, wf: Workflow) -> tuple[str, list[int]]:
+    await runtime.launch()
+    run_id = f"batching-{uuid.uuid4()}"
+    handler = wf.run(run_id=run_id)
+    await handler
+    adapter = runtime.get_external_adapter(run_id)
+    indices = [
+        event.index
+        async for event in adapter.stream_published_events()
+        if isinstance(event, Token)
+    ]
+    return run_id, indices
+
+
+async def test_step_events_are_written_in_batches(
+    batching_runtime: DBOSRuntime, db_file: Path
+) -> None:
+    wf = TokenStreamWorkflow(runtime=batching_runtime)
+
+    run_id, indices = await _run_and_read(batching_runtime, wf)
+
+    assert indices == list(range(_TOKENS))
+    # Four batches of tokens plus the control loop's own events.
+    assert _stream_rows(db_file, run_id) < _TOKENS // 10
+
+
+async def test_flush_policy_is_configurable_per_workflow(
+    batching_runtime: DBOSRuntime, db_file: Path
+) -> None:
+    wf = TokenStreamWorkflow(runtime=batching_runtime, workflow_name="per-event")
+
+    run_id, indices = await _run_and_read(batching_runtime, wf)
+
+    assert indices == list(range(_TOKENS))
+    assert _stream_rows(db_file, run_id) >= _TOKENS
@@ -197,3 +197,44 @@ async def test_run_id_isolation(journal_db_path: str) -> None:
     check2 = _make_journal("run-2", journal_db_path)
     await check2.load()
     assert check2.next_expected_key() == "step_b:0"
+
+
+@pytest.mark.asyncio
+async def test_record_many_persists_in_order(journal_db_path: str) -> None:
+    """record_many appends several keys after existing entries."""
+    journal = _make_journal("batch-run", journal_db_path)
+    await journal.load()
+    await journal.record("step_a:0")
+    await journal.record_many(["step_b:1", "step_b:2", "__pull__:0"])
+
+    assert journal._replay_index == 4
+
+    journal2 = _make_journal("batch-run", journal_db_path)
+    await journal2.load()
+    replayed = []
+    while (key := journal2.next_expected_key()) is not None:
+        replayed.append(key)
+        journal2.advance()
+    assert replayed == ["step_a:0", "step_b:1", "step_b:2", "__pull__:0"]
+
+
+@pytest.mark.asyncio
+async def test_record_many_uses_single_insert(journal_db_path: str) -> None:
+    """A batch of keys is written with one insert_many call."""
+    crud = SqliteJournalCrud(db_path=journal_db_path)
+    calls: list[tuple[int, list[str]]] = []
+    original = crud.insert_many
+
+    async def tracking_insert_many(
+        run_id: str, start_seq_num: int, task_keys: list[str]
+    ) -> None:
+        calls.append((start_seq_num, list(task_keys)))
+        await original(run_id, start_seq_num, task_keys)
+
+    crud.insert_many = tracking_insert_many  # type: ignore[method-assign]
+    journal = TaskJournal("single-insert-run", crud)
+    await journal.load()
+    await journal.record_many([])
+    await journal.record_many(["step_a:0", "step_a:1"])
+
+    assert calls == [(0, ["step_a:0", "step_a:1"])]
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Tests for in-process wakeups of ticks sent to a run's control loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import types
+from typing import Generator
+
+import pytest
+from dbos import DBOS, DBOSConfig
+from llama_agents.dbos import DBOSRuntime, tick_delivery
+from llama_agents.dbos.tick_delivery import TickWakeups, recv_tick
+from workflows.context import Context
+from workflows.decorators import step
+from workflows.events import Event, StartEvent, StopEvent
+from workflows.workflow import Workflow
+
+_HOPS = 5
+
+
+async def test_wake_sets_receivers_of_the_run() -> None:
+    wakeups = TickWakeups()
+    with wakeups.waiting("run-1") as first, wakeups.waiting("run-2") as other:
+        wakeups.wake("run-1")
+        await asyncio.wait_for(first.wait(), timeout=5)
+        assert not other.is_set()
+
+
+async def test_wake_from_another_thread() -> None:
+    wakeups = TickWakeups()
+    with wakeups.waiting("run-1") as woken:
+        thread = threading.Thread(target=wakeups.wake, args=("run-1",))
+        thread.start()
+        thread.join()
+        await asyncio.wait_for(woken.wait(), timeout=5)
+
+
+async def test_wake_without_receivers_is_a_no_op() -> None:
+    wakeups = TickWakeups()
+    with wakeups.waiting("run-1"):
+        pass
+    wakeups.wake("run-1")
+    assert wakeups._waiters == {}
+
+
+@pytest.mark.parametrize("dbos_instance", [None, types.SimpleNamespace()])
+async def test_recv_tick_falls_back_without_dbos_internals(
+    monkeypatch: pytest.MonkeyPatch, dbos_instance: types.SimpleNamespace | None
+) -> None:
+    calls: list[tuple[str, float]] = []
+
+    async def recv_async(topic: str, timeout_seconds: float) -> str:
+        calls.append((topic, timeout_seconds))
+        return "tick"
+
+    monkeypatch.setattr(DBOS, "recv_async", recv_async)
+    # No private DBOS internals at all, or a system database missing them.
+    monkeypatch.setattr(
+        tick_delivery,
+        "_get_dbos_instance",
+        None if dbos_instance is None else lambda: dbos_instance,
+    )
+    if dbos_instance is not None:
+        dbos_instance._sys_db = types.SimpleNamespace(recv_setup=None)
+
+    assert await recv_tick(TickWakeups(), "ticks", 5.0) == "tick"
+    assert calls == [("ticks", 5.0)]
+
+
+class Hop(Event):
+    index: int
+
+
+class SendEventChainWorkflow(Workflow):
+    @step
+    async def start(self, ctx: Context, ev: StartEvent) -> Hop | None:
+        ctx.send_event(Hop(index=0))
+        return None
+
+    @step
+    async def hop(self, ctx: Context, ev: Hop) -> StopEvent | Hop | None:
+        if ev.index + 1 == _HOPS:
+            return StopEvent(result=ev.index)
+        ctx.send_event(Hop(index=ev.index + 1))
+        return None
+
+
+@pytest.fixture(scope="module")
+def slow_notifications_runtime(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[DBOSRuntime, None, None]:
+    db_file = tmp_path_factory.mktemp("dbos") / "dbos_tick_delivery.sqlite3"
+    config: DBOSConfig = {
+        "name": "workflows-dbos-tick-delivery",
+        "system_database_url": f"sqlite+pysqlite:///{db_file}?check_same_thread=false",
+        "run_admin_server": False,
+        # Ticks must not depend on DBOS noticing them by polling.
+        "notification_listener_polling_interval_sec": 60.0,
+    }
+    DBOS(config=config)
+    runtime = DBOSRuntime(polling_interval_sec=0.01)
+    try:
+        yield runtime
+    finally:
+        runtime.destroy_sync()
+
+
+async def test_send_event_from_step_wakes_control_loop(
+    slow_notifications_runtime: DBOSRuntime,
+) -> None:
+    wf = SendEventChainWorkflow(runtime=slow_notifications_runtime)
+    await slow_notifications_runtime.launch()
+
+    # Without wakeups each hop waits for DBOS's next notification poll.
+    result = await asyncio.wait_for(wf.run(), timeout=30)
+
+    assert result == _HOPS - 1
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2026 LlamaIndex Inc.
 
+from ._run_scheduler import RunQueueFullError, RunScheduler, RunSchedulerStats
 from ._store.abstract_workflow_store import (
     AbstractWorkflowStore,
     HandlerQuery,
@@ -16,6 +17,9 @@ __all__ = [
     "AbstractWorkflowStore",
     "HandlerQuery",
     "PersistentHandler",
+    "RunQueueFullError",
+    "RunScheduler",
+    "RunSchedulerStats",
     "WorkflowServer",
     "MemoryWorkflowStore",
     "SqliteWorkflowStore",
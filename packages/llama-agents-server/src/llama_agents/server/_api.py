@@ -14,7 +14,11 @@ from llama_agents.client.protocol import (
     HandlerData,
     HandlersListResponse,
     HealthResponse,
+    RunWorkflowResult,
+    RunWorkflowsResponse,
     SendEventResponse,
+    SendEventResult,
+    SendEventsResponse,
     WorkflowEventsListResponse,
     WorkflowGraphResponse,
     WorkflowSchemaResponse,
@@ -38,6 +42,7 @@ from workflows.events import Event, InternalDispatchEvent, StartEvent
 from workflows.representation import get_workflow_representation
 from workflows.utils import _nanoid as nanoid
 
+from ._run_scheduler import RunQueueFullError
 from ._service import (
     EventSendError,
     HandlerAlreadyRunningError,
@@ -56,7 +61,9 @@ logger = logging.getLogger(__name__)
 
 
 async def _http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
+    return JSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers
+    )
 
 
 async def _unhandled_exception_handler(
@@ -70,6 +77,23 @@ async def _unhandled_exception_handler(
 
 _DEFAULT_ASSETS_PATH = Path(__file__).parent / "static"
 
+# Longest a GET /handlers/{handler_id}?wait=... request is held open.
+_MAX_HANDLER_WAIT_SECONDS = 60.0
+
+# Most items accepted by one POST /events or .../run-nowait/batch request.
+_MAX_BATCH_SIZE = 1000
+
+
+def _parse_wait(value: str) -> float:
+    """Parse a ``wait`` query value: seconds, optionally suffixed with ``s``."""
+    try:
+        seconds = float(value[:-1] if value.endswith("s") else value)
+    except ValueError:
+        seconds = -1.0
+    if not seconds >= 0:
+        raise HTTPException(detail=f"Invalid wait: '{value}'", status_code=400)
+    return min(seconds, _MAX_HANDLER_WAIT_SECONDS)
+
 
 class _WorkflowAPI:
     def __init__(
@@ -84,6 +108,8 @@ class _WorkflowAPI:
     ) -> None:
         self._service = service
         self._additional_events: dict[str, list[type[Event]]] = {}
+        # workflow name -> (workflow, registry), rebuilt if the workflow changes
+        self._event_registries: dict[str, tuple[Workflow, dict[str, type[Event]]]] = {}
         self._sse_heartbeat_interval = sse_heartbeat_interval
         self._accept_context_api = accept_context_api
 
@@ -123,6 +149,7 @@ class _WorkflowAPI:
 
     def register_additional_events(self, name: str, events: list[type[Event]]) -> None:
         self._additional_events[name] = events
+        self._event_registries.pop(name, None)
 
     def get_workflow_events(self, workflow_name: str) -> list[type[Event]]:
         workflow = self._service.get_workflow(workflow_name)
@@ -131,8 +158,19 @@ class _WorkflowAPI:
         return workflow.events + (self._additional_events.get(workflow_name) or [])
 
     def event_registry(self, workflow_name: str) -> dict[str, type[Event]]:
-        """Return a name→type mapping of events for the given workflow."""
-        return {e.__name__: e for e in self.get_workflow_events(workflow_name)}
+        """Return a name→type mapping of events for the given workflow.
+
+        Built once per registered workflow; treat the result as read-only.
+        """
+        workflow = self._service.get_workflow(workflow_name)
+        if workflow is None:
+            return {}
+        cached = self._event_registries.get(workflow_name)
+        if cached is not None and cached[0] is workflow:
+            return cached[1]
+        registry = {e.__name__: e for e in self.get_workflow_events(workflow_name)}
+        self._event_registries[workflow_name] = (workflow, registry)
+        return registry
 
     def _routes(self) -> list[Route]:
         return [
@@ -143,6 +181,11 @@ class _WorkflowAPI:
                 self._run_workflow_nowait,
                 methods=["POST"],
             ),
+            Route(
+                "/workflows/{name}/run-nowait/batch",
+                self._run_workflow_nowait_batch,
+                methods=["POST"],
+            ),
             Route(
                 "/workflows/{name}/schema",
                 self._get_events_schema,
@@ -155,6 +198,7 @@ class _WorkflowAPI:
             ),
             Route("/events/{handler_id}", self._stream_events, methods=["GET"]),
             Route("/events/{handler_id}", self._post_event, methods=["POST"]),
+            Route("/events", self._post_events, methods=["POST"]),
             Route("/health", self._health_check, methods=["GET"]),
             Route("/handlers", self._get_handlers, methods=["GET"]),
             Route(
@@ -395,6 +439,10 @@ class _WorkflowAPI:
             description: Invalid start_event payload
           404:
             description: Workflow or handler identifier not found
+          409:
+            description: Handler is already running
+          429:
+            description: Run queue is full; retry after the Retry-After delay
           500:
             description: Error running workflow or invalid request body
         """
@@ -414,9 +462,12 @@ class _WorkflowAPI:
                 handler_id=handler_id,
                 context=context,
                 start_event=input_ev,
+                fairness_key=self._fairness_key(request),
             )
         except HandlerAlreadyRunningError as e:
             raise HTTPException(detail=str(e), status_code=409)
+        except RunQueueFullError as e:
+            raise self._queue_full_exception(e)
         except Exception as e:
             logger.error(f"Error running workflow: {e}", exc_info=True)
             raise HTTPException(detail=f"Error running workflow: {e}", status_code=500)
@@ -581,31 +632,164 @@ class _WorkflowAPI:
             description: Invalid start_event payload
           404:
             description: Workflow or handler identifier not found
+          409:
+            description: Handler is already running
+          429:
+            description: Run queue is full; retry after the Retry-After delay
         """
         workflow = self._extract_workflow(request)
         context, start_event, handler_id = await self._extract_run_params(
             request, workflow, workflow.workflow_name
         )
+        handler_data = await self._start_run(
+            workflow, context, start_event, handler_id, self._fairness_key(request)
+        )
+        return JSONResponse(handler_data.model_dump())
+
+    async def _run_workflow_nowait_batch(self, request: Request) -> JSONResponse:
+        """
+        ---
+        summary: Run workflow (no-wait, batch)
+        description: |
+          Starts many runs of the specified workflow in one request. Each run
+          takes the same fields as the run-nowait body. Runs are validated up
+          front and started concurrently; each gets its own result, with the
+          status code the run-nowait endpoint would have answered.
+        parameters:
+          - in: path
+            name: name
+            required: true
+            schema:
+              type: string
+            description: Registered workflow name.
+        requestBody:
+          required: true
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  runs:
+                    type: array
+                    maxItems: 1000
+                    items:
+                      type: object
+                      properties:
+                        start_event:
+                          type: object
+                          description: 'Plain JSON object representing the start event (e.g., {"message": "..."}).'
+                        handler_id:
+                          type: string
+                          description: Workflow handler identifier to continue from a previous completed run.
+                        kwargs:
+                          type: object
+                          description: Additional keyword arguments for the workflow.
+                required: [runs]
+        responses:
+          200:
+            description: One result per run, in request order
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    results:
+                      type: array
+                      items:
+                        type: object
+                        properties:
+                          status_code:
+                            type: integer
+                          handler:
+                            $ref: '#/components/schemas/Handler'
+                          detail:
+                            type: string
+                        required: [status_code]
+                  required: [results]
+          400:
+            description: Invalid request body
+          404:
+            description: Workflow not found
+          413:
+            description: Too many runs in one request
+        """
+        workflow = self._extract_workflow(request)
+        items = await self._batch_items(request, "runs")
+        fairness_key = self._fairness_key(request)
 
+        # Validate every run before starting any.
+        parsed: list[tuple[Context | None, StartEvent | None, str] | HTTPException] = []
+        seen: set[str] = set()
+        for item in items:
+            try:
+                params = self._parse_run_params(item, workflow, workflow.workflow_name)
+                if params[2] in seen:
+                    raise HTTPException(
+                        detail=f"Handler {params[2]!r} appears more than once in the batch",
+                        status_code=409,
+                    )
+                seen.add(params[2])
+                parsed.append(params)
+            except HTTPException as e:
+                parsed.append(e)
+
+        async def start(
+            params: tuple[Context | None, StartEvent | None, str] | HTTPException,
+        ) -> RunWorkflowResult:
+            try:
+                if isinstance(params, HTTPException):
+                    raise params
+                handler_data = await self._start_run(workflow, *params, fairness_key)
+            except HTTPException as e:
+                return RunWorkflowResult(status_code=e.status_code, detail=e.detail)
+            return RunWorkflowResult(status_code=200, handler=handler_data)
+
+        results = await asyncio.gather(*(start(params) for params in parsed))
+        return JSONResponse(RunWorkflowsResponse(results=list(results)).model_dump())
+
+    async def _start_run(
+        self,
+        workflow: Workflow,
+        context: Context | None,
+        start_event: StartEvent | None,
+        handler_id: str,
+        fairness_key: str | None,
+    ) -> HandlerData:
         if start_event is not None:
             input_ev = workflow.start_event_class.model_validate(start_event)
         else:
             input_ev = None
 
         try:
-            handler_data = await self._service.start_workflow(
+            return await self._service.start_workflow(
                 workflow=workflow,
                 handler_id=handler_id,
                 context=context,
                 start_event=input_ev,
+                fairness_key=fairness_key,
             )
         except HandlerAlreadyRunningError as e:
             raise HTTPException(detail=str(e), status_code=409)
+        except RunQueueFullError as e:
+            raise self._queue_full_exception(e)
         except Exception as e:
             raise HTTPException(
                 detail=f"Initial persistence failed: {e}", status_code=500
             )
-        return JSONResponse(handler_data.model_dump())
+
+    def _fairness_key(self, request: Request) -> str | None:
+        scheduler = self._service.run_scheduler
+        if scheduler is None or scheduler.fairness_header is None:
+            return None
+        return request.headers.get(scheduler.fairness_header)
+
+    @staticmethod
+    def _queue_full_exception(exc: RunQueueFullError) -> HTTPException:
+        return HTTPException(
+            detail=str(exc),
+            status_code=429,
+            headers={"Retry-After": str(int(exc.retry_after))},
+        )
 
     async def _load_handler(self, handler_id: str) -> HandlerData:
         handler_data = await self._service.load_handler(handler_id)
@@ -662,7 +846,7 @@ class _WorkflowAPI:
             all_events = await store.query_events(run_id)
             run_is_complete = is_terminal_status(persistent.status) or (
                 bool(all_events)
-                and AbstractWorkflowStore._is_terminal_event(all_events[-1])
+                and AbstractWorkflowStore.is_terminal_event(all_events[-1])
             )
             if run_is_complete:
                 return None
@@ -752,7 +936,10 @@ class _WorkflowAPI:
         """
         ---
         summary: Get workflow handler
-        description: Returns the final result of an asynchronously started workflow, if available
+        description: |
+          Returns the final result of an asynchronously started workflow, if available.
+          With `wait`, the request is held open until the handler finishes or the
+          wait elapses, instead of returning the running handler right away.
         parameters:
           - in: path
             name: handler_id
@@ -760,6 +947,13 @@ class _WorkflowAPI:
             schema:
               type: string
             description: Workflow run identifier returned from the no-wait run endpoint.
+          - in: query
+            name: wait
+            required: false
+            schema:
+              type: string
+            description: |
+              Seconds to wait for the handler to finish (e.g. `30` or `30s`), at most 60.
         responses:
           200:
             description: Result is available
@@ -773,6 +967,8 @@ class _WorkflowAPI:
               application/json:
                 schema:
                   $ref: '#/components/schemas/Handler'
+          400:
+            description: Invalid wait
           404:
             description: Handler not found
           500:
@@ -786,7 +982,14 @@ class _WorkflowAPI:
         if not handler_id:
             raise HTTPException(detail="Handler ID is required", status_code=400)
 
-        handler_data = await self._load_handler(handler_id)
+        wait = request.query_params.get("wait")
+        if wait is None:
+            handler_data = await self._load_handler(handler_id)
+        else:
+            waited = await self._service.wait_for_handler(handler_id, _parse_wait(wait))
+            if waited is None:
+                raise HTTPException(detail="Handler not found", status_code=404)
+            handler_data = waited
         status = (
             202
             if handler_data.status == "running"
@@ -1137,19 +1340,12 @@ class _WorkflowAPI:
         except HandlerCompletedError:
             raise HTTPException(detail="Workflow already completed", status_code=409)
 
-        try:
-            event = EventEnvelope.parse(
-                event_data, self.event_registry(handler_data.workflow_name)
-            )
-        except EventValidationError as e:
-            raise HTTPException(detail=str(e), status_code=400)
-        except Exception as e:
-            raise HTTPException(
-                detail=f"Failed to deserialize event: {e}", status_code=400
-            )
+        event = self._parse_event(handler_data.workflow_name, event_data)
 
         try:
-            await self._service.send_event(handler_id, event, step=step)
+            await self._service.send_event(
+                handler_id, event, step=step, handler_data=handler_data
+            )
         except HandlerNotFoundError:
             raise HTTPException(detail="Handler not found", status_code=404)
         except HandlerCompletedError:
@@ -1159,6 +1355,138 @@ class _WorkflowAPI:
 
         return JSONResponse(SendEventResponse(status="sent").model_dump())
 
+    async def _post_events(self, request: Request) -> JSONResponse:
+        """
+        ---
+        summary: Send events to workflows
+        description: |
+          Sends many events, possibly to different handlers, in one request.
+          Handlers are looked up together and every event is validated before
+          any is sent. Events for the same handler are sent in request order.
+          Each event gets its own result, with the status code the single
+          event endpoint would have answered.
+        requestBody:
+          required: true
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  events:
+                    type: array
+                    maxItems: 1000
+                    items:
+                      type: object
+                      properties:
+                        handler_id:
+                          type: string
+                          description: Workflow handler identifier.
+                        event:
+                          description: Serialized event, as for POST /events/{handler_id}.
+                          oneOf:
+                            - type: string
+                            - type: object
+                        step:
+                          type: string
+                          description: Optional target step name.
+                      required: [handler_id, event]
+                required: [events]
+        responses:
+          200:
+            description: One result per event, in request order
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    results:
+                      type: array
+                      items:
+                        type: object
+                        properties:
+                          handler_id:
+                            type: string
+                          status_code:
+                            type: integer
+                          detail:
+                            type: string
+                        required: [handler_id, status_code]
+                  required: [results]
+          400:
+            description: Invalid request body
+          413:
+            description: Too many events in one request
+        """
+        items = await self._batch_items(request, "events")
+        handlers = await self._service.load_handlers(
+            {
+                item["handler_id"]
+                for item in items
+                if isinstance(item, dict) and isinstance(item.get("handler_id"), str)
+            }
+        )
+
+        results: list[SendEventResult] = []
+        # handler_id -> (result index, handler, event, step), in request order
+        pending: dict[str, list[tuple[int, HandlerData, Event, str | None]]] = {}
+        for index, item in enumerate(items):
+            handler_id = item.get("handler_id") if isinstance(item, dict) else None
+            if not isinstance(handler_id, str):
+                results.append(
+                    SendEventResult(
+                        handler_id="", status_code=400, detail="handler_id is required"
+                    )
+                )
+                continue
+            try:
+                event_data = item.get("event")
+                if not event_data:
+                    raise HTTPException(
+                        detail="Event data is required", status_code=400
+                    )
+                handler_data = handlers.get(handler_id)
+                if handler_data is None:
+                    raise HTTPException(detail="Handler not found", status_code=404)
+                if is_terminal_status(handler_data.status):
+                    raise HTTPException(
+                        detail="Workflow already completed", status_code=409
+                    )
+                event = self._parse_event(handler_data.workflow_name, event_data)
+            except HTTPException as e:
+                results.append(
+                    SendEventResult(
+                        handler_id=handler_id,
+                        status_code=e.status_code,
+                        detail=e.detail,
+                    )
+                )
+                continue
+            results.append(SendEventResult(handler_id=handler_id, status_code=200))
+            pending.setdefault(handler_id, []).append(
+                (index, handler_data, event, item.get("step"))
+            )
+
+        async def deliver(
+            queued: list[tuple[int, HandlerData, Event, str | None]],
+        ) -> None:
+            for index, handler_data, event, step in queued:
+                try:
+                    await self._service.send_event(
+                        handler_data.handler_id,
+                        event,
+                        step=step,
+                        handler_data=handler_data,
+                    )
+                except EventSendError as e:
+                    results[index] = SendEventResult(
+                        handler_id=handler_data.handler_id,
+                        status_code=500,
+                        detail=str(e),
+                    )
+
+        await asyncio.gather(*(deliver(queued) for queued in pending.values()))
+        return JSONResponse(SendEventsResponse(results=results).model_dump())
+
     async def _cancel_handler(self, request: Request) -> JSONResponse:
         """
         ---
@@ -1219,14 +1547,45 @@ class _WorkflowAPI:
 
         return workflow
 
+    async def _batch_items(self, request: Request, key: str) -> list[Any]:
+        """The list under ``key`` in a batch request body."""
+        try:
+            body = await request.json()
+        except Exception as e:
+            raise HTTPException(detail=f"Invalid JSON body: {e}", status_code=400)
+        items = body.get(key) if isinstance(body, dict) else None
+        if not isinstance(items, list):
+            raise HTTPException(detail=f"'{key}' must be a list", status_code=400)
+        if len(items) > _MAX_BATCH_SIZE:
+            raise HTTPException(
+                detail=f"At most {_MAX_BATCH_SIZE} {key} per request, got {len(items)}",
+                status_code=413,
+            )
+        return items
+
+    def _parse_event(self, workflow_name: str, event_data: Any) -> Event:
+        try:
+            return EventEnvelope.parse(event_data, self.event_registry(workflow_name))
+        except EventValidationError as e:
+            raise HTTPException(detail=str(e), status_code=400)
+        except Exception as e:
+            raise HTTPException(
+                detail=f"Failed to deserialize event: {e}", status_code=400
+            )
+
     async def _extract_run_params(
         self, request: Request, workflow: Workflow, workflow_name: str
     ) -> tuple[Context | None, StartEvent | None, str]:
         try:
-            try:
-                body = await request.json()
-            except Exception as e:
-                raise HTTPException(detail=f"Invalid JSON body: {e}", status_code=400)
+            body = await request.json()
+        except Exception as e:
+            raise HTTPException(detail=f"Invalid JSON body: {e}", status_code=400)
+        return self._parse_run_params(body, workflow, workflow_name)
+
+    def _parse_run_params(
+        self, body: Any, workflow: Workflow, workflow_name: str
+    ) -> tuple[Context | None, StartEvent | None, str]:
+        try:
             context_data = body.get("context")
             run_kwargs = body.get("kwargs", {})
             start_event_data = body.get("start_event", run_kwargs)
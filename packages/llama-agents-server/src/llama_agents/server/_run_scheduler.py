@@ -0,0 +1,325 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Server-level admission control for workflow runs.
+
+A ``RunScheduler`` caps how many runs a ``WorkflowServer`` executes at once,
+both globally and per workflow. Requests over the limit wait in a bounded
+queue; when the queue is full (or a request waits too long) the caller gets
+a ``RunQueueFullError`` carrying a ``Retry-After`` hint, which the HTTP API
+turns into a 429.
+
+Waiting requests are admitted in start-time fair queuing order across
+*fairness keys*: the workflow name by default, or the value of a configurable
+request header (e.g. a tenant ID). A key with weight 2 gets roughly twice the
+admissions of a key with weight 1 while both have waiters, and a burst on one
+key cannot starve the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+# Smoothing factor for the queue-wait moving average used for Retry-After.
+_WAIT_EWMA_ALPHA = 0.2
+# Prune stale fairness-key bookkeeping once this many keys are tracked.
+_MAX_IDLE_KEYS = 1024
+
+
+class RunQueueFullError(Exception):
+    """Raised when a run cannot be admitted because the wait queue is full
+    or the maximum queue wait elapsed."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RunSlot:
+    """An admitted run. Pass back to ``RunScheduler.release`` when it ends."""
+
+    workflow_name: str
+    fairness_key: str
+    admitted_at: float
+
+
+@dataclass(frozen=True)
+class RunSchedulerStats:
+    """Point-in-time snapshot of scheduler state, for metrics export."""
+
+    running: int
+    queued: int
+    running_by_workflow: dict[str, int]
+    queued_by_key: dict[str, int]
+    admitted_total: int
+    rejected_total: int
+    queue_wait_seconds_total: float
+    queue_wait_seconds_max: float
+
+
+@dataclass(order=True)
+class _Waiter:
+    finish_tag: float
+    seq: int
+    start_tag: float = field(compare=False)
+    workflow_name: str = field(compare=False)
+    fairness_key: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future[RunSlot] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class RunScheduler:
+    """Global and per-workflow concurrency limits with fair, bounded queuing.
+
+    All limits default to ``None`` (unlimited). Subclasses can override
+    ``acquire`` and ``release`` to delegate admission to another backend,
+    such as a durable runtime's own queues; the service only relies on those
+    two methods and ``fairness_header``.
+
+    Args:
+        max_concurrent_runs: Maximum runs executing at once across all
+            workflows on this server.
+        max_concurrent_runs_per_workflow: Default per-workflow cap.
+        workflow_limits: Per-workflow caps overriding the default, by
+            workflow name.
+        max_queued_runs: Maximum number of requests waiting for a slot.
+            ``0`` rejects immediately whenever no slot is free.
+        max_queue_wait: Seconds a request may wait before it is rejected.
+            ``None`` waits indefinitely.
+        weights: Fair-share weight per fairness key. Unlisted keys get 1.0.
+        fairness_header: Request header whose value is used as the fairness
+            key. When unset or absent, the workflow name is used.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_runs: int | None = None,
+        max_concurrent_runs_per_workflow: int | None = None,
+        workflow_limits: Mapping[str, int] | None = None,
+        max_queued_runs: int = 100,
+        max_queue_wait: float | None = 30.0,
+        weights: Mapping[str, float] | None = None,
+        fairness_header: str | None = None,
+    ) -> None:
+        self._max_concurrent_runs = max_concurrent_runs
+        self._max_per_workflow = max_concurrent_runs_per_workflow
+        self._workflow_limits = dict(workflow_limits or {})
+        self._max_queued_runs = max_queued_runs
+        self._max_queue_wait = max_queue_wait
+        self._weights = dict(weights or {})
+        self.fairness_header = fairness_header
+
+        self._running = 0
+        self._running_by_workflow: dict[str, int] = {}
+        self._heap: list[_Waiter] = []
+        # Abandoned waiters still in _heap; compacted once they are most of it.
+        self._dead = 0
+        self._queued = 0
+        self._queued_by_key: dict[str, int] = {}
+        self._last_finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._seq = 0
+
+        self._admitted_total = 0
+        self._rejected_total = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_ewma = 0.0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def acquire(
+        self, workflow_name: str, fairness_key: str | None = None
+    ) -> RunSlot:
+        """Wait for a run slot for ``workflow_name``.
+
+        Raises:
+            RunQueueFullError: The queue is full or ``max_queue_wait`` elapsed.
+        """
+        key = fairness_key or workflow_name
+        if self._can_admit(workflow_name):
+            return self._admit(workflow_name, key, waited=0.0)
+
+        if self._queued >= self._max_queued_runs:
+            self._rejected_total += 1
+            raise RunQueueFullError(
+                f"Too many queued runs ({self._queued}); try again later",
+                retry_after=self.retry_after(),
+            )
+
+        waiter = self._enqueue(workflow_name, key)
+        try:
+            if self._max_queue_wait is None:
+                return await waiter.future
+            return await asyncio.wait_for(waiter.future, self._max_queue_wait)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            self._rejected_total += 1
+            raise RunQueueFullError(
+                f"Timed out after {self._max_queue_wait}s waiting for a run slot",
+                retry_after=self.retry_after(),
+            ) from None
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def claim(self, workflow_name: str, fairness_key: str | None = None) -> RunSlot:
+        """Take a slot for a run that must start now, ignoring the limits.
+
+        Used for runs resumed from the store (at startup or after an idle
+        release). They are already accepted work, so they are never queued
+        or rejected, but they count against the limits until released and
+        new runs wait behind them.
+        """
+        return self._admit(workflow_name, fairness_key or workflow_name, waited=0.0)
+
+    def release(self, slot: RunSlot) -> None:
+        """Return a slot and admit the next eligible waiter(s)."""
+        self._running -= 1
+        remaining = self._running_by_workflow.get(slot.workflow_name, 1) - 1
+        if remaining > 0:
+            self._running_by_workflow[slot.workflow_name] = remaining
+        else:
+            self._running_by_workflow.pop(slot.workflow_name, None)
+        self._dispatch()
+
+    def retry_after(self) -> float:
+        """Suggested client back-off in seconds, from observed queue waits."""
+        return float(max(1, math.ceil(self._wait_ewma)))
+
+    def stats(self) -> RunSchedulerStats:
+        return RunSchedulerStats(
+            running=self._running,
+            queued=self._queued,
+            running_by_workflow=dict(self._running_by_workflow),
+            queued_by_key=dict(self._queued_by_key),
+            admitted_total=self._admitted_total,
+            rejected_total=self._rejected_total,
+            queue_wait_seconds_total=self._wait_total,
+            queue_wait_seconds_max=self._wait_max,
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _workflow_limit(self, workflow_name: str) -> int | None:
+        return self._workflow_limits.get(workflow_name, self._max_per_workflow)
+
+    def _global_available(self) -> bool:
+        return (
+            self._max_concurrent_runs is None
+            or self._running < self._max_concurrent_runs
+        )
+
+    def _can_admit(self, workflow_name: str) -> bool:
+        if not self._global_available():
+            return False
+        limit = self._workflow_limit(workflow_name)
+        return limit is None or self._running_by_workflow.get(workflow_name, 0) < limit
+
+    def _admit(self, workflow_name: str, key: str, waited: float) -> RunSlot:
+        self._running += 1
+        self._running_by_workflow[workflow_name] = (
+            self._running_by_workflow.get(workflow_name, 0) + 1
+        )
+        self._admitted_total += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        self._wait_ewma += _WAIT_EWMA_ALPHA * (waited - self._wait_ewma)
+        return RunSlot(
+            workflow_name=workflow_name,
+            fairness_key=key,
+            admitted_at=time.monotonic(),
+        )
+
+    def _enqueue(self, workflow_name: str, key: str) -> _Waiter:
+        weight = self._weights.get(key, 1.0)
+        start_tag = max(self._virtual_time, self._last_finish.get(key, 0.0))
+        finish_tag = start_tag + 1.0 / weight
+        self._last_finish[key] = finish_tag
+        self._seq += 1
+        waiter = _Waiter(
+            finish_tag=finish_tag,
+            seq=self._seq,
+            start_tag=start_tag,
+            workflow_name=workflow_name,
+            fairness_key=key,
+            enqueued_at=time.monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._heap, waiter)
+        self._queued += 1
+        self._queued_by_key[key] = self._queued_by_key.get(key, 0) + 1
+        return waiter
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Clean up after a waiter whose caller stopped waiting.
+
+        If admission raced with the timeout or cancellation, the slot it was
+        handed is returned so capacity is not leaked.
+        """
+        future = waiter.future
+        if future.done() and not future.cancelled():
+            self.release(future.result())
+            return
+        if not waiter.cancelled:
+            waiter.cancelled = True
+            self._dequeued(waiter)
+            self._dead += 1
+            if self._dead > len(self._heap) // 2:
+                self._heap = [
+                    w for w in self._heap if not w.cancelled and not w.future.done()
+                ]
+                heapq.heapify(self._heap)
+                self._dead = 0
+
+    def _dequeued(self, waiter: _Waiter) -> None:
+        self._queued -= 1
+        remaining = self._queued_by_key.get(waiter.fairness_key, 1) - 1
+        if remaining > 0:
+            self._queued_by_key[waiter.fairness_key] = remaining
+        else:
+            self._queued_by_key.pop(waiter.fairness_key, None)
+
+    def _dispatch(self) -> None:
+        """Admit waiters in finish-tag order while slots are available.
+
+        Waiters blocked only by their workflow's own limit are skipped, not
+        dropped, so other workflows can use the free global capacity.
+        """
+        blocked: list[_Waiter] = []
+        while self._heap and self._global_available():
+            waiter = heapq.heappop(self._heap)
+            if waiter.cancelled or waiter.future.done():
+                self._dead = max(0, self._dead - 1)
+                continue
+            if not self._can_admit(waiter.workflow_name):
+                blocked.append(waiter)
+                continue
+            waiter.cancelled = True
+            self._dequeued(waiter)
+            self._virtual_time = max(self._virtual_time, waiter.start_tag)
+            slot = self._admit(
+                waiter.workflow_name,
+                waiter.fairness_key,
+                waited=time.monotonic() - waiter.enqueued_at,
+            )
+            waiter.future.set_result(slot)
+        for waiter in blocked:
+            heapq.heappush(self._heap, waiter)
+        if len(self._last_finish) > _MAX_IDLE_KEYS:
+            self._last_finish = {
+                key: tag
+                for key, tag in self._last_finish.items()
+                if tag > self._virtual_time or key in self._queued_by_key
+            }
@@ -13,7 +13,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import sqlite3
-from collections.abc import AsyncIterator, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -51,6 +51,7 @@ from workflows.workflow import Workflow
 from .._store.abstract_workflow_store import (
     AbstractWorkflowStore,
     HandlerQuery,
+    PersistentHandler,
     Status,
     as_legacy_context_store,
     stream_workflow_ticks,
@@ -289,7 +290,9 @@ class TickPersistenceDecorator(BaseRuntimeDecorator):
 class PersistenceDecorator(TickPersistenceDecorator):
     """Runtime decorator that extends TickPersistenceDecorator with auto-restart.
 
-    Resumes previously running workflows on server start.
+    Resumes previously running workflows on server start. With
+    ``resume_filter``, only the handlers it accepts are resumed, so servers
+    sharing one store can each resume their own.
     """
 
     def __init__(
@@ -298,9 +301,11 @@ class PersistenceDecorator(TickPersistenceDecorator):
         store: AbstractWorkflowStore,
         *,
         resume_fresh_handler_grace: timedelta | None = RESUME_FRESH_HANDLER_GRACE,
+        resume_filter: Callable[[PersistentHandler], bool] | None = None,
     ) -> None:
         super().__init__(decorated, store)
         self._resume_fresh_handler_grace = resume_fresh_handler_grace
+        self._resume_filter = resume_filter
         self._background_tasks: set[asyncio.Task[None]] = set()
         self.resume_task: asyncio.Task[None] | None = None
 
@@ -341,6 +346,8 @@ class PersistenceDecorator(TickPersistenceDecorator):
                 )
             ):
                 continue
+            if self._resume_filter is not None and not self._resume_filter(persistent):
+                continue
             workflow = registered_workflows.get(persistent.workflow_name)
             if workflow is None:
                 continue
@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, TypeVar
 
 from llama_agents.client.protocol.serializable_events import (
     EventEnvelopeWithMetadata,
@@ -28,9 +28,11 @@ from workflows.events import (
     StopEvent,
     WorkflowCancelledEvent,
     WorkflowFailedEvent,
+    WorkflowIdleEvent,
     WorkflowTimedOutEvent,
 )
 from workflows.runtime.runtime_decorators import (
+    BaseExternalRunAdapterDecorator,
     BaseInternalRunAdapterDecorator,
     BaseRuntimeDecorator,
 )
@@ -40,16 +42,22 @@ from workflows.runtime.types.plugin import (
     InternalRunAdapter,
     Runtime,
 )
+from workflows.runtime.types.ticks import WorkflowTick
 from workflows.workflow import Workflow
 
+from .._run_scheduler import RunScheduler, RunSlot
 from .._store.abstract_workflow_store import (
     AbstractWorkflowStore,
+    HandlerQuery,
     PersistentHandler,
     Status,
+    is_terminal_status,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # ---------------------------------------------------------------------------
 # _ServerInternalRunAdapter
@@ -156,6 +164,27 @@ class _ServerInternalRunAdapter(BaseInternalRunAdapterDecorator):
             # Always forward to inner adapter (e.g. idle detection, DBOS stream)
             await super().write_to_event_stream(event)
 
+            if isinstance(event, WorkflowIdleEvent):
+                # Idle release marks the handler idle in the store below us.
+                await self._runtime._refresh_live_handler(self.run_id)
+
+
+class _ServerExternalRunAdapter(BaseExternalRunAdapterDecorator):
+    """External adapter that keeps the cached handler record current."""
+
+    def __init__(
+        self, decorated: ExternalRunAdapter, runtime: ServerRuntimeDecorator
+    ) -> None:
+        super().__init__(decorated)
+        self._runtime = runtime
+
+    @override
+    async def send_event(self, tick: WorkflowTick) -> None:
+        await super().send_event(tick)
+        # Waking an idle run clears its idle mark in the store below us.
+        if self._runtime._is_cached_idle(self.run_id):
+            await self._runtime._refresh_live_handler(self.run_id)
+
 
 # ---------------------------------------------------------------------------
 # ServerRuntimeDecorator -- adapter wrapping, handler persistence,
@@ -176,22 +205,33 @@ class ServerRuntimeDecorator(BaseRuntimeDecorator):
         store: AbstractWorkflowStore,
         *,
         persistence_backoff: list[float] | None = None,
+        run_scheduler: RunScheduler | None = None,
     ) -> None:
         super().__init__(decorated)
         self._store: AbstractWorkflowStore = store
+        self._run_scheduler = run_scheduler
+        self._slot_tasks: set[asyncio.Task[None]] = set()
         self._registered_workflows: dict[str, Workflow] = {}
         self._initial_state: dict[str, Any] = {}
         self._persistence_backoff = (
             list(persistence_backoff) if persistence_backoff is not None else [0.5, 3]
         )
-
-    async def _retry_store_write(self, coro_fn: Callable[[], Awaitable[None]]) -> None:
+        # Handler records of runs started by this process, by handler_id,
+        # while their local run is live. Every status change those runs make
+        # goes through _handle_status_update, which keeps them current; the
+        # idle marks written by inner decorators are re-read from the store.
+        self._live_handlers: dict[str, PersistentHandler] = {}
+        self._live_handler_ids: dict[str, str] = {}
+        # Set, by handler_id, when the live run's status turns terminal or
+        # the run settles. Created on demand by wait_live_handler.
+        self._live_handler_waits: dict[str, asyncio.Event] = {}
+
+    async def _retry_store_write(self, coro_fn: Callable[[], Awaitable[T]]) -> T:
         """Wrap a store write with retry/backoff."""
         backoffs = list(self._persistence_backoff)
         while True:
             try:
-                await coro_fn()
-                return
+                return await coro_fn()
             except Exception as e:
                 backoff = backoffs.pop(0) if backoffs else None
                 if backoff is None:
@@ -242,6 +282,20 @@ class ServerRuntimeDecorator(BaseRuntimeDecorator):
                 run_id, status=status, result=result, error=error
             )
         )
+        handler_id = self._live_handler_ids.get(run_id)
+        cached = self._live_handlers.get(handler_id) if handler_id else None
+        if cached is not None:
+            now = datetime.now(timezone.utc)
+            changes: dict[str, Any] = {"status": status, "updated_at": now}
+            if is_terminal_status(status):
+                changes["completed_at"] = now
+            if result is not None:
+                changes["result"] = result
+            if error is not None:
+                changes["error"] = error
+            self._live_handlers[cached.handler_id] = cached.model_copy(update=changes)
+            if is_terminal_status(status):
+                self._wake_live_handler_waiters(cached.handler_id)
 
     @override
     def run_workflow(
@@ -261,7 +315,7 @@ class ServerRuntimeDecorator(BaseRuntimeDecorator):
             store_type = serialized_state.get("store_type")
             if store_type is not None and store_type != "in_memory":
                 passthrough_state = None
-        return super().run_workflow(
+        adapter = super().run_workflow(
             run_id,
             workflow,
             init_state,
@@ -269,6 +323,25 @@ class ServerRuntimeDecorator(BaseRuntimeDecorator):
             serialized_state=passthrough_state,
             serializer=serializer,
         )
+        if self._run_scheduler is not None and run_id not in self._live_handler_ids:
+            # Not started through the service (which holds its own slot):
+            # a run resumed at startup or reloaded after an idle release.
+            slot = self._run_scheduler.claim(workflow.workflow_name)
+            task = asyncio.create_task(self._release_slot_when_settled(adapter, slot))
+            self._slot_tasks.add(task)
+            task.add_done_callback(self._slot_tasks.discard)
+        return adapter
+
+    async def _release_slot_when_settled(
+        self, adapter: ExternalRunAdapter, slot: RunSlot
+    ) -> None:
+        try:
+            await adapter.get_result()
+        except Exception:
+            pass
+        finally:
+            if self._run_scheduler is not None:
+                self._run_scheduler.release(slot)
 
     def get_internal_adapter(self, workflow: Workflow) -> InternalRunAdapter:
         """Wraps the inner runtime's adapter in _ServerInternalRunAdapter."""
@@ -276,6 +349,13 @@ class ServerRuntimeDecorator(BaseRuntimeDecorator):
         state_type = infer_state_type(workflow)
         return _ServerInternalRunAdapter(inner_adapter, self, state_type=state_type)
 
+    @override
+    def get_external_adapter(self, run_id: str) -> ExternalRunAdapter:
+        """Wraps the inner runtime's adapter in _ServerExternalRunAdapter."""
+        return _ServerExternalRunAdapter(
+            self._decorated.get_external_adapter(run_id), self
+        )
+
     # ------------------------------------------------------------------
     # Handler persistence
     # ------------------------------------------------------------------
@@ -285,24 +365,91 @@ class ServerRuntimeDecorator(BaseRuntimeDecorator):
         handler_id: str,
         workflow_name: str,
         run_id: str,
-    ) -> None:
-        """Persist initial handler record to store.
+    ) -> PersistentHandler | None:
+        """Persist the handler record for a new run and cache it.
 
         Must be called before the workflow is started so that
         ``update_handler_status`` can find the handler row when
         the workflow completes.
+
+        Returns the record it replaced, if any. When that record is not
+        terminal the handler is already running: nothing was written and the
+        caller must not start the run.
         """
         started_at = datetime.now(timezone.utc)
+        handler = PersistentHandler(
+            handler_id=handler_id,
+            workflow_name=workflow_name,
+            status="running",
+            run_id=run_id,
+            started_at=started_at,
+            updated_at=started_at,
+        )
 
-        await self._retry_store_write(
-            lambda: self._store.update(
-                PersistentHandler(
-                    handler_id=handler_id,
-                    workflow_name=workflow_name,
-                    status="running",
-                    run_id=run_id,
-                    started_at=started_at,
-                    updated_at=started_at,
-                )
-            )
+        previous = await self._retry_store_write(
+            lambda: self._store.start_handler(handler)
         )
+        if previous is not None and previous.run_id == run_id:
+            # A retried attempt found the row its first attempt wrote.
+            previous = None
+        if previous is None or is_terminal_status(previous.status):
+            self._live_handlers[handler_id] = handler
+            self._live_handler_ids[run_id] = handler_id
+        return previous
+
+    def cached_handler(self, handler_id: str) -> PersistentHandler | None:
+        """The handler record of a run live in this process, if any."""
+        return self._live_handlers.get(handler_id)
+
+    def _is_cached_idle(self, run_id: str) -> bool:
+        handler_id = self._live_handler_ids.get(run_id)
+        cached = self._live_handlers.get(handler_id) if handler_id else None
+        return cached is not None and cached.idle_since is not None
+
+    async def _refresh_live_handler(self, run_id: str) -> None:
+        """Re-read the idle mark an inner decorator wrote for a cached run.
+
+        Only ``idle_since`` is taken from the store, so a status update that
+        lands while the query is in flight is not rolled back.
+        """
+        handler_id = self._live_handler_ids.get(run_id)
+        if handler_id is None or handler_id not in self._live_handlers:
+            return
+        found = await self._store.query(HandlerQuery(run_id_in=[run_id]))
+        cached = self._live_handlers.get(handler_id)
+        if found and cached is not None and cached.run_id == run_id:
+            self._live_handlers[handler_id] = cached.model_copy(
+                update={"idle_since": found[0].idle_since}
+            )
+
+    def forget_handler(self, handler_id: str, run_id: str) -> None:
+        """Drop the cached record once the local run for ``run_id`` settles."""
+        cached = self._live_handlers.get(handler_id)
+        if cached is not None and cached.run_id == run_id:
+            del self._live_handlers[handler_id]
+            self._wake_live_handler_waiters(handler_id)
+        if self._live_handler_ids.get(run_id) == handler_id:
+            del self._live_handler_ids[run_id]
+
+    async def wait_live_handler(self, handler_id: str, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a live local run to finish.
+
+        Returns once the run's status turns terminal or the run settles
+        (which also happens when it is idle-released), or on timeout.
+        Returns False right away when ``handler_id`` is not live here.
+        """
+        if handler_id not in self._live_handlers:
+            return False
+        waiter = self._live_handler_waits.get(handler_id)
+        if waiter is None:
+            waiter = self._live_handler_waits[handler_id] = asyncio.Event()
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return True
+
+    def _wake_live_handler_waiters(self, handler_id: str) -> None:
+        waiter = self._live_handler_waits.pop(handler_id, None)
+        if waiter is not None:
+            waiter.set()
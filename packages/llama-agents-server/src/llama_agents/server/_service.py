@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Collection
 from datetime import datetime, timezone
 from typing import Literal
 
@@ -29,6 +30,7 @@ from workflows.handler import WorkflowHandler
 from workflows.utils import _nanoid as nanoid
 from workflows.workflow import Workflow
 
+from ._run_scheduler import RunScheduler, RunSlot
 from ._store.abstract_workflow_store import (
     AbstractWorkflowStore,
     HandlerQuery,
@@ -102,9 +104,11 @@ class _WorkflowService:
         self,
         runtime: ServerRuntimeDecorator,
         store: AbstractWorkflowStore,
+        run_scheduler: RunScheduler | None = None,
     ) -> None:
         self._runtime: ServerRuntimeDecorator = runtime
         self._store = store
+        self._run_scheduler = run_scheduler
 
     # ------------------------------------------------------------------
     # Workflow registration
@@ -135,6 +139,10 @@ class _WorkflowService:
     def store(self) -> AbstractWorkflowStore:
         return self._store
 
+    @property
+    def run_scheduler(self) -> RunScheduler | None:
+        return self._run_scheduler
+
     async def query_handlers(self, query: HandlerQuery) -> list[PersistentHandler]:
         return await self._store.query(query)
 
@@ -143,10 +151,36 @@ class _WorkflowService:
     # ------------------------------------------------------------------
 
     async def load_handler(self, handler_id: str) -> HandlerData | None:
-        found = await self._store.query(HandlerQuery(handler_id_in=[handler_id]))
-        if not found:
+        persisted = await self._find_handler(handler_id)
+        if persisted is None:
             return None
-        return handler_data_from_persistent(found[0])
+        return handler_data_from_persistent(persisted)
+
+    async def load_handlers(
+        self, handler_ids: Collection[str]
+    ) -> dict[str, HandlerData]:
+        """Load many handlers, keyed by handler_id; missing ones are left out.
+
+        Runs live in this process come from the cache; the rest are read in
+        a single store query.
+        """
+        found: dict[str, PersistentHandler] = {}
+        missing: set[str] = set()
+        for handler_id in handler_ids:
+            cached = self._runtime.cached_handler(handler_id)
+            if cached is not None:
+                found[handler_id] = cached
+            else:
+                missing.add(handler_id)
+        if missing:
+            for persisted in await self._store.query(
+                HandlerQuery(handler_id_in=sorted(missing))
+            ):
+                found.setdefault(persisted.handler_id, persisted)
+        return {
+            handler_id: handler_data_from_persistent(persisted)
+            for handler_id, persisted in found.items()
+        }
 
     async def resolve_handler(self, handler_id: str) -> HandlerData:
         handler_data = await self.load_handler(handler_id)
@@ -161,9 +195,15 @@ class _WorkflowService:
         handler_id: str,
         event: Event,
         step: str | None = None,
+        handler_data: HandlerData | None = None,
     ) -> None:
-        """Send a parsed event to a running handler."""
-        handler_data = await self.resolve_handler(handler_id)
+        """Send a parsed event to a running handler.
+
+        Pass ``handler_data`` when the caller already resolved the handler,
+        to skip looking it up again.
+        """
+        if handler_data is None:
+            handler_data = await self.resolve_handler(handler_id)
 
         workflow = self._runtime.get_workflow(handler_data.workflow_name)
         if workflow is None:
@@ -184,10 +224,10 @@ class _WorkflowService:
     async def cancel_handler(
         self, handler_id: str, purge: bool = False
     ) -> Literal["cancelled", "deleted"] | None:
-        found = await self._store.query(HandlerQuery(handler_id_in=[handler_id]))
-        if not found:
+        found = await self._find_handler(handler_id)
+        if found is None:
             return None
-        persisted = handler_data_from_persistent(found[0])
+        persisted = handler_data_from_persistent(found)
         if not purge and (
             persisted.run_id is None or is_terminal_status(persisted.status)
         ):
@@ -204,6 +244,8 @@ class _WorkflowService:
             n_deleted = await self._store.delete(
                 HandlerQuery(handler_id_in=[handler_id])
             )
+            if persisted.run_id is not None:
+                self._runtime.forget_handler(handler_id, persisted.run_id)
             if n_deleted == 0:
                 return None
 
@@ -215,32 +257,90 @@ class _WorkflowService:
         handler_id: str,
         start_event: StartEvent | None = None,
         context: Context | None = None,
+        fairness_key: str | None = None,
     ) -> HandlerData:
+        """Start a run, waiting for a slot when a run scheduler is configured.
+
+        Raises:
+            HandlerAlreadyRunningError: ``handler_id`` is already running.
+            RunQueueFullError: The run scheduler rejected the run.
+        """
         with instrument_tags({"llamaindex.handler_id": handler_id}):
-            existing = await self.load_handler(handler_id)
-            if existing is not None and not is_terminal_status(existing.status):
+            cached = self._runtime.cached_handler(handler_id)
+            if cached is not None and not is_terminal_status(cached.status):
                 raise HandlerAlreadyRunningError(
                     f"Handler {handler_id!r} is already running"
                 )
-            if context is None:
-                context = await self._context_from_handler_id(workflow, handler_id)
+            slot = (
+                await self._run_scheduler.acquire(workflow.workflow_name, fairness_key)
+                if self._run_scheduler is not None
+                else None
+            )
             # Pre-generate run_id and persist the handler record BEFORE starting
             # the workflow. This prevents a race where a fast workflow completes
             # and tries to update_handler_status before the handler row exists,
-            # causing the status update to be silently skipped.
+            # causing the status update to be silently skipped. The same write
+            # checks for a running handler and returns the record it replaced.
             run_id = nanoid()
-            await self._runtime.run_workflow_handler(
-                handler_id, workflow.workflow_name, run_id
-            )
-            _ = workflow.run(
-                ctx=context,
-                start_event=start_event,
-                run_id=run_id,
+            try:
+                previous = await self._runtime.run_workflow_handler(
+                    handler_id, workflow.workflow_name, run_id
+                )
+                if previous is not None and not is_terminal_status(previous.status):
+                    raise HandlerAlreadyRunningError(
+                        f"Handler {handler_id!r} is already running"
+                    )
+                if context is None and previous is not None:
+                    context = await self._context_from_handler(workflow, previous)
+                run = workflow.run(
+                    ctx=context,
+                    start_event=start_event,
+                    run_id=run_id,
+                )
+            except BaseException:
+                self._runtime.forget_handler(handler_id, run_id)
+                if slot is not None:
+                    self._release_slot(slot)
+                raise
+            if slot is not None:
+                self._release_slot_when_done(run, slot)
+            run.add_done_callback(
+                lambda _: self._runtime.forget_handler(handler_id, run_id)
             )
-            handler_data = await self.load_handler(handler_id)
-            if handler_data is None:
+            started = self._runtime.cached_handler(handler_id)
+            if started is None:
                 raise RuntimeError(f"Handler {handler_id} not found after creation")
-            return handler_data
+            return handler_data_from_persistent(started)
+
+    async def wait_for_handler(
+        self, handler_id: str, timeout: float
+    ) -> HandlerData | None:
+        """Load a handler, waiting up to ``timeout`` seconds for it to finish.
+
+        A run live in this process is awaited in memory; otherwise the
+        store's event subscription signals the run's terminal event. Returns
+        the handler as it stands once terminal or at the deadline, or None
+        if it does not exist.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        persisted = await self._find_handler(handler_id)
+        while (
+            persisted is not None
+            and persisted.run_id is not None
+            and not is_terminal_status(persisted.status)
+        ):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            if await self._runtime.wait_live_handler(handler_id, remaining):
+                # Terminal, or settled without finishing (idle release).
+                persisted = await self._find_handler(handler_id)
+                continue
+            await self._wait_for_terminal_event(persisted.run_id, remaining)
+            persisted = await self._find_handler(handler_id)
+            break
+        return handler_data_from_persistent(persisted) if persisted else None
 
     async def await_workflow(self, handler: HandlerData) -> HandlerData:
         if handler.run_id is None:
@@ -278,20 +378,47 @@ class _WorkflowService:
     # Private helpers
     # ------------------------------------------------------------------
 
-    async def _context_from_handler_id(
-        self, workflow: Workflow, handler_id: str
+    async def _find_handler(self, handler_id: str) -> PersistentHandler | None:
+        """The handler's record: cached for runs live here, else from the store."""
+        cached = self._runtime.cached_handler(handler_id)
+        if cached is not None:
+            return cached
+        found = await self._store.query(HandlerQuery(handler_id_in=[handler_id]))
+        return found[0] if found else None
+
+    async def _wait_for_terminal_event(self, run_id: str, timeout: float) -> None:
+        """Follow the run's new events until its terminal one, or timeout.
+
+        The subscription starts after the run's last stored event, so a
+        long-poll does not re-read the run's history. The terminal status is
+        written before the terminal event is appended, so the handler reads
+        as terminal once this returns early.
+        """
+
+        async def drain() -> None:
+            last = await self._store.get_last_event(run_id)
+            if last is not None and self._store.is_terminal_event(last):
+                return
+            after_sequence = last.sequence if last is not None else -1
+            async for _ in self._store.subscribe_events(run_id, after_sequence):
+                pass
+
+        try:
+            await asyncio.wait_for(drain(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _context_from_handler(
+        self, workflow: Workflow, handler: PersistentHandler
     ) -> Context | None:
-        """Look up a completed handler's final state and build a Context from it.
+        """Build a Context from a completed handler record's final state.
 
         Returns the lightweight serialized state reference so that SQL-backed
         stores can do an optimized copy rather than round-tripping through memory.
 
-        Returns None if the handler doesn't exist, isn't completed, or has no state.
+        Returns None if the handler isn't completed or has no state.
         """
-        found = await self._store.query(HandlerQuery(handler_id_in=[handler_id]))
-        if not found:
-            return None
-        handler = found[0]
+        handler_id = handler.handler_id
         if not is_terminal_status(handler.status) or handler.run_id is None:
             return None
 
@@ -313,6 +440,19 @@ class _WorkflowService:
             )
             return None
 
+    def _release_slot(self, slot: RunSlot) -> None:
+        if self._run_scheduler is not None:
+            self._run_scheduler.release(slot)
+
+    def _release_slot_when_done(self, run: WorkflowHandler, slot: RunSlot) -> None:
+        """Hold the scheduler slot until the local run's result settles.
+
+        Idle-released runs settle too (their control loop is aborted), so a
+        run parked on human input does not pin a slot. When such a run is
+        reloaded, the runtime claims a new slot for it.
+        """
+        run.add_done_callback(lambda _: self._release_slot(slot))
+
     def _workflow_run_handler(self, workflow_name: str, run_id: str) -> WorkflowHandler:
         workflow = self._runtime.get_workflow(workflow_name)
         if workflow is None:
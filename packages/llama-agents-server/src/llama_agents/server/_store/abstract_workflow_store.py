@@ -177,6 +177,24 @@ class AbstractWorkflowStore(ABC):
     @abstractmethod
     async def delete(self, query: HandlerQuery) -> int: ...
 
+    async def start_handler(
+        self, handler: PersistentHandler
+    ) -> PersistentHandler | None:
+        """Write ``handler`` for a new run unless its handler_id is running.
+
+        Returns the record it replaced, or ``None`` if there was none. When
+        the existing record is not terminal nothing is written and that
+        record is returned, so callers check its status.
+
+        Default queries then updates. Override to do both in one round trip.
+        """
+        found = await self.query(HandlerQuery(handler_id_in=[handler.handler_id]))
+        previous = found[0] if found else None
+        if previous is not None and not is_terminal_status(previous.status):
+            return previous
+        await self.update(handler)
+        return previous
+
     @abstractmethod
     async def append_event(
         self, run_id: str, event: EventEnvelopeWithMetadata
@@ -187,20 +205,33 @@ class AbstractWorkflowStore(ABC):
         self, run_id: str, after_sequence: int | None = None, limit: int | None = None
     ) -> list[StoredEvent]: ...
 
+    async def get_last_event(self, run_id: str) -> StoredEvent | None:
+        """The run's event with the highest sequence, or None if it has none.
+
+        Default loads all events via :meth:`query_events`. Override to read
+        just the last one.
+        """
+        events = await self.query_events(run_id)
+        return events[-1] if events else None
+
     @abstractmethod
     async def append_tick(self, run_id: str, tick_data: dict[str, Any]) -> None: ...
 
     @abstractmethod
     async def get_ticks(self, run_id: str) -> list[StoredTick]: ...
 
-    async def stream_ticks(self, run_id: str) -> AsyncIterator[StoredTick]:
+    async def stream_ticks(
+        self, run_id: str, after_sequence: int | None = None
+    ) -> AsyncIterator[StoredTick]:
         """Async-iterate stored ticks in sequence order (ascending).
 
+        With *after_sequence*, only ticks with a greater sequence are yielded.
         Default loads all ticks via :meth:`get_ticks`. Override for true
         streaming (e.g. cursor-based pagination).
         """
         for tick in await self.get_ticks(run_id):
-            yield tick
+            if after_sequence is None or tick.sequence > after_sequence:
+                yield tick
 
     async def after_tick(self, run_id: str, tick_data: dict[str, Any]) -> None:
         """Called after a tick's commands have been processed.
@@ -244,11 +275,14 @@ class AbstractWorkflowStore(ABC):
         await self.update(handler)
 
     @staticmethod
-    def _is_terminal_event(event: StoredEvent) -> bool:
+    def is_terminal_event(event: StoredEvent) -> bool:
         """Check if a stored event is terminal (StopEvent or subclass, etc.)."""
         types = (event.event.types or []) + [event.event.type]
         return StopEvent.__name__ in types
 
+    # Kept for subclasses written against the old private name.
+    _is_terminal_event = is_terminal_event
+
     async def subscribe_events(
         self, run_id: str, after_sequence: int = -1
     ) -> AsyncIterator[StoredEvent]:
@@ -268,7 +302,7 @@ class AbstractWorkflowStore(ABC):
             for event in events:
                 yield event
                 cursor = event.sequence
-                if self._is_terminal_event(event):
+                if self.is_terminal_event(event):
                     return
             if not events:
                 await asyncio.sleep(self.poll_interval)
@@ -363,7 +363,7 @@ class AgentDataStore(AbstractWorkflowStore):
             stored.model_dump(mode="json"),
         )
 
-        if self._is_terminal_event(stored):
+        if self.is_terminal_event(stored):
             await self._cleanup_run(run_id)
 
     async def query_events(
@@ -409,7 +409,7 @@ class AgentDataStore(AbstractWorkflowStore):
             for event in backfill:
                 yield event
                 cursor = event.sequence
-                if self._is_terminal_event(event):
+                if self.is_terminal_event(event):
                     return
 
             # Stream from in-memory queue
@@ -423,7 +423,7 @@ class AgentDataStore(AbstractWorkflowStore):
                     continue
                 yield event
                 cursor = event.sequence
-                if self._is_terminal_event(event):
+                if self.is_terminal_event(event):
                     return
         finally:
             self._remove_subscriber_queue(run_id, queue)
@@ -464,9 +464,11 @@ class AgentDataStore(AbstractWorkflowStore):
     async def get_ticks(self, run_id: str) -> list[StoredTick]:
         return [t async for t in self.stream_ticks(run_id)]
 
-    async def stream_ticks(self, run_id: str) -> AsyncIterator[StoredTick]:
+    async def stream_ticks(
+        self, run_id: str, after_sequence: int | None = None
+    ) -> AsyncIterator[StoredTick]:
         await self._regroup_ticks(run_id)
-        cursor: int | None = None
+        cursor = after_sequence
         while True:
             filters: dict[str, Any] = {"run_id": {"eq": run_id}}
             if cursor is not None:
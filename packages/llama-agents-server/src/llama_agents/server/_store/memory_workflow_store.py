@@ -174,6 +174,10 @@ class MemoryWorkflowStore(AbstractWorkflowStore):
             events = events[:limit]
         return events
 
+    async def get_last_event(self, run_id: str) -> StoredEvent | None:
+        events = self.events.get(run_id)
+        return events[-1] if events else None
+
     async def append_tick(self, run_id: str, tick_data: dict[str, Any]) -> None:
         if run_id not in self.ticks:
             self.ticks[run_id] = []
@@ -222,5 +226,5 @@ class MemoryWorkflowStore(AbstractWorkflowStore):
             for event in batch:
                 yield event
                 cursor += 1
-                if self._is_terminal_event(event):
+                if self.is_terminal_event(event):
                     return
@@ -0,0 +1,13 @@
+-- migration: 3
+
+-- Per-run event sequence counters. append_event takes the next sequence from
+-- here in the same statement as the insert, instead of MAX(sequence) + 1
+-- with retries on conflicting concurrent writers.
+CREATE TABLE IF NOT EXISTS wf_event_sequences (
+    run_id VARCHAR(255) PRIMARY KEY,
+    last_sequence INTEGER NOT NULL
+);
+
+INSERT INTO wf_event_sequences (run_id, last_sequence)
+SELECT run_id, MAX(sequence) FROM wf_events GROUP BY run_id
+ON CONFLICT (run_id) DO NOTHING;
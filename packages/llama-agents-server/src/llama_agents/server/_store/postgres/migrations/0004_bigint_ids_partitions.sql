@@ -0,0 +1,31 @@
+-- migration: 4
+
+-- 64-bit row ids: SERIAL ids are 32-bit and run out on long-lived
+-- deployments. Rewrites both tables once.
+ALTER TABLE wf_events ALTER COLUMN id TYPE BIGINT;
+ALTER SEQUENCE IF EXISTS wf_events_id_seq AS BIGINT;
+ALTER TABLE wf_ticks ALTER COLUMN id TYPE BIGINT;
+ALTER SEQUENCE IF EXISTS wf_ticks_id_seq AS BIGINT;
+
+-- Per-run tick sequence counters, as wf_event_sequences is for events.
+CREATE TABLE IF NOT EXISTS wf_tick_sequences (
+    run_id VARCHAR(255) PRIMARY KEY,
+    last_sequence INTEGER NOT NULL
+);
+
+INSERT INTO wf_tick_sequences (run_id, last_sequence)
+SELECT run_id, MAX(sequence) FROM wf_ticks GROUP BY run_id
+ON CONFLICT (run_id) DO NOTHING;
+
+-- Time partitions of wf_events / wf_ticks, maintained by the store when
+-- partitioning is enabled. range_start is NULL for the partition holding the
+-- rows written before the table was partitioned.
+CREATE TABLE IF NOT EXISTS wf_partitions (
+    partition_name VARCHAR(255) PRIMARY KEY,
+    parent_table VARCHAR(255) NOT NULL,
+    range_start TIMESTAMPTZ,
+    range_end TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_wf_partitions_parent_range_end
+    ON wf_partitions (parent_table, range_end);
@@ -0,0 +1,12 @@
+-- migration: 5
+
+-- Handler listings and the resume scan on startup filter by status and
+-- workflow name. Only running handlers are in the partial index, so it stays
+-- small however many finished handlers accumulate. Queries must spell the
+-- status as a constant (status = 'running') for the planner to use it.
+CREATE INDEX IF NOT EXISTS idx_wf_handlers_running
+    ON wf_handlers (workflow_name, idle_since)
+    WHERE status = 'running';
+
+CREATE INDEX IF NOT EXISTS idx_wf_handlers_workflow_name_started_at
+    ON wf_handlers (workflow_name, started_at);
@@ -0,0 +1,381 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Optional time partitioning and retention for the event and tick tables.
+
+With a ``PostgresPartitioning`` policy, ``wf_events`` and ``wf_ticks`` are
+range-partitioned on ``timestamp``. The first maintenance pass converts an
+existing heap table in place: the table is renamed to ``<table>_legacy`` and
+attached as the partition holding every row written so far, so existing
+deployments keep their data without copying it. Later passes create
+partitions ahead of time and, when ``retention`` is set, drop whole
+partitions once every run with rows in them is terminal and completed
+before the retention cutoff. Expired partitions are detached with
+``DETACH PARTITION ... CONCURRENTLY`` before they are dropped, so writers to
+the parent table are never blocked, and dropping a partition is a catalog
+operation, unlike ``DELETE``, so it leaves nothing for autovacuum to clean up.
+
+There is no default partition (Postgres refuses to detach concurrently from
+a table that has one), so rows can only be written inside the premade range.
+``maintenance_interval`` must therefore stay shorter than
+``premake * interval``. If maintenance stalls anyway, a writer whose row has
+no partition creates the missing partitions itself and retries, rather than
+failing every insert until the next pass.
+
+Unique indexes on a partitioned table must include the partition key, so the
+``(run_id, sequence)`` unique constraints of the heap tables are not carried
+over. On partitioned tables the per-run counter tables are the only guard
+against duplicate sequences: each append allocates its sequence with an
+upsert on the run's counter row, which serializes writers to the same run.
+Conversion resyncs every counter from the existing rows first, so no counter
+can lag behind the table it guards.
+
+Partitions are recorded in ``wf_partitions`` so that maintenance never has
+to parse partition bounds from the catalog.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Distinct from the migration lock so maintenance never waits on migrations.
+_MAINTENANCE_LOCK_ID = 7_201_407_233_458_174
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_TERMINAL_STATUSES_SQL = "'completed', 'failed', 'cancelled'"
+
+
+@dataclass(frozen=True)
+class PostgresPartitioning:
+    """Time-partitioning and retention policy for ``PostgresWorkflowStore``.
+
+    Args:
+        interval: Width of each partition. Boundaries are aligned to
+            multiples of ``interval`` since the Unix epoch.
+        retention: How long after a run completes its events and ticks are
+            kept. A partition is dropped once its range ended more than
+            ``retention`` ago and none of its runs is still running or
+            completed more recently. ``None`` keeps everything.
+        premake: Number of future partitions kept ready.
+        maintenance_interval: How often the store re-runs maintenance while
+            started. Must be comfortably shorter than
+            ``premake * interval``; a write past the premade range creates
+            its partition on the spot, but waits for it.
+    """
+
+    interval: timedelta = timedelta(days=1)
+    retention: timedelta | None = None
+    premake: int = 3
+    maintenance_interval: timedelta = timedelta(hours=1)
+
+    def __post_init__(self) -> None:
+        if self.interval < timedelta(minutes=1):
+            raise ValueError("interval must be at least one minute")
+        if self.retention is not None and self.retention <= timedelta(0):
+            raise ValueError("retention must be positive")
+        if self.premake < 1:
+            raise ValueError("premake must be at least 1")
+        if self.maintenance_interval <= timedelta(0):
+            raise ValueError("maintenance_interval must be positive")
+        if self.maintenance_interval >= self.premake * self.interval:
+            raise ValueError(
+                "maintenance_interval must be shorter than premake * interval"
+            )
+
+
+def partition_bounds(
+    start: datetime, until: datetime, interval: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Contiguous ranges from ``start`` that cover everything before ``until``.
+
+    Every range ends on a multiple of ``interval`` since the epoch; the first
+    one is shorter when ``start`` is not on such a boundary.
+    """
+    bounds: list[tuple[datetime, datetime]] = []
+    while start < until:
+        end = _EPOCH + ((start - _EPOCH) // interval + 1) * interval
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def partition_name(table: str, start: datetime) -> str:
+    return f"{table}_p{start.astimezone(timezone.utc):%Y%m%d%H%M%S}"
+
+
+def _literal(value: datetime) -> str:
+    # Partition bounds must be constants; ``value`` is always ours, not input.
+    return f"'{value.isoformat()}'"
+
+
+class PartitionMaintainer:
+    """Converts, extends, and prunes the partitioned tables of one schema.
+
+    ``tables`` maps each partitioned table to its per-run sequence counter
+    table, whose rows are pruned along with the run's last partition.
+    """
+
+    def __init__(
+        self,
+        policy: PostgresPartitioning,
+        schema: str | None,
+        handlers_table: str,
+        tables: Mapping[str, str],
+    ) -> None:
+        self._policy = policy
+        self._schema = schema
+        self._handlers_ref = self._ref(handlers_table)
+        self._partitions_ref = self._ref("wf_partitions")
+        self._tables = dict(tables)
+
+    def _ref(self, name: str) -> str:
+        if self._schema:
+            return f"{self._schema}.{name}"
+        return name
+
+    async def run(self, conn: asyncpg.Connection, now: datetime) -> bool:
+        """Run one maintenance pass. Returns False when another replica
+        holds the maintenance lock, in which case nothing is done."""
+        if not await conn.fetchval(
+            "SELECT pg_try_advisory_lock($1)", _MAINTENANCE_LOCK_ID
+        ):
+            return False
+        try:
+            for table, counter_table in self._tables.items():
+                if not await self._is_partitioned(conn, table):
+                    await self._convert(conn, table, counter_table, now)
+                await self._create_partitions(conn, table, now)
+                if self._policy.retention is not None:
+                    cutoff = now - self._policy.retention
+                    await self._drop_expired(conn, table, cutoff)
+                    await self._prune_counters(conn, table, counter_table, cutoff)
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", _MAINTENANCE_LOCK_ID)
+        return True
+
+    async def ensure_partitions(self, conn: asyncpg.Connection, now: datetime) -> None:
+        """Create the partitions a pass would, and nothing else.
+
+        For writers that found no partition for a row. Unlike ``run``, this
+        waits for a pass in progress elsewhere, which creates them too.
+        """
+        await conn.execute("SELECT pg_advisory_lock($1)", _MAINTENANCE_LOCK_ID)
+        try:
+            for table in self._tables:
+                if await self._is_partitioned(conn, table):
+                    await self._create_partitions(conn, table, now)
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", _MAINTENANCE_LOCK_ID)
+
+    async def _is_partitioned(self, conn: asyncpg.Connection, table: str) -> bool:
+        relkind = await conn.fetchval(
+            """
+            SELECT c.relkind FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relname = $1 AND n.nspname = COALESCE($2, current_schema())
+            """,
+            table,
+            self._schema,
+        )
+        if relkind is None:
+            raise RuntimeError(
+                f"Table {self._ref(table)} does not exist; run migrations first"
+            )
+        return relkind == "p"
+
+    async def _convert(
+        self,
+        conn: asyncpg.Connection,
+        table: str,
+        counter_table: str,
+        now: datetime,
+    ) -> None:
+        """Turn a heap table into a partitioned one holding it as a partition.
+
+        Writers are blocked while the legacy rows are scanned to resync the
+        sequence counters, validate the partition bound, and build the
+        ``(run_id, sequence)`` index of the partitioned table. The premade
+        partitions are created in the same transaction, so no write lands
+        outside a partition once the lock is released.
+        """
+        ref = self._ref(table)
+        legacy = f"{table}_legacy"
+        legacy_ref = self._ref(legacy)
+        logger.info("Converting %s to a time-partitioned table", ref)
+        async with conn.transaction():
+            await conn.execute(f"LOCK TABLE {ref} IN ACCESS EXCLUSIVE MODE")
+            cutover: datetime = await conn.fetchval(
+                f"""
+                SELECT GREATEST(now(), MAX(timestamp) + interval '1 microsecond')
+                FROM {ref}
+                """
+            )
+            # The unique (run_id, sequence) constraint goes away with the
+            # conversion; from here on the counters alone allocate sequences.
+            await conn.execute(
+                f"""
+                INSERT INTO {self._ref(counter_table)} AS s (run_id, last_sequence)
+                SELECT run_id, MAX(sequence) FROM {ref} GROUP BY run_id
+                ON CONFLICT (run_id) DO UPDATE
+                    SET last_sequence = GREATEST(s.last_sequence, EXCLUDED.last_sequence)
+                """
+            )
+            await conn.execute(f"ALTER TABLE {ref} RENAME TO {legacy}")
+            await conn.execute(
+                f"CREATE TABLE {ref} (LIKE {legacy_ref} INCLUDING DEFAULTS) "
+                "PARTITION BY RANGE (timestamp)"
+            )
+            # The id sequence would otherwise be dropped with the legacy rows.
+            sequence = await conn.fetchval(
+                "SELECT pg_get_serial_sequence($1, 'id')", legacy_ref
+            )
+            if sequence is not None:
+                await conn.execute(f"ALTER SEQUENCE {sequence} OWNED BY {ref}.id")
+            await conn.execute(
+                f"CREATE INDEX idx_{table}_run_id_sequence ON {ref} (run_id, sequence)"
+            )
+            await conn.execute(
+                f"ALTER TABLE {ref} ATTACH PARTITION {legacy_ref} "
+                f"FOR VALUES FROM (MINVALUE) TO ({_literal(cutover)})"
+            )
+            await self._record(conn, legacy, table, None, cutover)
+            await self._create_partitions(conn, table, now)
+
+    async def _create_partitions(
+        self, conn: asyncpg.Connection, table: str, now: datetime
+    ) -> None:
+        ref = self._ref(table)
+        last_end: datetime | None = await conn.fetchval(
+            f"SELECT MAX(range_end) FROM {self._partitions_ref} "
+            "WHERE parent_table = $1",
+            table,
+        )
+        if last_end is None:
+            raise RuntimeError(f"No partitions recorded for {ref}")
+        until = now + self._policy.premake * self._policy.interval
+        for start, end in partition_bounds(last_end, until, self._policy.interval):
+            name = partition_name(table, start)
+            part_ref = self._ref(name)
+            async with conn.transaction():
+                # CREATE TABLE ... PARTITION OF would lock the parent against
+                # writers; ATTACH PARTITION does not.
+                await conn.execute(
+                    f"CREATE TABLE {part_ref} (LIKE {ref} INCLUDING DEFAULTS)"
+                )
+                await conn.execute(
+                    f"ALTER TABLE {ref} ATTACH PARTITION {part_ref} "
+                    f"FOR VALUES FROM ({_literal(start)}) TO ({_literal(end)})"
+                )
+                await self._record(conn, name, table, start, end)
+            logger.debug("Created partition %s [%s, %s)", part_ref, start, end)
+
+    async def _drop_expired(
+        self, conn: asyncpg.Connection, table: str, cutoff: datetime
+    ) -> None:
+        rows = await conn.fetch(
+            f"""
+            SELECT partition_name FROM {self._partitions_ref}
+            WHERE parent_table = $1 AND range_end <= $2
+            ORDER BY range_end
+            """,
+            table,
+            cutoff,
+        )
+        for row in rows:
+            name = row["partition_name"]
+            part_ref = self._ref(name)
+            # Probe the partition's run_id index once per live handler,
+            # rather than scanning the partition.
+            retained = await conn.fetchval(
+                f"""
+                SELECT EXISTS (
+                    SELECT 1 FROM {self._handlers_ref} h
+                    WHERE (
+                        h.status NOT IN ({_TERMINAL_STATUSES_SQL})
+                        OR h.completed_at IS NULL
+                        OR h.completed_at > $1
+                    )
+                    AND EXISTS (SELECT 1 FROM {part_ref} p WHERE p.run_id = h.run_id)
+                )
+                """,
+                cutoff,
+            )
+            if retained:
+                logger.debug("Keeping partition %s: it has live runs", part_ref)
+                continue
+            await self._detach(conn, table, name)
+            async with conn.transaction():
+                await conn.execute(f"DROP TABLE {part_ref}")
+                await conn.execute(
+                    f"DELETE FROM {self._partitions_ref} WHERE partition_name = $1",
+                    name,
+                )
+            logger.info("Dropped expired partition %s", part_ref)
+
+    async def _detach(self, conn: asyncpg.Connection, table: str, name: str) -> None:
+        """Detach a partition without blocking writers to the parent.
+
+        ``DETACH ... CONCURRENTLY`` cannot run in a transaction, so a pass
+        can stop between detaching and dropping, or in the middle of the
+        detach itself. Both leave the partition recorded, and the next pass
+        picks up from the catalog state.
+        """
+        pending: bool | None = await conn.fetchval(
+            "SELECT inhdetachpending FROM pg_inherits WHERE inhrelid = to_regclass($1)",
+            self._ref(name),
+        )
+        if pending is None:
+            return
+        mode = "FINALIZE" if pending else "CONCURRENTLY"
+        await conn.execute(
+            f"ALTER TABLE {self._ref(table)} DETACH PARTITION {self._ref(name)} {mode}"
+        )
+
+    async def _prune_counters(
+        self,
+        conn: asyncpg.Connection,
+        table: str,
+        counter_table: str,
+        cutoff: datetime,
+    ) -> None:
+        """Forget sequence counters of expired runs that have no rows left."""
+        await conn.execute(
+            f"""
+            DELETE FROM {self._ref(counter_table)} s
+            USING {self._handlers_ref} h
+            WHERE s.run_id = h.run_id
+              AND h.status IN ({_TERMINAL_STATUSES_SQL})
+              AND h.completed_at <= $1
+              AND NOT EXISTS (
+                  SELECT 1 FROM {self._ref(table)} t WHERE t.run_id = s.run_id
+              )
+            """,
+            cutoff,
+        )
+
+    async def _record(
+        self,
+        conn: asyncpg.Connection,
+        name: str,
+        table: str,
+        start: datetime | None,
+        end: datetime,
+    ) -> None:
+        await conn.execute(
+            f"""
+            INSERT INTO {self._partitions_ref}
+                (partition_name, parent_table, range_start, range_end)
+            VALUES ($1, $2, $3, $4)
+            """,
+            name,
+            table,
+            start,
+            end,
+        )
@@ -4,14 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
-import contextlib
 import functools
 import json
 import logging
 import weakref
+from collections import deque
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Sequence, cast
+from typing import Any, Sequence, cast, get_args
 
 import asyncpg
 from llama_agents.client.protocol.serializable_events import EventEnvelopeWithMetadata
@@ -23,25 +24,84 @@ from .abstract_workflow_store import (
     AbstractWorkflowStore,
     HandlerQuery,
     PersistentHandler,
+    Status,
     StoredEvent,
     StoredTick,
+    is_terminal_status,
 )
 from .postgres.migrate import run_migrations as _run_migrations
+from .postgres.partitions import PartitionMaintainer, PostgresPartitioning
 from .postgres_state_store import PostgresStateStore
 
 logger = logging.getLogger(__name__)
 
-_TICK_PAGE_SIZE = 100
+# Ticks fetched per server-side cursor round trip in ``stream_ticks``.
+_TICK_STREAM_BATCH_SIZE = 1000
 
 # Bounds for the LISTEN-connection reconnect backoff.
 _LISTEN_RECONNECT_INITIAL_DELAY = 0.5
 _LISTEN_RECONNECT_MAX_DELAY = 30.0
 
+# Events up to this size (bytes of JSON) ride inline in the append NOTIFY.
+# Postgres caps NOTIFY payloads at 8000 bytes; the rest of the payload is the
+# run_id (at most 255 characters), sequence and timestamp.
+_NOTIFY_INLINE_MAX_BYTES = 7000
+# Notices buffered per subscriber before it falls back to re-querying.
+_MAX_BUFFERED_NOTICES = 1000
+
+
+_STATUSES: frozenset[str] = frozenset(get_args(Status))
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@dataclass(frozen=True)
+class _EventNotice:
+    """An ``append_event`` NOTIFY: the new sequence, plus the event when it fit."""
+
+    sequence: int
+    event: StoredEvent | None
+
+
+class _EventInbox:
+    """Notices for one ``subscribe_events`` consumer, in commit order."""
+
+    def __init__(self) -> None:
+        self.notices: deque[_EventNotice] = deque()
+        # Set when notices were discarded; the consumer must re-query.
+        self.overflowed = False
+
+    def push(self, notice: _EventNotice) -> None:
+        if len(self.notices) >= _MAX_BUFFERED_NOTICES:
+            self.notices.clear()
+            self.overflowed = True
+            return
+        self.notices.append(notice)
+
+    def take(self, cursor: int) -> tuple[list[StoredEvent], bool]:
+        """Pop the events that directly follow ``cursor``.
+
+        Returns the events and whether the consumer must re-query: a notice
+        without an inline event, a sequence gap, or an overflow.
+        """
+        events: list[StoredEvent] = []
+        expected = cursor + 1
+        while self.notices:
+            notice = self.notices.popleft()
+            if notice.sequence < expected:
+                continue
+            if notice.sequence > expected or notice.event is None:
+                return events, True
+            events.append(notice.event)
+            expected += 1
+        if self.overflowed:
+            self.overflowed = False
+            return events, True
+        return events, False
+
+
 class PostgresWorkflowStore(AbstractWorkflowStore):
     """Async Postgres workflow store using asyncpg with LISTEN/NOTIFY."""
 
@@ -56,12 +116,17 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
         pool_max_size: int = 10,
         auto_migrate: bool = True,
         pool: PoolProvider | None = None,
+        partitioning: PostgresPartitioning | None = None,
     ) -> None:
         """Construct a PostgresWorkflowStore.
 
         When ``pool`` is provided, the provider controls ownership semantics.
         When it is omitted, the store owns a lazily-created asyncpg pool using
         the provided DSN and pool size settings.
+
+        With ``partitioning``, the event and tick tables are time-partitioned
+        (converting existing tables on the first start) and maintained in the
+        background while the store is started; see ``PostgresPartitioning``.
         """
         super().__init__()
         self._dsn = dsn
@@ -82,10 +147,13 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
         self._conditions: weakref.WeakValueDictionary[str, asyncio.Condition] = (
             weakref.WeakValueDictionary()
         )
+        self._inboxes: dict[str, set[_EventInbox]] = {}
         # LISTEN reconnect bookkeeping.
         self._closing = False
         self._reconnect_lock = asyncio.Lock()
         self._reconnect_task: asyncio.Task[None] | None = None
+        self._partitioning = partitioning
+        self._maintenance_task: asyncio.Task[None] | None = None
 
     @property
     def _handlers_ref(self) -> str:
@@ -105,6 +173,18 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
             return f"{self._schema}.wf_ticks"
         return "wf_ticks"
 
+    @property
+    def _event_sequences_ref(self) -> str:
+        if self._schema:
+            return f"{self._schema}.wf_event_sequences"
+        return "wf_event_sequences"
+
+    @property
+    def _tick_sequences_ref(self) -> str:
+        if self._schema:
+            return f"{self._schema}.wf_tick_sequences"
+        return "wf_tick_sequences"
+
     @property
     def _notify_channel(self) -> str:
         return self._events_table_name
@@ -134,8 +214,14 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
             pool = await self._pool_provider.get()
             if self._auto_migrate:
                 await self._run_migrations_on(pool)
+            if self._partitioning is not None:
+                await self._maintain_partitions_on(pool)
             await self._setup_listener(pool)
             self._pool = pool
+            if self._partitioning is not None:
+                self._maintenance_task = asyncio.create_task(
+                    self._partition_maintenance_loop(self._partitioning)
+                )
 
     async def _setup_listener(self, pool: asyncpg.Pool) -> None:
         """Set up a dedicated connection for LISTEN/NOTIFY."""
@@ -162,12 +248,40 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
         channel: str,
         payload: str,
     ) -> None:
-        """Handle NOTIFY callback — schedule condition notification."""
+        """Handle NOTIFY callback — buffer the notice and wake subscribers.
+
+        Payloads are JSON objects from ``append_event``; a bare run_id (as
+        sent by older writers) just wakes subscribers to re-query.
+        """
         run_id = payload
+        if payload.startswith("{"):
+            try:
+                data = json.loads(payload)
+                run_id = data["run_id"]
+                inboxes = self._inboxes.get(run_id)
+                if inboxes:
+                    notice = self._parse_notice(data)
+                    for inbox in inboxes:
+                        inbox.push(notice)
+            except Exception:
+                logger.warning("Ignoring malformed event NOTIFY payload", exc_info=True)
+                return
         condition = self._conditions.get(run_id)
         if condition is not None:
             asyncio.ensure_future(self._notify_condition(condition))
 
+    @staticmethod
+    def _parse_notice(data: dict[str, Any]) -> _EventNotice:
+        event: StoredEvent | None = None
+        if data.get("event") is not None:
+            event = StoredEvent(
+                run_id=data["run_id"],
+                sequence=data["sequence"],
+                timestamp=datetime.fromisoformat(data["timestamp"]),
+                event=EventEnvelopeWithMetadata.model_validate(data["event"]),
+            )
+        return _EventNotice(sequence=data["sequence"], event=event)
+
     @staticmethod
     async def _notify_condition(condition: asyncio.Condition) -> None:
         async with condition:
@@ -258,6 +372,13 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
             except (asyncio.CancelledError, Exception):
                 pass
         self._reconnect_task = None
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._maintenance_task = None
         if self._listen_conn is not None:
             try:
                 await self._listen_conn.remove_listener(
@@ -327,6 +448,67 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
         async with pool.acquire() as conn:
             await _run_migrations(cast(asyncpg.Connection, conn), schema=self._schema)
 
+    # ── Partitions ──────────────────────────────────────────────────────
+
+    async def maintain_partitions(self) -> None:
+        """Create upcoming partitions and drop expired ones now.
+
+        Runs automatically on ``start()`` and every
+        ``maintenance_interval`` afterwards; call it directly to run
+        maintenance from a scheduled job instead.
+        """
+        pool = await self._ensure_pool()
+        await self._maintain_partitions_on(pool)
+
+    def _partition_maintainer(self) -> PartitionMaintainer:
+        if self._partitioning is None:
+            raise RuntimeError("PostgresWorkflowStore has no partitioning policy")
+        return PartitionMaintainer(
+            self._partitioning,
+            schema=self._schema,
+            handlers_table=self._handlers_table_name,
+            tables={
+                self._events_table_name: "wf_event_sequences",
+                "wf_ticks": "wf_tick_sequences",
+            },
+        )
+
+    async def _maintain_partitions_on(self, pool: asyncpg.Pool) -> None:
+        maintainer = self._partition_maintainer()
+        async with pool.acquire() as conn:
+            ran = await maintainer.run(cast(asyncpg.Connection, conn), _utc_now())
+        if not ran:
+            logger.debug("Partition maintenance is running elsewhere; skipped")
+
+    async def _create_missing_partitions(
+        self, error: asyncpg.CheckViolationError
+    ) -> None:
+        """Create partitions after an insert found none for its row, or re-raise.
+
+        That only happens when maintenance has stalled for longer than the
+        premade range lasts.
+        """
+        if self._partitioning is None or "no partition of relation" not in str(error):
+            raise error
+        logger.warning(
+            "No partition for a new row; partition maintenance is behind. "
+            "Creating partitions now."
+        )
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            await self._partition_maintainer().ensure_partitions(
+                cast(asyncpg.Connection, conn), _utc_now()
+            )
+
+    async def _partition_maintenance_loop(self, policy: PostgresPartitioning) -> None:
+        delay = policy.maintenance_interval.total_seconds()
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.maintain_partitions()
+            except Exception:
+                logger.warning("Partition maintenance failed", exc_info=True)
+
     @staticmethod
     def run_migrations_sync(dsn: str, schema: str | None = None) -> None:
         """Run migrations synchronously, handling event loop detection.
@@ -357,19 +539,11 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
     # ── Handlers ────────────────────────────────────────────────────────
 
     async def query(self, query: HandlerQuery) -> list[PersistentHandler]:
-        filter_spec = self._build_filters(query)
-        if filter_spec is None:
+        statement = self._query_statement(query)
+        if statement is None:
             return []
 
-        clauses, params = filter_spec
-        sql = f"""
-            SELECT handler_id, workflow_name, status, run_id, error, result,
-                   started_at, updated_at, completed_at, idle_since
-            FROM {self._handlers_ref}
-        """
-        if clauses:
-            sql = f"{sql} WHERE {' AND '.join(clauses)}"
-
+        sql, params = statement
         pool = await self._ensure_pool()
         async with pool.acquire() as conn:
             rows = await conn.fetch(sql, *params)
@@ -412,6 +586,71 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
                 handler.idle_since,
             )
 
+    async def start_handler(
+        self, handler: PersistentHandler
+    ) -> PersistentHandler | None:
+        """Upsert ``handler`` unless it is running, returning the prior row.
+
+        One statement: the prior row is locked and read, and the upsert only
+        replaces it when it is terminal.
+        """
+        result_json = None
+        if handler.result is not None:
+            result_json = JsonSerializer().serialize(handler.result)
+
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""
+                WITH previous AS (
+                    SELECT handler_id, workflow_name, status, run_id, error, result,
+                           started_at, updated_at, completed_at, idle_since
+                    FROM {self._handlers_ref}
+                    WHERE handler_id = $1
+                    FOR UPDATE
+                ), written AS (
+                    INSERT INTO {self._handlers_ref} AS h
+                        (handler_id, workflow_name, status, run_id, error, result,
+                         started_at, updated_at, completed_at, idle_since)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                    ON CONFLICT (handler_id) DO UPDATE SET
+                        workflow_name = EXCLUDED.workflow_name,
+                        status = EXCLUDED.status,
+                        run_id = EXCLUDED.run_id,
+                        error = EXCLUDED.error,
+                        result = EXCLUDED.result,
+                        started_at = EXCLUDED.started_at,
+                        updated_at = EXCLUDED.updated_at,
+                        completed_at = EXCLUDED.completed_at,
+                        idle_since = EXCLUDED.idle_since
+                    WHERE h.status IN ('completed', 'failed', 'cancelled')
+                    RETURNING 1
+                )
+                SELECT previous.*, EXISTS (SELECT 1 FROM written) AS written
+                FROM (SELECT 1) AS one
+                LEFT JOIN previous ON true
+                """,
+                handler.handler_id,
+                handler.workflow_name,
+                handler.status,
+                handler.run_id,
+                handler.error,
+                result_json,
+                handler.started_at,
+                handler.updated_at,
+                handler.completed_at,
+                handler.idle_since,
+            )
+        assert row is not None
+        previous = self._row_to_handler(row) if row["handler_id"] is not None else None
+        if not row["written"] and (
+            previous is None or is_terminal_status(previous.status)
+        ):
+            # A concurrent start inserted the row after our snapshot.
+            found = await self.query(HandlerQuery(handler_id_in=[handler.handler_id]))
+            return found[0] if found else None
+        return previous
+
     async def delete(self, query: HandlerQuery) -> int:
         filter_spec = self._build_filters(query)
         if filter_spec is None:
@@ -433,38 +672,98 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
     _MAX_SEQUENCE_RETRIES = 5
 
     async def append_event(self, run_id: str, event: EventEnvelopeWithMetadata) -> None:
+        """Insert an event under the run's next sequence and NOTIFY subscribers.
+
+        The sequence comes from the run's row in ``wf_event_sequences``, which
+        also serializes concurrent writers to the same run. The insert and the
+        NOTIFY (carrying the sequence, and the event itself when small enough)
+        are a single statement.
+
+        On a partitioned table the counter is the only guard against a
+        duplicate sequence, since there is no unique ``(run_id, sequence)``
+        constraint to violate; see ``PostgresPartitioning``. An insert past
+        the premade partitions creates them and retries.
+        """
         now = _utc_now()
         event_json = event.model_dump_json()
+        inline = len(event_json.encode()) <= _NOTIFY_INLINE_MAX_BYTES
 
         pool = await self._ensure_pool()
         insert_sql = f"""
-            INSERT INTO {self._events_ref} (run_id, sequence, timestamp, event_json)
-            VALUES (
-                $1,
-                COALESCE((SELECT MAX(sequence) FROM {self._events_ref} WHERE run_id = $1::varchar), -1) + 1,
-                $2,
-                $3
+            WITH seq AS (
+                INSERT INTO {self._event_sequences_ref} AS s (run_id, last_sequence)
+                VALUES ($1::varchar, 0)
+                ON CONFLICT (run_id) DO UPDATE SET last_sequence = s.last_sequence + 1
+                RETURNING last_sequence
+            ), ins AS (
+                INSERT INTO {self._events_ref} (run_id, sequence, timestamp, event_json)
+                SELECT $1::varchar, last_sequence, $2, $3::text FROM seq
+                RETURNING sequence
             )
+            SELECT pg_notify(
+                $4,
+                json_build_object(
+                    'run_id', $1::varchar,
+                    'sequence', sequence,
+                    'timestamp', $5::text,
+                    'event', CASE WHEN $6::boolean THEN $3::text::json END
+                )::text
+            )
+            FROM ins
         """
-        # Retry on unique constraint violation from concurrent sequence assignment
         for attempt in range(self._MAX_SEQUENCE_RETRIES):
             try:
                 async with pool.acquire() as conn:
-                    await conn.execute(insert_sql, run_id, now, event_json)
                     await conn.execute(
-                        "SELECT pg_notify($1, $2)",
-                        self._notify_channel,
+                        insert_sql,
                         run_id,
+                        now,
+                        event_json,
+                        self._notify_channel,
+                        now.isoformat(),
+                        inline,
                     )
                     return
+            except asyncpg.CheckViolationError as e:
+                if attempt == self._MAX_SEQUENCE_RETRIES - 1:
+                    raise
+                await self._create_missing_partitions(e)
             except asyncpg.UniqueViolationError:
+                # The counter is behind the events table, e.g. events were
+                # written by a version that did not maintain it. Resync it.
+                # Only unpartitioned tables keep the unique constraint that
+                # raises this; partitioning resyncs every counter up front.
                 if attempt == self._MAX_SEQUENCE_RETRIES - 1:
                     raise
                 logger.debug(
-                    "Sequence conflict for run_id=%s, retrying (attempt %d)",
+                    "Sequence conflict for run_id=%s, resyncing (attempt %d)",
                     run_id,
                     attempt + 1,
                 )
+                async with pool.acquire() as conn:
+                    await self._resync_event_sequence(conn, run_id)
+
+    async def _resync_event_sequence(
+        self, conn: asyncpg.Connection, run_id: str
+    ) -> None:
+        await self._resync_sequence(
+            conn, self._event_sequences_ref, self._events_ref, run_id
+        )
+
+    @staticmethod
+    async def _resync_sequence(
+        conn: asyncpg.Connection, counter_ref: str, table_ref: str, run_id: str
+    ) -> None:
+        await conn.execute(
+            f"""
+            INSERT INTO {counter_ref} AS s (run_id, last_sequence)
+            SELECT $1::varchar, COALESCE(MAX(sequence), -1)
+            FROM {table_ref} WHERE run_id = $1::varchar
+            ON CONFLICT (run_id) DO UPDATE
+                SET last_sequence = GREATEST(s.last_sequence, EXCLUDED.last_sequence)
+            """,
+            run_id,
+        )
 
     async def query_events(
         self,
@@ -505,59 +804,123 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
             for row in rows
         ]
 
+    async def get_last_event(self, run_id: str) -> StoredEvent | None:
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""
+                SELECT run_id, sequence, timestamp, event_json
+                FROM {self._events_ref}
+                WHERE run_id = $1
+                ORDER BY sequence DESC
+                LIMIT 1
+                """,
+                run_id,
+            )
+        if row is None:
+            return None
+        return StoredEvent(
+            run_id=row["run_id"],
+            sequence=row["sequence"],
+            timestamp=row["timestamp"],
+            event=EventEnvelopeWithMetadata.model_validate_json(row["event_json"]),
+        )
+
     async def subscribe_events(
         self, run_id: str, after_sequence: int = -1
     ) -> AsyncIterator[StoredEvent]:
+        """Stream events after ``after_sequence``.
+
+        Catches up with one query, then follows the run from the events
+        inlined in NOTIFY payloads. It re-queries only for events too large
+        to inline, on a sequence gap, after a LISTEN reconnect, or when
+        ``poll_interval`` passes without a notification.
+        """
         condition = self._get_or_create_condition(run_id)
+        # Register before the catch-up query so no notice can slip between.
+        inbox = _EventInbox()
+        inboxes = self._inboxes.setdefault(run_id, set())
+        inboxes.add(inbox)
         cursor = after_sequence
+        needs_query = True
+        try:
+            while True:
+                if needs_query:
+                    batch = await self.query_events(run_id, after_sequence=cursor)
+                    needs_query = False
+                else:
+                    batch, needs_query = inbox.take(cursor)
 
-        while True:
-            async with condition:
-                batch = await self.query_events(run_id, after_sequence=cursor)
                 if not batch:
-                    with contextlib.suppress(TimeoutError):
-                        await asyncio.wait_for(
-                            condition.wait(), timeout=self.poll_interval
-                        )
+                    if needs_query:
+                        continue
+                    async with condition:
+                        if inbox.notices or inbox.overflowed:
+                            continue
+                        try:
+                            await asyncio.wait_for(
+                                condition.wait(), timeout=self.poll_interval
+                            )
+                        except asyncio.TimeoutError:
+                            needs_query = True
+                            continue
+                    # Woken without a notice (reconnect, or an older writer's
+                    # bare run_id payload): fall back to querying.
+                    needs_query = not inbox.notices and not inbox.overflowed
                     continue
 
-            for event in batch:
-                yield event
-                cursor = event.sequence
-                if self._is_terminal_event(event):
-                    return
+                for event in batch:
+                    yield event
+                    cursor = event.sequence
+                    if self.is_terminal_event(event):
+                        return
+        finally:
+            inboxes.discard(inbox)
+            if not inboxes and self._inboxes.get(run_id) is inboxes:
+                del self._inboxes[run_id]
 
     # ── Ticks ──────────────────────────────────────────────────────────
 
     _MAX_TICK_SEQUENCE_RETRIES = 5
 
     async def append_tick(self, run_id: str, tick_data: dict[str, Any]) -> None:
+        """Insert a tick under the run's next sequence from ``wf_tick_sequences``."""
         now = _utc_now()
         tick_json = json.dumps(tick_data)
 
         pool = await self._ensure_pool()
         insert_sql = f"""
-            INSERT INTO {self._ticks_ref} (run_id, sequence, timestamp, tick_data)
-            VALUES (
-                $1,
-                COALESCE((SELECT MAX(sequence) FROM {self._ticks_ref} WHERE run_id = $1::varchar), -1) + 1,
-                $2,
-                $3::jsonb
+            WITH seq AS (
+                INSERT INTO {self._tick_sequences_ref} AS s (run_id, last_sequence)
+                VALUES ($1::varchar, 0)
+                ON CONFLICT (run_id) DO UPDATE SET last_sequence = s.last_sequence + 1
+                RETURNING last_sequence
             )
+            INSERT INTO {self._ticks_ref} (run_id, sequence, timestamp, tick_data)
+            SELECT $1::varchar, last_sequence, $2, $3::jsonb FROM seq
         """
         for attempt in range(self._MAX_TICK_SEQUENCE_RETRIES):
             try:
                 async with pool.acquire() as conn:
                     await conn.execute(insert_sql, run_id, now, tick_json)
                     return
+            except asyncpg.CheckViolationError as e:
+                if attempt == self._MAX_TICK_SEQUENCE_RETRIES - 1:
+                    raise
+                await self._create_missing_partitions(e)
             except asyncpg.UniqueViolationError:
+                # As in append_event: unpartitioned tables only.
                 if attempt == self._MAX_TICK_SEQUENCE_RETRIES - 1:
                     raise
                 logger.debug(
-                    "Tick sequence conflict for run_id=%s, retrying (attempt %d)",
+                    "Tick sequence conflict for run_id=%s, resyncing (attempt %d)",
                     run_id,
                     attempt + 1,
                 )
+                async with pool.acquire() as conn:
+                    await self._resync_sequence(
+                        conn, self._tick_sequences_ref, self._ticks_ref, run_id
+                    )
 
     async def get_ticks(self, run_id: str) -> list[StoredTick]:
         pool = await self._ensure_pool()
@@ -572,54 +935,68 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
                 run_id,
             )
 
-        return [
-            StoredTick(
-                run_id=row["run_id"],
-                sequence=row["sequence"],
-                timestamp=row["timestamp"],
-                tick_data=json.loads(row["tick_data"])
-                if isinstance(row["tick_data"], str)
-                else row["tick_data"],
-            )
-            for row in rows
-        ]
+        return [self._row_to_tick(row) for row in rows]
 
-    async def stream_ticks(self, run_id: str) -> AsyncIterator[StoredTick]:
+    async def stream_ticks(
+        self, run_id: str, after_sequence: int | None = None
+    ) -> AsyncIterator[StoredTick]:
+        """Stream a run's ticks through a server-side cursor on one connection.
+
+        The next batch is fetched while the caller decodes and reduces the
+        current one, so rehydrating a long run overlaps round trips with
+        replay instead of paying them one page at a time.
+        """
         pool = await self._ensure_pool()
-        cursor: int | None = None
-        while True:
-            if cursor is None:
-                sql = (
-                    f"SELECT run_id, sequence, timestamp, tick_data "
-                    f"FROM {self._ticks_ref} WHERE run_id = $1 "
-                    f"ORDER BY sequence LIMIT $2"
-                )
-                params: list[Any] = [run_id, _TICK_PAGE_SIZE]
-            else:
-                sql = (
-                    f"SELECT run_id, sequence, timestamp, tick_data "
-                    f"FROM {self._ticks_ref} WHERE run_id = $1 AND sequence > $2 "
-                    f"ORDER BY sequence LIMIT $3"
-                )
-                params = [run_id, cursor, _TICK_PAGE_SIZE]
-            async with pool.acquire() as conn:
-                rows = await conn.fetch(sql, *params)
-            for row in rows:
-                tick = StoredTick(
-                    run_id=row["run_id"],
-                    sequence=row["sequence"],
-                    timestamp=row["timestamp"],
-                    tick_data=json.loads(row["tick_data"])
-                    if isinstance(row["tick_data"], str)
-                    else row["tick_data"],
-                )
-                yield tick
-                cursor = tick.sequence
-            if len(rows) < _TICK_PAGE_SIZE:
-                return
+        async with pool.acquire() as conn, conn.transaction(readonly=True):
+            cursor = await conn.cursor(
+                f"""
+                SELECT run_id, sequence, timestamp, tick_data
+                FROM {self._ticks_ref}
+                WHERE run_id = $1 AND sequence > $2
+                ORDER BY sequence
+                """,
+                run_id,
+                -1 if after_sequence is None else after_sequence,
+            )
+            pending: asyncio.Future[list[asyncpg.Record]] | None = (
+                asyncio.ensure_future(cursor.fetch(_TICK_STREAM_BATCH_SIZE))
+            )
+            try:
+                while pending is not None:
+                    rows = await pending
+                    pending = None
+                    if len(rows) == _TICK_STREAM_BATCH_SIZE:
+                        pending = asyncio.ensure_future(
+                            cursor.fetch(_TICK_STREAM_BATCH_SIZE)
+                        )
+                    for row in rows:
+                        yield self._row_to_tick(row)
+            finally:
+                # The connection must be idle before the transaction ends.
+                if pending is not None:
+                    try:
+                        await pending
+                    except (asyncio.CancelledError, Exception):
+                        pass
 
     # ── Helpers ─────────────────────────────────────────────────────────
 
+    def _query_statement(self, query: HandlerQuery) -> tuple[str, list[Any]] | None:
+        """The SELECT for ``query`` and its parameters, or None if it matches nothing."""
+        filter_spec = self._build_filters(query)
+        if filter_spec is None:
+            return None
+
+        clauses, params = filter_spec
+        sql = f"""
+            SELECT handler_id, workflow_name, status, run_id, error, result,
+                   started_at, updated_at, completed_at, idle_since
+            FROM {self._handlers_ref}
+        """
+        if clauses:
+            sql = f"{sql} WHERE {' AND '.join(clauses)}"
+        return sql, params
+
     def _build_filters(self, query: HandlerQuery) -> tuple[list[str], list[Any]] | None:
         clauses: list[str] = []
         params: list[Any] = []
@@ -636,13 +1013,23 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
             (query.workflow_name_in, "workflow_name"),
             (query.handler_id_in, "handler_id"),
             (query.run_id_in, "run_id"),
-            (query.status_in, "status"),
         ]:
             if field is not None:
                 if len(field) == 0:
                     return None
                 add_in_clause(column, field)
 
+        if query.status_in is not None:
+            if len(query.status_in) == 0:
+                return None
+            unknown = set(query.status_in) - _STATUSES
+            if unknown:
+                raise ValueError(f"Unknown handler status: {sorted(unknown)}")
+            # Inlined rather than bound: a generic plan for a parameter can
+            # never use the partial index on running handlers.
+            literals = ", ".join("'" + status + "'" for status in query.status_in)
+            clauses.append(f"status IN ({literals})")
+
         if query.is_idle is not None:
             if query.is_idle:
                 clauses.append("idle_since IS NOT NULL")
@@ -651,6 +1038,18 @@ class PostgresWorkflowStore(AbstractWorkflowStore):
 
         return clauses, params
 
+    @staticmethod
+    def _row_to_tick(row: asyncpg.Record) -> StoredTick:
+        tick_data = row["tick_data"]
+        return StoredTick(
+            run_id=row["run_id"],
+            sequence=row["sequence"],
+            timestamp=row["timestamp"],
+            tick_data=json.loads(tick_data)
+            if isinstance(tick_data, str)
+            else tick_data,
+        )
+
     @staticmethod
     def _row_to_handler(row: asyncpg.Record) -> PersistentHandler:
         return PersistentHandler(
@@ -0,0 +1,9 @@
+-- migration: 6
+
+-- Handler listings and the resume scan on startup filter by status and
+-- workflow name.
+CREATE INDEX IF NOT EXISTS idx_handlers_status_workflow_name
+    ON handlers (status, workflow_name);
+
+CREATE INDEX IF NOT EXISTS idx_handlers_workflow_name_started_at
+    ON handlers (workflow_name, started_at);
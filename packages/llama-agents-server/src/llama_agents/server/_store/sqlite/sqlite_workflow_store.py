@@ -134,15 +134,11 @@ class SqliteWorkflowStore(AbstractWorkflowStore):
             conn.close()
 
     async def query(self, query: HandlerQuery) -> list[PersistentHandler]:
-        filter_spec = self._build_filters(query)
-        if filter_spec is None:
+        statement = self._query_statement(query)
+        if statement is None:
             return []
 
-        clauses, params = filter_spec
-        sql = """SELECT handler_id, workflow_name, status, run_id, error, result,
-                        started_at, updated_at, completed_at, idle_since FROM handlers"""
-        if clauses:
-            sql = f"{sql} WHERE {' AND '.join(clauses)}"
+        sql, params = statement
         with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(sql, tuple(params))
@@ -249,6 +245,24 @@ class SqliteWorkflowStore(AbstractWorkflowStore):
             for row in rows
         ]
 
+    async def get_last_event(self, run_id: str) -> StoredEvent | None:
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT run_id, sequence, timestamp, event_json FROM events "
+                "WHERE run_id = ? ORDER BY sequence DESC LIMIT 1",
+                (run_id,),
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        return StoredEvent(
+            run_id=row[0],
+            sequence=row[1],
+            timestamp=datetime.fromisoformat(row[2]),
+            event=EventEnvelopeWithMetadata.model_validate_json(row[3]),
+        )
+
     async def subscribe_events(
         self, run_id: str, after_sequence: int = -1
     ) -> AsyncIterator[StoredEvent]:
@@ -268,7 +282,7 @@ class SqliteWorkflowStore(AbstractWorkflowStore):
             for event in batch:
                 yield event
                 cursor = event.sequence
-                if self._is_terminal_event(event):
+                if self.is_terminal_event(event):
                     return
 
     async def append_tick(self, run_id: str, tick_data: dict[str, Any]) -> None:
@@ -302,8 +316,10 @@ class SqliteWorkflowStore(AbstractWorkflowStore):
             for row in rows
         ]
 
-    async def stream_ticks(self, run_id: str) -> AsyncIterator[StoredTick]:
-        seq_cursor: int | None = None
+    async def stream_ticks(
+        self, run_id: str, after_sequence: int | None = None
+    ) -> AsyncIterator[StoredTick]:
+        seq_cursor = after_sequence
         while True:
             if seq_cursor is None:
                 sql = (
@@ -352,6 +368,19 @@ class SqliteWorkflowStore(AbstractWorkflowStore):
             except (json.JSONDecodeError, TypeError):
                 return None
 
+    def _query_statement(self, query: HandlerQuery) -> tuple[str, list[str]] | None:
+        """The SELECT for ``query`` and its parameters, or None if it matches nothing."""
+        filter_spec = self._build_filters(query)
+        if filter_spec is None:
+            return None
+
+        clauses, params = filter_spec
+        sql = """SELECT handler_id, workflow_name, status, run_id, error, result,
+                        started_at, updated_at, completed_at, idle_since FROM handlers"""
+        if clauses:
+            sql = f"{sql} WHERE {' AND '.join(clauses)}"
+        return sql, params
+
     def _build_filters(self, query: HandlerQuery) -> tuple[list[str], list[str]] | None:
         clauses: list[str] = []
         params: list[str] = []
@@ -6,7 +6,7 @@ from __future__ import annotations
 import asyncio
 from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Callable
 from warnings import catch_warnings, simplefilter
 
 from llama_agents.client.protocol import HandlerData
@@ -17,13 +17,14 @@ from workflows.plugins.basic import BasicRuntime
 from workflows.runtime.types.plugin import Runtime
 from workflows.utils import _nanoid as nanoid
 
+from ._run_scheduler import RunScheduler
 from ._runtime.idle_release_runtime import IdleReleaseDecorator
 from ._runtime.persistence_runtime import (
     PersistenceDecorator,
     TickPersistenceDecorator,
 )
 from ._runtime.server_runtime import ServerRuntimeDecorator
-from ._service import EventSendError, _WorkflowService
+from ._service import EventSendError, HandlerAlreadyRunningError, _WorkflowService
 from ._store.abstract_workflow_store import (
     AbstractWorkflowStore,
     HandlerQuery,
@@ -39,6 +40,7 @@ def _durable_runtime(
     store: AbstractWorkflowStore,
     resume_existing: bool,
     resume_fresh_handler_grace: timedelta | None,
+    resume_filter: Callable[[PersistentHandler], bool] | None,
     idle_timeout: float | None,
 ) -> tuple[Runtime, PersistenceDecorator | None]:
     persistence: PersistenceDecorator | None = None
@@ -49,6 +51,7 @@ def _durable_runtime(
             runtime,
             store=store,
             resume_fresh_handler_grace=resume_fresh_handler_grace,
+            resume_filter=resume_filter,
         )
         persisted: TickPersistenceDecorator = persistence
     else:
@@ -71,12 +74,14 @@ class _DurableWorkflowRuntime:
         runtime: Runtime | None = None,
         resume_existing: bool = True,
         resume_fresh_handler_grace: timedelta | None = None,
+        resume_filter: Callable[[PersistentHandler], bool] | None = None,
         wait_for_resume: bool = True,
         idle_timeout: float | None = 60.0,
         abort_active_on_stop: bool = True,
         start_store_before_runtime: bool = True,
         persistence_backoff: list[float] | None = None,
         wrap_runtime: bool = True,
+        run_scheduler: RunScheduler | None = None,
     ) -> None:
         store = workflow_store if workflow_store is not None else MemoryWorkflowStore()
         if wrap_runtime:
@@ -85,6 +90,7 @@ class _DurableWorkflowRuntime:
                 store=store,
                 resume_existing=resume_existing,
                 resume_fresh_handler_grace=resume_fresh_handler_grace,
+                resume_filter=resume_filter,
                 idle_timeout=idle_timeout if resume_existing else None,
             )
         else:
@@ -100,8 +106,11 @@ class _DurableWorkflowRuntime:
             durable,
             store=self._store,
             persistence_backoff=persistence_backoff,
+            run_scheduler=run_scheduler,
+        )
+        self._service = _WorkflowService(
+            runtime=self._runtime, store=self._store, run_scheduler=run_scheduler
         )
-        self._service = _WorkflowService(runtime=self._runtime, store=self._store)
         self._active_handlers: dict[str, WorkflowHandler] = {}
         self._started = False
 
@@ -176,13 +185,15 @@ class _DurableWorkflowRuntime:
         if start_event_kwargs:
             start_event = workflow._get_start_event_instance(None, **start_event_kwargs)
         durable_handler_id = handler_id if handler_id is not None else nanoid()
-        await self._raise_if_active_handler_exists(durable_handler_id)
-        data = await self._service.start_workflow(
-            workflow,
-            durable_handler_id,
-            start_event=start_event,
-            context=context,
-        )
+        try:
+            data = await self._service.start_workflow(
+                workflow,
+                durable_handler_id,
+                start_event=start_event,
+                context=context,
+            )
+        except HandlerAlreadyRunningError as exc:
+            raise RuntimeError(str(exc)) from exc
         if data.run_id is None:
             raise RuntimeError(f"Handler {durable_handler_id!r} has no run ID")
         self._track_handler(data.handler_id, self._build_workflow_handler(data))
@@ -236,14 +247,6 @@ class _DurableWorkflowRuntime:
             raise KeyError(f"Handler {handler_id!r} not found")
         return found[0]
 
-    async def _raise_if_active_handler_exists(self, handler_id: str) -> None:
-        found = await self._store.query(HandlerQuery(handler_id_in=[handler_id]))
-        if not found:
-            return
-        existing = found[0]
-        if not is_terminal_status(existing.status):
-            raise RuntimeError(f"Handler {handler_id!r} is already running")
-
     async def _wait_for_aborted_handlers(self) -> None:
         for _ in range(10):
             if all(handler.is_done() for handler in self._active_handlers.values()):
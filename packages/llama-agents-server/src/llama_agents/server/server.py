@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
@@ -15,8 +15,9 @@ from workflows.events import Event
 from workflows.runtime.types.plugin import Runtime
 
 from ._api import _WorkflowAPI
+from ._run_scheduler import RunScheduler
 from ._runtime.persistence_runtime import RESUME_FRESH_HANDLER_GRACE
-from ._store.abstract_workflow_store import AbstractWorkflowStore
+from ._store.abstract_workflow_store import AbstractWorkflowStore, PersistentHandler
 from ._store.memory_workflow_store import MemoryWorkflowStore
 from .runtime import _DurableWorkflowRuntime
 
@@ -64,6 +65,8 @@ class WorkflowServer:
         idle_timeout: float = 60.0,
         sse_heartbeat_interval: float | None = 25.0,
         accept_context_api: bool = False,
+        run_scheduler: RunScheduler | None = None,
+        resume_filter: Callable[[PersistentHandler], bool] | None = None,
     ):
         """Create a new workflow server.
 
@@ -97,16 +100,30 @@ class WorkflowServer:
                 bodies. Defaults to ``False``. Context deserialization can
                 instantiate arbitrary Pydantic objects via ``importlib``, so
                 only enable this on trusted networks.
+            run_scheduler: Admission control for new runs. When set, run
+                requests beyond its global or per-workflow limits wait in a
+                bounded fair queue and are rejected with ``429`` and a
+                ``Retry-After`` header when the queue is full. Defaults to
+                ``None`` (no limits). Runs resumed from the store, on startup
+                or after an idle release, start without queuing but count
+                against the limits while they run.
+            resume_filter: Called on startup with each running handler found
+                in ``workflow_store``; only handlers it returns ``True`` for
+                are resumed. Lets several servers share one store, each
+                resuming the handlers it owns. Defaults to ``None`` (resume
+                all). Ignored with a custom ``runtime``.
         """
         if runtime is None:
             self._runtime_core = _DurableWorkflowRuntime(
                 workflow_store=workflow_store,
                 resume_existing=True,
                 resume_fresh_handler_grace=RESUME_FRESH_HANDLER_GRACE,
+                resume_filter=resume_filter,
                 wait_for_resume=False,
                 idle_timeout=idle_timeout,
                 abort_active_on_stop=False,
                 persistence_backoff=list(persistence_backoff),
+                run_scheduler=run_scheduler,
             )
         else:
             self._runtime_core = _DurableWorkflowRuntime(
@@ -117,6 +134,7 @@ class WorkflowServer:
                 start_store_before_runtime=False,
                 persistence_backoff=list(persistence_backoff),
                 wrap_runtime=False,
+                run_scheduler=run_scheduler,
             )
         self._workflow_store = self._runtime_core._store
         self._runtime = self._runtime_core._runtime
@@ -219,6 +237,11 @@ class WorkflowServer:
 
         await server.serve()
 
+    @property
+    def run_scheduler(self) -> RunScheduler | None:
+        """The configured run scheduler, e.g. for exporting ``stats()``."""
+        return self._service.run_scheduler
+
     def openapi_schema(self) -> dict:
         return self._api.openapi_schema()
 
@@ -18,6 +18,7 @@ from llama_agents.server import (
     HandlerQuery,
     MemoryWorkflowStore,
     PersistentHandler,
+    RunScheduler,
     SqliteWorkflowStore,
     WorkflowServer,
 )
@@ -211,6 +212,41 @@ async def test_released_handler_reloaded_on_event(
         )
 
 
+@pytest.mark.asyncio
+async def test_reloaded_handler_counts_against_run_scheduler(
+    memory_store: MemoryWorkflowStore, waiting_workflow: WaitingWorkflow
+) -> None:
+    """An idle-released run frees its slot and claims a new one on reload."""
+    scheduler = RunScheduler(max_concurrent_runs=1)
+    server = WorkflowServer(
+        workflow_store=memory_store, idle_timeout=0.01, run_scheduler=scheduler
+    )
+    server.add_workflow("test", waiting_workflow)
+
+    async with server.contextmanager():
+        handler_data = await server._service.start_workflow(
+            waiting_workflow, "reload-slot-1"
+        )
+        run_id = handler_data.run_id
+        assert run_id is not None
+        await wait_handler_idle_and_released(
+            memory_store, "reload-slot-1", _get_idle_release(server), run_id
+        )
+
+        async def _released() -> None:
+            assert scheduler.stats().running == 0
+
+        await wait_for_passing(_released)
+        assert scheduler.stats().admitted_total == 1
+
+        await server._service.send_event(
+            "reload-slot-1", WaitableExternalEvent(response="hello")
+        )
+        await wait_handler_status(memory_store, "reload-slot-1", "completed")
+        assert scheduler.stats().admitted_total == 2
+        await wait_for_passing(_released)
+
+
 @pytest.mark.asyncio
 async def test_idle_since_cleared_on_reload(
     memory_store: MemoryWorkflowStore, waiting_workflow: WaitingWorkflow
@@ -395,6 +431,40 @@ async def test_on_server_start_finalizes_terminal_replay_as_failed(
         assert handler.error is not None
 
 
+@pytest.mark.asyncio
+async def test_on_server_start_resumes_only_handlers_accepted_by_filter(
+    memory_store: MemoryWorkflowStore, simple_test_workflow: Workflow
+) -> None:
+    """Servers sharing a store each resume just their own handlers."""
+    for handler_id in ("mine-1", "theirs-1"):
+        await memory_store.update(
+            PersistentHandler(
+                handler_id=handler_id,
+                workflow_name="test",
+                status="running",
+                run_id=f"run-{handler_id}",
+            )
+        )
+
+    server = WorkflowServer(
+        workflow_store=memory_store,
+        idle_timeout=0.01,
+        resume_filter=lambda handler: handler.handler_id.startswith("mine-"),
+    )
+    server.add_workflow("test", simple_test_workflow)
+
+    async with server.contextmanager():
+        # No ticks, so the resumed handler is classified as crashed.
+        await wait_handler_status(memory_store, "mine-1", "failed")
+        persistence = _get_persistence(server)
+        assert persistence.resume_task is not None
+        await persistence.resume_task
+
+        theirs = await memory_store.query(HandlerQuery(handler_id_in=["theirs-1"]))
+        assert theirs[0].status == "running"
+        assert "run-theirs-1" not in _get_idle_release(server)._active_run_ids
+
+
 @pytest.mark.asyncio
 async def test_on_server_start_ignores_unregistered_workflows(
     memory_store: MemoryWorkflowStore, simple_test_workflow: Workflow
@@ -424,7 +424,8 @@ async def test_get_handler_store_crash_returns_500(
 ) -> None:
     """Store.query() fails when fetching handler -> unhandled exception -> 500."""
     store, client = crashing_store_and_client
-    response = await client.post("/workflows/ok/run-nowait", json={"start_event": "{}"})
+    # Wait for completion: records of runs live in this process are cached.
+    response = await client.post("/workflows/ok/run", json={"start_event": "{}"})
     handler_id = response.json()["handler_id"]
 
     store.fail_query = True
@@ -442,7 +443,8 @@ async def test_cancel_handler_store_crash_returns_500(
 ) -> None:
     """Store.query() fails when cancelling handler -> unhandled exception -> 500."""
     store, client = crashing_store_and_client
-    response = await client.post("/workflows/ok/run-nowait", json={"start_event": "{}"})
+    # Wait for completion: records of runs live in this process are cached.
+    response = await client.post("/workflows/ok/run", json={"start_event": "{}"})
     handler_id = response.json()["handler_id"]
 
     store.fail_query = True
@@ -460,7 +462,8 @@ async def test_post_event_store_crash_returns_500(
 ) -> None:
     """Store.query() fails when resolving handler for event send -> 500."""
     store, client = crashing_store_and_client
-    response = await client.post("/workflows/ok/run-nowait", json={"start_event": "{}"})
+    # Wait for completion: records of runs live in this process are cached.
+    response = await client.post("/workflows/ok/run", json={"start_event": "{}"})
     handler_id = response.json()["handler_id"]
 
     store.fail_query = True
@@ -351,12 +351,12 @@ async def test_update_handler_status_terminal_sets_completed_at(
 
 def test_is_terminal_event_stop_event() -> None:
     stored = _make_stored_event(StopEvent(result="done"))
-    assert AbstractWorkflowStore._is_terminal_event(stored) is True
+    assert AbstractWorkflowStore.is_terminal_event(stored) is True
 
 
 def test_is_terminal_event_regular_event() -> None:
     stored = _make_stored_event(Event())
-    assert AbstractWorkflowStore._is_terminal_event(stored) is False
+    assert AbstractWorkflowStore.is_terminal_event(stored) is False
 
 
 def test_is_terminal_event_workflow_failed_event() -> None:
@@ -367,11 +367,16 @@ def test_is_terminal_event_workflow_failed_event() -> None:
         elapsed_seconds=0.1,
     )
     stored = _make_stored_event(event)
-    assert AbstractWorkflowStore._is_terminal_event(stored) is True
+    assert AbstractWorkflowStore.is_terminal_event(stored) is True
 
 
 def test_is_terminal_event_workflow_cancelled_event() -> None:
     stored = _make_stored_event(WorkflowCancelledEvent())
+    assert AbstractWorkflowStore.is_terminal_event(stored) is True
+
+
+def test_is_terminal_event_keeps_private_alias() -> None:
+    stored = _make_stored_event(StopEvent(result="done"))
     assert AbstractWorkflowStore._is_terminal_event(stored) is True
 
 
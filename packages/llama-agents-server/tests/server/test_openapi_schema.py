@@ -17,6 +17,8 @@ def test_openapi_schema_includes_all_routes(simple_test_workflow: Workflow) -> N
         "/workflows": {"get"},
         "/workflows/{name}/run": {"post"},
         "/workflows/{name}/run-nowait": {"post"},
+        "/workflows/{name}/run-nowait/batch": {"post"},
+        "/events": {"post"},
         "/results/{handler_id}": {"get"},
         "/handlers/{handler_id}": {"get"},
         "/events/{handler_id}": {"get"},
@@ -0,0 +1,409 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import pytest
+from llama_agents.client.protocol.serializable_events import EventEnvelopeWithMetadata
+from llama_agents.server._store.abstract_workflow_store import PersistentHandler
+from llama_agents.server._store.postgres.partitions import (
+    PartitionMaintainer,
+    PostgresPartitioning,
+    partition_bounds,
+    partition_name,
+)
+from llama_agents.server._store.postgres_workflow_store import PostgresWorkflowStore
+from workflows.events import StopEvent
+
+_DAY = timedelta(days=1)
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+# ── Unit tests (no DB) ──────────────────────────────────────────────
+
+
+def test_policy_validation() -> None:
+    with pytest.raises(ValueError, match="interval"):
+        PostgresPartitioning(interval=timedelta(seconds=1))
+    with pytest.raises(ValueError, match="retention"):
+        PostgresPartitioning(retention=timedelta(0))
+    with pytest.raises(ValueError, match="premake"):
+        PostgresPartitioning(premake=0)
+    with pytest.raises(ValueError, match="maintenance_interval"):
+        PostgresPartitioning(
+            interval=timedelta(minutes=10),
+            premake=1,
+            maintenance_interval=timedelta(minutes=10),
+        )
+
+
+def test_partition_bounds_align_to_interval() -> None:
+    start = _utc(2026, 3, 1, 15, 30)
+    bounds = partition_bounds(start, _utc(2026, 3, 3, 1), _DAY)
+    assert bounds == [
+        (start, _utc(2026, 3, 2)),
+        (_utc(2026, 3, 2), _utc(2026, 3, 3)),
+        (_utc(2026, 3, 3), _utc(2026, 3, 4)),
+    ]
+    assert partition_bounds(_utc(2026, 3, 4), _utc(2026, 3, 4), _DAY) == []
+    assert partition_name("wf_events", _utc(2026, 3, 2)) == "wf_events_p20260302000000"
+
+
+class _FakeConn:
+    """Records executed SQL and answers the maintainer's catalog queries."""
+
+    def __init__(
+        self,
+        relkind: str = "p",
+        last_end: datetime | None = None,
+        expired: list[str] | None = None,
+        retained: set[str] | None = None,
+        detach_pending: dict[str, bool | None] | None = None,
+        locked: bool = False,
+        writable_until: datetime | None = None,
+    ) -> None:
+        self.relkind = relkind
+        self.last_end = last_end
+        self.expired = expired or []
+        self.retained = retained or set()
+        self.detach_pending = detach_pending or {}
+        self.locked = locked
+        # Inserts into wf_events at or past this fail as Postgres would
+        # with no partition for the row.
+        self.writable_until = writable_until
+        self.executed: list[str] = []
+
+    async def fetchval(self, sql: str, *args: Any) -> Any:
+        if "pg_try_advisory_lock" in sql:
+            return not self.locked
+        if "relkind" in sql:
+            return self.relkind
+        if "MAX(range_end)" in sql:
+            return self.last_end
+        if "pg_get_serial_sequence" in sql:
+            return "wf_events_id_seq"
+        if "GREATEST" in sql:
+            return _utc(2026, 3, 1, 15, 30)
+        if "inhdetachpending" in sql:
+            return self.detach_pending.get(args[0], False)
+        if "SELECT EXISTS" in sql:
+            return any(f"FROM {name} p" in sql for name in self.retained)
+        raise AssertionError(sql)
+
+    async def fetch(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        return [{"partition_name": name} for name in self.expired]
+
+    async def execute(self, sql: str, *args: Any) -> str:
+        sql = " ".join(sql.split())
+        self.executed.append(sql)
+        if (
+            "INSERT INTO wf_events (" in sql
+            and self.writable_until is not None
+            and args[1] >= self.writable_until
+        ):
+            raise asyncpg.CheckViolationError(
+                'no partition of relation "wf_events" found for row'
+            )
+        if sql.startswith("INSERT INTO wf_partitions"):
+            self.last_end = args[3]
+            if self.writable_until is not None:
+                self.writable_until = self.last_end
+        return "OK"
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[None]:
+        yield
+
+    def transaction(self) -> Any:
+        return self._transaction()
+
+
+def _maintainer(policy: PostgresPartitioning) -> PartitionMaintainer:
+    return PartitionMaintainer(
+        policy,
+        schema=None,
+        handlers_table="wf_handlers",
+        tables={"wf_events": "wf_event_sequences"},
+    )
+
+
+async def test_maintainer_converts_heap_table_in_place() -> None:
+    conn = _FakeConn(relkind="r")
+    policy = PostgresPartitioning(premake=1)
+
+    ran = await _maintainer(policy).run(
+        cast(asyncpg.Connection, conn), _utc(2026, 3, 1, 16)
+    )
+
+    assert ran
+    executed = conn.executed
+    assert "ALTER TABLE wf_events RENAME TO wf_events_legacy" in executed
+    assert (
+        "ALTER TABLE wf_events ATTACH PARTITION wf_events_legacy "
+        "FOR VALUES FROM (MINVALUE) TO ('2026-03-01T15:30:00+00:00')"
+    ) in executed
+    assert "ALTER SEQUENCE wf_events_id_seq OWNED BY wf_events.id" in executed
+    # Counters are resynced before the unique constraint is left behind.
+    resync = next(
+        i for i, sql in enumerate(executed) if "INTO wf_event_sequences" in sql
+    )
+    assert resync < executed.index("ALTER TABLE wf_events RENAME TO wf_events_legacy")
+    # No default partition, which would rule out detaching concurrently.
+    assert not any("DEFAULT" in sql and "PARTITION OF" in sql for sql in executed)
+    # A sliver up to the next boundary, then one premade partition.
+    attached = [sql for sql in executed if "ATTACH PARTITION wf_events_p" in sql]
+    assert attached == [
+        "ALTER TABLE wf_events ATTACH PARTITION wf_events_p20260301153000 "
+        "FOR VALUES FROM ('2026-03-01T15:30:00+00:00') TO ('2026-03-02T00:00:00+00:00')",
+        "ALTER TABLE wf_events ATTACH PARTITION wf_events_p20260302000000 "
+        "FOR VALUES FROM ('2026-03-02T00:00:00+00:00') TO ('2026-03-03T00:00:00+00:00')",
+    ]
+    assert executed[-1] == "SELECT pg_advisory_unlock($1)"
+
+
+async def test_maintainer_drops_only_partitions_without_live_runs() -> None:
+    conn = _FakeConn(
+        last_end=_utc(2026, 3, 20),
+        expired=["wf_events_legacy", "wf_events_p20260301000000"],
+        retained={"wf_events_legacy"},
+    )
+    policy = PostgresPartitioning(retention=timedelta(days=7))
+
+    await _maintainer(policy).run(cast(asyncpg.Connection, conn), _utc(2026, 3, 18))
+
+    removed = [
+        sql
+        for sql in conn.executed
+        if sql.startswith("DROP TABLE") or "DETACH PARTITION" in sql
+    ]
+    assert removed == [
+        "ALTER TABLE wf_events DETACH PARTITION wf_events_p20260301000000 CONCURRENTLY",
+        "DROP TABLE wf_events_p20260301000000",
+    ]
+    assert not any("RENAME" in sql for sql in conn.executed)
+    assert any(
+        sql.startswith("DELETE FROM wf_event_sequences") for sql in conn.executed
+    )
+
+
+async def test_maintainer_resumes_an_interrupted_detach() -> None:
+    conn = _FakeConn(
+        last_end=_utc(2026, 3, 20),
+        expired=["wf_events_p20260301000000", "wf_events_p20260302000000"],
+        detach_pending={
+            "wf_events_p20260301000000": True,
+            "wf_events_p20260302000000": None,
+        },
+    )
+    policy = PostgresPartitioning(retention=timedelta(days=7))
+
+    await _maintainer(policy).run(cast(asyncpg.Connection, conn), _utc(2026, 3, 18))
+
+    removed = [
+        sql
+        for sql in conn.executed
+        if sql.startswith("DROP TABLE") or "DETACH PARTITION" in sql
+    ]
+    # A pending detach is finalized; an already detached one is just dropped.
+    assert removed == [
+        "ALTER TABLE wf_events DETACH PARTITION wf_events_p20260301000000 FINALIZE",
+        "DROP TABLE wf_events_p20260301000000",
+        "DROP TABLE wf_events_p20260302000000",
+    ]
+
+
+async def test_maintainer_skips_when_another_replica_holds_the_lock() -> None:
+    conn = _FakeConn(relkind="r", locked=True)
+
+    ran = await _maintainer(PostgresPartitioning()).run(
+        cast(asyncpg.Connection, conn), _utc(2026, 3, 1)
+    )
+
+    assert not ran
+    assert conn.executed == []
+
+
+async def test_append_tick_takes_sequence_from_counter() -> None:
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    store._pool = pool
+
+    await store.append_tick("run-1", {"type": "TickSendEvent"})
+
+    conn.execute.assert_awaited_once()
+    sql = conn.execute.await_args.args[0]
+    assert "wf_tick_sequences" in sql
+    assert "MAX(sequence)" not in sql
+
+
+async def test_append_event_creates_partitions_when_maintenance_stalled() -> None:
+    # The premade range ran out two days ago.
+    stalled_until = datetime.now(timezone.utc) - 2 * _DAY
+    conn = _FakeConn(last_end=stalled_until, writable_until=stalled_until)
+    policy = PostgresPartitioning(premake=1)
+    store = PostgresWorkflowStore(
+        dsn="postgresql://localhost/test", partitioning=policy
+    )
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    store._pool = pool
+
+    await store.append_event("run-1", EventEnvelopeWithMetadata.from_event(StopEvent()))
+
+    inserts = [sql for sql in conn.executed if "INSERT INTO wf_events (" in sql]
+    assert len(inserts) == 2
+    attached = [sql for sql in conn.executed if "ATTACH PARTITION" in sql]
+    assert len(attached) >= 3
+    # Created under the maintenance lock, waiting for it rather than skipping.
+    assert "SELECT pg_advisory_lock($1)" in conn.executed
+    assert conn.last_end is not None
+    assert conn.last_end > datetime.now(timezone.utc)
+
+
+async def test_append_event_without_partitioning_reraises_check_violation() -> None:
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
+    conn = _FakeConn(writable_until=_utc(2000, 1, 1))
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    store._pool = pool
+
+    with pytest.raises(asyncpg.CheckViolationError):
+        await store.append_event(
+            "run-1", EventEnvelopeWithMetadata.from_event(StopEvent())
+        )
+
+
+# ── Integration tests (require Docker) ──────────────────────────────
+
+
+@pytest.mark.docker
+async def test_integration_partitioning_converts_and_expires(postgres_dsn: str) -> None:
+    schema = "test_pg_partitions"
+    conn = await asyncpg.connect(postgres_dsn)
+    await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+
+    # Rows written before partitioning was enabled.
+    plain = PostgresWorkflowStore(dsn=postgres_dsn, schema=schema)
+    try:
+        await plain.start()
+        await plain.append_event(
+            "old-run", EventEnvelopeWithMetadata.from_event(StopEvent())
+        )
+        await plain.append_tick("old-run", {"type": "TickSendEvent"})
+    finally:
+        await plain.close()
+
+    policy = PostgresPartitioning(retention=timedelta(days=1))
+    store = PostgresWorkflowStore(dsn=postgres_dsn, schema=schema, partitioning=policy)
+    try:
+        await store.start()
+        relkinds = await conn.fetch(
+            f"SELECT relname, relkind FROM pg_class c "
+            f"JOIN pg_namespace n ON n.oid = c.relnamespace "
+            f"WHERE n.nspname = '{schema}' AND relname IN ('wf_events', 'wf_ticks')"
+        )
+        assert {row["relkind"] for row in relkinds} == {"p"}
+
+        # Old rows are still readable and sequences continue.
+        await store.append_event(
+            "old-run", EventEnvelopeWithMetadata.from_event(StopEvent())
+        )
+        events = await store.query_events("old-run")
+        assert [event.sequence for event in events] == [0, 1]
+        await store.append_tick("new-run", {"type": "TickSendEvent"})
+        assert len(await store.get_ticks("new-run")) == 1
+
+        # Without a unique (run_id, sequence) constraint, the counter alone
+        # keeps concurrent appends to one run from sharing a sequence.
+        await asyncio.gather(
+            *(
+                store.append_event(
+                    "busy-run", EventEnvelopeWithMetadata.from_event(StopEvent())
+                )
+                for _ in range(20)
+            )
+        )
+        busy = await store.query_events("busy-run")
+        assert [event.sequence for event in busy] == list(range(20))
+
+        # A live run keeps its partition; once it completed long enough ago,
+        # the legacy partition is dropped.
+        long_ago = datetime.now(timezone.utc) - timedelta(days=3)
+        handler = PersistentHandler(
+            handler_id="h-old",
+            workflow_name="wf",
+            status="running",
+            run_id="old-run",
+            started_at=long_ago,
+            updated_at=long_ago,
+        )
+        await store.update(handler)
+        await conn.execute(
+            f"UPDATE {schema}.wf_partitions SET range_end = $1 "
+            "WHERE partition_name = 'wf_events_legacy'",
+            long_ago,
+        )
+        await store.maintain_partitions()
+        assert len(await store.query_events("old-run")) == 2
+
+        handler.status = "completed"
+        handler.completed_at = long_ago
+        await store.update(handler)
+        await store.maintain_partitions()
+        # Only the event appended after conversion remains.
+        assert [event.sequence for event in await store.query_events("old-run")] == [1]
+    finally:
+        await store.close()
+        await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await conn.close()
+
+
+@pytest.mark.docker
+async def test_integration_append_after_stalled_maintenance(postgres_dsn: str) -> None:
+    schema = "test_pg_partitions_stalled"
+    conn = await asyncpg.connect(postgres_dsn)
+    await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+
+    store = PostgresWorkflowStore(
+        dsn=postgres_dsn, schema=schema, partitioning=PostgresPartitioning()
+    )
+    try:
+        await store.start()
+        # As if maintenance stopped long ago: only the legacy partition,
+        # which ends at conversion time, is left.
+        rows = await conn.fetch(
+            f"SELECT partition_name FROM {schema}.wf_partitions "
+            "WHERE range_start IS NOT NULL"
+        )
+        for row in rows:
+            await conn.execute(f"DROP TABLE {schema}.{row['partition_name']}")
+        await conn.execute(
+            f"DELETE FROM {schema}.wf_partitions WHERE range_start IS NOT NULL"
+        )
+
+        await store.append_event(
+            "run-1", EventEnvelopeWithMetadata.from_event(StopEvent())
+        )
+        await store.append_tick("run-1", {"type": "TickSendEvent"})
+
+        assert [event.sequence for event in await store.query_events("run-1")] == [0]
+        assert len(await store.get_ticks("run-1")) == 1
+    finally:
+        await store.close()
+        await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await conn.close()
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import time
 from datetime import datetime, timezone
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock
@@ -15,6 +17,7 @@ from llama_agents.server._store.abstract_workflow_store import (
     HandlerQuery,
     PersistentHandler,
     Status,
+    StoredEvent,
 )
 from llama_agents.server._store.postgres_workflow_store import PostgresWorkflowStore
 from server_test_fixtures import wait_for_passing  # type: ignore[import]
@@ -96,6 +99,23 @@ async def test_build_filters_produces_correct_clauses() -> None:
     assert "idle_since IS NULL" in clauses[0]
 
 
+async def test_build_filters_inlines_status_for_partial_index() -> None:
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
+
+    result = store._build_filters(
+        HandlerQuery(workflow_name_in=["wf"], status_in=["running"])
+    )
+    assert result is not None
+    clauses, params = result
+    assert clauses == ["workflow_name IN ($1)", "status IN ('running')"]
+    assert params == ["wf"]
+
+    with pytest.raises(ValueError, match="Unknown handler status"):
+        store._build_filters(
+            HandlerQuery(status_in=cast(list[Status], ["running'; --"]))
+        )
+
+
 async def test_on_notify_wakes_condition() -> None:
     store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
     condition = store._get_or_create_condition("run-1")
@@ -122,6 +142,265 @@ async def test_on_notify_wakes_condition() -> None:
     assert woken
 
 
+def _notify_payload(
+    run_id: str, sequence: int, event: EventEnvelopeWithMetadata | None
+) -> str:
+    return json.dumps(
+        {
+            "run_id": run_id,
+            "sequence": sequence,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event": event.model_dump(mode="json") if event is not None else None,
+        }
+    )
+
+
+def _stored(
+    run_id: str, sequence: int, event: EventEnvelopeWithMetadata
+) -> StoredEvent:
+    return StoredEvent(
+        run_id=run_id,
+        sequence=sequence,
+        timestamp=datetime.now(timezone.utc),
+        event=event,
+    )
+
+
+async def test_append_event_inlines_small_events_in_one_statement() -> None:
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    store._pool = pool
+
+    await store.append_event("run-1", _make_event())
+
+    conn.execute.assert_awaited_once()
+    sql, *args = conn.execute.await_args.args
+    assert "wf_event_sequences" in sql
+    assert "pg_notify" in sql
+    assert "MAX(sequence)" not in sql
+    assert args[0] == "run-1"
+    assert args[-1] is True
+
+    class BigEvent(Event):
+        blob: str
+
+    conn.execute.reset_mock()
+    big = EventEnvelopeWithMetadata.from_event(BigEvent(blob="x" * 10_000))
+    await store.append_event("run-1", big)
+    assert conn.execute.await_args.args[-1] is False
+
+
+async def test_start_handler_upserts_and_returns_previous_in_one_statement() -> None:
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
+    conn = MagicMock()
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    store._pool = pool
+    empty = dict.fromkeys(
+        [
+            "handler_id",
+            "workflow_name",
+            "status",
+            "run_id",
+            "error",
+            "result",
+            "started_at",
+            "updated_at",
+            "completed_at",
+            "idle_since",
+        ]
+    )
+
+    conn.fetchrow = AsyncMock(return_value={**empty, "written": True})
+    assert await store.start_handler(_make_handler(run_id="run-2")) is None
+    conn.fetchrow.assert_awaited_once()
+    sql = conn.fetchrow.await_args.args[0]
+    assert "FOR UPDATE" in sql
+    assert "ON CONFLICT (handler_id) DO UPDATE" in sql
+
+    running = {
+        **empty,
+        "handler_id": "h1",
+        "workflow_name": "test_workflow",
+        "status": "running",
+        "run_id": "run-1",
+        "written": False,
+    }
+    conn.fetchrow = AsyncMock(return_value=running)
+    previous = await store.start_handler(_make_handler(run_id="run-2"))
+    assert previous is not None
+    assert previous.status == "running"
+    assert previous.run_id == "run-1"
+
+
+async def test_subscribe_events_follows_notify_payloads_without_requerying() -> None:
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test", poll_interval=5)
+    queries: list[int | None] = []
+
+    async def query_events(
+        run_id: str, after_sequence: int | None = None, limit: int | None = None
+    ) -> list[StoredEvent]:
+        queries.append(after_sequence)
+        return [_stored(run_id, 0, _make_event())] if after_sequence == -1 else []
+
+    store.query_events = query_events  # type: ignore[method-assign]
+
+    async def collect() -> list[StoredEvent]:
+        return [ev async for ev in store.subscribe_events("run-1")]
+
+    task = asyncio.create_task(collect())
+    while not queries:
+        await asyncio.sleep(0)
+
+    # A stale notice for the event the catch-up query already returned is skipped.
+    for sequence, event in [
+        (0, _make_event()),
+        (1, _make_event()),
+        (2, _make_stop_event()),
+    ]:
+        store._on_notify(
+            MagicMock(), 0, "wf_events", _notify_payload("run-1", sequence, event)
+        )
+
+    collected = await asyncio.wait_for(task, timeout=1.0)
+    assert [ev.sequence for ev in collected] == [0, 1, 2]
+    assert queries == [-1]
+    assert store._inboxes == {}
+
+
+async def test_subscribe_events_requeries_for_large_events_and_gaps() -> None:
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test", poll_interval=5)
+    stored = [
+        _stored("run-1", 0, _make_event()),
+        _stored("run-1", 1, _make_event()),
+        _stored("run-1", 2, _make_event()),
+        _stored("run-1", 3, _make_stop_event()),
+    ]
+    queries: list[int | None] = []
+    visible = 0
+
+    async def query_events(
+        run_id: str, after_sequence: int | None = None, limit: int | None = None
+    ) -> list[StoredEvent]:
+        queries.append(after_sequence)
+        start = -1 if after_sequence is None else after_sequence
+        return [ev for ev in stored[:visible] if ev.sequence > start]
+
+    store.query_events = query_events  # type: ignore[method-assign]
+
+    async def collect() -> list[StoredEvent]:
+        return [ev async for ev in store.subscribe_events("run-1")]
+
+    task = asyncio.create_task(collect())
+    while not queries:
+        await asyncio.sleep(0)
+
+    # Sequence 0 was too large to inline: the subscriber reads it back.
+    visible = 1
+    store._on_notify(MagicMock(), 0, "wf_events", _notify_payload("run-1", 0, None))
+    while len(queries) < 2:
+        await asyncio.sleep(0)
+
+    # Sequence 1's notice was missed: 2 reveals the gap.
+    visible = 4
+    store._on_notify(
+        MagicMock(), 0, "wf_events", _notify_payload("run-1", 2, stored[2].event)
+    )
+
+    collected = await asyncio.wait_for(task, timeout=1.0)
+    assert [ev.sequence for ev in collected] == [0, 1, 2, 3]
+    assert queries == [-1, -1, 0]
+
+
+class _FakeCursor:
+    def __init__(self, rows: list[dict[str, Any]], log: list[str]) -> None:
+        self._rows = rows
+        self._log = log
+
+    async def fetch(self, n: int) -> list[dict[str, Any]]:
+        self._log.append(f"fetch {n}")
+        await asyncio.sleep(0)
+        batch, self._rows = self._rows[:n], self._rows[n:]
+        return batch
+
+
+async def test_stream_ticks_prefetches_through_one_cursor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(postgres_workflow_store, "_TICK_STREAM_BATCH_SIZE", 2)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "run_id": "run-1",
+            "sequence": i,
+            "timestamp": now,
+            "tick_data": f'{{"i": {i}}}',
+        }
+        for i in range(5)
+    ]
+    log: list[str] = []
+    conn = MagicMock()
+    conn.cursor = AsyncMock(return_value=_FakeCursor(rows, log))
+    conn.transaction.return_value.__aenter__ = AsyncMock(return_value=None)
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=None)
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
+    store._pool = pool
+
+    ticks = []
+    async for tick in store.stream_ticks("run-1"):
+        ticks.append(tick)
+        if tick.sequence == 0:
+            # The next batch is fetched while the consumer works on this one.
+            await asyncio.sleep(0)
+            assert log == ["fetch 2", "fetch 2"]
+
+    assert [tick.tick_data for tick in ticks] == [{"i": i} for i in range(5)]
+    assert log == ["fetch 2", "fetch 2", "fetch 2"]
+    pool.acquire.assert_called_once()
+    conn.transaction.assert_called_once_with(readonly=True)
+
+
+async def test_stream_ticks_waits_for_prefetch_when_closed_early(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(postgres_workflow_store, "_TICK_STREAM_BATCH_SIZE", 1)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"run_id": "run-1", "sequence": i, "timestamp": now, "tick_data": {"i": i}}
+        for i in range(3)
+    ]
+    log: list[str] = []
+    conn = MagicMock()
+    conn.cursor = AsyncMock(return_value=_FakeCursor(rows, log))
+    exited = MagicMock()
+
+    async def transaction_exit(*args: Any) -> None:
+        exited(pending=log.count("fetch 1"))
+
+    conn.transaction.return_value.__aenter__ = AsyncMock(return_value=None)
+    conn.transaction.return_value.__aexit__ = transaction_exit
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
+    store._pool = pool
+
+    stream = store.stream_ticks("run-1")
+    assert (await stream.__anext__()).sequence == 0
+    await stream.aclose()
+
+    # The prefetch started before the consumer stopped finished first.
+    exited.assert_called_once_with(pending=2)
+
+
 async def test_close_without_start_is_safe() -> None:
     store = PostgresWorkflowStore(dsn="postgresql://localhost/test")
     await store.close()  # Should not raise
@@ -392,6 +671,72 @@ async def test_integration_handler_crud(postgres_dsn: str) -> None:
         await store.close()
 
 
+@pytest.mark.docker
+async def test_integration_start_handler_refuses_running(postgres_dsn: str) -> None:
+    store = PostgresWorkflowStore(dsn=postgres_dsn, schema="test_pg_store")
+    try:
+        await store.start()
+        await store.delete(HandlerQuery(handler_id_in=["pg-start"]))
+
+        first = _make_handler(handler_id="pg-start", run_id="pg-start-1")
+        assert await store.start_handler(first) is None
+
+        second = _make_handler(handler_id="pg-start", run_id="pg-start-2")
+        previous = await store.start_handler(second)
+        assert previous is not None and previous.run_id == "pg-start-1"
+        found = await store.query(HandlerQuery(handler_id_in=["pg-start"]))
+        assert found[0].run_id == "pg-start-1"
+
+        await store.update_handler_status("pg-start-1", status="completed")
+        previous = await store.start_handler(second)
+        assert previous is not None and previous.status == "completed"
+        found = await store.query(HandlerQuery(handler_id_in=["pg-start"]))
+        assert found[0].run_id == "pg-start-2"
+        assert found[0].status == "running"
+    finally:
+        await store.close()
+
+
+@pytest.mark.docker
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        (HandlerQuery(handler_id_in=["h1"]), "wf_handlers_pkey"),
+        (HandlerQuery(run_id_in=["r1"]), "idx_wf_handlers_run_id"),
+        (HandlerQuery(status_in=["running"]), "idx_wf_handlers_running"),
+        (
+            HandlerQuery(
+                status_in=["running"], workflow_name_in=["wf_a", "wf_b"], is_idle=False
+            ),
+            "idx_wf_handlers_running",
+        ),
+        (
+            HandlerQuery(workflow_name_in=["wf_a"]),
+            "idx_wf_handlers_workflow_name_started_at",
+        ),
+    ],
+)
+async def test_integration_handler_queries_use_an_index(
+    postgres_dsn: str, query: HandlerQuery, index: str
+) -> None:
+    store = PostgresWorkflowStore(dsn=postgres_dsn, schema="test_pg_store")
+    try:
+        await store.start()
+        statement = store._query_statement(query)
+        assert statement is not None
+        sql, params = statement
+        pool = await store._ensure_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                # Test tables are tiny; make the planner show its index choice.
+                await conn.execute("SET LOCAL enable_seqscan = off")
+                plan = await conn.fetch(f"EXPLAIN {sql}", *params)
+        text = "\n".join(row[0] for row in plan)
+        assert index in text, text
+    finally:
+        await store.close()
+
+
 @pytest.mark.docker
 async def test_integration_event_append_and_query(postgres_dsn: str) -> None:
     store = PostgresWorkflowStore(dsn=postgres_dsn, schema="test_pg_store")
@@ -412,6 +757,10 @@ async def test_integration_event_append_and_query(postgres_dsn: str) -> None:
         events = await store.query_events("pg-run-ev", after_sequence=0, limit=1)
         assert len(events) == 1
         assert events[0].sequence == 1
+
+        last = await store.get_last_event("pg-run-ev")
+        assert last is not None and last.sequence == 2
+        assert await store.get_last_event("pg-run-missing") is None
     finally:
         await store.close()
 
@@ -477,6 +826,37 @@ async def test_integration_tick_append_and_get(postgres_dsn: str) -> None:
         await store.close()
 
 
+@pytest.mark.docker
+@pytest.mark.parametrize("tick_count", [10_000, 100_000])
+async def test_integration_stream_ticks_rehydrates_long_runs(
+    postgres_dsn: str, tick_count: int
+) -> None:
+    store = PostgresWorkflowStore(dsn=postgres_dsn, schema="test_pg_store")
+    run_id = f"pg-run-long-{tick_count}"
+    try:
+        await store.start()
+        pool = await store._ensure_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(
+                f"""
+                INSERT INTO {store._ticks_ref} (run_id, sequence, timestamp, tick_data)
+                SELECT $1, n, now(), jsonb_build_object('type', 'TickSendEvent', 'n', n)
+                FROM generate_series(0, $2 - 1) AS n
+                """,
+                run_id,
+                tick_count,
+            )
+
+        started = time.perf_counter()
+        sequences = [tick.sequence async for tick in store.stream_ticks(run_id)]
+        elapsed = time.perf_counter() - started
+
+        assert sequences == list(range(tick_count))
+        print(f"stream_ticks: {tick_count} ticks in {elapsed:.2f}s")
+    finally:
+        await store.close()
+
+
 @pytest.mark.docker
 async def test_integration_create_state_store_memoizes_per_run(
     postgres_dsn: str,
@@ -502,3 +882,44 @@ async def test_integration_create_state_store_memoizes_per_run(
         assert await first.get("count") == 10
     finally:
         await store.close()
+
+
+@pytest.mark.docker
+async def test_integration_concurrent_appends_get_contiguous_sequences(
+    postgres_dsn: str,
+) -> None:
+    store = PostgresWorkflowStore(
+        dsn=postgres_dsn, schema="test_pg_store", poll_interval=5.0
+    )
+    try:
+        await store.start()
+        await store.run_migrations()
+        run_id = "pg-run-concurrent"
+
+        class BigEvent(Event):
+            blob: str
+
+        async def subscribe() -> list[StoredEvent]:
+            return [ev async for ev in store.subscribe_events(run_id)]
+
+        subscribers = [asyncio.create_task(subscribe()) for _ in range(3)]
+
+        async def subscribed() -> None:
+            assert len(store._inboxes.get(run_id, ())) == 3
+
+        await wait_for_passing(subscribed, max_duration=2.0, interval=0.01)
+
+        await asyncio.gather(
+            *(store.append_event(run_id, _make_event()) for _ in range(20))
+        )
+        await store.append_event(
+            run_id, EventEnvelopeWithMetadata.from_event(BigEvent(blob="x" * 10_000))
+        )
+        await store.append_event(run_id, _make_stop_event())
+
+        events = await store.query_events(run_id)
+        assert [ev.sequence for ev in events] == list(range(22))
+        for collected in await asyncio.wait_for(asyncio.gather(*subscribers), 5.0):
+            assert [ev.sequence for ev in collected] == list(range(22))
+    finally:
+        await store.close()
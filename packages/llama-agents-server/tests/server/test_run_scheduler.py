@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Tests for RunScheduler admission control and fair queuing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from llama_agents.server import (
+    MemoryWorkflowStore,
+    RunQueueFullError,
+    RunScheduler,
+    WorkflowServer,
+)
+from server_test_fixtures import wait_for_passing  # type: ignore[import]
+from workflows.workflow import Workflow
+
+
+async def test_global_limit_queues_and_admits_on_release() -> None:
+    scheduler = RunScheduler(max_concurrent_runs=1)
+    first = await scheduler.acquire("wf")
+    waiting = asyncio.create_task(scheduler.acquire("wf"))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    assert scheduler.stats().queued == 1
+
+    scheduler.release(first)
+    second = await waiting
+    assert second.workflow_name == "wf"
+    stats = scheduler.stats()
+    assert stats.running == 1
+    assert stats.queued == 0
+    assert stats.admitted_total == 2
+
+
+async def test_per_workflow_limit_does_not_block_other_workflows() -> None:
+    scheduler = RunScheduler(max_concurrent_runs=3, max_concurrent_runs_per_workflow=1)
+    await scheduler.acquire("a")
+    blocked = asyncio.create_task(scheduler.acquire("a"))
+    await asyncio.sleep(0)
+    other = await asyncio.wait_for(scheduler.acquire("b"), 1)
+    assert other.workflow_name == "b"
+    assert not blocked.done()
+    blocked.cancel()
+
+
+async def test_workflow_limits_override_default() -> None:
+    scheduler = RunScheduler(
+        max_concurrent_runs_per_workflow=1, workflow_limits={"wide": 2}
+    )
+    await scheduler.acquire("wide")
+    await asyncio.wait_for(scheduler.acquire("wide"), 1)
+    assert scheduler.stats().running_by_workflow == {"wide": 2}
+
+
+async def test_full_queue_rejects_with_retry_after() -> None:
+    scheduler = RunScheduler(max_concurrent_runs=1, max_queued_runs=1)
+    await scheduler.acquire("wf")
+    queued = asyncio.create_task(scheduler.acquire("wf"))
+    await asyncio.sleep(0)
+    with pytest.raises(RunQueueFullError) as exc_info:
+        await scheduler.acquire("wf")
+    assert exc_info.value.retry_after >= 1
+    assert scheduler.stats().rejected_total == 1
+    queued.cancel()
+
+
+async def test_queue_wait_timeout_rejects_and_frees_queue_position() -> None:
+    scheduler = RunScheduler(max_concurrent_runs=1, max_queue_wait=0.01)
+    slot = await scheduler.acquire("wf")
+    with pytest.raises(RunQueueFullError, match="Timed out"):
+        await scheduler.acquire("wf")
+    assert scheduler.stats().queued == 0
+    scheduler.release(slot)
+    assert scheduler.stats().running == 0
+
+
+async def test_claimed_slots_ignore_limits_but_count_against_them() -> None:
+    scheduler = RunScheduler(max_concurrent_runs=1)
+    resumed = [scheduler.claim("wf"), scheduler.claim("wf")]
+    assert scheduler.stats().running == 2
+
+    waiting = asyncio.create_task(scheduler.acquire("wf"))
+    await asyncio.sleep(0)
+    scheduler.release(resumed[0])
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    scheduler.release(resumed[1])
+    await asyncio.wait_for(waiting, 1)
+    assert scheduler.stats().running == 1
+
+
+async def test_cancelled_waiter_is_skipped() -> None:
+    scheduler = RunScheduler(max_concurrent_runs=1)
+    slot = await scheduler.acquire("wf")
+    cancelled = asyncio.create_task(scheduler.acquire("wf"))
+    kept = asyncio.create_task(scheduler.acquire("wf"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    scheduler.release(slot)
+    await asyncio.wait_for(kept, 1)
+    assert scheduler.stats().running == 1
+    assert scheduler.stats().queued == 0
+
+
+async def test_abandoned_waiters_are_compacted_out_of_the_heap() -> None:
+    scheduler = RunScheduler(max_concurrent_runs=1, max_queue_wait=None)
+    slot = await scheduler.acquire("wf")
+    kept = asyncio.create_task(scheduler.acquire("wf", "kept"))
+    for _ in range(20):
+        abandoned = asyncio.create_task(scheduler.acquire("wf"))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await abandoned
+    assert scheduler.stats().queued == 1
+    assert len(scheduler._heap) <= 2
+    scheduler.release(slot)
+    admitted = await asyncio.wait_for(kept, 1)
+    assert admitted.fairness_key == "kept"
+
+
+async def test_weighted_fair_queuing_across_keys() -> None:
+    """A burst on one key does not starve another, and weights are honored."""
+    scheduler = RunScheduler(
+        max_concurrent_runs=1,
+        max_queued_runs=100,
+        weights={"heavy": 2.0},
+    )
+    holder = await scheduler.acquire("wf")
+    order: list[str] = []
+
+    async def run(key: str) -> None:
+        slot = await scheduler.acquire("wf", fairness_key=key)
+        order.append(key)
+        await asyncio.sleep(0)
+        scheduler.release(slot)
+
+    # "burst" enqueues first, but should not monopolize admissions.
+    tasks = [asyncio.create_task(run("burst")) for _ in range(6)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(run("heavy")) for _ in range(6)]
+    await asyncio.sleep(0)
+    scheduler.release(holder)
+    await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+    first_nine = order[:9]
+    assert first_nine.count("heavy") == 6
+    assert first_nine.count("burst") == 3
+
+
+async def test_server_returns_429_when_run_queue_full(
+    interactive_workflow: Workflow,
+) -> None:
+    scheduler = RunScheduler(max_concurrent_runs=1, max_queued_runs=0)
+    server = WorkflowServer(
+        workflow_store=MemoryWorkflowStore(), run_scheduler=scheduler
+    )
+    server.add_workflow("interactive", interactive_workflow)
+
+    async with server.contextmanager():
+        transport = ASGITransport(app=server.app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.post("/workflows/interactive/run-nowait", json={})
+            assert first.status_code == 200
+            handler_id = first.json()["handler_id"]
+
+            rejected = await client.post("/workflows/interactive/run-nowait", json={})
+            assert rejected.status_code == 429
+            assert rejected.headers["Retry-After"] == "1"
+
+            # Completing the first run frees the slot.
+            event_str = '{"type": "ExternalEvent", "data": {"response": "done"}}'
+            sent = await client.post(f"/events/{handler_id}", json={"event": event_str})
+            assert sent.status_code == 200
+
+            async def _slot_released() -> None:
+                assert scheduler.stats().running == 0
+
+            await wait_for_passing(_slot_released)
+            accepted = await client.post("/workflows/interactive/run-nowait", json={})
+            assert accepted.status_code == 200
@@ -455,6 +455,61 @@ async def test_run_workflow_nowait_with_start_event(client: AsyncClient) -> None
     assert len(data["handler_id"]) == 10  # Default nanoid length
 
 
+@pytest.mark.asyncio
+async def test_run_workflow_nowait_batch_reports_each_run(
+    client: AsyncClient,
+) -> None:
+    response = await client.post(
+        "/workflows/test/run-nowait/batch",
+        json={
+            "runs": [
+                {"start_event": {"message": "one"}},
+                {"handler_id": "batch-dup"},
+                {"handler_id": "batch-dup"},
+                {"start_event": "not json"},
+                "not an object",
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status_code"] for r in results] == [200, 200, 409, 400, 400]
+    assert results[1]["handler"]["handler_id"] == "batch-dup"
+    assert "more than once" in results[2]["detail"]
+    assert results[2]["handler"] is None
+    for result in results[:2]:
+        handler_id = result["handler"]["handler_id"]
+        assert result["handler"]["status"] == "running"
+        await wait_for_passing(lambda: validate_result_response(handler_id, client))
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_nowait_batch_rejects_running_handler(
+    client: AsyncClient,
+) -> None:
+    response = await client.post(
+        "/workflows/interactive/run-nowait", json={"handler_id": "batch-busy"}
+    )
+    assert response.status_code == 200
+
+    response = await client.post(
+        "/workflows/interactive/run-nowait/batch",
+        json={"runs": [{"handler_id": "batch-busy"}, {}]},
+    )
+
+    assert response.status_code == 200
+    assert [r["status_code"] for r in response.json()["results"]] == [409, 200]
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_nowait_batch_not_found(client: AsyncClient) -> None:
+    response = await client.post(
+        "/workflows/nonexistent/run-nowait/batch", json={"runs": [{}]}
+    )
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_run_workflow_nowait_not_found(client: AsyncClient) -> None:
     response = await client.post("/workflows/nonexistent/run-nowait", json={})
@@ -1108,6 +1163,64 @@ async def test_post_event_missing_event_data(client: AsyncClient) -> None:
     assert "Event data is required" in response.text
 
 
+@pytest.mark.asyncio
+async def test_post_events_batch_reports_each_event(
+    client: AsyncClient, server: WorkflowServer
+) -> None:
+    handler_ids = []
+    for _ in range(2):
+        response = await client.post("/workflows/interactive/run-nowait", json={})
+        handler_ids.append(response.json()["handler_id"])
+    for handler_id in handler_ids:
+        await wait_for_requested_external_event(server._service.store, handler_id)
+    response = await client.post("/workflows/test/run", json={})
+    completed_id = response.json()["handler_id"]
+
+    serializer = JsonSerializer()
+    events = [
+        {
+            "handler_id": handler_id,
+            "event": serializer.serialize_value(ExternalEvent(response=handler_id)),
+        }
+        for handler_id in handler_ids
+    ]
+    events += [
+        {"handler_id": "nonexistent_handler", "event": "{}"},
+        {"handler_id": completed_id, "event": "{}"},
+        {"handler_id": handler_ids[0], "event": "invalid json"},
+        {"handler_id": handler_ids[0]},
+        {"event": "{}"},
+    ]
+    response = await client.post("/events", json={"events": events})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status_code"] for r in results] == [200, 200, 404, 409, 400, 400, 400]
+    assert [r["handler_id"] for r in results[:4]] == [
+        *handler_ids,
+        "nonexistent_handler",
+        completed_id,
+    ]
+    assert "Failed to deserialize event" in results[4]["detail"]
+    assert "Event data is required" in results[5]["detail"]
+    for handler_id in handler_ids:
+        result = await wait_for_passing(
+            lambda: validate_result_response(handler_id, client)
+        )
+        assert result["result"]["value"]["result"] == f"received: {handler_id}"
+
+
+@pytest.mark.asyncio
+async def test_post_events_batch_rejects_invalid_bodies(client: AsyncClient) -> None:
+    response = await client.post("/events", json={"events": "nope"})
+    assert response.status_code == 400
+    assert "'events' must be a list" in response.text
+
+    too_many = [{"handler_id": "h", "event": "{}"}] * 1001
+    response = await client.post("/events", json={"events": too_many})
+    assert response.status_code == 413
+
+
 @pytest.mark.asyncio
 async def test_handler_datetime_fields_progress(
     client: AsyncClient, server: WorkflowServer
@@ -1161,6 +1274,57 @@ async def test_handler_datetime_fields_progress(
         assert completed_at >= updated_at_2
 
 
+@pytest.mark.asyncio
+async def test_get_handler_wait_returns_when_handler_finishes(
+    client: AsyncClient, server: WorkflowServer
+) -> None:
+    response = await client.post("/workflows/interactive/run-nowait", json={})
+    handler_id = response.json()["handler_id"]
+    await wait_for_requested_external_event(server._service.store, handler_id)
+
+    waiter = asyncio.create_task(client.get(f"/handlers/{handler_id}?wait=10s"))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    event_str = JsonSerializer().serialize(ExternalEvent(response="done"))
+    send = await client.post(f"/events/{handler_id}", json={"event": event_str})
+    assert send.status_code == 200
+
+    response = await asyncio.wait_for(waiter, timeout=5)
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_get_handler_wait_times_out_while_running(client: AsyncClient) -> None:
+    response = await client.post("/workflows/interactive/run-nowait", json={})
+    handler_id = response.json()["handler_id"]
+
+    response = await client.get(f"/handlers/{handler_id}", params={"wait": "0.05"})
+    assert response.status_code == 202
+    assert response.json()["status"] == "running"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("wait", ["soon", "-1", "nan"])
+async def test_get_handler_wait_rejects_invalid_values(
+    client: AsyncClient, wait: str
+) -> None:
+    response = await client.post("/workflows/test/run-nowait", json={})
+    handler_id = response.json()["handler_id"]
+
+    response = await client.get(f"/handlers/{handler_id}", params={"wait": wait})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_handler_wait_unknown_handler_returns_404(
+    client: AsyncClient,
+) -> None:
+    response = await client.get("/handlers/missing", params={"wait": "1"})
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_cancel_handler_persists_cancelled_status(
     interactive_workflow: Workflow,
@@ -28,6 +28,7 @@ from workflows.events import (
     StopEvent,
     WorkflowCancelledEvent,
     WorkflowFailedEvent,
+    WorkflowIdleEvent,
     WorkflowTimedOutEvent,
 )
 from workflows.runtime.runtime_decorators import BaseRuntimeDecorator
@@ -143,6 +144,13 @@ class RecordingStore(MemoryWorkflowStore):
         await super().start()
 
 
+class CopyingStore(MemoryWorkflowStore):
+    """Returns copies of stored records, like the database-backed stores."""
+
+    async def query(self, query: HandlerQuery) -> list[PersistentHandler]:
+        return [handler.model_copy() for handler in await super().query(query)]
+
+
 class RecordingRuntime(StubRuntime):
     def __init__(self, events: list[str]) -> None:
         super().__init__()
@@ -394,6 +402,44 @@ async def test_run_workflow_handler_persists_initial_record() -> None:
     assert handler.started_at is not None
 
 
+async def test_cached_handler_follows_idle_marks_written_below() -> None:
+    """Idle marks written to the store by inner decorators reach the cache."""
+    store = CopyingStore()
+
+    class IdleMarkingInternalAdapter(StubInternalAdapter):
+        async def write_to_event_stream(self, event: Event) -> None:
+            if isinstance(event, WorkflowIdleEvent):
+                await store.update_handler_status(
+                    self.run_id, idle_since=datetime.now(timezone.utc)
+                )
+
+    class IdleClearingExternalAdapter(StubExternalAdapter):
+        async def send_event(self, tick: WorkflowTick) -> None:
+            await store.update_handler_status(self.run_id, idle_since=None)
+
+    class IdleMarkingRuntime(StubRuntime):
+        def get_internal_adapter(self, workflow: Any) -> InternalRunAdapter:
+            return IdleMarkingInternalAdapter()
+
+        def get_external_adapter(self, run_id: str) -> ExternalRunAdapter:
+            return IdleClearingExternalAdapter()
+
+    decorator = ServerRuntimeDecorator(IdleMarkingRuntime(), store=store)
+    wf = SimpleWorkflow(runtime=decorator)
+    await decorator.run_workflow_handler("h-idle", "my_workflow", "r1")
+
+    await decorator.get_internal_adapter(wf).write_to_event_stream(WorkflowIdleEvent())
+    cached = decorator.cached_handler("h-idle")
+    assert cached is not None
+    assert cached.idle_since is not None
+    assert cached.status == "running"
+
+    await decorator.get_external_adapter("r1").send_event(MagicMock())
+    cached = decorator.cached_handler("h-idle")
+    assert cached is not None
+    assert cached.idle_since is None
+
+
 async def test_retry_store_write_succeeds_after_failures() -> None:
     """_retry_store_write retries and eventually succeeds."""
     store = MemoryWorkflowStore()
@@ -541,6 +541,12 @@ async def test_pre_migration_root_row_reads_as_root(tmp_path: Path) -> None:
                 applied_at TEXT NOT NULL DEFAULT (datetime('now')),
                 PRIMARY KEY (package, version)
             );
+            CREATE TABLE handlers (
+                handler_id TEXT PRIMARY KEY,
+                workflow_name TEXT,
+                status TEXT,
+                started_at TEXT
+            );
             CREATE TABLE workflow_state (
                 run_id TEXT PRIMARY KEY,
                 state_json TEXT NOT NULL DEFAULT '{}',
@@ -167,6 +167,39 @@ async def test_query_filters_by_handler_id_and_empty_lists(tmp_path: Path) -> No
     assert {h.handler_id for h in all_rows} == {"h1", "h2", "h3"}
 
 
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        (HandlerQuery(handler_id_in=["h1"]), "sqlite_autoindex_handlers_1"),
+        (HandlerQuery(run_id_in=["r1"]), "idx_handlers_run_id"),
+        (HandlerQuery(status_in=["running"]), "idx_handlers_status_workflow_name"),
+        (
+            HandlerQuery(
+                status_in=["running"], workflow_name_in=["wf_a", "wf_b"], is_idle=False
+            ),
+            "idx_handlers_status_workflow_name",
+        ),
+        (
+            HandlerQuery(workflow_name_in=["wf_a"]),
+            "idx_handlers_workflow_name_started_at",
+        ),
+    ],
+)
+def test_handler_queries_use_an_index(
+    tmp_path: Path, query: HandlerQuery, index: str
+) -> None:
+    store = SqliteWorkflowStore(str(tmp_path / "handlers.db"))
+    statement = store._query_statement(query)
+    assert statement is not None
+    sql, params = statement
+
+    with store._connect() as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+
+    details = " ".join(row[-1] for row in plan)
+    assert f"USING INDEX {index}" in details, details
+
+
 class CustomStopEvent(StopEvent):
     x: int
     y: list[int]
@@ -3,18 +3,25 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, cast
+from typing import Any, AsyncGenerator, AsyncIterator, cast
 
 import pytest
+from llama_agents.client.protocol.serializable_events import EventEnvelopeWithMetadata
 from llama_agents.server import (
     HandlerQuery,
     MemoryWorkflowStore,
     PersistentHandler,
     WorkflowServer,
 )
-from llama_agents.server._service import EventSendError, HandlerCompletedError
+from llama_agents.server._service import (
+    EventSendError,
+    HandlerAlreadyRunningError,
+    HandlerCompletedError,
+)
+from llama_agents.server._store.abstract_workflow_store import StoredEvent
 from pydantic import BaseModel
 from server_test_fixtures import (  # type: ignore[import]
     ErrorWorkflow,
@@ -283,6 +290,210 @@ async def test_send_event_happy_path(
         await wait_for_passing(handler_completed, max_duration=2.0, interval=0.01)
 
 
+@pytest.mark.asyncio
+async def test_start_and_send_skip_store_lookups_for_live_runs(
+    memory_store: MemoryWorkflowStore, interactive_workflow: Workflow
+) -> None:
+    """Handler records of runs live in this process are served from memory."""
+    server = WorkflowServer(workflow_store=memory_store, idle_timeout=0.01)
+    server.add_workflow(
+        "interactive", interactive_workflow, additional_events=[ExternalEvent]
+    )
+    handler_lookups: list[HandlerQuery] = []
+    query = memory_store.query
+
+    async def counting_query(q: HandlerQuery) -> list[PersistentHandler]:
+        if q.handler_id_in is not None:
+            handler_lookups.append(q)
+        return await query(q)
+
+    memory_store.query = counting_query  # type: ignore[method-assign]
+
+    async with server.contextmanager():
+        started = await server._service.start_workflow(interactive_workflow, "live-1")
+        assert started.status == "running"
+        await wait_for_requested_external_event(memory_store, "live-1")
+        handler_lookups.clear()
+
+        with pytest.raises(HandlerAlreadyRunningError):
+            await server._service.start_workflow(interactive_workflow, "live-1")
+        loaded = await server._service.load_handler("live-1")
+        assert loaded is not None and loaded.run_id == started.run_id
+        await server._service.send_event("live-1", ExternalEvent(response="pong"))
+        assert handler_lookups == []
+
+        async def handler_completed() -> None:
+            loaded = await server._service.load_handler("live-1")
+            assert loaded is not None
+            assert loaded.status == "completed"
+
+        await wait_for_passing(handler_completed, max_duration=2.0, interval=0.01)
+        # Once the run settles, lookups fall back to the store.
+        await wait_for_passing(
+            lambda: _assert_evicted(server, "live-1"), max_duration=2.0, interval=0.01
+        )
+
+
+async def _assert_evicted(server: WorkflowServer, handler_id: str) -> None:
+    assert server._service._runtime.cached_handler(handler_id) is None
+
+
+@pytest.mark.asyncio
+async def test_load_handlers_reads_the_store_once(
+    memory_store: MemoryWorkflowStore, interactive_workflow: Workflow
+) -> None:
+    """Batch loads serve live runs from memory and the rest in one query."""
+    server = WorkflowServer(workflow_store=memory_store)
+    server.add_workflow(
+        "interactive", interactive_workflow, additional_events=[ExternalEvent]
+    )
+    now = datetime.now(timezone.utc)
+    stored_ids = [f"stored-{i}" for i in range(50)]
+    for handler_id in stored_ids:
+        await memory_store.update(
+            PersistentHandler(
+                handler_id=handler_id,
+                workflow_name="interactive",
+                status="completed",
+                run_id=f"run-{handler_id}",
+                started_at=now,
+            )
+        )
+    handler_lookups: list[HandlerQuery] = []
+    query = memory_store.query
+
+    async def counting_query(q: HandlerQuery) -> list[PersistentHandler]:
+        if q.handler_id_in is not None:
+            handler_lookups.append(q)
+        return await query(q)
+
+    memory_store.query = counting_query  # type: ignore[method-assign]
+
+    async with server.contextmanager():
+        await server._service.start_workflow(interactive_workflow, "batch-live")
+        await wait_for_requested_external_event(memory_store, "batch-live")
+        handler_lookups.clear()
+
+        loaded = await server._service.load_handlers(
+            [*stored_ids, "batch-live", "missing", *stored_ids]
+        )
+
+        assert set(loaded) == {*stored_ids, "batch-live"}
+        assert loaded["batch-live"].status == "running"
+        assert len(handler_lookups) == 1
+        assert sorted(handler_lookups[0].handler_id_in or []) == sorted(
+            [*stored_ids, "missing"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_wait_for_handler_waiters_do_not_poll_the_store(
+    memory_store: MemoryWorkflowStore, interactive_workflow: Workflow
+) -> None:
+    """Waiters on a live run, and on a run the store only knows about, are
+    woken by completion signals rather than repeated handler queries."""
+    server = WorkflowServer(workflow_store=memory_store)
+    server.add_workflow(
+        "interactive", interactive_workflow, additional_events=[ExternalEvent]
+    )
+    handler_lookups = 0
+    query = memory_store.query
+
+    async def counting_query(q: HandlerQuery) -> list[PersistentHandler]:
+        nonlocal handler_lookups
+        if q.handler_id_in is not None:
+            handler_lookups += 1
+        return await query(q)
+
+    memory_store.query = counting_query  # type: ignore[method-assign]
+
+    event_queries = 0
+    events_read = 0
+    query_events = memory_store.query_events
+    get_last_event = memory_store.get_last_event
+    subscribe_events = memory_store.subscribe_events
+
+    async def counting_query_events(
+        run_id: str, after_sequence: int | None = None, limit: int | None = None
+    ) -> list[StoredEvent]:
+        nonlocal event_queries, events_read
+        event_queries += 1
+        events = await query_events(run_id, after_sequence, limit)
+        events_read += len(events)
+        return events
+
+    async def counting_get_last_event(run_id: str) -> StoredEvent | None:
+        nonlocal event_queries, events_read
+        event_queries += 1
+        event = await get_last_event(run_id)
+        events_read += event is not None
+        return event
+
+    async def counting_subscribe_events(
+        run_id: str, after_sequence: int = -1
+    ) -> AsyncIterator[StoredEvent]:
+        nonlocal events_read
+        async for event in subscribe_events(run_id, after_sequence):
+            events_read += 1
+            yield event
+
+    memory_store.query_events = counting_query_events  # type: ignore[method-assign]
+    memory_store.get_last_event = counting_get_last_event  # type: ignore[method-assign]
+    memory_store.subscribe_events = counting_subscribe_events  # type: ignore[method-assign]
+
+    async with server.contextmanager():
+        # Live in this process: answered from memory.
+        await server._service.start_workflow(interactive_workflow, "wait-live")
+        await wait_for_requested_external_event(memory_store, "wait-live")
+        handler_lookups = 0
+        waiters = [
+            asyncio.create_task(server._service.wait_for_handler("wait-live", 10))
+            for _ in range(1000)
+        ]
+        await asyncio.sleep(0.05)
+        await server._service.send_event("wait-live", ExternalEvent(response="x"))
+        results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=10)
+        assert {r.status for r in results if r is not None} == {"completed"}
+        assert handler_lookups == 0
+
+        # Owned elsewhere: one lookup before and one after the terminal event.
+        # The run already has a long history, which waiters do not re-read.
+        for _ in range(50):
+            await memory_store.append_event(
+                "remote-run",
+                EventEnvelopeWithMetadata.from_event(ExternalEvent(response="earlier")),
+            )
+        now = datetime.now(timezone.utc)
+        await memory_store.update(
+            PersistentHandler(
+                handler_id="wait-remote",
+                workflow_name="interactive",
+                status="running",
+                run_id="remote-run",
+                started_at=now,
+                updated_at=now,
+            )
+        )
+        handler_lookups = 0
+        event_queries = 0
+        events_read = 0
+        waiters = [
+            asyncio.create_task(server._service.wait_for_handler("wait-remote", 10))
+            for _ in range(1000)
+        ]
+        await asyncio.sleep(0.2)
+        await memory_store.update_handler_status("remote-run", status="completed")
+        await memory_store.append_event(
+            "remote-run", EventEnvelopeWithMetadata.from_event(StopEvent())
+        )
+        results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=10)
+        assert {r.status for r in results if r is not None} == {"completed"}
+        assert handler_lookups == 2000
+        # One read of the last event each, then only the terminal event.
+        assert event_queries == 1000
+        assert events_read == 2000
+
+
 @pytest.mark.asyncio
 async def test_cancel_terminal_handler_without_purge(
     memory_store: MemoryWorkflowStore, simple_test_workflow: Workflow
@@ -315,27 +526,23 @@ async def test_cancel_terminal_handler_without_purge(
 
 
 @pytest.mark.asyncio
-async def test_context_from_handler_id_falls_back_to_legacy_state_snapshot(
+async def test_context_from_handler_falls_back_to_legacy_state_snapshot(
     memory_store: MemoryWorkflowStore, simple_test_workflow: Workflow
 ) -> None:
     server = WorkflowServer(workflow_store=memory_store, idle_timeout=0.01)
     server.add_workflow("simple", simple_test_workflow)
-    await memory_store.update(
-        PersistentHandler(
-            handler_id="completed-with-plugin-state",
-            workflow_name="simple",
-            status="completed",
-            run_id="plugin-run",
-            started_at=datetime.now(timezone.utc),
-        )
+    handler = PersistentHandler(
+        handler_id="completed-with-plugin-state",
+        workflow_name="simple",
+        status="completed",
+        run_id="plugin-run",
+        started_at=datetime.now(timezone.utc),
     )
     state_stores = cast(dict[Any, Any], memory_store.state_stores)
     state_stores[("plugin-run", ())] = ToDictOnlyStateStore()
 
     async with server.contextmanager():
-        ctx = await server._service._context_from_handler_id(
-            simple_test_workflow, "completed-with-plugin-state"
-        )
+        ctx = await server._service._context_from_handler(simple_test_workflow, handler)
 
     assert ctx is not None
     assert await ctx.store.get("count") == 7
@@ -388,13 +595,14 @@ async def test_typed_state_continuation_via_memory_store(
     await prev.set("counter", 41)
 
     async with server.contextmanager():
-        ctx = await server._service._context_from_handler_id(wf, "h-typed-continuation")
-        assert ctx is not None
-        handler = wf.run(ctx=ctx)
+        # Restarting the handler continues from the previous run's state.
+        started = await server._service.start_workflow(wf, "h-typed-continuation")
+        finished = await server._service.await_workflow(started)
         # The continued run must see the previous run's typed state (41) and
         # be able to use it as the typed model (crash/degradation regression).
-        result = await handler
-        assert result == 42
+        assert finished.status == "completed"
+        assert finished.result is not None
+        assert finished.result.value["result"] == 42
 
 
 @pytest.mark.asyncio
@@ -418,8 +626,9 @@ async def test_dict_state_pydantic_value_continuation_via_memory_store(
     await prev.set("obj", _InnerValue(x=42))
 
     async with server.contextmanager():
-        ctx = await server._service._context_from_handler_id(wf, "h-dict-continuation")
-        assert ctx is not None
-        handler = wf.run(ctx=ctx)
-        result = await handler
+        started = await server._service.start_workflow(wf, "h-dict-continuation")
+        finished = await server._service.await_workflow(started)
+        assert finished.status == "completed"
+        assert finished.result is not None
+        result = finished.result.value["result"]
         assert result == "_InnerValue", f"pydantic value degraded to {result}"
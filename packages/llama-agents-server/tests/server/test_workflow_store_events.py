@@ -163,6 +163,20 @@ async def test_query_events_for_nonexistent_run_id_returns_empty(
     assert result == []
 
 
+@pytest.mark.asyncio
+async def test_get_last_event_returns_highest_sequence(
+    store: AbstractWorkflowStore,
+) -> None:
+    assert await store.get_last_event("run-1") is None
+    for i in range(3):
+        await store.append_event("run-1", make_envelope(seq_label=i))
+    await store.append_event("run-2", make_envelope(seq_label=9))
+
+    last = await store.get_last_event("run-1")
+    assert last is not None
+    assert (last.run_id, last.sequence) == ("run-1", 2)
+
+
 @pytest.mark.asyncio
 async def test_events_from_different_run_ids_are_isolated(
     store: AbstractWorkflowStore,
@@ -294,6 +308,20 @@ async def test_stream_ticks_yields_all_rows_in_order(
     assert yielded == list(range(13))
 
 
+@pytest.mark.asyncio
+async def test_stream_ticks_after_sequence(
+    store: AbstractWorkflowStore,
+) -> None:
+    for i in range(13):
+        await store.append_tick("run-1", {"type": "TickSendEvent", "i": i})
+
+    yielded: list[int] = []
+    async for tick in store.stream_ticks("run-1", after_sequence=9):
+        yielded.append(tick.sequence)
+
+    assert yielded == [10, 11, 12]
+
+
 @pytest.mark.asyncio
 async def test_stream_ticks_empty_history(
     store: AbstractWorkflowStore,
@@ -603,22 +603,36 @@ class Context(Generic[MODEL_T]):
         """
         return self._require_internal(fn="retry_info").retry_info()
 
-    def write_event_to_stream(self, ev: Event | None) -> None:
+    def write_event_to_stream(self, ev: Event | None) -> asyncio.Future[Any]:
         """Enqueue an event for streaming to [WorkflowHandler]](workflows.handler.WorkflowHandler).
 
+        The write happens in the background. Await the returned future to
+        wait until the event is buffered: with a
+        [StreamBufferPolicy][workflows.runtime.publish_buffer.StreamBufferPolicy]
+        using the `"block"` overflow, this suspends the step while the
+        buffer is full, so a fast producer is paced by its consumer.
+        Writes that are not awaited still complete before the step returns.
+
         Args:
             ev (Event | None): The event to stream. `None` can be used as a
                 sentinel in some streaming modes.
 
+        Returns:
+            asyncio.Future: Resolves once the event is buffered.
+
         Examples:
             ```python
             @step
             async def my_step(self, ctx: Context, ev: StartEvent) -> StopEvent:
                 ctx.write_event_to_stream(ev)
+                for chunk in chunks:
+                    await ctx.write_event_to_stream(ChunkEvent(chunk=chunk))
                 return StopEvent(result="ok")
             ```
         """
-        self._require_internal(fn="write_event_to_stream").write_event_to_stream(ev)
+        return self._require_internal(fn="write_event_to_stream").write_event_to_stream(
+            ev
+        )
 
     async def _finalize_step(self) -> None:
         """Finalize step execution by awaiting background tasks.
@@ -20,8 +20,8 @@ from workflows.runtime.types.results import (
     DeleteCollectedEvent,
     DeleteWaiter,
     StepWorkerContext,
-    StepWorkerStateContextVar,
     WaitingForEvent,
+    current_step_worker_context,
 )
 from workflows.runtime.types.step_id import StepId
 from workflows.runtime.types.ticks import TickAddEvent
@@ -102,7 +102,7 @@ class InternalContext(Generic[MODEL_T]):
     def _get_step_ctx(fn: str) -> StepWorkerContext:
         """Get the current step worker context. Raises if not in a step."""
         try:
-            return StepWorkerStateContextVar.get()
+            return current_step_worker_context()
         except LookupError:
             raise WorkflowRuntimeError(
                 f"{fn} may only be called from within a step function"
@@ -176,7 +176,7 @@ class InternalContext(Generic[MODEL_T]):
 
         total = []
         by_type: dict[type[Event], list[Event]] = defaultdict(list)
-        for e in collected_events + [ev]:
+        for e in [*collected_events, ev]:
             by_type[type(e)].append(e)
         # order by expected type
         for e_type in expected:
@@ -192,7 +192,7 @@ class InternalContext(Generic[MODEL_T]):
 
         recovery_counts: dict[str, int] = {}
         try:
-            step_ctx = StepWorkerStateContextVar.get()
+            step_ctx = current_step_worker_context()
             recovery_counts = dict(step_ctx.retry.recovery_counts)
         except LookupError:
             pass
@@ -233,36 +233,51 @@ class InternalContext(Generic[MODEL_T]):
                 if work_item_id is not None
                 else base_waiter_id
             )
-            existing_waiter_ids = {w.waiter_id for w in collected_waiters}
-            if legacy_waiter_id in existing_waiter_ids:
+            if legacy_waiter_id in collected_waiters:
                 waiter_id = legacy_waiter_id
-            elif base_waiter_id in existing_waiter_ids:
+            elif base_waiter_id in collected_waiters:
                 waiter_id = base_waiter_id
             else:
                 waiter_id = work_item_waiter_id
 
-        waiter = next((w for w in collected_waiters if w.waiter_id == waiter_id), None)
+        waiter = collected_waiters.get(waiter_id)
         if waiter is not None and waiter.timed_out:
             step_ctx.returns.return_values.append(DeleteWaiter(waiter_id=waiter_id))
             raise asyncio.TimeoutError(f"Timed out waiting for {event_type.__name__}")
         if waiter is None or waiter.resolved_event is None:
-            raise WaitingForEvent(
-                AddWaiter(
-                    waiter_id=waiter_id,
-                    requirements=requirements,
-                    timeout=timeout,
-                    event_type=event_type,
-                    waiter_event=waiter_event,
-                )
+            add = AddWaiter(
+                waiter_id=waiter_id,
+                requirements=requirements,
+                timeout=timeout,
+                event_type=event_type,
+                waiter_event=waiter_event,
+            )
+            if step_ctx.parking is None:
+                raise WaitingForEvent(add)
+            # Resume in place: park here until the work item is re-delivered,
+            # then look the waiter up again in the resuming invocation's state.
+            await step_ctx.parking.suspend(add)
+            return await self.wait_for_event(
+                event_type,
+                waiter_event=waiter_event,
+                waiter_id=waiter_id,
+                requirements=requirements,
+                timeout=timeout,
             )
         else:
             step_ctx.returns.return_values.append(DeleteWaiter(waiter_id=waiter_id))
             return cast(T, waiter.resolved_event)
 
-    def write_event_to_stream(self, ev: Event | None) -> None:
-        """Write an event to the published event stream."""
-        if ev is not None:
-            self._execute_task(self._internal_adapter.write_to_event_stream(ev))
+    def write_event_to_stream(self, ev: Event | None) -> asyncio.Future[Any]:
+        """Write an event to the published event stream.
+
+        Returns the write, which completes once the event is buffered.
+        """
+        if ev is None:
+            done: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            done.set_result(None)
+            return done
+        return self._execute_task(self._internal_adapter.write_to_event_stream(ev))
 
     def retry_info(self) -> RetryInfo:
         """Snapshot of the currently-executing step's retry state.
@@ -6,6 +6,7 @@ from __future__ import annotations
 import base64
 import contextvars
 import json
+import math
 import pickle
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
@@ -13,7 +14,54 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from .utils import get_qualified_name, import_module_from_qualified_name
+from .utils import get_qualified_name, resolve_qualified_name
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # Route types the stdlib json module rejects back to the stdlib fallback
+    # instead of letting orjson encode them natively.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+# Leaves both encoders write alike, checked by exact type to stay cheap.
+_PLAIN_JSON_TYPES = frozenset({str, int, bool, type(None)})
+
+
+class _NotJsonNative(Exception):
+    """A value orjson would encode where the stdlib rejects it, or encode
+    differently."""
+
+
+def _is_json_native(value: Any) -> bool:
+    """Whether ``value`` holds only types the stdlib ``json`` module encodes
+    without a ``default`` hook, the same way orjson does."""
+    if isinstance(value, float):
+        # The stdlib writes NaN/Infinity literals; orjson writes null.
+        return math.isfinite(value)
+    if value is None or isinstance(value, (str, int)):
+        # Includes enums that mix in str/int: both encode their value.
+        return True
+    if isinstance(value, dict):
+        return all(_is_json_native(k) and _is_json_native(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_native(item) for item in value)
+    return False
+
+
+def _native_key(key: Any) -> Any:
+    if not _is_json_native(key):
+        raise _NotJsonNative
+    return key
+
 
 # Threads the active serializer's allowlist into nested field validators during
 # deserialization. Pydantic's `model_validate(context=...)` is not a reliable
@@ -59,6 +107,14 @@ class JsonSerializer(BaseSerializer):
     Fallback for unsupported objects is to attempt JSON encoding directly; if it
     fails, a `ValueError` is raised.
 
+    When [orjson](https://github.com/ijl/orjson) is installed (the `orjson`
+    extra), `serialize` encodes with it. It accepts and rejects the same
+    values as the standard library: anything the standard library cannot
+    encode, such as UUIDs or plain enums, raises `ValueError` even though
+    orjson could encode it. The output is compact JSON. One difference
+    remains: NaN and infinities inside a Pydantic model's fields are written
+    as `null`, as `model_dump_json` writes them.
+
     Examples:
         ```python
         s = JsonSerializer()
@@ -129,6 +185,38 @@ class JsonSerializer(BaseSerializer):
 
         return value
 
+    def _serialize_native(self, value: Any) -> Any:
+        """`serialize_value`, raising `_NotJsonNative` on the way for any raw
+        value orjson and the stdlib would not encode alike.
+
+        Model payloads are not checked: ``model_dump(mode="json")`` already
+        turns UUIDs, enums and the like into JSON types.
+        """
+        if type(value) in _PLAIN_JSON_TYPES:
+            return value
+
+        if hasattr(value, "class_name"):
+            retval = self.serialize_value(value)
+            if not _is_json_native(retval["value"]):
+                raise _NotJsonNative
+            return retval
+
+        if isinstance(value, BaseModel):
+            return self.serialize_value(value)
+
+        if isinstance(value, dict):
+            return {
+                k if type(k) is str else _native_key(k): self._serialize_native(v)
+                for k, v in value.items()
+            }
+
+        if isinstance(value, list):
+            return [self._serialize_native(item) for item in value]
+
+        if not _is_json_native(value):
+            raise _NotJsonNative
+        return value
+
     def serialize(self, value: Any) -> str:
         """Serialize an arbitrary value to a JSON string.
 
@@ -142,8 +230,18 @@ class JsonSerializer(BaseSerializer):
             ValueError: If the value cannot be encoded to JSON.
         """
         try:
-            serialized_value = self.serialize_value(value)
-            return json.dumps(serialized_value)
+            if orjson is not None and (
+                type(self).serialize_value is JsonSerializer.serialize_value
+            ):
+                try:
+                    return orjson.dumps(
+                        self._serialize_native(value), option=_ORJSON_OPTIONS
+                    ).decode("utf-8")
+                except (_NotJsonNative, TypeError):
+                    # UUIDs, plain enums, NaN/Infinity, integers over 64 bits
+                    # and unknown objects: the stdlib encodes or rejects them.
+                    pass
+            return json.dumps(self.serialize_value(value))
         except Exception:
             raise ValueError(f"Failed to serialize value: {type(value)}: {value!s}")
 
@@ -159,7 +257,7 @@ class JsonSerializer(BaseSerializer):
         if isinstance(data, dict):
             if data.get("__is_pydantic") and data.get("qualified_name"):
                 self._validate_qualified_name(data["qualified_name"])
-                module_class = import_module_from_qualified_name(data["qualified_name"])
+                module_class = resolve_qualified_name(data["qualified_name"])
                 token = allowed_type_names_var.set(self._allowed_type_names)
                 try:
                     return module_class.model_validate(data["value"])
@@ -167,7 +265,7 @@ class JsonSerializer(BaseSerializer):
                     allowed_type_names_var.reset(token)
             elif data.get("__is_component") and data.get("qualified_name"):
                 self._validate_qualified_name(data["qualified_name"])
-                module_class = import_module_from_qualified_name(data["qualified_name"])
+                module_class = resolve_qualified_name(data["qualified_name"])
                 return module_class.from_dict(data["value"])
             return {k: self.deserialize_value(v) for k, v in data.items()}
         elif isinstance(data, list):
@@ -183,6 +281,7 @@ class JsonSerializer(BaseSerializer):
         Returns:
             Any: The reconstructed value.
         """
+        # Not orjson: it reads integers over 64 bits back as floats.
         data = json.loads(value)
         return self.deserialize_value(data)
 
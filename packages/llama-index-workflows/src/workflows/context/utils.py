@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
 from typing import (
     Any,
@@ -58,3 +59,21 @@ def import_module_from_qualified_name(qualified_name: str) -> Any:
         raise AttributeError(
             f"Attribute {module_path[1]} not found in module {module_path[0]}: {e}"
         )
+
+
+@lru_cache(maxsize=1024)
+def resolve_qualified_name(qualified_name: str) -> Any:
+    """
+    Memoized [import_module_from_qualified_name][workflows.context.utils.import_module_from_qualified_name].
+
+    Deserialization resolves the same handful of event and model classes over
+    and over; this skips the import machinery after the first lookup. Failed
+    lookups are not cached.
+
+    Args:
+        qualified_name (str): The fully qualified name of the attribute to import.
+
+    Returns:
+        Any: The resolved attribute.
+    """
+    return import_module_from_qualified_name(qualified_name)
@@ -83,6 +83,9 @@ class StepConfig:
     catch_error_for_steps: list[str] | None = None
     catch_error_max_recoveries: int = 1
     accept_event_subclasses: bool = False
+    # Keep the step body parked across ctx.wait_for_event and resume it at the
+    # await point, instead of re-running the step from the top.
+    resume_waits_in_place: bool = False
 
 
 @dataclasses.dataclass(frozen=True)
@@ -127,6 +130,7 @@ def step(
     retry_policy: RetryPolicy | None = None,
     skip_graph_checks: list[StepGraphCheck] | None = None,
     accept_event_subclasses: bool = False,
+    resume_waits_in_place: bool = False,
 ) -> Callable[[Callable[P, R]], StepFunction[P, R]]: ...
 
 
@@ -138,6 +142,7 @@ def step(
     retry_policy: RetryPolicy | None = None,
     skip_graph_checks: list[StepGraphCheck] | None = None,
     accept_event_subclasses: bool = False,
+    resume_waits_in_place: bool = False,
 ) -> Callable[[Callable[P, R]], StepFunction[P, R]] | StepFunction[P, R]:
     """
     Decorate a callable to declare it as a workflow step.
@@ -158,6 +163,11 @@ def step(
             for this step. Currently supports ``"reachability"`` to allow
             intentionally unreachable steps.
         accept_event_subclasses (bool): If True, enable subclass-aware event routing.
+        resume_waits_in_place (bool): If True, an async step that calls
+            `ctx.wait_for_event` stays suspended and continues from the await
+            point when the event arrives, instead of being re-run from the
+            top. Runs restored from a snapshot, or on runtimes that replay
+            step bodies (such as DBOS), fall back to re-running the step.
 
     Returns:
         Callable: The original function, annotated with internal step metadata.
@@ -197,6 +207,7 @@ def step(
             localns=localns,
             skip_graph_checks=skip_graph_checks or [],
             accept_event_subclasses=accept_event_subclasses,
+            resume_waits_in_place=resume_waits_in_place,
         )
 
     if func is not None:
@@ -210,6 +221,7 @@ def step(
             localns=localns,
             skip_graph_checks=skip_graph_checks or [],
             accept_event_subclasses=accept_event_subclasses,
+            resume_waits_in_place=resume_waits_in_place,
         )
     return decorator
 
@@ -221,6 +233,7 @@ def make_step_function(
     localns: dict[str, Any] | None = None,
     skip_graph_checks: list[StepGraphCheck] | None = None,
     accept_event_subclasses: bool = False,
+    resume_waits_in_place: bool = False,
 ) -> StepFunction[P, R]:
     # This will raise providing a message with the specific validation failure
     spec = inspect_signature(func, localns=localns)
@@ -255,6 +268,7 @@ def make_step_function(
         collection_param=spec.collection_param,
         collection_policy=spec.collection_policy,
         accept_event_subclasses=accept_event_subclasses,
+        resume_waits_in_place=resume_waits_in_place,
     )
 
     return casted
@@ -269,6 +283,7 @@ def _apply_step_decorator(
     localns: dict[str, Any] | None,
     skip_graph_checks: list[StepGraphCheck],
     accept_event_subclasses: bool,
+    resume_waits_in_place: bool,
 ) -> StepFunction[P, R]:
     if not isinstance(num_workers, int) or num_workers <= 0:
         raise WorkflowValidationError("num_workers must be an integer greater than 0")
@@ -280,6 +295,7 @@ def _apply_step_decorator(
         localns=localns,
         skip_graph_checks=skip_graph_checks,
         accept_event_subclasses=accept_event_subclasses,
+        resume_waits_in_place=resume_waits_in_place,
     )
 
     # If this is a free function, call add_step() explicitly.
@@ -19,7 +19,7 @@ from pydantic import (
 )
 
 from workflows.context.serializers import JsonSerializer, allowed_type_names_var
-from workflows.context.utils import import_module_from_qualified_name
+from workflows.context.utils import resolve_qualified_name
 
 
 class DictLikeModel(BaseModel):
@@ -261,7 +261,7 @@ def _deserialize_exception(data: Any) -> Exception:
     if not _exception_type_permitted(exc_type):
         return UnreconstructedException(exc_message, original_type=exc_type)
     try:
-        exc_cls = import_module_from_qualified_name(exc_type)
+        exc_cls = resolve_qualified_name(exc_type)
         # Only construct genuine exception types. The qualified name comes from a
         # serialized blob and could resolve to any callable (e.g. ``builtins.eval``,
         # which the ``builtins`` allowlist exemption would otherwise permit) —
@@ -306,7 +306,7 @@ def _serialize_event_type(event_type: type[Event]) -> str:
 def _deserialize_event_type(data: Any) -> type[Event]:
     if isinstance(data, type):
         return data
-    return import_module_from_qualified_name(data)
+    return resolve_qualified_name(data)
 
 
 SerializableEventType = Annotated[
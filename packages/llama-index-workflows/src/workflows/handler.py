@@ -7,7 +7,7 @@ import asyncio
 import functools
 import warnings
 from collections.abc import Generator
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable
 
 from workflows.runtime.types.plugin import (
     ExternalRunAdapter,
@@ -20,6 +20,7 @@ from .types import RunResultT
 
 if TYPE_CHECKING:
     from .context import Context
+    from .runtime.publish_buffer import PublishBufferStats
     from .workflow import Workflow
 
 
@@ -101,6 +102,22 @@ class WorkflowHandler(Awaitable[RunResultT]):
         """Return True when the workflow has completed."""
         return self._result_task.done()
 
+    def add_done_callback(self, fn: Callable[[WorkflowHandler], None]) -> None:
+        """Call ``fn`` with this handler once the run's result settles.
+
+        The callback runs whether the run completed, failed, was cancelled,
+        or had its control loop aborted. It is called soon after scheduling
+        if the run has already settled.
+        """
+        self._result_task.add_done_callback(lambda _: fn(self))
+
+    def publish_buffer_stats(self) -> PublishBufferStats | None:
+        """Size and high-water mark of this run's published-event buffer.
+
+        Returns None when the runtime does not buffer events in process.
+        """
+        return self._external_adapter.publish_buffer_stats()
+
     async def stream_events(
         self, expose_internal: bool = False
     ) -> AsyncGenerator[Event, None]:
@@ -25,6 +25,11 @@ from workflows.context.state_store import (
 )
 from workflows.errors import WorkflowRuntimeError
 from workflows.events import Event, StartEvent, StopEvent
+from workflows.runtime.publish_buffer import (
+    PublishBuffer,
+    PublishBufferStats,
+    StreamBufferPolicy,
+)
 from workflows.runtime.types.internal_state import BrokerState
 from workflows.runtime.types.plugin import (
     ExternalRunAdapter,
@@ -37,6 +42,7 @@ from workflows.runtime.types.plugin import (
     WaitResultTick,
     WaitResultTimeout,
 )
+from workflows.runtime.types.results import current_step_worker_context
 from workflows.runtime.types.step_function import (
     as_step_worker_functions,
     create_workflow_run_function,
@@ -61,11 +67,13 @@ class AsyncioAdapterQueues:
         run_id: str,
         init_state: BrokerState,
         state_store: StateStore[Any] | None = None,
+        stream_buffer: StreamBufferPolicy | None = None,
     ):
         self.run_id = run_id
         self.init_state = init_state
         self.ticks: list[WorkflowTick] = []
         self.state_store = state_store
+        self.stream_buffer = stream_buffer
 
     # created lazily via cached_property for Python 3.14+ compatibility (they require a running event loop)
     @functools.cached_property
@@ -74,8 +82,8 @@ class AsyncioAdapterQueues:
 
     # created lazily via cached_property for Python 3.14+ compatibility (they require a running event loop)
     @functools.cached_property
-    def publish_queue(self) -> asyncio.Queue[Event]:
-        return asyncio.Queue[Event]()
+    def publish_queue(self) -> PublishBuffer:
+        return PublishBuffer(self.stream_buffer)
 
     # created lazily via cached_property for Python 3.14+ compatibility (they require a running event loop)
     @functools.cached_property
@@ -103,7 +111,13 @@ class InternalAsyncioAdapter(InternalRunAdapter, SnapshottableAdapter):
         return self._queues.init_state
 
     async def write_to_event_stream(self, event: Event) -> None:
-        self._queues.publish_queue.put_nowait(event)
+        try:
+            current_step_worker_context()
+        except LookupError:
+            # Published by the control loop, which never waits on consumers.
+            self._queues.publish_queue.put_nowait(event)
+        else:
+            await self._queues.publish_queue.put(event)
 
     async def get_now(self) -> float:
         # Wall clock, not monotonic: get_now timestamps (first_attempt_at,
@@ -197,6 +211,10 @@ class ExternalAsyncioAdapter(
             return None
         return self._queues.complete.result()
 
+    def publish_buffer_stats(self) -> PublishBufferStats:
+        """Size, high-water mark, and drop counts of the published-event buffer."""
+        return self._queues.publish_queue.stats()
+
     @property
     def is_running(self) -> bool:
         return not self._queues.complete.done()
@@ -241,12 +259,17 @@ class BasicRuntime(Runtime):
         )
 
     def _get_or_create_queues(
-        self, run_id: str, init_state: BrokerState
+        self,
+        run_id: str,
+        init_state: BrokerState,
+        stream_buffer: StreamBufferPolicy | None = None,
     ) -> AsyncioAdapterQueues:
         """Get existing queues or create new ones for a run_id."""
         queues = self._queues.get(run_id)
         if queues is None:
-            queues = AsyncioAdapterQueues(run_id=run_id, init_state=init_state)
+            queues = AsyncioAdapterQueues(
+                run_id=run_id, init_state=init_state, stream_buffer=stream_buffer
+            )
             self._queues[run_id] = queues
         return queues
 
@@ -304,7 +327,9 @@ class BasicRuntime(Runtime):
             state_type = infer_state_type(registered.workflow)
             state_store = InMemoryStateStore(state_type())
         # might want to lock this better. Unlikely race condition if you spam with the same run_id.
-        queues = self._get_or_create_queues(run_id, init_state)
+        queues = self._get_or_create_queues(
+            run_id, init_state, registered.workflow._stream_buffer
+        )
         queues.state_store = state_store
 
         # Capture propagation context (otel trace, instrument tags, etc.)
@@ -7,7 +7,7 @@ import hashlib
 import inspect
 import logging
 import time
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Sequence
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from typing import Any
@@ -80,6 +80,7 @@ from workflows.runtime.types.results import (
     StepWorkerResult,
     StepWorkerState,
     StepWorkerWaiter,
+    snapshot_collected_events,
 )
 from workflows.runtime.types.step_id import StepId
 from workflows.runtime.types.ticks import (
@@ -356,6 +357,7 @@ def rewind_in_progress(
                 ),
             )
         step_state.in_progress = []
+        step_state.free_worker_ids = []
         commands.extend(_drain_eligible_queue(step_id, step_state, now_seconds))
         for attempt in step_state.queue:
             if attempt.not_before is not None:
@@ -385,7 +387,7 @@ def _check_idle_state(state: BrokerState) -> bool:
     return True
 
 
-def _collect_buffer_diverged(live: list[Event], snapshot: list[Event]) -> bool:
+def _collect_buffer_diverged(live: Sequence[Event], snapshot: Sequence[Event]) -> bool:
     """True when a live ctx.collect_events() buffer no longer matches a snapshot."""
     return len(live) != len(snapshot) or any(a is not b for a, b in zip(live, snapshot))
 
@@ -481,7 +483,7 @@ def _rerun_for_stale_collect_buffer(
         return None
     this_execution.shared_state = replace(
         this_execution.shared_state,
-        collected_events={x: list(y) for x, y in worker_state.collected_events.items()},
+        collected_events=snapshot_collected_events(worker_state.collected_events),
     )
     return [
         CommandRunWorker(
@@ -546,7 +548,7 @@ def _apply_step_result(
                 worker.in_progress.clear()
                 worker.collected_events.clear()
                 worker.static_collect_events.clear()
-                worker.collected_waiters.clear()
+            state.clear_waiters()
             # Drop open collection state; no release can fire after the run ends.
             _clear_collection_state(state)
             acc.commands.append(CommandCompleteRun(result=result.result))
@@ -581,7 +583,7 @@ def _apply_step_result(
         )
     elif isinstance(result, AddCollectedEvent):
         # The current state of collected events.
-        collected_events = state.workers[step_name].collected_events.setdefault(
+        collected_events = state.workers[step_name].collected_events.get(
             result.event_id, []
         )
         # the events snapshot that was sent with the step function execution that yielded this result
@@ -594,10 +596,9 @@ def _apply_step_result(
             acc.step_no_longer_in_progress = False
             updated_state = replace(
                 this_execution.shared_state,
-                collected_events={
-                    x: list(y)
-                    for x, y in state.workers[step_name].collected_events.items()
-                },
+                collected_events=snapshot_collected_events(
+                    state.workers[step_name].collected_events
+                ),
             )
             this_execution.shared_state = updated_state
             acc.commands.append(
@@ -609,21 +610,16 @@ def _apply_step_result(
                 )
             )
         else:
-            collected_events.append(result.event)
+            state.workers[step_name].collected_events_buffer(result.event_id).append(
+                result.event
+            )
     elif isinstance(result, DeleteCollectedEvent):
         if did_complete_step:  # allow retries to grab the events
             # indicates that a run has successfully collected its events, and they can be deleted from the collected events state
             state.workers[step_name].collected_events.pop(result.event_id, None)
     elif isinstance(result, AddWaiter):
         # indicates that a run has added a waiter to the collected waiters state
-        existing = next(
-            (
-                (i)
-                for i, x in enumerate(worker_state.collected_waiters)
-                if x.waiter_id == result.waiter_id
-            ),
-            None,
-        )
+        existing = result.waiter_id in worker_state.collected_waiters
         new_waiter = StepWorkerWaiter(
             waiter_id=result.waiter_id,
             event=this_execution.event,
@@ -638,10 +634,8 @@ def _apply_step_result(
             collection_release_payload=this_execution.shared_state.collection_release_payload,
             work_item_id=this_execution.work_item_id,
         )
-        if existing is not None:
-            worker_state.collected_waiters[existing] = new_waiter
-        else:
-            worker_state.collected_waiters.append(new_waiter)
+        state.add_waiter(step_name, new_waiter)
+        if not existing:
             if result.waiter_event:
                 acc.commands.append(CommandPublishEvent(event=result.waiter_event))
             if result.timeout is not None:
@@ -655,11 +649,7 @@ def _apply_step_result(
     elif isinstance(result, DeleteWaiter):
         if did_complete_step:  # allow retries to grab the waiter events
             # indicates that a run has obtained the waiting event, and it can be deleted from the collected waiters state
-            to_remove = result.waiter_id
-            waiters = state.workers[step_name].collected_waiters
-            item = next(filter(lambda w: w.waiter_id == to_remove, waiters), None)
-            if item is not None:
-                waiters.remove(item)
+            state.remove_waiter(step_name, result.waiter_id)
     else:
         raise ValueError(f"Unknown result type: {type(result)}")
 
@@ -931,6 +921,7 @@ def _process_step_result_tick(
         )
         if this_execution in worker_state.in_progress:
             worker_state.in_progress.remove(this_execution)
+            worker_state.release_worker_id(this_execution.worker_id)
     # enqueue next events if there are any
     if not is_completed:
         acc.commands.extend(_drain_eligible_queue(step_id, worker_state, now_seconds))
@@ -1019,14 +1010,13 @@ def _add_or_enqueue_event(
     )
     if has_space:
         # Assign the smallest available worker id
-        used = set(x.worker_id for x in state.in_progress)
-        id_candidates = [i for i in range(state.config.num_workers) if i not in used]
-        id = id_candidates[0]
-        state_copy = state._deepcopy()
+        id = state.claim_worker_id()
+        # The step reads views of the live collect buffers rather than copies;
+        # waiters are immutable, so a shallow copy of the mapping suffices.
         shared_state: StepWorkerState = StepWorkerState(
             step_name=step_name,
-            collected_events=state_copy.collected_events,
-            collected_waiters=state_copy.collected_waiters,
+            collected_events=snapshot_collected_events(state.collected_events),
+            collected_waiters=dict(state.collected_waiters),
             collection_release_payload=event.collection_release_payload._copy()
             if event.collection_release_payload is not None
             else None,
@@ -1144,38 +1134,30 @@ def _resolve_waiters(
     """
     commands: list[WorkflowCommand] = []
     waiter_resolved_steps: set[str] = set()
-    for step_name, step_config in state.config.steps.items():
-        step_id = StepId.root(step_name)
-        wait_conditions = state.workers[step_name].collected_waiters
-        for wait_condition in wait_conditions:
-            is_match = event_matches(
-                tick.event,
-                wait_condition.waiting_for_event,
-                allow_subclasses=step_config.accept_event_subclasses,
-            )
-            is_match = is_match and all(
-                getattr(tick.event, k, None) == v
-                for k, v in wait_condition.requirements.items()
+    # The waiter index narrows the candidates to waiters for the event's type
+    # (or a base type, for subclass-accepting steps) with equal requirements.
+    for step_name, wait_condition in state.waiters_matching(tick.event):
+        waiter_resolved_steps.add(step_name)
+        worker_state = state.workers[step_name]
+        worker_state.collected_waiters[wait_condition.waiter_id] = replace(
+            wait_condition, resolved_event=tick.event
+        )
+        # Resume re-delivers the suspended work item whole from the
+        # waiter record: original trigger, stream scope, collect batch.
+        commands.extend(
+            _add_or_enqueue_event(
+                EventAttempt(
+                    event=wait_condition.event,
+                    bound_events=wait_condition.bound_events,
+                    scope_path=wait_condition.scope_path,
+                    collection_release_payload=wait_condition.collection_release_payload,
+                    work_item_id=wait_condition.work_item_id,
+                ),
+                StepId.root(step_name),
+                worker_state,
+                now_seconds,
             )
-            if is_match:
-                waiter_resolved_steps.add(step_name)
-                wait_condition.resolved_event = tick.event
-                # Resume re-delivers the suspended work item whole from the
-                # waiter record: original trigger, stream scope, collect batch.
-                commands.extend(
-                    _add_or_enqueue_event(
-                        EventAttempt(
-                            event=wait_condition.event,
-                            bound_events=wait_condition.bound_events,
-                            scope_path=wait_condition.scope_path,
-                            collection_release_payload=wait_condition.collection_release_payload,
-                            work_item_id=wait_condition.work_item_id,
-                        ),
-                        step_id,
-                        state.workers[step_name],
-                        now_seconds,
-                    )
-                )
+        )
     return commands, waiter_resolved_steps
 
 
@@ -1518,14 +1500,11 @@ def _process_waiter_timeout_tick(
     if step_name not in state.workers:
         return state, commands
     worker_state = state.workers[step_name]
-    waiter = next(
-        (w for w in worker_state.collected_waiters if w.waiter_id == tick.waiter_id),
-        None,
-    )
+    waiter = worker_state.collected_waiters.get(tick.waiter_id)
     # Only act if the waiter is still pending (not yet resolved by an event)
     if waiter is None or waiter.resolved_event is not None:
         return state, commands
-    waiter.timed_out = True
+    worker_state.collected_waiters[tick.waiter_id] = replace(waiter, timed_out=True)
     # Timeout resumes the suspended work item whole, like waiter resolution.
     subcommands = _add_or_enqueue_event(
         EventAttempt(
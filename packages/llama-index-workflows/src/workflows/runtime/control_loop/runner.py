@@ -6,7 +6,9 @@ from __future__ import annotations
 import asyncio
 import heapq
 import logging
-from typing import TYPE_CHECKING
+from collections import deque
+from functools import partial
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
 
 from workflows.errors import (
     WorkflowRuntimeError,
@@ -36,6 +38,7 @@ from workflows.runtime.types.named_task import (
     PendingStart,
     PendingWorker,
     PullTask,
+    RunningTasks,
     WorkerTask,
 )
 from workflows.runtime.types.plugin import (
@@ -75,6 +78,8 @@ from workflows.runtime.control_loop.reduce import (
 
 logger = logging.getLogger("workflows.runtime.control_loop")
 
+T = TypeVar("T")
+
 
 def _is_shutdown_error(e: BaseException) -> bool:
     if isinstance(e, (asyncio.CancelledError, KeyboardInterrupt)):
@@ -97,6 +102,20 @@ async def _single_pull(adapter: InternalRunAdapter) -> WorkflowTick | None:
     return None
 
 
+async def _noting_finish(running: RunningTasks, fn: Callable[[], Awaitable[T]]) -> T:
+    """Run ``fn``, then mark the current task finished in ``running``.
+
+    Takes a callable rather than a coroutine so that closing a never-started
+    pending coroutine does not leave an un-awaited inner one behind.
+    """
+    try:
+        return await fn()
+    finally:
+        task = asyncio.current_task()
+        if task is not None:
+            running.note_finished(task)
+
+
 class _ControlLoopRunner:
     """
     Private class to encapsulate the async control loop runtime state and behavior.
@@ -121,12 +140,11 @@ class _ControlLoopRunner:
         self.context = context
         self.step_workers = step_workers
         self.state = init_state
-        self.worker_tasks: set[asyncio.Task[TickStepResult]] = set()
-        # Transient tick buffer - drained synchronously at start of each loop iteration
-        self.tick_buffer: list[WorkflowTick] = []
-        # Pending items to be processed (from rehydration or delayed ticks)
-        for tick in self.state.rehydrate_with_ticks():
-            self.tick_buffer.append(tick)
+        # Started worker and pull tasks, with their completions queued as they happen
+        self.running = RunningTasks()
+        # Transient tick buffer - drained synchronously at start of each loop iteration.
+        # Seeded with pending items from rehydration.
+        self.tick_buffer: deque[WorkflowTick] = deque(self.state.rehydrate_with_ticks())
         # Scheduled wakeups: heap of (wakeup_time, sequence, tick) tuples
         # The sequence counter ensures deterministic ordering when timestamps are equal,
         # avoiding TypeError from comparing WorkflowTick objects that don't implement __lt__
@@ -134,8 +152,6 @@ class _ControlLoopRunner:
         self._wakeup_sequence = 0
         # Pull task sequence counter for deterministic journaling
         self._pull_sequence = 0
-        # Map from worker task to (step_id, worker_id) key
-        self._task_keys: dict[asyncio.Task[TickStepResult], tuple[StepId, int]] = {}
         # Whether a TickIdleCheck is currently in tick_buffer
         self._idle_check_pending = False
         # Pending worker coroutines not yet started (started by adapter in wait_for_next_task)
@@ -234,7 +250,11 @@ class _ControlLoopRunner:
                 )
 
         self._pending_workers.append(
-            PendingWorker(command.step_id, command.id, _run_worker())
+            PendingWorker(
+                command.step_id,
+                command.id,
+                _noting_finish(self.running, _run_worker),
+            )
         )
 
     def _stamp_retry_decisions(
@@ -335,20 +355,21 @@ class _ControlLoopRunner:
             pass
 
         # Cancel worker tasks
-        for task in self.worker_tasks:
+        worker_tasks = [nt.task for nt in self.running if isinstance(nt, WorkerTask)]
+        for task in worker_tasks:
             task.cancel()
 
         try:
-            if self.worker_tasks:
+            if worker_tasks:
                 await asyncio.wait_for(
-                    asyncio.gather(*self.worker_tasks, return_exceptions=True),
+                    asyncio.gather(*worker_tasks, return_exceptions=True),
                     timeout=0.5,
                 )
         except Exception:
             pass
 
-        self.worker_tasks.clear()
-        self._task_keys.clear()
+        for task in worker_tasks:
+            self.running.discard(task)
 
     async def run(
         self, start_event: Event | None = None, start_with_timeout: bool = True
@@ -407,7 +428,7 @@ class _ControlLoopRunner:
                 was_buffered = bool(self.tick_buffer)
                 # Drain and process buffered ticks first (from rehydration, queue_tick, etc.)
                 while self.tick_buffer:
-                    tick = self.tick_buffer.pop(0)
+                    tick = self.tick_buffer.popleft()
                     if isinstance(tick, TickIdleCheck):
                         if self.tick_buffer:
                             self.tick_buffer.append(tick)
@@ -424,31 +445,24 @@ class _ControlLoopRunner:
                 # Calculate timeout for next scheduled wakeup
                 timeout = self.next_wakeup_timeout(now)
 
-                # Build pending list: new workers + pull if needed
-                pending: list[PendingStart] = list(self._pending_workers)
-                self._pending_workers.clear()
+                # Hand over new workers + pull if needed
+                pending: list[PendingStart] = self._pending_workers
+                self._pending_workers = []
 
                 if pull_task is None:
                     pull_sequence = self._pull_sequence
                     self._pull_sequence += 1
                     pending.append(
-                        PendingPull(pull_sequence, _single_pull(self.adapter))
+                        PendingPull(
+                            pull_sequence,
+                            _noting_finish(
+                                self.running, partial(_single_pull, self.adapter)
+                            ),
+                        )
                     )
-                else:
-                    pull_sequence = self._pull_sequence - 1
-
-                # Build running list from existing tasks
-                running: list[WorkerTask | PullTask] = [
-                    WorkerTask(key[0], key[1], task)
-                    for task in self.worker_tasks
-                    for key in [self._task_keys.get(task)]
-                    if key is not None
-                ]
-                if pull_task is not None:
-                    running.append(PullTask(pull_sequence, pull_task))
 
                 result = await self.adapter.wait_for_next_task(
-                    running, pending, timeout
+                    self.running, pending, timeout
                 )
 
                 if len(result.started) != len(pending):
@@ -460,13 +474,13 @@ class _ControlLoopRunner:
 
                 # Merge started tasks into tracking
                 for nt in result.started:
+                    self.running.add(nt)
                     if isinstance(nt, PullTask):
                         pull_task = nt.task
-                    elif isinstance(nt, WorkerTask):
-                        self.worker_tasks.add(nt.task)
-                        self._task_keys[nt.task] = (nt.step_id, nt.worker_id)
 
                 completed_task = result.completed
+                if completed_task is not None:
+                    self.running.discard(completed_task)
 
                 if completed_task is None:
                     # Timeout - process scheduled ticks
@@ -491,8 +505,6 @@ class _ControlLoopRunner:
                             self.tick_buffer.append(pull_tick)
                 else:
                     # Worker task completed
-                    self.worker_tasks.discard(completed_task)
-                    self._task_keys.pop(completed_task, None)
                     try:
                         tick_result = completed_task.result()
                     except asyncio.CancelledError:
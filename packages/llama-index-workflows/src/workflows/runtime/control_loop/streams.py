@@ -85,7 +85,7 @@ def _detect_stuck_streams(
         and not waiter.timed_out
         and any(sid in state.streams for sid in waiter.scope_path)
         for worker_state in state.workers.values()
-        for waiter in worker_state.collected_waiters
+        for waiter in worker_state.collected_waiters.values()
     )
     if has_in_stream_waiter:
         return None
@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Bounded buffering for a run's published event stream.
+
+By default every event a run publishes (``ctx.write_event_to_stream``, step
+state changes, ``InputRequiredEvent``...) is buffered until a consumer reads
+it from ``handler.stream_events()``. A step that streams faster than its
+consumer, or a run nobody streams, grows that buffer without limit.
+
+A ``StreamBufferPolicy`` bounds the buffer and picks what happens when it is
+full:
+
+* ``"block"``: a step that awaits ``ctx.write_event_to_stream(ev)`` is
+  suspended until the consumer makes room. Writes that are not awaited wait
+  in the background instead, and the step is held when it returns until they
+  are buffered. Events published by the control loop itself are never
+  delayed, so the buffer may briefly exceed its bound by those.
+* ``"drop_oldest"``: the oldest droppable event is discarded.
+* ``"coalesce"``: the newest buffered event of the same type is replaced
+  (the replacement goes to the back, keeping publish order); when there is
+  none, the oldest droppable event is discarded.
+
+``StopEvent`` (and its subclasses) and ``InputRequiredEvent`` are never
+dropped, coalesced, or blocked on: the first ends the stream and the second
+asks the consumer for input the run is waiting on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+from workflows.events import Event, InputRequiredEvent, StopEvent
+
+StreamOverflow = Literal["block", "drop_oldest", "coalesce"]
+
+_OVERFLOW_POLICIES: tuple[StreamOverflow, ...] = ("block", "drop_oldest", "coalesce")
+
+
+@dataclass(frozen=True)
+class StreamBufferPolicy:
+    """Bound on a run's published-event buffer.
+
+    Args:
+        max_events: Maximum number of buffered events before ``overflow``
+            applies. Must be at least 1.
+        overflow: ``"block"``, ``"drop_oldest"``, or ``"coalesce"``.
+    """
+
+    max_events: int
+    overflow: StreamOverflow = "block"
+
+    def __post_init__(self) -> None:
+        if isinstance(self.max_events, bool) or not isinstance(self.max_events, int):
+            raise ValueError("max_events must be an integer")
+        if self.max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        if self.overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {', '.join(_OVERFLOW_POLICIES)}, "
+                f"got {self.overflow!r}"
+            )
+
+
+@dataclass(frozen=True)
+class PublishBufferStats:
+    """Point-in-time snapshot of a publish buffer, for metrics export."""
+
+    size: int
+    max_events: int | None
+    high_water_mark: int
+    published_total: int
+    dropped_total: int
+    coalesced_total: int
+    blocked_total: int
+
+
+def _is_protected(event: Event) -> bool:
+    return isinstance(event, (StopEvent, InputRequiredEvent))
+
+
+def _wakeup_next(waiters: deque[asyncio.Future[None]]) -> None:
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
+
+
+class PublishBuffer:
+    """FIFO of published events, optionally bounded by a ``StreamBufferPolicy``.
+
+    Exposes the subset of the ``asyncio.Queue`` API the asyncio adapters use.
+    Without a policy it behaves like an unbounded queue.
+    """
+
+    def __init__(self, policy: StreamBufferPolicy | None = None) -> None:
+        self._policy = policy
+        self._items: deque[Event] = deque()
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._putters: deque[asyncio.Future[None]] = deque()
+        self._high_water_mark = 0
+        self._published_total = 0
+        self._dropped_total = 0
+        self._coalesced_total = 0
+        self._blocked_total = 0
+        # writers inside ``put`` that are waiting or were woken but not resumed
+        self._blocked_writers = 0
+
+    @property
+    def policy(self) -> StreamBufferPolicy | None:
+        return self._policy
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return self._policy is not None and len(self._items) >= self._policy.max_events
+
+    def stats(self) -> PublishBufferStats:
+        return PublishBufferStats(
+            size=len(self._items),
+            max_events=self._policy.max_events if self._policy else None,
+            high_water_mark=self._high_water_mark,
+            published_total=self._published_total,
+            dropped_total=self._dropped_total,
+            coalesced_total=self._coalesced_total,
+            blocked_total=self._blocked_total,
+        )
+
+    async def put(self, event: Event) -> None:
+        """Buffer ``event``, waiting for room under the ``"block"`` policy.
+
+        Blocked writers are admitted in arrival order, so a step's events
+        keep their order even though each write runs as its own task.
+        """
+        if self._may_block(event) and (self.full() or self._blocked_writers):
+            self._blocked_total += 1
+            self._blocked_writers += 1
+            try:
+                requeue = False
+                while True:
+                    putter = asyncio.get_running_loop().create_future()
+                    if requeue:
+                        # Woken, but the buffer refilled: keep our place.
+                        self._putters.appendleft(putter)
+                    else:
+                        self._putters.append(putter)
+                    requeue = True
+                    try:
+                        await putter
+                    except BaseException:
+                        putter.cancel()
+                        try:
+                            self._putters.remove(putter)
+                        except ValueError:
+                            pass
+                        if not self.full() and not putter.cancelled():
+                            # We were woken but are leaving; pass the slot on.
+                            _wakeup_next(self._putters)
+                        raise
+                    if not self.full():
+                        break
+            finally:
+                self._blocked_writers -= 1
+        self.put_nowait(event)
+        if not self.full():
+            _wakeup_next(self._putters)
+
+    def put_nowait(self, event: Event) -> None:
+        """Buffer ``event`` without waiting.
+
+        Under the ``"block"`` policy this admits the event over the bound;
+        callers that may wait should use ``put``.
+        """
+        if self.full() and not _is_protected(event):
+            assert self._policy is not None
+            if self._policy.overflow == "coalesce" and self._coalesce(event):
+                self._coalesced_total += 1
+            elif self._policy.overflow != "block":
+                self._drop_oldest()
+        self._items.append(event)
+        self._published_total += 1
+        self._high_water_mark = max(self._high_water_mark, len(self._items))
+        _wakeup_next(self._getters)
+
+    async def get(self) -> Event:
+        while not self._items:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if self._items and not getter.cancelled():
+                    _wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def get_nowait(self) -> Event:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        event = self._items.popleft()
+        _wakeup_next(self._putters)
+        return event
+
+    def _may_block(self, event: Event) -> bool:
+        return (
+            self._policy is not None
+            and self._policy.overflow == "block"
+            and not _is_protected(event)
+        )
+
+    def _coalesce(self, event: Event) -> bool:
+        """Drop the newest buffered event of ``event``'s type, if any."""
+        event_type = type(event)
+        for index in range(len(self._items) - 1, -1, -1):
+            if type(self._items[index]) is event_type:
+                del self._items[index]
+                return True
+        return False
+
+    def _drop_oldest(self) -> None:
+        for index, buffered in enumerate(self._items):
+            if not _is_protected(buffered):
+                del self._items[index]
+                self._dropped_total += 1
+                return
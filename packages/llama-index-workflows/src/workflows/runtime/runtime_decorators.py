@@ -10,6 +10,7 @@ every method to it. Subclasses override only the methods they need to customise.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from contextlib import contextmanager
 from typing import Any, AsyncGenerator, Generator
 
@@ -20,8 +21,9 @@ from workflows.events import (
     StartEvent,
     StopEvent,
 )
+from workflows.runtime.publish_buffer import PublishBufferStats
 from workflows.runtime.types.internal_state import BrokerState
-from workflows.runtime.types.named_task import NamedTask, PendingStart
+from workflows.runtime.types.named_task import NamedTask, PendingStart, RunningTasks
 from workflows.runtime.types.plugin import (
     ExternalRunAdapter,
     InternalRunAdapter,
@@ -154,7 +156,7 @@ class BaseInternalRunAdapterDecorator(InternalRunAdapter):
 
     async def wait_for_next_task(
         self,
-        running: list[NamedTask],
+        running: RunningTasks | Sequence[NamedTask],
         pending: list[PendingStart],
         timeout: float | None = None,
     ) -> WaitForNextTaskResult:
@@ -194,3 +196,6 @@ class BaseExternalRunAdapterDecorator(ExternalRunAdapter):
         self, namespace: tuple[str, ...] = ()
     ) -> StateStore[Any] | None:
         return self._decorated.get_state_store(namespace)
+
+    def publish_buffer_stats(self) -> PublishBufferStats | None:
+        return self._decorated.publish_buffer_stats()
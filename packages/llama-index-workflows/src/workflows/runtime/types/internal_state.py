@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+import heapq
 import importlib
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
@@ -26,6 +27,7 @@ from workflows.decorators import CatchErrorHandler, StepConfig
 from workflows.events import Event
 from workflows.retry_policy import RetryPolicy
 from workflows.runtime.types.results import (
+    CollectedEventsView,
     CollectionReleasePayload,
     StepWorkerState,
     StepWorkerWaiter,
@@ -94,6 +96,175 @@ class CollectionReleaseState:
         return dataclasses.replace(self, buffer=list(self.buffer))
 
 
+_WaiterKey = tuple[str, str]  # (step_name, waiter_id)
+
+
+@dataclass(frozen=True)
+class _WaiterIndexEntry:
+    event_type: type
+    requirement_names: tuple[str, ...]
+    # None when a requirement value is unhashable
+    requirement_values: tuple[Any, ...] | None
+    requirements: dict[str, Any]
+    seq: int
+
+
+class WaiterIndex:
+    """
+    Lookup of active waiters by awaited event type and requirement values.
+
+    Waiters are bucketed by ``waiting_for_event``, then by the sorted names of
+    their requirements, then by the requirement values, so resolving an event
+    costs one hash lookup per distinct set of requirement names rather than a
+    scan of every waiter. Waiters with unhashable requirement values fall back
+    to a per-type list that is checked linearly.
+
+    The index is derived from the workers' ``collected_waiters``: it is not
+    serialized, and ``BrokerState.from_serialized`` rebuilds it. Copies share
+    storage until one of them is mutated, so copying broker state on every tick
+    stays cheap while the set of waiters is unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[_WaiterKey, _WaiterIndexEntry] = {}
+        self._buckets: dict[
+            type, dict[tuple[str, ...], dict[tuple[Any, ...], set[_WaiterKey]]]
+        ] = {}
+        self._unhashable: dict[type, set[_WaiterKey]] = {}
+        self._seq = 0
+        self._shared = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def _copy(self) -> WaiterIndex:
+        copy = WaiterIndex()
+        copy._entries = self._entries
+        copy._buckets = self._buckets
+        copy._unhashable = self._unhashable
+        copy._seq = self._seq
+        copy._shared = self._shared = True
+        return copy
+
+    def _unshare(self) -> None:
+        if not self._shared:
+            return
+        self._entries = dict(self._entries)
+        self._buckets = {
+            event_type: {
+                names: {values: set(keys) for values, keys in by_values.items()}
+                for names, by_values in by_names.items()
+            }
+            for event_type, by_names in self._buckets.items()
+        }
+        self._unhashable = {
+            event_type: set(keys) for event_type, keys in self._unhashable.items()
+        }
+        self._shared = False
+
+    def add(self, step_name: str, waiter: StepWorkerWaiter) -> None:
+        """Index ``waiter``, replacing any entry with the same id for the step."""
+        self._unshare()
+        key = (step_name, waiter.waiter_id)
+        previous = self._entries.get(key)
+        if previous is not None:
+            self._discard(key, previous)
+            seq = previous.seq
+        else:
+            self._seq += 1
+            seq = self._seq
+        names = tuple(sorted(waiter.requirements))
+        values: tuple[Any, ...] | None = tuple(
+            waiter.requirements[name] for name in names
+        )
+        try:
+            hash(values)
+        except TypeError:
+            values = None
+        entry = _WaiterIndexEntry(
+            event_type=waiter.waiting_for_event,
+            requirement_names=names,
+            requirement_values=values,
+            requirements=dict(waiter.requirements),
+            seq=seq,
+        )
+        self._entries[key] = entry
+        if values is None:
+            self._unhashable.setdefault(entry.event_type, set()).add(key)
+        else:
+            self._buckets.setdefault(entry.event_type, {}).setdefault(
+                names, {}
+            ).setdefault(values, set()).add(key)
+
+    def remove(self, step_name: str, waiter_id: str) -> None:
+        key = (step_name, waiter_id)
+        if key not in self._entries:
+            return
+        self._unshare()
+        self._discard(key, self._entries.pop(key))
+
+    def clear(self) -> None:
+        self._entries = {}
+        self._buckets = {}
+        self._unhashable = {}
+        self._shared = False
+
+    def _discard(self, key: _WaiterKey, entry: _WaiterIndexEntry) -> None:
+        if entry.requirement_values is None:
+            keys = self._unhashable[entry.event_type]
+            keys.discard(key)
+            if not keys:
+                del self._unhashable[entry.event_type]
+            return
+        by_names = self._buckets[entry.event_type]
+        by_values = by_names[entry.requirement_names]
+        keys = by_values[entry.requirement_values]
+        keys.discard(key)
+        if not keys:
+            del by_values[entry.requirement_values]
+            if not by_values:
+                del by_names[entry.requirement_names]
+                if not by_names:
+                    del self._buckets[entry.event_type]
+
+    def matches(
+        self, event: Event, subclass_steps: frozenset[str] | set[str]
+    ) -> list[_WaiterKey]:
+        """Keys of the waiters ``event`` satisfies, in insertion order.
+
+        A waiter for a base class of the event only matches when its step is
+        in ``subclass_steps`` (steps declared with ``accept_event_subclasses``).
+        """
+        found: list[_WaiterKey] = []
+        for depth, event_type in enumerate(type(event).__mro__):
+            exact = depth == 0
+            for names, by_values in self._buckets.get(event_type, {}).items():
+                probe = tuple(getattr(event, name, None) for name in names)
+                try:
+                    keys = by_values.get(probe, ())
+                except TypeError:
+                    # An unhashable attribute can still compare equal to a
+                    # requirement value (e.g. a set and a frozenset).
+                    keys = [
+                        key
+                        for values, group in by_values.items()
+                        if values == probe
+                        for key in group
+                    ]
+                found.extend(key for key in keys if exact or key[0] in subclass_steps)
+            for key in self._unhashable.get(event_type, ()):
+                if not exact and key[0] not in subclass_steps:
+                    continue
+                requirements = self._entries[key].requirements
+                if all(getattr(event, k, None) == v for k, v in requirements.items()):
+                    found.append(key)
+        found.sort(key=lambda key: self._entries[key].seq)
+        return found
+
+
 @dataclass()
 class BrokerState:
     """
@@ -108,6 +279,8 @@ class BrokerState:
         stream_seq: Monotonic counter used to mint deterministic collection stream ids
         streams: Open collection streams keyed by stream id
         collection_release_states: Per-binding release buffers keyed by stream and binding
+        waiter_index: Index over every worker's collected_waiters. Add and remove
+            waiters through add_waiter/remove_waiter so the two stay in sync.
     """
 
     is_running: bool
@@ -119,6 +292,42 @@ class BrokerState:
     collection_release_states: dict[str, CollectionReleaseState] = field(
         default_factory=dict
     )
+    # derived from the workers' collected_waiters, which equality already covers
+    waiter_index: WaiterIndex = field(
+        default_factory=WaiterIndex, compare=False, repr=False
+    )
+
+    def add_waiter(self, step_name: str, waiter: StepWorkerWaiter) -> None:
+        """Add or replace (by waiter_id) a waiter on ``step_name``."""
+        self.workers[step_name].collected_waiters[waiter.waiter_id] = waiter
+        self.waiter_index.add(step_name, waiter)
+
+    def remove_waiter(self, step_name: str, waiter_id: str) -> None:
+        self.workers[step_name].collected_waiters.pop(waiter_id, None)
+        self.waiter_index.remove(step_name, waiter_id)
+
+    def clear_waiters(self) -> None:
+        for worker in self.workers.values():
+            worker.collected_waiters.clear()
+        self.waiter_index.clear()
+
+    def waiters_matching(self, event: Event) -> list[tuple[str, StepWorkerWaiter]]:
+        """Waiters ``event`` satisfies as ``(step_name, waiter)`` pairs.
+
+        Ordered like a scan of ``config.steps`` and then each step's waiters.
+        """
+        subclass_steps = {
+            name
+            for name, step_config in self.config.steps.items()
+            if step_config.accept_event_subclasses
+        }
+        step_order = {name: i for i, name in enumerate(self.config.steps)}
+        matched = [
+            (step_name, self.workers[step_name].collected_waiters[waiter_id])
+            for step_name, waiter_id in self.waiter_index.matches(event, subclass_steps)
+        ]
+        matched.sort(key=lambda pair: step_order.get(pair[0], len(step_order)))
+        return matched
 
     def deepcopy(self) -> BrokerState:
         """
@@ -138,6 +347,7 @@ class BrokerState:
                 key: state._copy()
                 for key, state in self.collection_release_states.items()
             },
+            waiter_index=self.waiter_index._copy(),
         )
 
     @staticmethod
@@ -166,7 +376,7 @@ class BrokerState:
                     in_progress=[],
                     collected_events={},
                     static_collect_events=[],
-                    collected_waiters=[],
+                    collected_waiters={},
                 )
                 for name, step_func in workflow._get_steps().items()
             },
@@ -179,7 +389,7 @@ class BrokerState:
         commands: list[WorkflowTick] = []
         for step_name, worker_state in sorted(self.workers.items(), key=lambda x: x[0]):
             for waiter in sorted(
-                worker_state.collected_waiters, key=lambda x: x.waiter_id
+                worker_state.collected_waiters.values(), key=lambda x: x.waiter_id
             ):
                 if waiter.has_requirements and not waiter.requirements:
                     # Re-ping the step with its whole work record so the
@@ -279,7 +489,7 @@ class BrokerState:
                     ),
                     work_item_id=waiter.work_item_id,
                 )
-                for waiter in worker_state.collected_waiters
+                for waiter in worker_state.collected_waiters.values()
             ]
 
             workers_dict[step_name] = SerializedStepWorkerState(
@@ -384,12 +594,12 @@ class BrokerState:
             ]
 
             # Restore waiters
-            worker.collected_waiters = []
             for waiter_data in worker_data.collected_waiters:
                 waiter_payload = _deserialize_release_payload(
                     waiter_data.collection_release_payload, serializer
                 )
-                worker.collected_waiters.append(
+                base_state.add_waiter(
+                    step_name,
                     StepWorkerWaiter(
                         waiter_id=waiter_data.waiter_id,
                         bound_events={
@@ -417,7 +627,7 @@ class BrokerState:
                         scope_path=tuple(waiter_data.scope_path),
                         collection_release_payload=waiter_payload,
                         work_item_id=waiter_data.work_item_id,
-                    )
+                    ),
                 )
 
         return base_state
@@ -631,25 +841,68 @@ class InternalStepWorkerState:
         queue: Events waiting to be processed by this step
         config: Step configuration (includes retry policy, num_workers, etc.)
         in_progress: Currently executing workers for this step
-        collected_events: Events being collected via ctx.collect_events(), keyed by buffer_id
-        collected_waiters: Active waiters created by ctx.wait_for_event()
+        collected_events: Events being collected via ctx.collect_events(), keyed by buffer_id.
+            Copies share buffers as CollectedEventsView; mutate through
+            collected_events_buffer.
+        collected_waiters: Active waiters created by ctx.wait_for_event(), keyed by
+            waiter_id. Indexed by BrokerState.waiter_index; mutate through
+            BrokerState.add_waiter/remove_waiter.
+        free_worker_ids: Min-heap of worker ids not used by in_progress. Derived;
+            use claim_worker_id/release_worker_id.
     """
 
     queue: list[EventAttempt]
     config: StepConfig
     in_progress: list[InProgressState]
-    collected_events: dict[str, list[Event]]
-    collected_waiters: list[StepWorkerWaiter]
+    collected_events: dict[str, list[Event] | CollectedEventsView]
+    collected_waiters: dict[str, StepWorkerWaiter]
     static_collect_events: list[Event] = field(default_factory=list)
+    free_worker_ids: list[int] = field(default_factory=list, compare=False, repr=False)
+
+    def claim_worker_id(self) -> int:
+        """Take the smallest worker id not in use. Requires a free worker slot."""
+        if len(self.free_worker_ids) + len(self.in_progress) != self.config.num_workers:
+            # First claim, or the free list was reset (rewind) or in_progress
+            # was edited without claiming/releasing: rebuild from in_progress.
+            used = {w.worker_id for w in self.in_progress}
+            self.free_worker_ids = [
+                i for i in range(self.config.num_workers) if i not in used
+            ]
+        return heapq.heappop(self.free_worker_ids)
+
+    def release_worker_id(self, worker_id: int) -> None:
+        heapq.heappush(self.free_worker_ids, worker_id)
+
+    def collected_events_buffer(self, buffer_id: str) -> list[Event]:
+        """The appendable collect buffer for ``buffer_id``, created if missing.
+
+        A shared buffer is taken over in place by the first copy of the state
+        to append to it; a copy whose view has fallen behind copies it first.
+        """
+        events = self.collected_events.get(buffer_id)
+        if isinstance(events, list):
+            return events
+        owned = None if events is None else events.appendable()
+        if owned is None:
+            owned = [] if events is None else list(events)
+        self.collected_events[buffer_id] = owned
+        return owned
 
     def _deepcopy(self) -> InternalStepWorkerState:
+        # collect buffers are only appended to, so a prefix view is a stable
+        # copy. Both sides hold views; the first to append reuses the list
+        # and the other copies it on its next append.
+        shared = {k: CollectedEventsView(v) for k, v in self.collected_events.items()}
+        self.collected_events = dict(shared)
         return InternalStepWorkerState(
             queue=[dataclasses.replace(x) for x in self.queue],
             config=self.config,
             in_progress=[x._deepcopy() for x in self.in_progress],
-            collected_events={k: list(v) for k, v in self.collected_events.items()},
+            collected_events=shared,
             static_collect_events=list(self.static_collect_events),
-            collected_waiters=[dataclasses.replace(x) for x in self.collected_waiters],
+            # waiters are replaced, never mutated, once they are in state
+            collected_waiters=dict(self.collected_waiters),
+            free_worker_ids=list(self.free_worker_ids),
         )
 
 
@@ -692,7 +945,8 @@ class InProgressState:
             event=self.event,
             bound_events=dict(self.bound_events) if self.bound_events else None,
             worker_id=self.worker_id,
-            shared_state=self.shared_state._deepcopy(),
+            # snapshots are immutable
+            shared_state=self.shared_state,
             attempts=self.attempts,
             first_attempt_at=self.first_attempt_at,
             last_exception=self.last_exception,
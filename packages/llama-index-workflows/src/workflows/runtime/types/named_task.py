@@ -5,8 +5,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 from asyncio import Task
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from typing import Any, Coroutine
 
@@ -44,21 +46,29 @@ class PullTask:
 NamedTask = WorkerTask | PullTask
 
 
-def all_tasks(named_tasks: Sequence[NamedTask]) -> set[Task[Any]]:
+def all_tasks(named_tasks: Iterable[NamedTask]) -> set[Task[Any]]:
     """Extract all tasks for use with asyncio.wait."""
     return {nt.task for nt in named_tasks}
 
 
-def find_by_key(named_tasks: Sequence[NamedTask], key: str) -> Task[Any] | None:
+def find_by_key(
+    named_tasks: RunningTasks | Sequence[NamedTask], key: str
+) -> Task[Any] | None:
     """Find a task by its key, returns None if not found."""
+    if isinstance(named_tasks, RunningTasks):
+        return named_tasks.find_by_key(key)
     for nt in named_tasks:
         if nt.key == key:
             return nt.task
     return None
 
 
-def get_key(named_tasks: Sequence[NamedTask], task: Task[Any]) -> str:
+def get_key(named_tasks: RunningTasks | Sequence[NamedTask], task: Task[Any]) -> str:
     """Get the key for a task. Raises KeyError if not found."""
+    if isinstance(named_tasks, RunningTasks):
+        if task not in named_tasks:
+            raise KeyError(f"Task {task} not found")
+        return named_tasks.key_of(task)
     for nt in named_tasks:
         if nt.task is task:
             return nt.key
@@ -72,6 +82,8 @@ def pick_highest_priority(
 
     Priority is determined by list order - tasks earlier in the list
     have higher priority. Workers should be listed before pull.
+    ``RunningTasks.pop_done`` hands out finished tasks with this priority
+    without scanning the list.
 
     Returns None if done is empty.
     Raises ValueError if done is non-empty but no tasks match (indicates bug).
@@ -121,3 +133,140 @@ class PendingPull:
 
 
 PendingStart = PendingWorker | PendingPull
+
+
+class RunningTasks:
+    """Started tasks awaiting completion, tracked across control loop iterations.
+
+    Each task gets a single done callback when it is added, which queues it as
+    finished. Finding the next completed task therefore costs O(log n) instead
+    of re-registering callbacks on every running task, as ``asyncio.wait``
+    would. Finished tasks are handed out with the same priority as
+    ``pick_highest_priority``: workers before a pull, then in start order.
+
+    A task's own coroutine may call ``note_finished`` as its last action, so
+    the task counts as finished as soon as it is done rather than once its
+    done callback has run. This matches ``asyncio.wait``, which inspects
+    ``done()`` when it wakes up.
+    """
+
+    def __init__(self, named_tasks: Iterable[NamedTask] = ()) -> None:
+        self._by_task: dict[Task[Any], tuple[int, NamedTask]] = {}
+        self._by_key: dict[str, Task[Any]] = {}
+        self._next_seq = 0
+        # heap of (is_pull, start sequence, task); sequences are unique
+        self._done: list[tuple[bool, int, Task[Any]]] = []
+        self._queued: set[Task[Any]] = set()
+        self._waiter: asyncio.Future[None] | None = None
+        for named in named_tasks:
+            self.add(named)
+
+    def __len__(self) -> int:
+        return len(self._by_task)
+
+    def __iter__(self) -> Iterator[NamedTask]:
+        return iter([named for _, named in self._by_task.values()])
+
+    def __contains__(self, task: object) -> bool:
+        return task in self._by_task
+
+    def add(self, named: NamedTask) -> None:
+        """Track a started task. Adding an already tracked task is a no-op."""
+        if named.task in self._by_task:
+            return
+        self._by_task[named.task] = (self._next_seq, named)
+        self._next_seq += 1
+        self._by_key[named.key] = named.task
+        named.task.add_done_callback(self._on_done)
+
+    def discard(self, task: Task[Any]) -> None:
+        """Stop tracking a task, e.g. once its completion was processed."""
+        entry = self._by_task.pop(task, None)
+        if entry is None:
+            return
+        key = entry[1].key
+        if self._by_key.get(key) is task:
+            del self._by_key[key]
+        self._queued.discard(task)
+        task.remove_done_callback(self._on_done)
+        # Tasks discarded without being handed out (replay, cleanup) leave
+        # stale heap entries behind; compact before they outgrow the live set.
+        if len(self._done) > 2 * len(self._by_task) + 64:
+            self._done = [item for item in self._done if item[2] in self._by_task]
+            heapq.heapify(self._done)
+
+    def key_of(self, task: Task[Any]) -> str:
+        """Get the key for a task. Raises KeyError if not tracked."""
+        return self._by_task[task][1].key
+
+    def find_by_key(self, key: str) -> Task[Any] | None:
+        """Find a task by its key, returns None if not found."""
+        return self._by_key.get(key)
+
+    def note_finished(self, task: Task[Any]) -> None:
+        """Queue ``task`` as finished ahead of its done callback.
+
+        Must only be called from the task itself, with no await between the
+        call and the end of its coroutine.
+        """
+        self._queue_finished(task)
+
+    def pop_done(self) -> Task[Any] | None:
+        """Return the next finished task not yet handed out, if any.
+
+        The task stays tracked until it is discarded.
+        """
+        while self._done:
+            _, _, task = heapq.heappop(self._done)
+            if task in self._by_task:
+                return task
+        return None
+
+    def pop_all_done(self) -> list[Task[Any]]:
+        """Return every finished task not yet handed out, in hand-out order."""
+        tasks: list[Task[Any]] = []
+        while (task := self.pop_done()) is not None:
+            tasks.append(task)
+        return tasks
+
+    async def wait_done(self, timeout: float | None = None) -> Task[Any] | None:
+        """Wait up to ``timeout`` seconds for a finished task (see ``pop_done``).
+
+        Returns None on timeout, or immediately when nothing is tracked.
+        """
+        task = self.pop_done()
+        if task is not None or not self._by_task:
+            return task
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        # Await the waiter directly (not via asyncio.wait) so a completion
+        # wakes the caller as soon as asyncio.wait would have.
+        timer = (
+            loop.call_later(timeout, _resolve, waiter) if timeout is not None else None
+        )
+        self._waiter = waiter
+        try:
+            await waiter
+        finally:
+            self._waiter = None
+            if timer is not None:
+                timer.cancel()
+        return self.pop_done()
+
+    def _queue_finished(self, task: Task[Any]) -> None:
+        entry = self._by_task.get(task)
+        if entry is None or task in self._queued:
+            return
+        self._queued.add(task)
+        seq, named = entry
+        heapq.heappush(self._done, (isinstance(named, PullTask), seq, task))
+
+    def _on_done(self, task: Task[Any]) -> None:
+        self._queue_finished(task)
+        if self._waiter is not None:
+            _resolve(self._waiter)
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
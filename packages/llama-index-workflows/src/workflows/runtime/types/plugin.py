@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
@@ -27,13 +28,13 @@ from workflows.events import Event, StartEvent, StopEvent
 from workflows.runtime.types.named_task import (
     NamedTask,
     PendingStart,
-    all_tasks,
-    pick_highest_priority,
+    RunningTasks,
 )
 
 if TYPE_CHECKING:
     from workflows.context.context import Context
     from workflows.context.serializers import BaseSerializer
+    from workflows.runtime.publish_buffer import PublishBufferStats
     from workflows.runtime.types.internal_state import BrokerState
     from workflows.runtime.types.step_function import StepWorkerFunction
     from workflows.workflow import Workflow
@@ -211,6 +212,17 @@ class InternalRunAdapter(ABC):
         """
         return False
 
+    def supports_in_place_resume(self) -> bool:
+        """Whether step bodies may stay parked in memory across ``wait_for_event``.
+
+        Steps declared with ``resume_waits_in_place=True`` only do so when this
+        returns True. Adapters that journal operations made inside step bodies
+        and replay them by re-running the body must return False, since a body
+        resumed in place issues those operations in a different order than a
+        replayed one. Default is True.
+        """
+        return True
+
     async def on_tick(self, tick: WorkflowTick) -> None:
         """
         Called whenever a tick event is processed by the control loop.
@@ -233,7 +245,7 @@ class InternalRunAdapter(ABC):
 
     async def wait_for_next_task(
         self,
-        running: list[NamedTask],
+        running: RunningTasks | Sequence[NamedTask],
         pending: list[PendingStart],
         timeout: float | None = None,
     ) -> WaitForNextTaskResult:
@@ -244,7 +256,11 @@ class InternalRunAdapter(ABC):
         function_id acquisition in DBOS).
 
         Args:
-            running: Already-started tasks from previous iterations.
+            running: Started tasks still in flight. The control loop passes a
+                `RunningTasks` it keeps across iterations; newly started tasks
+                should be added to it. A plain sequence of already-started
+                tasks, as passed before `RunningTasks` existed, is still
+                accepted and waited on with `asyncio.wait`.
             pending: Coroutines to start this iteration.
             timeout: Timeout in seconds, None for no timeout.
 
@@ -254,17 +270,30 @@ class InternalRunAdapter(ABC):
         IMPORTANT: Must return at most ONE completed task per call.
         """
         started = [p.start(asyncio.create_task(p.coro)) for p in pending]
-        all_named = running + started
-        tasks = all_tasks(all_named)
-        if not tasks:
-            return WaitForNextTaskResult(None, started)
-        done, _ = await asyncio.wait(
-            tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
-        )
-        completed = pick_highest_priority(all_named, done) if done else None
+        if not isinstance(running, RunningTasks):
+            return WaitForNextTaskResult(
+                await _wait_first_in_order([*running, *started], timeout), started
+            )
+        for named in started:
+            running.add(named)
+        completed = await running.wait_done(timeout)
         return WaitForNextTaskResult(completed, started)
 
 
+async def _wait_first_in_order(
+    named_tasks: list[NamedTask], timeout: float | None
+) -> asyncio.Task[Any] | None:
+    """The first finished task in list order, waiting up to ``timeout``."""
+    if not named_tasks:
+        return None
+    done, _ = await asyncio.wait(
+        {nt.task for nt in named_tasks},
+        timeout=timeout,
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    return next((nt.task for nt in named_tasks if nt.task in done), None)
+
+
 class ExternalRunAdapter(ABC):
     """
     Adapter interface for use OUTSIDE a workflow's control loop.
@@ -348,6 +377,14 @@ class ExternalRunAdapter(ABC):
         """
         return None
 
+    def publish_buffer_stats(self) -> PublishBufferStats | None:
+        """
+        Metrics for this run's in-process buffer of published events.
+
+        Returns None if events are not buffered in process. Default returns None.
+        """
+        return None
+
 
 @dataclass
 class RunContext:
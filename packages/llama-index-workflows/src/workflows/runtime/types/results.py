@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import itertools
 import weakref
+from collections.abc import Iterator, Mapping, Sequence
 from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import (
@@ -13,6 +16,7 @@ from typing import (
     Generic,
     Literal,
     TypeVar,
+    overload,
 )
 
 from pydantic import (
@@ -73,33 +77,98 @@ class StepWorkerContext:
     # add commands here to mutate the internal worker state after step execution
     returns: Returns
     retry: RetryAttempt = dataclasses.field(default_factory=RetryAttempt)
+    # set when the step resumes wait_for_event in place; the parked body reads
+    # the latest invocation's context through it
+    parking: ParkedStep | None = None
+
+
+class CollectedEventsView(Sequence[Event]):
+    """
+    Read-only prefix of a live ctx.collect_events() buffer.
+
+    The control loop only appends to a live buffer (or drops it whole), so the
+    first ``len(view)`` events never change underneath a view. Steps get views
+    instead of copies, making a snapshot O(1) in the buffer size.
+    """
+
+    __slots__ = ("_events", "_length")
+
+    def __init__(self, events: Sequence[Event], length: int | None = None) -> None:
+        if length is None:
+            length = len(events)
+        if isinstance(events, CollectedEventsView):
+            # A view of a view reads the same underlying buffer.
+            length = min(length, events._length)
+            events = events._events
+        self._events = events
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def appendable(self) -> list[Event] | None:
+        """The underlying list if this view covers all of it, else None.
+
+        Appending to it leaves every other view of the buffer a valid prefix.
+        """
+        if isinstance(self._events, list) and self._length == len(self._events):
+            return self._events
+        return None
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Event]: ...
+
+    def __getitem__(self, index: int | slice) -> Event | list[Event]:
+        if isinstance(index, slice):
+            return [self._events[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("collected events index out of range")
+        return self._events[index]
+
+    def __iter__(self) -> Iterator[Event]:
+        return itertools.islice(self._events, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+def snapshot_collected_events(
+    buffers: Mapping[str, Sequence[Event]],
+) -> dict[str, CollectedEventsView]:
+    """Views of every live collect buffer, as handed to a step invocation."""
+    return {
+        buffer_id: CollectedEventsView(events) for buffer_id, events in buffers.items()
+    }
 
 
 @dataclass(frozen=True)
 class StepWorkerState:
     """
     State passed to step functions and returned by step functions.
+
+    Immutable once built: in-progress executions share it rather than copying.
     """
 
     step_name: str
-    collected_events: dict[str, list[Event]]
-    collected_waiters: list[StepWorkerWaiter]
+    collected_events: Mapping[str, Sequence[Event]]
+    # keyed by waiter_id
+    collected_waiters: dict[str, StepWorkerWaiter]
     collection_release_payload: CollectionReleasePayload | None = None
     scope_path: tuple[str, ...] = ()
     work_item_id: str | None = None
 
-    def _deepcopy(self) -> StepWorkerState:
-        return StepWorkerState(
-            step_name=self.step_name,
-            collected_events={k: list(v) for k, v in self.collected_events.items()},
-            collected_waiters=[dataclasses.replace(x) for x in self.collected_waiters],
-            collection_release_payload=self.collection_release_payload._copy()
-            if self.collection_release_payload is not None
-            else None,
-            scope_path=self.scope_path,
-            work_item_id=self.work_item_id,
-        )
-
 
 @dataclass(frozen=True)
 class CollectionReleasePayload:
@@ -184,6 +253,9 @@ SerializableCollectionReleasePayload = Annotated[
 class StepWorkerWaiter(Generic[EventType]):
     """
     Any current waiters for events that are or are not resolved. Upon resolution, step should provide a delete waiter command.
+
+    Waiters held in broker state are shared between state copies, so they are
+    never mutated in place: resolution and timeout swap in an updated copy.
     """
 
     # the waiter id
@@ -238,6 +310,88 @@ class WaitingForEvent(Exception, Generic[EventType]):
 
 StepWorkerStateContextVar = ContextVar[StepWorkerContext]("step_worker")
 
+
+def current_step_worker_context() -> StepWorkerContext:
+    """The step worker context for the running step invocation.
+
+    A body parked across ``wait_for_event`` keeps the context of the
+    invocation that started it; this follows it to the invocation that
+    resumed it.
+
+    Raises:
+        LookupError: If called outside of a step function.
+    """
+    step_ctx = StepWorkerStateContextVar.get()
+    if step_ctx.parking is not None:
+        return step_ctx.parking.step_ctx
+    return step_ctx
+
+
+class ParkedStep:
+    """A step body kept alive across ``wait_for_event`` instead of re-run.
+
+    Used for steps declared with ``resume_waits_in_place=True``. When the body
+    waits for an event that has not arrived, it hands its ``AddWaiter`` to the
+    invoking worker (which returns it to the control loop as usual) and stays
+    suspended. When the control loop re-delivers the work item, the new
+    invocation resumes the body at the await point instead of calling the step
+    function again.
+    """
+
+    step_ctx: StepWorkerContext
+
+    def __init__(self, context: Any) -> None:
+        # Strong reference to the Context the body was started with; the
+        # InternalContextVar only holds a weakref.
+        self.context = context
+        self.body: asyncio.Task[Any] | None = None
+        self.waiter_id: str | None = None
+        self._suspended: asyncio.Future[AddWaiter[Any]] | None = None
+        self._resume: asyncio.Future[None] | None = None
+
+    def begin_invocation(
+        self, step_ctx: StepWorkerContext
+    ) -> asyncio.Future[AddWaiter[Any]]:
+        """Attach a worker invocation. The returned future resolves when the
+        body suspends on a wait."""
+        self.step_ctx = step_ctx
+        self._suspended = asyncio.get_running_loop().create_future()
+        return self._suspended
+
+    def carried_returns(self) -> list[StepFunctionResult]:
+        """Results that only apply once the step completes, so every
+        invocation of the body must repeat them (as a replayed body would)."""
+        return [
+            r
+            for r in self.step_ctx.returns.return_values
+            if isinstance(r, (DeleteWaiter, DeleteCollectedEvent))
+        ]
+
+    async def suspend(self, add: AddWaiter[Any]) -> None:
+        """Called by the body: park until a later invocation resumes it.
+
+        Raises:
+            WaitingForEvent: If the current invocation already has a pending
+                suspension (concurrent waits); the body falls back to the
+                replay behavior.
+        """
+        if self._suspended is None or self._suspended.done():
+            raise WaitingForEvent(add)
+        self.waiter_id = add.waiter_id
+        self._resume = asyncio.get_running_loop().create_future()
+        self._suspended.set_result(add)
+        await self._resume
+
+    def resume(self) -> None:
+        """Wake the suspended body. Call after ``begin_invocation``."""
+        if self._resume is not None and not self._resume.done():
+            self._resume.set_result(None)
+
+    def cancel(self) -> None:
+        if self.body is not None and not self.body.done():
+            self.body.cancel()
+
+
 # Holds a weakref to the Context (in internal-face state) for the currently
 # executing step.  A weakref is used so that asyncio timer-handle context
 # snapshots do not pin the Workflow in memory (see RunContextContainer for
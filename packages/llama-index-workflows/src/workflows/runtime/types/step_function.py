@@ -15,11 +15,14 @@ from typing import TYPE_CHECKING, Any, Awaitable, Callable, Protocol, TypeVar
 from llama_index_instrumentation import get_dispatcher
 from llama_index_instrumentation.base import BaseEvent
 from llama_index_instrumentation.dispatcher import (
+    Dispatcher,
     active_instrument_tags,
     instrument_tags,
 )
+from llama_index_instrumentation.event_handlers import NullEventHandler
 from llama_index_instrumentation.events.span import SpanDropEvent
 from llama_index_instrumentation.span import active_span_id
+from llama_index_instrumentation.span_handlers import NullSpanHandler
 from workflows._event_summary import summarize_event
 from workflows.decorators import P, StepConfig
 from workflows.errors import WorkflowCancelledByUser, WorkflowRuntimeError
@@ -37,7 +40,9 @@ from workflows.runtime.types.plugin import (
     run_context,
 )
 from workflows.runtime.types.results import (
+    AddWaiter,
     InternalContextVar,
+    ParkedStep,
     RetryAttempt,
     Returns,
     StepFunctionResult,
@@ -88,10 +93,33 @@ class WorkflowRunOutputEvent(BaseEvent):
         return "workflow.output"
 
 
-def _emit_output_event(event: BaseEvent) -> None:
-    """Fire an instrumentation event, silently ignoring failures."""
+def _is_instrumented(dispatcher: Dispatcher) -> bool:
+    """Whether any real span or event handler is reachable from ``dispatcher``.
+
+    Follows the same propagation chain as ``Dispatcher.event``. When this is
+    false, span wrapping and event summaries are skipped, since nothing would
+    consume them.
+    """
+    c: Dispatcher | None = dispatcher
+    while c is not None:
+        for h in c.span_handlers:
+            if not isinstance(h, NullSpanHandler):
+                return True
+        for h in c.event_handlers:
+            if not isinstance(h, NullEventHandler):
+                return True
+        c = c.parent if c.propagate else None
+    return False
+
+
+def _emit_output_event(event_factory: Callable[[], BaseEvent]) -> None:
+    """Build and fire an instrumentation event, silently ignoring failures.
+
+    The event is only built when a handler is attached to receive it.
+    """
     try:
-        _dispatcher.event(event)
+        if _is_instrumented(_dispatcher):
+            _dispatcher.event(event_factory())
     except Exception:
         pass
 
@@ -102,6 +130,71 @@ def _run_with_tags(tags: dict[str, Any], func: Callable[[], Any]) -> Any:
         return func()
 
 
+# Step bodies parked across wait_for_event (resume_waits_in_place), by run id
+# then (step name, waiter id). Cleared when the run's workflow function exits.
+_parked_steps: dict[str, dict[tuple[str, str], ParkedStep]] = {}
+
+
+def _take_parked_step(run_id: str, state: StepWorkerState) -> ParkedStep | None:
+    """Pop the parked body this invocation resumes, if any.
+
+    That is a body of the same work item suspended on a waiter that has since
+    resolved or timed out. Anything else (a snapshot restore, a retry) runs the
+    step from the top as usual.
+    """
+    parked_for_run = _parked_steps.get(run_id)
+    if not parked_for_run:
+        return None
+    for waiter in state.collected_waiters.values():
+        if waiter.resolved_event is None and not waiter.timed_out:
+            continue
+        if waiter.work_item_id != state.work_item_id:
+            continue
+        parked = parked_for_run.pop((state.step_name, waiter.waiter_id), None)
+        if parked is not None and parked.body is not None and not parked.body.done():
+            return parked
+    return None
+
+
+def _park_step(run_id: str, step_name: str, waiter_id: str, parked: ParkedStep) -> None:
+    parked_for_run = _parked_steps.setdefault(run_id, {})
+    previous = parked_for_run.get((step_name, waiter_id))
+    if previous is not None and previous is not parked:
+        # The work item was re-run from the top (e.g. re-pinged after a
+        # restore) while an older body was parked on the same waiter.
+        previous.cancel()
+    parked_for_run[(step_name, waiter_id)] = parked
+
+
+def _cancel_parked_steps(run_id: str) -> None:
+    for parked in _parked_steps.pop(run_id, {}).values():
+        parked.cancel()
+
+
+async def _run_in_place(
+    parked: ParkedStep,
+    suspended: asyncio.Future[AddWaiter[Any]],
+    start_body: Callable[[], Awaitable[Any]] | None,
+) -> AddWaiter[Any] | None:
+    """Start or resume a parked step body and wait until it finishes or
+    suspends on its next wait. Returns the waiter when it suspended."""
+    if parked.body is None:
+        assert start_body is not None
+        parked.body = asyncio.create_task(start_body())
+    else:
+        parked.resume()
+    try:
+        await asyncio.wait(
+            {parked.body, suspended}, return_when=asyncio.FIRST_COMPLETED
+        )
+    except asyncio.CancelledError:
+        parked.cancel()
+        raise
+    if parked.body.done():
+        return None
+    return suspended.result()
+
+
 class StepWorkerFunction(Protocol):
     def __call__(
         self,
@@ -179,20 +272,37 @@ def as_step_worker_function(
     ) -> list[StepFunctionResult]:
         from workflows.context.context import Context
 
-        internal_context = Context._create_internal(workflow=workflow)
-        returns = Returns(return_values=[])
+        config = workflow._get_steps()[step_name]._step_config
+        parking_run_id: str | None = None
+        parked: ParkedStep | None = None
+        if config.resume_waits_in_place:
+            adapter = workflow._runtime.get_internal_adapter(workflow)
+            if adapter.supports_in_place_resume():
+                parking_run_id = adapter.run_id
+                parked = _take_parked_step(parking_run_id, state)
+        resuming = parked is not None
+
+        if parked is not None:
+            internal_context = parked.context
+            returns = Returns(return_values=parked.carried_returns())
+        else:
+            internal_context = Context._create_internal(workflow=workflow)
+            returns = Returns(return_values=[])
+            if parking_run_id is not None:
+                parked = ParkedStep(internal_context)
 
         step_ctx = StepWorkerContext(
             event=event,
             state=state,
             returns=returns,
             retry=retry,
+            parking=parked,
         )
+        suspended = parked.begin_invocation(step_ctx) if parked is not None else None
         token = StepWorkerStateContextVar.set(step_ctx)
         ctx_token = InternalContextVar.set(weakref.ref(internal_context))
 
         try:
-            config = workflow._get_steps()[step_name]._step_config
             collected_binding: dict[str, Event] | None = None
             collection_binding: dict[str, list[Event]] | None = None
             if config.collection_param is not None:
@@ -233,7 +343,7 @@ def as_step_worker_function(
                         step_result = await call_func(*args, **kwargs)
                         if step_result is not None and isinstance(step_result, Event):
                             _emit_output_event(
-                                WorkflowStepOutputEvent(
+                                lambda: WorkflowStepOutputEvent(
                                     output=summarize_event(step_result)
                                 )
                             )
@@ -254,7 +364,9 @@ def as_step_worker_function(
                     step_result = call_func(*args, **kwargs)
                     if step_result is not None and isinstance(step_result, Event):
                         _emit_output_event(
-                            WorkflowStepOutputEvent(output=summarize_event(step_result))
+                            lambda: WorkflowStepOutputEvent(
+                                output=summarize_event(step_result)
+                            )
                         )
                     return step_result
 
@@ -262,24 +374,43 @@ def as_step_worker_function(
 
             # Prepare input event tags — these become span attributes when the
             # span is entered (inside partial_func), not when the wrapper is created.
-            try:
-                input_tags = {
-                    "llamaindex.step.input_event": type(event).__name__,
-                    "llamaindex.step.input_summary": summarize_event(event),
-                }
-            except Exception:
-                input_tags = {}
+            # With no handlers attached, skip both the summary and the span.
+            instrumented = _is_instrumented(workflow._dispatcher)
+            input_tags: dict[str, Any] = {}
+            if instrumented and not resuming:
+                try:
+                    input_tags = {
+                        "llamaindex.step.input_event": type(event).__name__,
+                        "llamaindex.step.input_summary": summarize_event(event),
+                    }
+                except Exception:
+                    pass
             merged_tags = {**active_instrument_tags.get(), **input_tags}
 
-            partial_func = await partial(
-                func=workflow._dispatcher.span(span_target),
-                step_config=config,
-                event=event,
-                context=internal_context,
-                workflow=workflow,
-                collected_events=collected_binding,
-                collection_events=collection_binding,
-            )
+            # A resumed body already has its arguments and resources bound.
+            partial_func: Callable[[], Any] | None = None
+            if not resuming:
+                partial_func = await partial(
+                    func=workflow._dispatcher.span(span_target)
+                    if instrumented
+                    else span_target,
+                    step_config=config,
+                    event=event,
+                    context=internal_context,
+                    workflow=workflow,
+                    collected_events=collected_binding,
+                    collection_events=collection_binding,
+                )
+
+            async def run_body() -> Any:
+                assert partial_func is not None
+                with instrument_tags(merged_tags):
+                    body_result = await partial_func()
+                if captured_cancelled is not None:
+                    raise captured_cancelled
+                if captured_waiting is not None:
+                    raise captured_waiting
+                return body_result
 
             try:
                 # coerce to coroutine function
@@ -287,21 +418,30 @@ def as_step_worker_function(
                     # run_in_executor doesn't accept **kwargs, so we need to use partial
                     copy = copy_context()
 
+                    sync_func = partial_func
+                    assert sync_func is not None
                     result: StepReturnT = (
                         await asyncio.get_event_loop().run_in_executor(
                             None,
                             lambda: copy.run(
-                                lambda: _run_with_tags(merged_tags, partial_func)
+                                lambda: _run_with_tags(merged_tags, sync_func)
                             ),
                         )
                     )
+                elif parked is None or suspended is None:
+                    result = await run_body()
                 else:
-                    with instrument_tags(merged_tags):
-                        result = await partial_func()
-                    if captured_cancelled is not None:
-                        raise captured_cancelled
-                    if captured_waiting is not None:
-                        raise captured_waiting
+                    waiter = await _run_in_place(
+                        parked, suspended, None if resuming else run_body
+                    )
+                    if waiter is not None:
+                        # Suspended on a wait: report the waiter like a replayed
+                        # step would, and keep the body parked for the resume.
+                        assert parking_run_id is not None
+                        _park_step(parking_run_id, step_name, waiter.waiter_id, parked)
+                        raise WaitingForEvent(waiter)
+                    assert parked.body is not None
+                    result = parked.body.result()
                 if isinstance(result, list) and config.is_fan_out:
                     # A step that actually returned a list fans out: each
                     # element is emitted as its own event into a fresh stream.
@@ -429,7 +569,7 @@ def create_workflow_run_function(
         bound_args = inspect.signature(run_workflow).bind(init_state, start_event, tags)
 
         # Set start event info as instrument tags for the run span
-        if start_event is not None:
+        if start_event is not None and _is_instrumented(_dispatcher):
             try:
                 run_input_tags = {
                     "llamaindex.start_event": summarize_event(start_event),
@@ -457,7 +597,7 @@ def create_workflow_run_function(
                     )
 
                     _emit_output_event(
-                        WorkflowRunOutputEvent(output=summarize_event(result))
+                        lambda: WorkflowRunOutputEvent(output=summarize_event(result))
                     )
 
                     _dispatcher.span_exit(
@@ -472,6 +612,7 @@ def create_workflow_run_function(
                 # Cancel any background tasks from InternalContext on completion or cancellation
                 if isinstance(internal_ctx._face, InternalContext):
                     internal_ctx._face.cancel_background_tasks()
+                _cancel_parked_steps(internal_adapter.run_id)
         except WorkflowCancelledByUser:
             # User-initiated cancellation is not an error — exit the span
             # cleanly so it shows as OK rather than ERROR in traces.
@@ -16,6 +16,7 @@ from pydantic import ValidationError
 
 if TYPE_CHECKING:  # pragma: no cover
     from .context import Context
+    from .runtime.publish_buffer import StreamBufferPolicy
     from .runtime.types.plugin import Runtime
 from ._event_matching import step_accepts_event
 from .decorators import CatchErrorHandler, StepConfig, StepFunction, WorkflowGraphCheck
@@ -104,6 +105,7 @@ class Workflow(metaclass=WorkflowMeta):
         runtime: Runtime | None = None,
         workflow_name: str | None = None,
         skip_graph_checks: set[WorkflowGraphCheck] | None = None,
+        stream_buffer: StreamBufferPolicy | None = None,
     ) -> None:
         """
         Initialize a workflow instance.
@@ -130,6 +132,11 @@ class Workflow(metaclass=WorkflowMeta):
             skip_graph_checks (set[str] | None): Optional set of graph validation
                 checks to skip (e.g. "reachability", "terminal_event"). Use to
                 allow intentional patterns that would otherwise fail validation.
+            stream_buffer (StreamBufferPolicy | None): Optional bound on each
+                run's buffer of published events, and what to do when it is
+                full (block the writing step, drop the oldest event, or
+                coalesce by event type). The default, `None`, buffers without
+                limit. Applied by the basic runtime.
         """
         # Inline imports: every module below imports ``Workflow`` transitively,
         # so deferring to call time breaks the cycle.
@@ -155,6 +162,7 @@ class Workflow(metaclass=WorkflowMeta):
         self._verbose = verbose
         self._disable_validation = disable_validation
         self._num_concurrent_runs = num_concurrent_runs
+        self._stream_buffer = stream_buffer
         # Store explicit name (None means use computed name)
         self._workflow_name = workflow_name
 
@@ -3,12 +3,31 @@
 
 from __future__ import annotations
 
+import base64
+import enum
+import json
+import pickle
+import uuid
+from typing import Any
+
 import pytest
-from workflows.context import Context
+from workflows.context import Context, serializers
+from workflows.context.serializers import (
+    BaseSerializer,
+    JsonSerializer,
+    PickleSerializer,
+)
+from workflows.context.utils import resolve_qualified_name
 from workflows.errors import ContextSerdeError
+from workflows.events import Event, StartEvent
 from workflows.workflow import Workflow
 
 
+class PayloadEvent(Event):
+    name: str
+    numbers: list[int]
+
+
 def test_serialization_roundtrip(ctx: Context, workflow: Workflow) -> None:
     assert Context.from_dict(workflow, ctx.to_dict())
 
@@ -27,3 +46,100 @@ def test_deserialization_invalid(ctx: Context, workflow: Workflow) -> None:
     }
     with pytest.raises(ContextSerdeError):
         Context.from_dict(workflow, old_payload)
+
+
+_PAYLOAD: dict[str, Any] = {
+    "event": PayloadEvent(name="a", numbers=[1, 2, 3]),
+    "nested": {"items": [StartEvent(), 1, "two", None], "flag": True},
+}
+
+
+@pytest.mark.parametrize(
+    "serializer_cls", [JsonSerializer, PickleSerializer], ids=["json", "pickle"]
+)
+def test_roundtrip(serializer_cls: type[BaseSerializer]) -> None:
+    serializer = serializer_cls()
+    restored = serializer.deserialize(serializer.serialize(_PAYLOAD))
+    assert restored["event"] == _PAYLOAD["event"]
+    assert isinstance(restored["nested"]["items"][0], StartEvent)
+    assert restored["nested"]["items"][1:] == [1, "two", None]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"x": [1, 2.5, None, True], 3: "int key", None: "none key"},
+        {"big": 2**70 + 1},
+        {"nan": float("nan"), "inf": [float("-inf")]},
+        ("tuple", {"x": 1}),
+    ],
+)
+def test_json_encodes_like_stdlib(value: Any) -> None:
+    serializer = JsonSerializer()
+    payload = serializer.serialize(value)
+    assert payload.replace(" ", "") == json.dumps(value).replace(" ", "")
+    restored = serializer.deserialize(payload)
+    assert json.dumps(restored) == json.dumps(json.loads(json.dumps(value)))
+
+
+def test_json_rejects_unknown_objects() -> None:
+    serializer = JsonSerializer()
+    with pytest.raises(ValueError):
+        serializer.serialize({"when": object()})
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class _Size(str, enum.Enum):
+    LARGE = "large"
+
+
+@pytest.mark.parametrize(
+    "value", [uuid.uuid4(), _Color.RED, {_Color.RED: 1}, [(uuid.uuid4(),)]]
+)
+def test_json_rejects_what_stdlib_rejects(value: Any) -> None:
+    with pytest.raises(TypeError):
+        json.dumps({"value": value})
+    with pytest.raises(ValueError):
+        JsonSerializer().serialize({"value": value})
+
+
+def test_json_encodes_mixin_enums_like_stdlib() -> None:
+    value = {"size": _Size.LARGE, _Size.LARGE: 1}
+    assert json.loads(JsonSerializer().serialize(value)) == json.loads(
+        json.dumps(value)
+    )
+
+
+def test_json_skips_stdlib_for_native_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("orjson")
+
+    def _stdlib_dumps(value: Any) -> str:
+        raise AssertionError("stdlib encoder used")
+
+    monkeypatch.setattr(serializers.json, "dumps", _stdlib_dumps)
+    serializer = JsonSerializer()
+    value = {**_PAYLOAD, "size": _Size.LARGE, 3: [1.5, ("a", None)]}
+    restored = serializer.deserialize(serializer.serialize(value))
+    assert restored["event"] == _PAYLOAD["event"]
+    assert restored["3"] == [1.5, ["a", None]]
+
+
+def test_pickle_falls_back_for_values_json_rejects() -> None:
+    serializer = PickleSerializer()
+    value = {"id": uuid.uuid4()}
+    payload = serializer.serialize(value)
+    assert pickle.loads(base64.b64decode(payload)) == value
+    assert serializer.deserialize(payload) == value
+
+
+def test_resolve_qualified_name_is_memoized() -> None:
+    resolve_qualified_name.cache_clear()
+    qualified_name = f"{PayloadEvent.__module__}.PayloadEvent"
+    assert resolve_qualified_name(qualified_name) is PayloadEvent
+    assert resolve_qualified_name(qualified_name) is PayloadEvent
+    assert resolve_qualified_name.cache_info().hits == 1
@@ -14,6 +14,7 @@ The control loop is the core event processing engine that:
 import asyncio
 import time
 import uuid
+from collections import deque
 from typing import Coroutine
 
 import pytest
@@ -44,6 +45,7 @@ from workflows.retry_policy import (
 )
 from workflows.runtime.control_loop.runner import _ControlLoopRunner, control_loop
 from workflows.runtime.types.internal_state import BrokerState
+from workflows.runtime.types.named_task import NamedTask, PullTask, WorkerTask
 from workflows.runtime.types.plugin import RunContext, run_context
 from workflows.runtime.types.step_function import as_step_worker_function
 from workflows.runtime.types.step_id import StepId
@@ -654,10 +656,12 @@ async def test_control_loop_defers_idle_behind_buffered_tick(
     state = BrokerState.from_workflow(workflow)
     state.is_running = True
     runner = _ControlLoopRunner(workflow, test_plugin, ctx, step_workers, state)
-    runner.tick_buffer = [
-        TickIdleCheck(),
-        TickAddEvent(event=ContinueEvent(value="done")),
-    ]
+    runner.tick_buffer = deque(
+        [
+            TickIdleCheck(),
+            TickAddEvent(event=ContinueEvent(value="done")),
+        ]
+    )
 
     with setting_run_id(run_id):
         run_ctx = RunContext(
@@ -1372,3 +1376,22 @@ async def test_external_event_not_double_routed_when_waiter_exists(
     assert step_run_count == 2, (
         f"handle_input should run exactly twice, but ran {step_run_count} times"
     )
+
+
+async def test_wait_for_next_task_accepts_a_task_sequence() -> None:
+    """Adapters written before RunningTasks pass a plain list of tasks."""
+    adapter = MockRunAdapter(run_id="legacy")
+    pull = asyncio.create_task(asyncio.sleep(0))
+    worker = asyncio.create_task(asyncio.sleep(0))
+    await asyncio.sleep(0)
+    running: list[NamedTask] = [
+        WorkerTask(StepId.root("step"), 0, worker),
+        PullTask(0, pull),
+    ]
+
+    result = await adapter.wait_for_next_task(running, [], timeout=1.0)
+    assert result.completed is worker
+    assert result.started == []
+
+    empty = await adapter.wait_for_next_task([], [], timeout=0)
+    assert empty.completed is None
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import hashlib
 from collections.abc import AsyncIterator
+from dataclasses import replace
 from typing import cast
 
 import pytest
@@ -71,6 +72,7 @@ from workflows.runtime.types.internal_state import (
 from workflows.runtime.types.results import (
     AddCollectedEvent,
     AddWaiter,
+    CollectedEventsView,
     DeleteCollectedEvent,
     DeleteWaiter,
     RetryDecision,
@@ -133,7 +135,7 @@ def base_state() -> BrokerState:
                 config=step_config,
                 in_progress=[],
                 collected_events={},
-                collected_waiters=[],
+                collected_waiters={},
             )
         },
     )
@@ -154,7 +156,7 @@ def add_worker(
             shared_state=StepWorkerState(
                 step_name="test_step",
                 collected_events=snapshot_collected or {},
-                collected_waiters=[],
+                collected_waiters={},
             ),
             attempts=0,
             first_attempt_at=first_attempt_at,
@@ -214,7 +216,8 @@ def test_add_event_matches_waiter_does_not_emit_unhandled(
     base_state: BrokerState,
 ) -> None:
     """Events that satisfy a waiter should not emit UnhandledEvent."""
-    base_state.workers["test_step"].collected_waiters.append(
+    base_state.add_waiter(
+        "test_step",
         StepWorkerWaiter(
             waiter_id="waiter-1",
             event=StartEvent(),
@@ -222,7 +225,7 @@ def test_add_event_matches_waiter_does_not_emit_unhandled(
             requirements={},
             has_requirements=False,
             resolved_event=None,
-        )
+        ),
     )
     tick = TickAddEvent(event=OtherEvent(data="hit"), step_id=None)
     _, commands = _process_add_event_tick(tick, base_state, now_seconds=0.0)
@@ -480,7 +483,7 @@ def test_explicit_routing_requires_acceptance(base_state: BrokerState) -> None:
         config=other_step_cfg,
         in_progress=[],
         collected_events={},
-        collected_waiters=[],
+        collected_waiters={},
     )
 
     # Try to route MyTestEvent explicitly to non-accepting step → should not start
@@ -511,13 +514,14 @@ def test_waiter_resolution(base_state: BrokerState) -> None:
         has_requirements=True,
         resolved_event=None,
     )
-    base_state.workers["test_step"].collected_waiters.append(waiter)
+    base_state.add_waiter("test_step", waiter)
 
     tick = TickAddEvent(event=OtherEvent(data="expected"))
     new_state, commands = _process_add_event_tick(tick, base_state, now_seconds=100.0)
 
     assert (
-        new_state.workers["test_step"].collected_waiters[0].resolved_event is not None
+        new_state.workers["test_step"].collected_waiters["w1"].resolved_event
+        is not None
     )
     run_cmds = [c for c in commands if isinstance(c, CommandRunWorker)]
     assert any(c.event == original_event for c in run_cmds)
@@ -788,7 +792,7 @@ def test_step_worker_failed_retry_preserves_first_attempt_at(
             shared_state=StepWorkerState(
                 step_name="test_step",
                 collected_events={},
-                collected_waiters=[],
+                collected_waiters={},
             ),
             attempts=2,  # Already retried twice
             first_attempt_at=original_first_attempt_at,
@@ -1349,7 +1353,7 @@ def test_check_idle_state_is_idle_with_waiter(base_state: BrokerState) -> None:
         has_requirements=False,
         resolved_event=None,
     )
-    base_state.workers["test_step"].collected_waiters.append(waiter)
+    base_state.add_waiter("test_step", waiter)
     assert _check_idle_state(base_state) is True
 
 
@@ -1403,7 +1407,7 @@ def test_check_idle_state_multi_step_not_idle_if_one_has_work(
         config=other_step_cfg,
         in_progress=[],
         collected_events={},
-        collected_waiters=[],
+        collected_waiters={},
     )
 
     # Add waiter to test_step (which alone would make it idle)
@@ -1415,7 +1419,7 @@ def test_check_idle_state_multi_step_not_idle_if_one_has_work(
         has_requirements=False,
         resolved_event=None,
     )
-    base_state.workers["test_step"].collected_waiters.append(waiter)
+    base_state.add_waiter("test_step", waiter)
 
     # Without work in other_step, workflow is idle
     assert _check_idle_state(base_state) is True
@@ -1428,7 +1432,7 @@ def test_check_idle_state_multi_step_not_idle_if_one_has_work(
             shared_state=StepWorkerState(
                 step_name="other_step",
                 collected_events={},
-                collected_waiters=[],
+                collected_waiters={},
             ),
             attempts=0,
             first_attempt_at=100.0,
@@ -1485,7 +1489,7 @@ def test_no_idle_event_when_workflow_completes(base_state: BrokerState) -> None:
         has_requirements=False,
         resolved_event=None,
     )
-    base_state.workers["test_step"].collected_waiters.append(waiter)
+    base_state.add_waiter("test_step", waiter)
 
     # Complete the workflow with StopEvent
     tick: TickStepResult = TickStepResult(
@@ -1535,7 +1539,7 @@ def test_rebuild_state_from_ticks_clears_in_progress(base_state: BrokerState) ->
     shared_state = StepWorkerState(
         step_name="test_step",
         collected_events={},
-        collected_waiters=[],
+        collected_waiters={},
     )
     base_state.workers["test_step"].in_progress = [
         InProgressState(
@@ -1604,7 +1608,7 @@ def test_rebuild_state_from_ticks_preserves_queue_order(
     shared_state = StepWorkerState(
         step_name="test_step",
         collected_events={},
-        collected_waiters=[],
+        collected_waiters={},
     )
     base_state.workers["test_step"].in_progress = [
         InProgressState(
@@ -1662,7 +1666,7 @@ def _simple_step_tick_sequence() -> list[WorkflowTick]:
 
 async def test_rebuild_state_from_ticks_stream_empty(base_state: BrokerState) -> None:
     shared_state = StepWorkerState(
-        step_name="test_step", collected_events={}, collected_waiters=[]
+        step_name="test_step", collected_events={}, collected_waiters={}
     )
     event1 = MyTestEvent(value=1)
     base_state.workers["test_step"].in_progress = [
@@ -1729,7 +1733,7 @@ async def test_rebuild_state_from_ticks_stream_clears_in_progress(
     event1 = MyTestEvent(value=1)
     event2 = MyTestEvent(value=2)
     shared_state = StepWorkerState(
-        step_name="test_step", collected_events={}, collected_waiters=[]
+        step_name="test_step", collected_events={}, collected_waiters={}
     )
     base_state.workers["test_step"].in_progress = [
         InProgressState(
@@ -1785,3 +1789,195 @@ async def test_replay_ticks_stream_no_exit_command_when_running(
     ticks: list[WorkflowTick] = [TickAddEvent(event=MyTestEvent(value=1))]
     replay = await replay_ticks_stream(base_state, _aiter(ticks))
     assert replay.exit_command is None
+
+
+def _pending_waiter(
+    waiter_id: str, waiting_for: type[Event], **requirements: object
+) -> StepWorkerWaiter:
+    return StepWorkerWaiter(
+        waiter_id=waiter_id,
+        event=MyTestEvent(value=int(waiter_id.removeprefix("w"))),
+        waiting_for_event=waiting_for,
+        requirements=dict(requirements),
+        has_requirements=bool(requirements),
+        resolved_event=None,
+    )
+
+
+def test_waiter_index_resolves_only_the_matching_waiter(
+    base_state: BrokerState,
+) -> None:
+    for i in range(10_000):
+        base_state.add_waiter(
+            "test_step", _pending_waiter(f"w{i}", OtherEvent, data=f"id-{i}")
+        )
+
+    tick = TickAddEvent(event=OtherEvent(data="id-4242"))
+    new_state, commands = _process_add_event_tick(tick, base_state, now_seconds=0.0)
+
+    waiters = new_state.workers["test_step"].collected_waiters
+    assert [w.waiter_id for w in waiters.values() if w.resolved_event] == ["w4242"]
+    run_workers = [c for c in commands if isinstance(c, CommandRunWorker)]
+    assert [c.event for c in run_workers] == [MyTestEvent(value=4242)]
+    # The reducer works on a copy; the input state is untouched.
+    assert (
+        base_state.workers["test_step"].collected_waiters["w4242"].resolved_event
+        is None
+    )
+
+
+def test_waiter_index_honors_accept_event_subclasses(base_state: BrokerState) -> None:
+    class SubOtherEvent(OtherEvent):
+        pass
+
+    base_state.add_waiter("test_step", _pending_waiter("w1", OtherEvent, data="x"))
+    tick = TickAddEvent(event=SubOtherEvent(data="x"))
+
+    new_state, _ = _process_add_event_tick(tick, base_state, now_seconds=0.0)
+    assert new_state.workers["test_step"].collected_waiters["w1"].resolved_event is None
+
+    base_state.config.steps["test_step"].accept_event_subclasses = True
+    new_state, _ = _process_add_event_tick(tick, base_state, now_seconds=0.0)
+    assert new_state.workers["test_step"].collected_waiters["w1"].resolved_event == (
+        SubOtherEvent(data="x")
+    )
+
+
+def test_waiter_index_matches_unhashable_requirements(base_state: BrokerState) -> None:
+    class TagsEvent(Event):
+        tags: list[str]
+
+    base_state.add_waiter("test_step", _pending_waiter("w1", TagsEvent, tags=["a"]))
+
+    miss, _ = _process_add_event_tick(
+        TickAddEvent(event=TagsEvent(tags=["b"])), base_state, now_seconds=0.0
+    )
+    hit, _ = _process_add_event_tick(
+        TickAddEvent(event=TagsEvent(tags=["a"])), base_state, now_seconds=0.0
+    )
+
+    assert miss.workers["test_step"].collected_waiters["w1"].resolved_event is None
+    assert hit.workers["test_step"].collected_waiters["w1"].resolved_event is not None
+
+
+def test_waiter_index_copies_are_isolated(base_state: BrokerState) -> None:
+    base_state.add_waiter("test_step", _pending_waiter("w1", OtherEvent, data="x"))
+    copy = base_state.deepcopy()
+
+    copy.remove_waiter("test_step", "w1")
+    copy.add_waiter("test_step", _pending_waiter("w2", OtherEvent, data="y"))
+
+    assert ("test_step", "w1") in base_state.waiter_index
+    assert ("test_step", "w2") not in base_state.waiter_index
+    assert len(copy.waiter_index) == 1
+    assert list(copy.workers["test_step"].collected_waiters) == ["w2"]
+
+
+def _dispatch(state: InternalStepWorkerState, value: int) -> CommandRunWorker:
+    commands = _add_or_enqueue_event(
+        EventAttempt(event=MyTestEvent(value=value)),
+        StepId.root("test_step"),
+        state,
+        now_seconds=0.0,
+    )
+    return next(c for c in commands if isinstance(c, CommandRunWorker))
+
+
+def test_worker_ids_reuse_the_smallest_free_slot(base_state: BrokerState) -> None:
+    worker_state = base_state.workers["test_step"]
+    worker_state.config = replace(worker_state.config, num_workers=3)
+
+    assert [_dispatch(worker_state, i).id for i in range(3)] == [0, 1, 2]
+
+    for worker_id in (1, 0):
+        execution = next(
+            w for w in worker_state.in_progress if w.worker_id == worker_id
+        )
+        worker_state.in_progress.remove(execution)
+        worker_state.release_worker_id(worker_id)
+    assert [_dispatch(worker_state, i).id for i in range(2)] == [0, 1]
+
+
+def test_worker_ids_resync_after_direct_in_progress_edits(
+    base_state: BrokerState,
+) -> None:
+    worker_state = base_state.workers["test_step"]
+    worker_state.config = replace(worker_state.config, num_workers=2)
+    assert _dispatch(worker_state, 0).id == 0
+
+    # rewind_in_progress requeues in-flight work and resets the free list
+    worker_state.in_progress = []
+    worker_state.free_worker_ids = []
+    add_worker(base_state, MyTestEvent(value=9), worker_id=0)
+
+    assert _dispatch(worker_state, 1).id == 1
+
+
+def test_dispatch_snapshot_views_collect_buffer_without_copying(
+    base_state: BrokerState,
+) -> None:
+    worker_state = base_state.workers["test_step"]
+    buffer = [MyTestEvent(value=i) for i in range(3)]
+    worker_state.collected_events["buf"] = buffer
+
+    _dispatch(worker_state, 0)
+    buffer.append(MyTestEvent(value=3))
+
+    snapshot = worker_state.in_progress[0].shared_state.collected_events["buf"]
+    assert snapshot == [MyTestEvent(value=i) for i in range(3)]
+    assert snapshot[-1] is buffer[2]
+    assert snapshot[1:] == [buffer[1], buffer[2]]
+    with pytest.raises(IndexError):
+        snapshot[3]
+    # Copying the broker state shares the immutable snapshot.
+    copied = base_state.deepcopy().workers["test_step"].in_progress[0]
+    assert copied.shared_state is worker_state.in_progress[0].shared_state
+
+
+def test_deepcopy_shares_collect_buffers_until_appended(
+    base_state: BrokerState,
+) -> None:
+    buffer = [MyTestEvent(value=i) for i in range(3)]
+    base_state.workers["test_step"].collected_events["buf"] = buffer
+
+    copied = base_state.deepcopy().workers["test_step"]
+    shared = copied.collected_events["buf"]
+    assert isinstance(shared, CollectedEventsView)
+    assert shared == buffer
+    assert shared[0] is buffer[0]
+
+    # Appending on either side leaves the other unchanged.
+    buffer.append(MyTestEvent(value=3))
+    assert len(copied.collected_events["buf"]) == 3
+    copied.collected_events_buffer("buf").append(MyTestEvent(value=4))
+    assert [ev.value for ev in copied.collected_events["buf"]] == [0, 1, 2, 4]
+    assert [ev.value for ev in buffer] == [0, 1, 2, 3]
+    assert copied.collected_events_buffer("new") == []
+
+
+def test_collect_buffer_is_not_copied_on_each_tick(
+    base_state: BrokerState,
+) -> None:
+    state = base_state
+    buffer = state.workers["test_step"].collected_events_buffer("buf")
+    snapshots = []
+    for i in range(50):
+        snapshots.append(state)
+        state = state.deepcopy()
+        appended = state.workers["test_step"].collected_events_buffer("buf")
+        appended.append(MyTestEvent(value=i))
+        assert appended is buffer
+
+    # Older states still see their own prefix.
+    for i, old in enumerate(snapshots):
+        assert [
+            ev.value for ev in old.workers["test_step"].collected_events["buf"]
+        ] == list(range(i))
+
+    # An older state that appends after falling behind gets its own copy.
+    stale = snapshots[10].workers["test_step"]
+    branched = stale.collected_events_buffer("buf")
+    assert branched is not buffer
+    branched.append(MyTestEvent(value=-1))
+    assert [ev.value for ev in branched] == [*range(10), -1]
+    assert len(buffer) == 50
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2026 LlamaIndex Inc.
 
-"""Tests for NamedTask (WorkerTask | PullTask).
+"""Tests for NamedTask (WorkerTask | PullTask) and RunningTasks.
 
 NamedTask associates asyncio tasks with stable string keys, providing:
 - Task identification for DBOS journaling
@@ -12,12 +12,14 @@ NamedTask associates asyncio tasks with stable string keys, providing:
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Any
 
 import pytest
 from workflows.runtime.types.named_task import (
     PULL_PREFIX,
     PullTask,
+    RunningTasks,
     WorkerTask,
     all_tasks,
     find_by_key,
@@ -361,6 +363,111 @@ async def test_pick_highest_priority_no_match_raises() -> None:
                 pass
 
 
+# --- RunningTasks ---
+
+
+async def _cancel_all(tasks: list[asyncio.Task[Any]]) -> None:
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def test_running_tasks_hands_out_workers_in_start_order_before_pull() -> None:
+    """Tasks finishing together come out like pick_highest_priority orders them."""
+    gate = asyncio.Event()
+    pull = asyncio.create_task(gate.wait())
+    w1 = asyncio.create_task(gate.wait())
+    w0 = asyncio.create_task(gate.wait())
+    running = RunningTasks(
+        [
+            PullTask(0, pull),
+            WorkerTask(StepId.root("s"), 1, w1),
+            WorkerTask(StepId.root("s"), 0, w0),
+        ]
+    )
+
+    gate.set()
+    assert await running.wait_done(timeout=1.0) is w1
+    assert running.pop_all_done() == [w0, pull]
+    assert running.pop_done() is None
+    # Handed-out tasks stay tracked until discarded.
+    assert len(running) == 3
+    assert running.key_of(w0) == "s:0"
+
+
+async def test_running_tasks_wait_done_timeout_and_empty() -> None:
+    assert await RunningTasks().wait_done(timeout=None) is None
+
+    task = create_pending_task()
+    try:
+        running = RunningTasks([WorkerTask(StepId.root("s"), 0, task)])
+        assert await running.wait_done(timeout=0.01) is None
+        assert running.find_by_key("s:0") is task
+    finally:
+        await _cancel_all([task])
+
+
+async def test_running_tasks_discard_drops_pending_completion() -> None:
+    gate = asyncio.Event()
+    tasks = [asyncio.create_task(gate.wait()) for _ in range(3)]
+    running = RunningTasks(
+        WorkerTask(StepId.root("s"), i, t) for i, t in enumerate(tasks)
+    )
+
+    running.discard(tasks[0])
+    gate.set()
+    await asyncio.gather(*tasks)
+    await asyncio.sleep(0)
+
+    assert running.pop_all_done() == tasks[1:]
+    assert tasks[0] not in running
+    assert running.find_by_key("s:0") is None
+
+
+async def test_running_tasks_note_finished_counts_before_done_callback() -> None:
+    """A task that notes itself finished is queued once, not again on done."""
+    running = RunningTasks()
+
+    async def body() -> None:
+        await asyncio.sleep(0)
+        task = asyncio.current_task()
+        assert task is not None
+        running.note_finished(task)
+
+    task = asyncio.create_task(body())
+    running.add(WorkerTask(StepId.root("s"), 0, task))
+    while not task.done():
+        await asyncio.sleep(0)
+
+    assert running.pop_done() is task
+    # The done callback does not queue it a second time.
+    await asyncio.sleep(0)
+    assert running.pop_done() is None
+
+
+async def test_running_tasks_wait_does_not_scale_with_in_flight_tasks() -> None:
+    """10k in-flight workers finishing one at a time stay cheap to wait on."""
+    gates = [asyncio.Event() for _ in range(10_000)]
+    running = RunningTasks(
+        WorkerTask(StepId.root("s"), i, asyncio.create_task(gate.wait()))
+        for i, gate in enumerate(gates)
+    )
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    for gate in gates:
+        gate.set()
+        completed = await running.wait_done(timeout=1.0)
+        assert completed is not None
+        running.discard(completed)
+    elapsed = time.perf_counter() - started
+
+    assert len(running) == 0
+    # ~0.1 s here; asyncio.wait over the in-flight set takes ~50 s. The bound
+    # is loose enough for a loaded CI machine.
+    assert elapsed < 5.0, f"waiting degraded: {elapsed:.3f}s"
+
+
 # --- Integration ---
 
 
@@ -417,3 +524,27 @@ async def test_multiple_workers_same_step() -> None:
                 await t
             except asyncio.CancelledError:
                 pass
+
+
+async def test_helpers_accept_running_tasks() -> None:
+    """The lookup helpers delegate to RunningTasks' indexes."""
+    w0 = create_pending_task()
+    pull = create_pending_task()
+    stranger = create_pending_task()
+    try:
+        running = RunningTasks(
+            [WorkerTask(StepId.root("step"), 0, w0), PullTask(0, pull)]
+        )
+        assert all_tasks(running) == {w0, pull}
+        assert find_by_key(running, "step:0") is w0
+        assert find_by_key(running, "missing") is None
+        assert get_key(running, pull) == f"{PULL_PREFIX}:0"
+        with pytest.raises(KeyError):
+            get_key(running, stranger)
+    finally:
+        for t in [w0, pull, stranger]:
+            t.cancel()
+            try:
+                await t
+            except asyncio.CancelledError:
+                pass
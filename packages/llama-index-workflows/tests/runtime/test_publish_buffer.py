@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Tests for bounded published-event buffering."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from workflows.context import Context
+from workflows.decorators import step
+from workflows.events import Event, InputRequiredEvent, StartEvent, StopEvent
+from workflows.runtime.publish_buffer import PublishBuffer, StreamBufferPolicy
+from workflows.workflow import Workflow
+
+
+class Token(Event):
+    n: int
+
+
+class Progress(Event):
+    pct: int
+
+
+def test_policy_validation() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        StreamBufferPolicy(max_events=0)
+    with pytest.raises(ValueError, match="overflow"):
+        StreamBufferPolicy(max_events=1, overflow="drop_newest")  # type: ignore[arg-type]
+
+
+async def test_unbounded_by_default() -> None:
+    buffer = PublishBuffer()
+    for n in range(100):
+        await buffer.put(Token(n=n))
+    assert buffer.qsize() == 100
+    assert buffer.stats().max_events is None
+
+
+async def test_drop_oldest_never_drops_protected_events() -> None:
+    buffer = PublishBuffer(StreamBufferPolicy(max_events=2, overflow="drop_oldest"))
+    buffer.put_nowait(InputRequiredEvent())
+    buffer.put_nowait(Token(n=0))
+    buffer.put_nowait(Token(n=1))
+    buffer.put_nowait(StopEvent())
+
+    drained = [buffer.get_nowait() for _ in range(buffer.qsize())]
+    assert drained == [InputRequiredEvent(), Token(n=1), StopEvent()]
+    stats = buffer.stats()
+    assert stats.dropped_total == 1
+    assert stats.high_water_mark == 3
+
+
+async def test_coalesce_keeps_latest_event_per_type() -> None:
+    buffer = PublishBuffer(StreamBufferPolicy(max_events=2, overflow="coalesce"))
+    buffer.put_nowait(Progress(pct=10))
+    buffer.put_nowait(Token(n=0))
+    buffer.put_nowait(Progress(pct=20))
+    # Each replacement moves to the back, keeping publish order.
+    buffer.put_nowait(Token(n=1))
+
+    drained = [buffer.get_nowait() for _ in range(buffer.qsize())]
+    assert drained == [Progress(pct=20), Token(n=1)]
+    assert buffer.stats().coalesced_total == 2
+
+
+async def test_coalesce_falls_back_to_dropping_oldest() -> None:
+    buffer = PublishBuffer(StreamBufferPolicy(max_events=1, overflow="coalesce"))
+    buffer.put_nowait(Progress(pct=10))
+    buffer.put_nowait(Token(n=0))
+
+    assert [buffer.get_nowait()] == [Token(n=0)]
+    assert buffer.stats().dropped_total == 1
+
+
+async def test_block_waits_for_consumer() -> None:
+    buffer = PublishBuffer(StreamBufferPolicy(max_events=1))
+    await buffer.put(Token(n=0))
+    blocked = asyncio.create_task(buffer.put(Token(n=1)))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    # Non-blocking publishers (the control loop) and terminal events still
+    # get through.
+    buffer.put_nowait(Progress(pct=50))
+    await buffer.put(StopEvent())
+    assert buffer.qsize() == 3
+
+    assert await buffer.get() == Token(n=0)
+    assert await buffer.get() == Progress(pct=50)
+    assert await buffer.get() == StopEvent()
+    await asyncio.wait_for(blocked, timeout=1)
+    assert await buffer.get() == Token(n=1)
+    assert buffer.stats().blocked_total == 1
+
+
+async def test_cancelled_blocked_put_leaves_buffer_usable() -> None:
+    buffer = PublishBuffer(StreamBufferPolicy(max_events=1))
+    await buffer.put(Token(n=0))
+    blocked = asyncio.create_task(buffer.put(Token(n=1)))
+    await asyncio.sleep(0)
+    blocked.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await blocked
+
+    assert await buffer.get() == Token(n=0)
+    await asyncio.wait_for(buffer.put(Token(n=2)), timeout=1)
+    assert buffer.get_nowait() == Token(n=2)
+
+
+class TokenStreamWorkflow(Workflow):
+    @step
+    async def generate(self, ctx: Context, ev: StartEvent) -> StopEvent:
+        for n in range(50):
+            ctx.write_event_to_stream(Token(n=n))
+        return StopEvent(result="done")
+
+
+async def test_drop_oldest_bounds_unconsumed_run() -> None:
+    workflow = TokenStreamWorkflow(
+        stream_buffer=StreamBufferPolicy(max_events=5, overflow="drop_oldest")
+    )
+    handler = workflow.run()
+
+    assert await handler == "done"
+    events = [ev async for ev in handler.stream_events()]
+    assert isinstance(events[-1], StopEvent)
+    tokens = [ev for ev in events if isinstance(ev, Token)]
+    assert tokens[-1] == Token(n=49)
+    stats = handler.publish_buffer_stats()
+    assert stats is not None
+    assert stats.high_water_mark <= 6
+    assert stats.dropped_total > 0
+
+
+async def test_block_delivers_every_event_to_slow_consumer() -> None:
+    workflow = TokenStreamWorkflow(stream_buffer=StreamBufferPolicy(max_events=2))
+    handler = workflow.run()
+
+    tokens = []
+    async for ev in handler.stream_events():
+        if isinstance(ev, Token):
+            tokens.append(ev.n)
+            await asyncio.sleep(0)
+    assert await handler == "done"
+    assert tokens == list(range(50))
+    stats = handler.publish_buffer_stats()
+    assert stats is not None
+    assert stats.blocked_total > 0
+    assert stats.dropped_total == 0
+
+
+class AwaitedTokenWorkflow(Workflow):
+    written: int = 0
+
+    @step
+    async def produce(self, ctx: Context, ev: StartEvent) -> StopEvent:
+        for n in range(50):
+            await ctx.write_event_to_stream(Token(n=n))
+            AwaitedTokenWorkflow.written = n + 1
+        return StopEvent(result="done")
+
+
+async def test_block_suspends_step_awaiting_write_until_consumed() -> None:
+    AwaitedTokenWorkflow.written = 0
+    workflow = AwaitedTokenWorkflow(stream_buffer=StreamBufferPolicy(max_events=3))
+    handler = workflow.run()
+
+    await asyncio.sleep(0.05)
+    # With nothing consumed, the step is parked on a write once the buffer
+    # (which also holds the control loop's own events) is full.
+    written = AwaitedTokenWorkflow.written
+    assert written < 3
+    await asyncio.sleep(0.05)
+    assert AwaitedTokenWorkflow.written == written
+    stats = handler.publish_buffer_stats()
+    assert stats is not None
+    assert stats.size == 3
+    assert stats.blocked_total == 1
+
+    tokens = [ev.n async for ev in handler.stream_events() if isinstance(ev, Token)]
+    assert await handler == "done"
+    assert tokens == list(range(50))
+    assert AwaitedTokenWorkflow.written == 50
@@ -9,13 +9,13 @@ from workflows.context.context_types import (
     SerializedContextV0,
 )
 from workflows.context.serializers import JsonSerializer
-from workflows.events import StartEvent, StopEvent
+from workflows.events import HumanResponseEvent, StartEvent, StopEvent
 from workflows.runtime.types.internal_state import (
     BrokerState,
     EventAttempt,
     InProgressState,
 )
-from workflows.runtime.types.results import StepWorkerState
+from workflows.runtime.types.results import StepWorkerState, StepWorkerWaiter
 from workflows.workflow import Workflow
 
 
@@ -161,7 +161,7 @@ def test_in_progress_retry_state_survives_serialization() -> None:
             shared_state=StepWorkerState(
                 step_name="start",
                 collected_events={},
-                collected_waiters=[],
+                collected_waiters={},
             ),
             attempts=2,
             first_attempt_at=100.0,
@@ -226,3 +226,30 @@ def test_deserialize_broken_state_raises_validation_error(workflow: Workflow) ->
     # because the queue value is not valid JSON
     with pytest.raises(JSONDecodeError):
         SerializedContext.from_v0(serialized_v0)
+
+
+def test_waiter_index_is_rebuilt_on_deserialization() -> None:
+    workflow = _RetryStateWorkflow()
+    state = BrokerState.from_workflow(workflow)
+    state.add_waiter(
+        "start",
+        StepWorkerWaiter(
+            waiter_id="w1",
+            event=StartEvent(),
+            waiting_for_event=HumanResponseEvent,
+            requirements={"response": "yes"},
+            has_requirements=True,
+            resolved_event=None,
+        ),
+    )
+    serializer = JsonSerializer()
+
+    restored = BrokerState.from_serialized(
+        state.to_serialized(serializer), workflow, serializer
+    )
+
+    assert ("start", "w1") in restored.waiter_index
+    # Requirements are not serialized, so the restored waiter matches any
+    # event of its type until the step re-registers it.
+    matched = restored.waiters_matching(HumanResponseEvent(response="no"))
+    assert [(name, w.waiter_id) for name, w in matched] == [("start", "w1")]
@@ -434,7 +434,7 @@ def test_disallowed_non_builtin_exception_degrades_without_importing(
         imported.append(name)
         return import_module_from_qualified_name(name)
 
-    monkeypatch.setattr("workflows.events.import_module_from_qualified_name", spy)
+    monkeypatch.setattr("workflows.events.resolve_qualified_name", spy)
 
     restored = cast(WorkflowFailedEvent, serializer.deserialize(blob))
     assert isinstance(restored.exception, UnreconstructedException)
@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2026 LlamaIndex Inc.
 
+import asyncio
 from unittest import mock
 
 import pytest
 from workflows.errors import WorkflowRuntimeError
+from workflows.events import StopEvent
 from workflows.handler import WorkflowHandler
 from workflows.workflow import Workflow
 
@@ -38,3 +40,22 @@ async def test_stream_events_consume_only_once() -> None:
     ):
         async for _ in h.stream_events():
             pass
+
+
+@pytest.mark.asyncio
+async def test_add_done_callback_runs_when_result_settles() -> None:
+    h = _create_mock_handler()
+    adapter = h._external_adapter
+    assert isinstance(adapter, MockRunAdapter)
+    seen: list[WorkflowHandler] = []
+    h.add_done_callback(seen.append)
+
+    adapter._result.set_result(StopEvent(result="done"))
+    await h
+    await asyncio.sleep(0)
+    assert seen == [h]
+
+    # Registering after the run settled still calls back.
+    h.add_done_callback(seen.append)
+    await asyncio.sleep(0)
+    assert seen == [h, h]
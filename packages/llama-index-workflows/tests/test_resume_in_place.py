@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 LlamaIndex Inc.
+"""Tests for steps declared with ``resume_waits_in_place=True``."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from workflows.context import Context
+from workflows.decorators import step
+from workflows.errors import WorkflowCancelledByUser
+from workflows.events import (
+    HumanResponseEvent,
+    InputRequiredEvent,
+    StartEvent,
+    StopEvent,
+)
+from workflows.handler import WorkflowHandler
+from workflows.plugins.basic import InternalAsyncioAdapter
+from workflows.runtime.types import step_function
+from workflows.workflow import Workflow
+
+
+class AskEvent(InputRequiredEvent):
+    index: int
+
+
+class AnswerEvent(HumanResponseEvent):
+    index: int
+    answer: str
+
+
+class SecondAnswerEvent(HumanResponseEvent):
+    answer: str
+
+
+def _approval_chain(waits: int, in_place: bool) -> tuple[Workflow, list[int]]:
+    """A step that runs a prefix once per execution, then waits ``waits`` times."""
+    prefix_runs: list[int] = []
+
+    class ApprovalWorkflow(Workflow):
+        @step(resume_waits_in_place=in_place)
+        async def approve(self, ctx: Context, ev: StartEvent) -> StopEvent:
+            prefix_runs.append(1)
+            answers = []
+            for i in range(waits):
+                answer = await ctx.wait_for_event(
+                    AnswerEvent,
+                    waiter_event=AskEvent(index=i),
+                    requirements={"index": i},
+                )
+                answers.append(answer.answer)
+            return StopEvent(result=answers)
+
+    return ApprovalWorkflow(timeout=10), prefix_runs
+
+
+async def _answer_all(handler: WorkflowHandler) -> Any:
+    assert handler.ctx is not None
+    async for ev in handler.stream_events():
+        if isinstance(ev, AskEvent):
+            handler.ctx.send_event(AnswerEvent(index=ev.index, answer=f"a{ev.index}"))
+    return await handler
+
+
+@pytest.mark.parametrize("waits", [1, 3, 5])
+async def test_prefix_runs_once_per_step_in_place(waits: int) -> None:
+    workflow, prefix_runs = _approval_chain(waits, in_place=True)
+
+    result = await _answer_all(workflow.run())
+
+    assert result == [f"a{i}" for i in range(waits)]
+    assert len(prefix_runs) == 1
+
+
+@pytest.mark.parametrize("waits", [1, 3, 5])
+async def test_prefix_reruns_per_wait_without_in_place(waits: int) -> None:
+    workflow, prefix_runs = _approval_chain(waits, in_place=False)
+
+    result = await _answer_all(workflow.run())
+
+    assert result == [f"a{i}" for i in range(waits)]
+    assert len(prefix_runs) == waits + 1
+
+
+async def test_in_place_completion_clears_waiters_and_parked_bodies() -> None:
+    workflow, _ = _approval_chain(3, in_place=True)
+    handler = workflow.run()
+
+    await _answer_all(handler)
+
+    assert handler.ctx is not None
+    snapshot = handler.ctx.to_dict()
+    assert snapshot["workers"]["approve"]["collected_waiters"] == []
+    assert step_function._parked_steps == {}
+
+
+async def test_restored_run_falls_back_to_replay() -> None:
+    prefix_runs: list[int] = []
+
+    class TwoStepApproval(Workflow):
+        @step(resume_waits_in_place=True)
+        async def approve(self, ctx: Context, ev: StartEvent) -> StopEvent:
+            prefix_runs.append(1)
+            first = await ctx.wait_for_event(
+                AnswerEvent, waiter_event=AskEvent(index=0)
+            )
+            second = await ctx.wait_for_event(
+                SecondAnswerEvent, waiter_event=AskEvent(index=1)
+            )
+            return StopEvent(result=[first.answer, second.answer])
+
+    workflow = TwoStepApproval(timeout=10)
+    handler = workflow.run()
+    assert handler.ctx is not None
+
+    snapshot: dict[str, Any] | None = None
+    async for ev in handler.stream_events():
+        if isinstance(ev, AskEvent):
+            if ev.index == 0:
+                handler.ctx.send_event(AnswerEvent(index=0, answer="a0"))
+            else:
+                snapshot = handler.ctx.to_dict()
+                await handler.cancel_run()
+                break
+    with pytest.raises(WorkflowCancelledByUser):
+        await handler
+    assert snapshot is not None
+    assert step_function._parked_steps == {}
+    assert len(prefix_runs) == 1
+
+    restored = workflow.run(ctx=Context.from_dict(workflow, snapshot))
+    assert restored.ctx is not None
+    restored.ctx.send_event(SecondAnswerEvent(answer="a1"))
+
+    assert await restored == ["a0", "a1"]
+    # The restored run has no parked body, so it replays the step once.
+    assert len(prefix_runs) == 2
+
+
+async def test_wait_timeout_resumes_in_place() -> None:
+    prefix_runs: list[int] = []
+
+    class TimeoutWorkflow(Workflow):
+        @step(resume_waits_in_place=True)
+        async def approve(self, ctx: Context, ev: StartEvent) -> StopEvent:
+            prefix_runs.append(1)
+            try:
+                await ctx.wait_for_event(AnswerEvent, timeout=0.05)
+            except asyncio.TimeoutError:
+                return StopEvent(result="timed out")
+            return StopEvent(result="answered")
+
+    assert await TimeoutWorkflow(timeout=5).run() == "timed out"
+    assert len(prefix_runs) == 1
+
+
+async def test_adapter_without_support_replays(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        InternalAsyncioAdapter, "supports_in_place_resume", lambda self: False
+    )
+    workflow, prefix_runs = _approval_chain(2, in_place=True)
+
+    assert await _answer_all(workflow.run()) == ["a0", "a1"]
+    assert len(prefix_runs) == 3
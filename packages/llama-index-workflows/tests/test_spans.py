@@ -10,6 +10,7 @@ from typing import Any, Generator
 import pytest
 from llama_index_instrumentation import get_dispatcher
 from llama_index_instrumentation.base import BaseEvent
+from llama_index_instrumentation.dispatcher import Dispatcher
 from llama_index_instrumentation.event_handlers import BaseEventHandler
 from llama_index_instrumentation.span import BaseSpan
 from llama_index_instrumentation.span_handlers import BaseSpanHandler
@@ -17,7 +18,11 @@ from pydantic import PrivateAttr
 from workflows.context import Context
 from workflows.decorators import step
 from workflows.events import Event, StartEvent, StopEvent
-from workflows.runtime.types.step_function import SpanCancelledEvent
+from workflows.runtime.types.step_function import (
+    SpanCancelledEvent,
+    WorkflowRunOutputEvent,
+    WorkflowStepOutputEvent,
+)
 from workflows.workflow import Workflow
 
 
@@ -193,3 +198,72 @@ async def test_cancel_run_produces_exited_spans_not_dropped(
     assert len(cancel_events) >= 1, (
         f"Expected at least 1 SpanCancelledEvent, got {len(cancel_events)}"
     )
+
+
+class SummaryWorkflow(Workflow):
+    @step
+    async def async_step(self, ev: StartEvent) -> WaitEvent:
+        return WaitEvent(value="x")
+
+    @step
+    def sync_step(self, ev: WaitEvent) -> StopEvent:
+        return StopEvent(result=ev.value)
+
+
+async def test_no_handlers_skips_summaries_and_spans(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without handlers, events are never summarized and no spans are entered."""
+    calls: list[Event] = []
+
+    def tracking_summarize(event: Event, max_length: int = 200) -> str:
+        calls.append(event)
+        return "summary"
+
+    monkeypatch.setattr(
+        "workflows.runtime.types.step_function.summarize_event", tracking_summarize
+    )
+    enter_calls: list[str] = []
+    original_span_enter = Dispatcher.span_enter
+
+    def tracking_span_enter(
+        self: Dispatcher, id_: str, *args: Any, **kwargs: Any
+    ) -> None:
+        enter_calls.append(id_)
+        original_span_enter(self, id_, *args, **kwargs)
+
+    monkeypatch.setattr(Dispatcher, "span_enter", tracking_span_enter)
+
+    result = await SummaryWorkflow().run()
+
+    assert result == "x"
+    assert calls == []
+    assert not any("async_step" in id_ or "sync_step" in id_ for id_ in enter_calls)
+
+
+async def test_handlers_receive_step_summaries(
+    span_tracker: SpanTracker,
+    event_tracker: EventTracker,
+) -> None:
+    """With handlers attached, step spans carry input summaries and outputs are emitted."""
+    result = await SummaryWorkflow().run()
+    assert result == "x"
+
+    step_outputs = [
+        e for e in event_tracker._events if isinstance(e, WorkflowStepOutputEvent)
+    ]
+    assert [e.output for e in step_outputs] == [
+        "WaitEvent(value='x')",
+        "StopEvent(result='x')",
+    ]
+    run_outputs = [
+        e for e in event_tracker._events if isinstance(e, WorkflowRunOutputEvent)
+    ]
+    assert len(run_outputs) == 1
+
+    step_exits = [
+        id_
+        for id_ in span_tracker._exited_ids
+        if "async_step" in id_ or "sync_step" in id_
+    ]
+    assert len(step_exits) == 2